@@ -15,18 +15,26 @@
 
 """Package asyn."""
 
+from .async_process import AsyncProcess
+from .child_exit_waiter import ChildExitWaiter
 from .concurrent_queue import ConcurrentQueue
 from .concurrent_queue_t import ConcurrentQueueT
 from .concurrent_double_side_queue_t import ConcurrentDoubleSideQueueT
+from .pipe_reactor import PipeReactor
 from .process import Process
 from .retry import Retry
 from .thread_pool import ThreadPool
+from .timer_wheel import TimerWheel
 
 __all__ = [
+    "AsyncProcess",
+    "ChildExitWaiter",
     "ConcurrentQueue",
     "ConcurrentQueueT",
     "ConcurrentDoubleSideQueueT",
+    "PipeReactor",
     "Process",
     "Retry",
     "ThreadPool",
+    "TimerWheel",
 ]
@@ -0,0 +1,346 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module async_process."""
+
+from __future__ import annotations
+import asyncio
+from concurrent import futures
+from dataclasses import dataclass, field
+import signal
+import subprocess
+import threading
+from typing import ClassVar, Sequence
+
+from biz.dfch.logging import log
+
+__all__ = ["AsyncProcess"]
+
+
+class AsyncProcess:
+    """Runs short-lived processes concurrently on a shared asyncio loop.
+
+    All processes share a global concurrency limit. Every call has its own
+    deadline; a process that does not finish within it is terminated (and
+    killed after `KILL_GRACE_TIME`). Cancelling a call terminates its process.
+
+    The loop runs on a dedicated daemon thread, so the `*_sync` wrappers
+    can be called from any worker thread.
+
+    Example:
+        results = AsyncProcess.Factory.get().run_all_sync(
+            [["/usr/bin/udevadm", "info", "--name", e] for e in devices],
+            timeout=5)
+    """
+
+    MAX_CONCURRENCY: int = 8
+    KILL_GRACE_TIME: float = 0.5
+
+    @dataclass(frozen=True)
+    class Result:
+        """The result of a process."""
+
+        cmd: list[str]
+        return_code: int | None
+        stdout: list[str] = field(default_factory=list)
+        stderr: list[str] = field(default_factory=list)
+        is_timed_out: bool = False
+
+        @property
+        def is_ok(self) -> bool:
+            """True, if the process exited with `0` within its deadline."""
+
+            return 0 == self.return_code and not self.is_timed_out
+
+    class Factory:  # pylint: disable=R0903
+        """Factory class."""
+
+        __instance: ClassVar[AsyncProcess | None] = None
+        _sync_root: ClassVar[threading.Lock] = threading.Lock()
+
+        @staticmethod
+        def get() -> AsyncProcess:
+            """Gets the process-wide instance."""
+
+            if AsyncProcess.Factory.__instance is not None:
+                return AsyncProcess.Factory.__instance
+
+            with AsyncProcess.Factory._sync_root:
+
+                if AsyncProcess.Factory.__instance is not None:
+                    return AsyncProcess.Factory.__instance
+
+                AsyncProcess.Factory.__instance = AsyncProcess(
+                    AsyncProcess.MAX_CONCURRENCY)
+
+            return AsyncProcess.Factory.__instance
+
+    _max_concurrency: int
+    _loop: asyncio.AbstractEventLoop
+    _limiter: asyncio.Semaphore
+    _thread: threading.Thread
+
+    def __init__(self, max_concurrency: int):
+
+        if not AsyncProcess.Factory._sync_root.locked():
+            raise RuntimeError("Private ctor. Use Factory instead.")
+
+        assert isinstance(max_concurrency, int) and 0 < max_concurrency
+
+        self._max_concurrency = max_concurrency
+        self._loop = asyncio.new_event_loop()
+        self._limiter = asyncio.Semaphore(max_concurrency)
+
+        self._thread = threading.Thread(
+            target=self._worker, name="async-process", daemon=True)
+        self._thread.start()
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of processes running at the same time."""
+
+        return self._max_concurrency
+
+    def _worker(self) -> None:
+        """Runs the event loop."""
+
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def run(
+            self,
+            cmd: list[str],
+            timeout: float | None = None,
+            stdin: list[str] | None = None,
+            env: dict[str, str] | None = None,
+            capture_stderr: bool = True,
+            encoding: str = "utf-8",
+    ) -> AsyncProcess.Result:
+        """Runs a process and collects its output.
+
+        Args:
+            cmd (list[str]): The command to execute with its arguments.
+            timeout (float | None): The deadline in seconds, counted from
+                when the process is started (not while it waits for the
+                limiter), or `None` to wait indefinitely.
+            stdin (list[str] | None): Lines sent to `stdin` of the process.
+            env (dict[str, str] | None): The complete environment of the
+                process (see `Process.Environment`), or `None` to inherit.
+            capture_stderr (bool): If `False`, `stderr` is discarded.
+            encoding (str): The encoding of the process output.
+
+        Returns:
+            AsyncProcess.Result: The result. If the deadline passed, it
+                contains the output read until the process was stopped.
+
+        Raises:
+            FileNotFoundError: If the executable does not exist.
+            asyncio.CancelledError: If the call was cancelled. The process
+                is terminated.
+        """
+
+        assert cmd and isinstance(cmd, list)
+        assert timeout is None or 0 <= timeout
+        assert stdin is None or isinstance(stdin, list)
+
+        _newline = "\n"
+
+        async with self._limiter:
+
+            log.debug("Starting process '%s' ...", cmd)
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=subprocess.PIPE if stdin else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=(subprocess.PIPE if capture_stderr
+                        else subprocess.DEVNULL),
+                env=env,
+            )
+
+            data = (_newline.join(stdin) + _newline).encode(encoding) \
+                if stdin else None
+
+            stdout, stderr = bytearray(), bytearray()
+            is_timed_out = False
+            try:
+                await asyncio.wait_for(
+                    self._communicate(process, data, stdout, stderr),
+                    timeout)
+
+            except asyncio.TimeoutError:
+                log.warning("Process '%s' [%s] did not stop within [%ss].",
+                            cmd[0], process.pid, timeout)
+                is_timed_out = True
+                await self._terminate(process)
+
+                # Output read so far is kept; collect what is left in the
+                # pipes (same as `Process.communicate`).
+                try:
+                    await asyncio.wait_for(
+                        self._read_all(process, stdout, stderr),
+                        self.KILL_GRACE_TIME)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                log.debug("Process '%s' [%s] cancelled.", cmd[0], process.pid)
+                await asyncio.shield(self._terminate(process))
+                raise
+
+        result = AsyncProcess.Result(
+            cmd=cmd,
+            return_code=process.returncode,
+            stdout=stdout.decode(encoding, "replace").splitlines()
+            if stdout else [],
+            stderr=stderr.decode(encoding, "replace").splitlines()
+            if stderr else [],
+            is_timed_out=is_timed_out,
+        )
+
+        log.debug("Starting process '%s' OK. [%s]",
+                  cmd[0], result.return_code)
+
+        return result
+
+    @staticmethod
+    async def _communicate(
+            process: asyncio.subprocess.Process,
+            data: bytes | None,
+            stdout: bytearray,
+            stderr: bytearray,
+    ) -> None:
+        """Sends `data` to the process and reads its output into `stdout`
+        and `stderr` until it exits. Unlike `Process.communicate` of
+        `asyncio`, output read before a cancellation is kept."""
+
+        if data is not None:
+            try:
+                process.stdin.write(data)
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                # The process exited without reading its input.
+                pass
+            process.stdin.close()
+
+        await AsyncProcess._read_all(process, stdout, stderr)
+        await process.wait()
+
+    @staticmethod
+    async def _read_all(
+            process: asyncio.subprocess.Process,
+            stdout: bytearray,
+            stderr: bytearray,
+    ) -> None:
+        """Reads `stdout` and `stderr` of a process until they are closed."""
+
+        async def read(stream: asyncio.StreamReader | None,
+                       buffer: bytearray) -> None:
+            if stream is None:
+                return
+
+            while chunk := await stream.read(1 << 16):
+                buffer.extend(chunk)
+
+        await asyncio.gather(
+            read(process.stdout, stdout), read(process.stderr, stderr))
+
+    async def _terminate(self, process: asyncio.subprocess.Process) -> None:
+        """Terminates a process, then kills it after the grace time."""
+
+        if process.returncode is not None:
+            return
+
+        try:
+            process.send_signal(signal.SIGTERM)
+            await asyncio.wait_for(process.wait(), self.KILL_GRACE_TIME)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def run_all(
+            self,
+            cmds: Sequence[list[str]],
+            timeout: float | None = None,
+            **kwargs,
+    ) -> list[AsyncProcess.Result]:
+        """Runs processes concurrently (within the global limit).
+
+        Args:
+            cmds (Sequence[list[str]]): The commands.
+            timeout (float | None): The deadline per process in seconds.
+            kwargs: See `run`.
+
+        Returns:
+            list[AsyncProcess.Result]: The results in the order of `cmds`.
+                A process that could not be started has a `return_code` of
+                `None` and its error in `stderr`.
+        """
+
+        async def run_one(cmd: list[str]) -> AsyncProcess.Result:
+            try:
+                return await self.run(cmd, timeout, **kwargs)
+            except OSError as ex:
+                log.error("Starting process '%s' FAILED. [%s]", cmd, ex)
+                return AsyncProcess.Result(cmd, None, [], [str(ex)])
+
+        return list(await asyncio.gather(*(run_one(e) for e in cmds)))
+
+    def submit(
+            self,
+            cmd: list[str],
+            timeout: float | None = None,
+            **kwargs,
+    ) -> futures.Future:
+        """Starts `run` from any thread.
+
+        Returns:
+            futures.Future: The future of the `AsyncProcess.Result`.
+                Cancelling it terminates the process.
+        """
+
+        return asyncio.run_coroutine_threadsafe(
+            self.run(cmd, timeout, **kwargs), self._loop)
+
+    def run_sync(
+            self,
+            cmd: list[str],
+            timeout: float | None = None,
+            **kwargs,
+    ) -> AsyncProcess.Result:
+        """Runs a process and waits for its result. See `run`."""
+
+        assert threading.current_thread() is not self._thread
+
+        return self.submit(cmd, timeout, **kwargs).result()
+
+    def run_all_sync(
+            self,
+            cmds: Sequence[list[str]],
+            timeout: float | None = None,
+            **kwargs,
+    ) -> list[AsyncProcess.Result]:
+        """Runs processes concurrently and waits for all results. See
+        `run_all`."""
+
+        assert threading.current_thread() is not self._thread
+
+        if not cmds:
+            return []
+
+        return asyncio.run_coroutine_threadsafe(
+            self.run_all(cmds, timeout, **kwargs), self._loop).result()
@@ -0,0 +1,118 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module child_exit_waiter."""
+
+from __future__ import annotations
+import os
+import selectors
+import subprocess
+import time
+from typing import Sequence
+
+from biz.dfch.logging import log
+
+__all__ = ["ChildExitWaiter"]
+
+
+class ChildExitWaiter:  # pylint: disable=R0903
+    """Waits for child processes to exit without polling.
+
+    Every child is waited on through a pidfd (`os.pidfd_open`, Linux 5.3+)
+    registered in a selector, so waiting returns as soon as the last child
+    exits. Where pidfds are not available, the children are polled with an
+    exponential backoff capped at `MAX_POLL_INTERVAL`.
+    """
+
+    MIN_POLL_INTERVAL: float = 0.001
+    MAX_POLL_INTERVAL: float = 0.005
+
+    @staticmethod
+    def _open_pidfd(popen: subprocess.Popen) -> int | None:
+        """Returns a pidfd for the child, or `None` if not supported."""
+
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return None
+
+        try:
+            return pidfd_open(popen.pid)
+        except ProcessLookupError:
+            # Already reaped.
+            return None
+        except OSError as ex:
+            log.debug("pidfd_open [%s] FAILED. [%s]", popen.pid, ex)
+            return None
+
+    @staticmethod
+    def wait(
+            popens: Sequence[subprocess.Popen],
+            deadline: float,
+    ) -> bool:
+        """Waits until all children exited or the deadline passed.
+
+        Exited children are reaped, so `Popen.returncode` is set.
+
+        Args:
+            popens (Sequence[subprocess.Popen]): The children to wait for.
+            deadline (float): The deadline as `time.monotonic()` value.
+
+        Returns:
+            bool: True, if all children exited; false, otherwise.
+        """
+
+        assert isinstance(deadline, (int, float))
+
+        pending = [e for e in popens if e.poll() is None]
+        if not pending:
+            return True
+
+        polled: list[subprocess.Popen] = []
+        interval = ChildExitWaiter.MIN_POLL_INTERVAL
+
+        with selectors.DefaultSelector() as selector:
+            try:
+                for popen in pending:
+                    fd = ChildExitWaiter._open_pidfd(popen)
+                    if fd is None:
+                        polled.append(popen)
+                        continue
+                    selector.register(fd, selectors.EVENT_READ, popen)
+
+                while True:
+                    polled = [e for e in polled if e.poll() is None]
+                    if not polled and not selector.get_map():
+                        return True
+
+                    remaining = deadline - time.monotonic()
+                    if 0 >= remaining:
+                        return False
+
+                    timeout = remaining
+                    if polled:
+                        timeout = min(remaining, interval)
+                        interval = min(
+                            interval * 2, ChildExitWaiter.MAX_POLL_INTERVAL)
+
+                    for key, _ in selector.select(timeout):
+                        # A pidfd is readable once the child exited.
+                        key.data.poll()
+                        selector.unregister(key.fd)
+                        os.close(key.fd)
+
+            finally:
+                for key in list(selector.get_map().values()):
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
@@ -15,8 +15,10 @@
 
 """Module concurrent_queue."""
 
+from collections import deque
 import queue
 import threading
+import time
 from typing import overload, TypeVar
 
 T = TypeVar("T")
@@ -25,20 +27,31 @@ T = TypeVar("T")
 class ConcurrentQueue:
     """Implements a thread safe FIFO queue.
 
-    Note: though `queue.Queue` itself is thread safe, operations like
-    `empty()`are not. Therefore all queue operations are locked."""
+    All state is guarded by a single lock. Blocking producers and consumers
+    wait on conditions bound to that lock, so a waiting `dequeue` releases
+    the lock and never stalls `enqueue`, `is_empty` or `size`."""
 
-    def __init__(self, do_raise: bool = False):
+    def __init__(self, do_raise: bool = False, max_size: int = 0):
         """Creates an instance of this class.
 
         Args:
-            do_raise (bool): If true, queue.Empty and TimeoutError exceptions
-                are raised; if false, only None is returned.
+            do_raise (bool): If true, queue.Empty and queue.Full exceptions
+                are raised; if false, only None or False is returned.
+            max_size (int): The maximum number of items in the queue. If
+                max_size is 0, then the queue is unbounded.
+
+        Raises:
+            AssertionError: If max_size < 0.
         """
 
-        self._queue = queue.Queue()
+        assert 0 <= max_size
+
+        self._queue = deque()
         self._sync_root = threading.Lock()
+        self._not_empty = threading.Condition(self._sync_root)
+        self._not_full = threading.Condition(self._sync_root)
         self._do_raise = do_raise
+        self._max_size = max_size
 
     @property
     def is_empty(self) -> bool:
@@ -49,31 +62,62 @@ class ConcurrentQueue:
         """
 
         with self._sync_root:
-            return self._queue.empty()
+            return not self._queue
 
     @property
     def size(self) -> int:
-        """Returns the size of items in the quwue."""
+        """Returns the size of items in the queue."""
 
         with self._sync_root:
-            return self._queue.qsize()
+            return len(self._queue)
+
+    @property
+    def max_size(self) -> int:
+        """Returns the capacity of the queue or 0 if it is unbounded."""
 
-    def enqueue(self, item: object) -> None:
+        return self._max_size
+
+    def _is_full(self) -> bool:
+        return 0 < self._max_size <= len(self._queue)
+
+    def enqueue(self, item: object, timeout_ms: int | None = None) -> bool:
         """Enqueues an item into the queue.
 
-        Blocks until the item could be enqueued.
+        On an unbounded queue this never blocks. On a bounded queue this
+        blocks until the item could be enqueued or the timeout elapsed.
 
         Args:
             item (object): The object to be inserted.
+            timeout_ms (int | None): The non-negative wait timeout in
+                milliseconds. If timeout_ms is None, then the timeout is
+                infinite; if timeout_ms is 0, then the call does not wait.
+
+        Returns:
+            bool: True if the item was enqueued; false if the queue was full.
 
         Raises:
-            AssertionError: If item is None.
+            AssertionError: If item is None or timeout < 0.
+            queue.Full: If do_raise=True and queue is still full.
         """
 
         assert item is not None
+        assert timeout_ms is None or 0 <= timeout_ms
 
-        with self._sync_root:
-            self._queue.put(item)
+        with self._not_full:
+            if self._is_full():
+                if timeout_ms is None:
+                    while self._is_full():
+                        self._not_full.wait()
+                elif not self._wait(self._not_full, self._is_full,
+                                    timeout_ms):
+                    if self._do_raise:
+                        raise queue.Full
+                    return False
+
+            self._queue.append(item)
+            self._not_empty.notify()
+
+            return True
 
     @overload
     def dequeue(self) -> object | None:
@@ -109,52 +153,54 @@ class ConcurrentQueue:
         """Dequeues an item from the queue.
 
         This operation will wait for the specified timeout before returning.
+        While waiting, the lock is released.
 
         Args:
             timeout_ms (int): The non-negative wait timeout in milliseconds. If
-                timeout_ms is 0, then the timeout is infitive.
+                timeout_ms is None or 0, then the call does not wait.
 
         Returns:
             (object | None): The item or None if the queue was empty.
 
         Raises:
-            AssertionError: If timeout None or < 0.
-            queue.Empty: If do_raise=True and queue is empty.
-            TimeoutError: If do_raise=True and timeout elapsed.
+            AssertionError: If timeout < 0.
+            queue.Empty: If do_raise=True and queue is empty after timeout.
         """
 
-        assert timeout_ms is None or (
-            timeout_ms is not None and 0 <= timeout_ms)
+        assert timeout_ms is None or 0 <= timeout_ms
 
-        with self._sync_root:
-            result = None
+        with self._not_empty:
+            if not self._queue and timeout_ms:
+                self._wait(
+                    self._not_empty, lambda: not self._queue, timeout_ms)
 
-            if self._do_raise:
-                if not timeout_ms:
-                    result = self._queue.get_nowait()
-                else:
-                    result = self._queue.get(
-                        block=True, timeout=timeout_ms/1000)
+            if not self._queue:
+                if self._do_raise:
+                    raise queue.Empty
+                return None
 
-                self._queue.task_done()
-                return result
+            result = self._queue.popleft()
+            self._not_full.notify()
 
-            try:
-                if not timeout_ms:
-                    result = self._queue.get_nowait()
-                else:
-                    result = self._queue.get(
-                        block=True, timeout=timeout_ms/1000)
+            return result
 
-                self._queue.task_done()
+    @staticmethod
+    def _wait(condition: threading.Condition, predicate, timeout_ms: int
+              ) -> bool:
+        """Waits on `condition` while `predicate` holds.
 
-                return result
+        Returns:
+            bool: True if predicate no longer holds; false on timeout.
+        """
 
-            except queue.Empty:
-                return None
+        deadline = time.monotonic() + timeout_ms / 1000
+        while predicate():
+            remaining = deadline - time.monotonic()
+            if 0 >= remaining:
+                return False
+            condition.wait(remaining)
 
-            except TimeoutError:
-                return None
+        return True
 
     def clear(self) -> None:
         """Clears all items in the queue.
@@ -167,10 +213,5 @@ class ConcurrentQueue:
         """
 
         with self._sync_root:
-
-            while not self._queue.empty():
-                try:
-                    self._queue.get_nowait()
-                    self._queue.task_done()
-                except queue.Empty:
-                    continue
+            self._queue.clear()
+            self._not_full.notify_all()
@@ -30,19 +30,20 @@ T = TypeVar('T')
 class ConcurrentQueueT(ConcurrentQueue, Generic[T]):
     """Implements a generic thread safe FIFO queue."""
 
-    def __init__(self, _type: type[T], do_raise: bool = False):
+    def __init__(self, _type: type[T], do_raise: bool = False,
+                 max_size: int = 0):
 
-        super().__init__(do_raise)
+        super().__init__(do_raise, max_size)
 
         assert _type is not None
         self._type = _type
 
-    def enqueue(self, item: T) -> None:
+    def enqueue(self, item: T, timeout_ms: int | None = None) -> bool:
 
         assert item is not None and isinstance(
             item, self._type), f"{self._type} != {type(item)}"
 
-        super().enqueue(item)
+        return super().enqueue(item, timeout_ms)
 
     @overload
     def dequeue(self) -> T | None:
@@ -0,0 +1,324 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module pipe_reactor."""
+
+from __future__ import annotations
+import codecs
+from dataclasses import dataclass, field
+import os
+import re
+import selectors
+import threading
+from typing import IO, Callable, ClassVar
+
+from biz.dfch.logging import log
+
+__all__ = ["PipeReactor"]
+
+
+class PipeReactor:
+    """Multiplexes the output pipes of all child processes on a single thread.
+
+    Every registered pipe is read when it becomes readable and split into
+    lines (`\\n`, `\\r\\n` and `\\r`, same as universal newlines). Each line
+    is passed to the callback of the pipe without its line terminator.
+
+    The reactor thread is started on first registration and runs as a daemon.
+    """
+
+    READ_SIZE: int = 1 << 16
+    # Partial lines longer than this are delivered as a line.
+    MAX_LINE_LENGTH: int = 1 << 16
+
+    _NEWLINE = re.compile(r"\r\n|\r|\n")
+
+    @dataclass
+    class _Entry:
+        """A registered pipe."""
+
+        fd: int
+        on_line: Callable[[str], None]
+        on_close: Callable[[], None] | None
+        decoder: codecs.IncrementalDecoder
+        buffer: str = field(default="")
+
+    _selector: selectors.BaseSelector
+    _sync_root: threading.Lock
+    _pending: list[PipeReactor._Entry]
+    _removals: list[tuple[int, threading.Event]]
+    _wakeup_read: int
+    _wakeup_write: int
+    _thread: threading.Thread | None
+
+    class Factory:  # pylint: disable=R0903
+        """Factory class."""
+
+        __instance: ClassVar[PipeReactor | None] = None
+        _sync_root: ClassVar[threading.Lock] = threading.Lock()
+
+        @staticmethod
+        def get() -> PipeReactor:
+            """Gets the process-wide instance of the reactor."""
+
+            if PipeReactor.Factory.__instance is not None:
+                return PipeReactor.Factory.__instance
+
+            with PipeReactor.Factory._sync_root:
+
+                if PipeReactor.Factory.__instance is not None:
+                    return PipeReactor.Factory.__instance
+
+                PipeReactor.Factory.__instance = PipeReactor()
+
+            return PipeReactor.Factory.__instance
+
+    def __init__(self):
+
+        if not PipeReactor.Factory._sync_root.locked():
+            raise RuntimeError("Private ctor. Use Factory instead.")
+
+        self._selector = selectors.DefaultSelector()
+        self._sync_root = threading.Lock()
+        self._pending = []
+        self._removals = []
+        self._thread = None
+
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+
+    @property
+    def count(self) -> int:
+        """The number of registered pipes."""
+
+        with self._sync_root:
+            return len(self._selector.get_map()) - 1 + len(self._pending)
+
+    def register(
+            self,
+            stream: IO,
+            on_line: Callable[[str], None],
+            on_close: Callable[[], None] | None = None,
+            encoding: str = "utf-8",
+    ) -> None:
+        """Starts reading from a pipe.
+
+        Args:
+            stream (IO): The pipe to read from. The reactor reads from its
+                file descriptor; the stream itself must not be read from.
+            on_line (Callable[[str], None]): Invoked on the reactor thread for
+                every line.
+            on_close (Callable[[], None] | None): Invoked on the reactor
+                thread after the last line when the pipe is closed.
+            encoding (str): The charset of the pipe.
+        """
+
+        assert stream is not None
+        assert callable(on_line)
+        assert on_close is None or callable(on_close)
+        assert encoding and encoding.strip()
+
+        entry = PipeReactor._Entry(
+            fd=stream.fileno(),
+            on_line=on_line,
+            on_close=on_close,
+            decoder=codecs.getincrementaldecoder(encoding)(errors="replace"))
+
+        with self._sync_root:
+            self._pending.append(entry)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="pipe-reactor", daemon=True)
+                self._thread.start()
+
+        self._wakeup()
+
+    def unregister(self, stream: IO) -> None:
+        """Stops reading from a pipe before it reached EOF.
+
+        Returns once the reactor no longer uses the file descriptor, so the
+        stream can be closed afterwards. `on_close` of the pipe is invoked on
+        the reactor thread.
+        Does nothing if the pipe is not registered.
+
+        Args:
+            stream (IO): The pipe passed to `register`.
+        """
+
+        assert stream is not None
+
+        fd = stream.fileno()
+        removed = threading.Event()
+
+        with self._sync_root:
+            if self._thread is None:
+                return
+            # Pending registrations are added before removals are processed.
+            self._removals.append((fd, removed))
+            if threading.current_thread() is self._thread:
+                removals, self._removals = self._removals, []
+            else:
+                removals = None
+
+        if removals is not None:
+            self._remove(removals)
+            return
+
+        self._wakeup()
+        removed.wait()
+
+    def _unregister(self, fd: int) -> PipeReactor._Entry | None:
+        """Removes a file descriptor from the selector. Runs on the reactor
+        thread."""
+
+        try:
+            return self._selector.unregister(fd).data
+        except (ValueError, KeyError, OSError):
+            return None
+
+    def _remove(self, removals: list[tuple[int, threading.Event]]) -> None:
+        """Processes `unregister` requests. Runs on the reactor thread."""
+
+        for fd, removed in removals:
+            entry = self._unregister(fd)
+            if entry is not None and entry.on_close is not None:
+                self._invoke(entry.on_close)
+            removed.set()
+
+    def _wakeup(self) -> None:
+        """Interrupts `select` so pending registrations are picked up."""
+
+        try:
+            os.write(self._wakeup_write, b"\0")
+        except BlockingIOError:
+            # Already signalled.
+            pass
+
+    def _worker(self) -> None:
+        """Reactor loop."""
+
+        log.debug("Starting pipe reactor ...")
+
+        try:
+            while True:
+                with self._sync_root:
+                    pending, self._pending = self._pending, []
+                    removals, self._removals = self._removals, []
+
+                for entry in pending:
+                    self._register(entry)
+
+                self._remove(removals)
+
+                for key, _ in self._selector.select():
+                    if key.data is None:
+                        self._drain_wakeup()
+                        continue
+
+                    # Unregistered while this batch was being processed.
+                    if self._selector.get_map().get(key.fd) is not key:
+                        continue
+
+                    try:
+                        self._read(key.data)
+                    except Exception as ex:  # pylint: disable=W0718
+                        log.error("Reading from pipe [%s] FAILED. [%s]",
+                                  key.data.fd, ex, exc_info=True)
+                        self._close(key.data)
+        finally:
+            # Restarted by the next registration.
+            with self._sync_root:
+                self._thread = None
+                removals, self._removals = self._removals, []
+            for _, removed in removals:
+                removed.set()
+            log.error("Pipe reactor stopped.")
+
+    def _register(self, entry: PipeReactor._Entry) -> None:
+        """Adds a pipe to the selector. A pipe that cannot be added is
+        reported as closed."""
+
+        try:
+            self._selector.register(entry.fd, selectors.EVENT_READ, entry)
+        except (ValueError, KeyError, OSError) as ex:
+            log.error("Registering pipe [%s] FAILED. [%s]", entry.fd, ex)
+            if entry.on_close is not None:
+                self._invoke(entry.on_close)
+
+    def _close(self, entry: PipeReactor._Entry) -> None:
+        """Removes a pipe from the selector and reports it as closed."""
+
+        try:
+            self._selector.unregister(entry.fd)
+        except (ValueError, KeyError, OSError):
+            pass
+
+        if entry.on_close is not None:
+            self._invoke(entry.on_close)
+
+    def _drain_wakeup(self) -> None:
+        """Empties the wakeup pipe."""
+
+        try:
+            while os.read(self._wakeup_read, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _read(self, entry: PipeReactor._Entry) -> None:
+        """Reads available data from a pipe and delivers complete lines."""
+
+        try:
+            data = os.read(entry.fd, self.READ_SIZE)
+        except OSError as ex:
+            log.warning("Error reading from pipe [%s]. %s", entry.fd, ex)
+            data = b""
+
+        is_closed = not data
+        text = entry.buffer + entry.decoder.decode(data, final=is_closed)
+
+        lines = self._NEWLINE.split(text)
+        entry.buffer = lines.pop()
+
+        # A trailing "\r" could be the first half of "\r\n".
+        if not is_closed and text.endswith("\r"):
+            entry.buffer = lines.pop() + "\r"
+
+        if is_closed and entry.buffer:
+            lines.append(entry.buffer)
+            entry.buffer = ""
+        elif self.MAX_LINE_LENGTH < len(entry.buffer):
+            lines.append(entry.buffer)
+            entry.buffer = ""
+
+        for line in lines:
+            self._invoke(entry.on_line, line)
+
+        if not is_closed:
+            return
+
+        self._close(entry)
+
+    @staticmethod
+    def _invoke(func: Callable, *args) -> None:
+        """Invokes a callback; exceptions do not stop the reactor."""
+
+        try:
+            func(*args)
+        except Exception as ex:  # pylint: disable=W0718
+            log.error("Pipe reactor callback FAILED. [%s]", ex, exc_info=True)
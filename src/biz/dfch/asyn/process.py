@@ -17,8 +17,10 @@
 
 from __future__ import annotations
 
+import functools
 import locale
 import os
+import shutil
 import subprocess
 import threading
 import time
@@ -28,8 +30,14 @@ from typing import IO, Sequence, Tuple
 from biz.dfch.logging import log
 from col import CircularQueue
 
+from .child_exit_waiter import ChildExitWaiter
+from .pipe_reactor import PipeReactor
+
 __all__ = ["Process"]
 
+# Windows does not know SIGKILL; `Popen.send_signal(SIGTERM)` terminates.
+_SIGKILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
 
 class Process:
     """Starts and stops processes. Use `start()` to initialize this class."""
@@ -42,8 +50,81 @@ class Process:
     _STDOUT = "stdout"
     _STDERR = "stderr"
 
-    _stdout_thread: threading.Thread
-    _stderr_thread: threading.Thread
+    # Read all pipes on a single shared thread (selectors are POSIX only for
+    # pipes).
+    _USE_PIPE_REACTOR: bool = "posix" == os.name
+    # Maximum time to wait for pending output after the process exited.
+    _PIPE_DRAIN_TIMEOUT: float = 1.0
+
+    # Signals sent by `communicate` when a process does not exit within
+    # `max_wait_time`, each with the time to wait for the process to exit.
+    _COMMUNICATE_SCHEDULE: tuple[tuple[signal.Signals, float], ...] = (
+        (signal.SIGTERM, 0.5),
+        (signal.SIGINT, 0.5),
+        (_SIGKILL, 5.0),
+    )
+
+    # Spawn short-lived processes in `communicate` with a resolved
+    # executable.
+    _USE_SPAWN_FAST_PATH: bool = "posix" == os.name
+
+    # Absolute executable paths by name and search path, see
+    # `_resolve_executable`.
+    _MAX_EXECUTABLES = 64
+    _executables: dict[tuple[str, str], str] = {}
+
+    _stdout_thread: threading.Thread | None
+    _stderr_thread: threading.Thread | None
+
+    class Environment(dict):
+        """A complete process environment.
+
+        Passed as `env` to `communicate`, it is used as is instead of being
+        merged with `os.environ` on every call. Changes to `os.environ`
+        after creation are not reflected.
+        """
+
+        @classmethod
+        def create(cls, values: dict[str, str]) -> Process.Environment:
+            """Merges `values` into a copy of the current environment."""
+
+            assert isinstance(values, dict)
+
+            result = cls(os.environ)
+            result.update(values)
+
+            return result
+
+    @staticmethod
+    def _resolve_executable(name: str, env: dict[str, str] | None) -> str:
+        """Returns the absolute path of an executable as found on the `PATH`
+        of `env` (or of the calling process if `env` is `None`), or `name` if
+        it cannot be resolved.
+
+        Only successful lookups are cached; a cached path that is no longer
+        executable is resolved again.
+        """
+
+        if os.path.isabs(name):
+            return name
+
+        path = os.pathsep.join(os.get_exec_path(env))
+        key = (name, path)
+
+        result = Process._executables.get(key)
+        if result is not None and os.access(result, os.X_OK):
+            return result
+
+        result = shutil.which(name, path=path)
+        if result is None:
+            Process._executables.pop(key, None)
+            return name
+
+        if Process._MAX_EXECUTABLES <= len(Process._executables):
+            Process._executables.clear()
+        Process._executables[key] = result
+
+        return result
 
     def __init__(self, popen: subprocess.Popen, encoding: str) -> None:
         """Initialise a `Process` instance. Use `start` to initialize this
@@ -68,6 +149,12 @@ class Process:
 
         self._queue = CircularQueue[Tuple[str, str]](self._MAX_QUEUE_SIZE)
 
+        self._pipes_lock = threading.Lock()
+        self._pipes_open = 0
+        self._pipes_closed = threading.Event()
+        self._pipes_closed.set()
+        self._reactor_streams: list[IO[str]] = []
+
     @property
     def pid(self) -> int:
         """Returns the PID of the process.
@@ -108,79 +195,212 @@ class Process:
         """
         return self._popen.poll()
 
-    def stop(self, max_wait_time: int = 5, force: bool = False) -> bool:
+    def wait(self, timeout: float | None = None) -> int | None:
+        """Waits for the process to exit.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait, or
+                `None` (default) to wait indefinitely.
+
+        Returns:
+            int | None: The exit code, or `None` if the process is still
+                running after `timeout`.
+        """
+
+        assert timeout is None or (
+            isinstance(timeout, (int, float)) and 0 <= timeout)
+
+        if timeout is None:
+            result = self._popen.wait()
+        elif ChildExitWaiter.wait([self._popen], time.monotonic() + timeout):
+            result = self._popen.returncode
+        else:
+            return None
+
+        self._pipes_closed.wait(self._PIPE_DRAIN_TIMEOUT)
+
+        return result
+
+    def stop(self, max_wait_time: float = 5, force: bool = False) -> bool:
         """Stops a running process, then forcibly terminates if specified and
         if it is still running. Does nothing if the process is already stopped.
 
+        Returns as soon as the process exited; waiting does not poll.
+
         Args:
-            max_wait_time (int): Maximum number of seconds to wait for graceful
-                termination.
+            max_wait_time (float): Maximum number of seconds to wait for
+                graceful termination (and for forcible termination).
             force (bool): If `True`, the process is forcibly stopped; false
                 by default.
 
         Returns:
             bool: Returns `True` if the process could be stopped; `False` if
-            the process was already stopped.
+            the process was already stopped, or if it could not be stopped
+            forcibly.
 
         Raises:
-            RuntimeError: If the process could not be stopped.
+            RuntimeError: If the process could not be stopped gracefully and
+                `force` is `False`, or if signalling the process failed.
         """
 
         assert 0 <= max_wait_time
 
         try:
 
-            if self._popen.stdin:
-                self._popen.stdin.flush()
-
-            if self._popen.stdout:
-                self._popen.stdout.flush()
-
-            if self._popen.stderr:
-                self._popen.stderr.flush()
+            self._flush()
 
             # Process already stopped.
             if self._popen.poll() is not None:
+                self._close_pipes(time.monotonic() + self._PIPE_DRAIN_TIMEOUT)
                 return False
 
-            self._popen.terminate()
+            schedule = Process._get_stop_schedule(max_wait_time, force)
+            if Process._escalate([self._popen], schedule):
+                self._close_pipes(time.monotonic() + self._PIPE_DRAIN_TIMEOUT)
+                return True
+
+        except Exception as ex:
+
+            message = f"Process [{self._popen.pid}] could not be stopped."
+            log.error(message, exc_info=True)
+            raise RuntimeError(message) from ex
 
-            end_time = time.monotonic() + max_wait_time
-            while end_time > time.monotonic():
-                if self._popen.poll() is not None:
-                    return True
+        if force:
+            log.error("Process [%s] could not be stopped.", self._popen.pid)
+            return False
 
-                time.sleep(0.25)
+        message = f"Process [{self._popen.pid}] could not be stopped " \
+            "gracefully."
+        log.error(message)
 
-            # Process stopped gracefully.
-            if self._popen.poll() is not None:
+        raise RuntimeError(message)
+
+    @staticmethod
+    def stop_all(
+        processes: Sequence[Process],
+        max_wait_time: float = 5,
+        force: bool = False,
+    ) -> bool:
+        """Stops running processes in parallel.
+
+        Every step of the stop schedule signals all remaining processes at
+        once, so stopping finishes as soon as the last process exited and
+        never later than the sum of the step deadlines.
+
+        Args:
+            processes (Sequence[Process]): The processes to stop.
+            max_wait_time (float): Maximum number of seconds to wait for
+                graceful termination (and for forcible termination).
+            force (bool): If `True`, remaining processes are forcibly
+                stopped; false by default.
+
+        Returns:
+            bool: True, if all processes are stopped; false, otherwise.
+        """
+
+        assert 0 <= max_wait_time
+
+        for process in processes:
+            process._flush()
+
+        popens = [e._popen for e in processes if e._popen.poll() is None]
+        if popens:
+            schedule = Process._get_stop_schedule(max_wait_time, force)
+            result = Process._escalate(popens, schedule)
+        else:
+            result = True
+
+        if not result:
+            log.error("Processes %s could not be stopped.",
+                      [e.pid for e in popens if e.poll() is None])
+
+        deadline = time.monotonic() + Process._PIPE_DRAIN_TIMEOUT
+        for process in processes:
+            if process._popen.poll() is not None:
+                process._close_pipes(deadline)
+
+        return result
+
+    @staticmethod
+    def _get_stop_schedule(
+        max_wait_time: float,
+        force: bool
+    ) -> list[tuple[signal.Signals, float]]:
+        """Returns the signals and wait times used by `stop`."""
+
+        result = [(signal.SIGTERM, max_wait_time)]
+        if force:
+            result.append((_SIGKILL, max_wait_time))
+
+        return result
+
+    @staticmethod
+    def _escalate(
+        popens: list[subprocess.Popen],
+        schedule: Sequence[tuple[signal.Signals, float]],
+    ) -> bool:
+        """Sends the signals of a schedule until all processes exited.
+
+        After every signal, waits up to its wait time for all processes to
+        exit.
+
+        Returns:
+            bool: True, if all processes exited; false, otherwise.
+        """
+
+        for sig, wait_time in schedule:
+            for popen in popens:
+                if popen.poll() is not None:
+                    continue
+                try:
+                    popen.send_signal(sig)
+                except ProcessLookupError:
+                    pass
+
+            deadline = time.monotonic() + wait_time
+            if ChildExitWaiter.wait(popens, deadline):
                 return True
 
-            if not force:
+            log.warning("Processes %s did not stop within [%ss] after '%s'.",
+                        [e.pid for e in popens if e.poll() is None],
+                        wait_time, signal.Signals(sig).name)
 
-                message = f"Process [{self._popen.pid}] could not be stopped" \
-                    "gracefully."
-                log.error(message, exc_info=True)
+        return False
 
-                raise RuntimeError(message)
+    def _flush(self) -> None:
+        """Flushes the pipes of the process."""
 
-            self._popen.kill()
+        if self._popen.stdin:
+            self._popen.stdin.flush()
 
-            start_time = time.time_ns()
-            while time.time_ns() - start_time < max_wait_time * 10**9:
-                if self._popen.poll() is not None:
-                    return True
+        if self._popen.stdout:
+            self._popen.stdout.flush()
 
-                time.sleep(0.25)
+        if self._popen.stderr:
+            self._popen.stderr.flush()
 
-            # Process stopped forcibly.
-            return self._popen.poll() is not None
+    def _close_pipes(self, deadline: float) -> None:
+        """Closes the pipes read by the reactor once the process exited.
 
-        except Exception as ex:
+        Waits until `deadline` for the output to be read. Pipes still open
+        then (e.g. inherited by a child of the process) are unregistered from
+        the reactor before they are closed, so their file descriptors can be
+        reused.
+        """
 
-            message = f"Process [{self._popen.pid}] could not be stopped."
-            log.error(message, exc_info=True)
-            raise RuntimeError(message) from ex
+        # Pipes that reached EOF are no longer used by the reactor.
+        is_read = self._pipes_closed.wait(
+            max(0.0, deadline - time.monotonic()))
+
+        with self._pipes_lock:
+            streams, self._reactor_streams = self._reactor_streams, []
+
+        for stream in streams:
+            if stream.closed:
+                continue
+            if not is_read:
+                PipeReactor.Factory.get().unregister(stream)
+            stream.close()
 
     @staticmethod
     def communicate(
@@ -190,10 +410,19 @@ class Process:
         max_wait_time: float = 5,
         encoding: str = "utf-8",
         env: dict[str, str] = {},
+        capture_stderr: bool = True,
         **kwargs
     ) -> tuple[list[str], list[str]]:
         """Sends text to a process and waits for return synchronously.
 
+        Without `cwd` and `kwargs`, the process is spawned on a fast path:
+        the executable is resolved once per name and `PATH` of the effective
+        environment, so the child does not search `PATH` on every call. The
+        process still runs in a new session and inherited descriptors are
+        still closed: descriptors created by Python are not inheritable, but
+        descriptors opened by C libraries (such as `libjack`) may be. This
+        rules out `posix_spawn`; `subprocess` uses `vfork` instead.
+
         Args:
             cmd (list[str]): The command to execute with its arguments.
             stdin (list[str] | None): The input to be sent to stdin of the
@@ -205,6 +434,11 @@ class Process:
                 Note that, when the process does not stop within that timeout,
                 the process is stopped (which will take additional time).
             encoding (str): The encoding to be used ("utf-8" is default).
+            env (dict[str, str]): Variables added to the environment of the
+                calling process. Pass a `Process.Environment` to use a
+                precomputed environment as is.
+            capture_stderr (bool): If `False`, `stderr` is discarded and an
+                empty list is returned for it; true by default.
 
         Returns:
             (tuple[list[str], list[str]]): A 2-tuple that contains `stdout` and
@@ -218,33 +452,37 @@ class Process:
 
         _newline = '\n'
         _space = ' '
-        _sigterm_wait_time = 0.5
 
         log.debug("Starting process '%s' ...", _space.join(cmd))
 
-        # Regular output.
-        stdout1: str = ""
-        stderr1: str = ""
-        # Possible output after SIGINT.
-        stdout2: str = ""
-        stderr2: str = ""
-        # Possible output after SIGKILL.
-        stdout3: str = ""
-        stderr3: str = ""
+        stdout: str = ""
+        stderr: str = ""
+
+        if isinstance(env, Process.Environment):
+            _env = env
+        elif env:
+            _env = Process.Environment.create(env)
+        else:
+            # Inherit the environment of the calling process.
+            _env = None
 
-        _env = os.environ.copy()
-        _env.update(env)
+        if Process._USE_SPAWN_FAST_PATH and cwd is None and not kwargs:
+            args = [Process._resolve_executable(cmd[0], _env)] + cmd[1:]
+        else:
+            args = cmd
+
+        kwargs = {"start_new_session": True} | kwargs
 
         try:
             process = subprocess.Popen(  # pylint: disable=R1732
-                args=cmd,
+                args=args,
                 cwd=cwd,
                 encoding=encoding,
                 text=True,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                start_new_session=True,
+                stderr=(subprocess.PIPE if capture_stderr
+                        else subprocess.DEVNULL),
                 env=_env,
                 **kwargs,
             )
@@ -256,41 +494,32 @@ class Process:
 
             try:
 
-                stdout1, stderr1 = process.communicate(
+                stdout, stderr = process.communicate(
                     input=_input,
                     timeout=max_wait_time if 0 < max_wait_time else None)
 
             except subprocess.TimeoutExpired:
 
-                try:
+                # Output read so far is kept by `Popen` and returned by the
+                # next successful call to `communicate`.
+                for sig, wait_time in Process._COMMUNICATE_SCHEDULE:
                     log.warning(
                         ("Process '%s' did not stop within timeout. "
-                         "Sending SIGTERM ..."),
-                        cmd[0])
-                    process.send_signal(signal.SIGTERM)
-                except Exception:  # pylint: disable=W0718
-                    # Ignore exception.
-                    pass
-
-                try:
-                    process.wait(_sigterm_wait_time)
-                except subprocess.TimeoutExpired:
-                    log.warning(
-                        ("Process '%s' did not stop within timeout. "
-                         "Sending SIGINT ..."),
-                        cmd[0])
-                    process.send_signal(signal.SIGINT)
-                    stdout2, stderr2 = process.communicate()
-
-                try:
-                    process.wait(_sigterm_wait_time)
-                except subprocess.TimeoutExpired:
-                    log.warning(
-                        ("Process '%s' did not stop within timeout. "
-                         "Sending SIGKILL ..."),
-                        cmd[0])
-                    process.kill()
-                    stdout3, stderr3 = process.communicate()
+                         "Sending %s ..."),
+                        cmd[0], signal.Signals(sig).name)
+
+                    try:
+                        process.send_signal(sig)
+                    except Exception:  # pylint: disable=W0718
+                        # Ignore exception.
+                        pass
+
+                    try:
+                        stdout, stderr = process.communicate(
+                            timeout=wait_time)
+                        break
+                    except subprocess.TimeoutExpired:
+                        continue
 
             if process.poll() is not None:
                 log.info("Starting process '%s' OK. [%s]", _space.join(
@@ -300,18 +529,10 @@ class Process:
                     cmd), process.returncode, exc_info=True)
 
             result = ([], [])
-            if stdout1:
-                result[0].extend(stdout1.splitlines())
-            if stderr1:
-                result[1].extend(stderr1.splitlines())
-            if stdout2:
-                result[0].extend(stdout2.splitlines())
-            if stderr2:
-                result[1].extend(stderr2.splitlines())
-            if stdout3:
-                result[0].extend(stdout3.splitlines())
-            if stderr3:
-                result[1].extend(stderr3.splitlines())
+            if stdout:
+                result[0].extend(stdout.splitlines())
+            if stderr:
+                result[1].extend(stderr.splitlines())
             return result
 
         except Exception as ex:  # pylint: disable=W0718
@@ -383,35 +604,75 @@ class Process:
         process = cls(result, encoding)
 
         if capture_stdout:
-            process._stdout_thread = threading.Thread(
-                target=process._read_stream, args=(
-                    process._popen.stdout, process._STDOUT)
-            )
-            log.debug(
-                "Starting reading from pipe '%s' [%s] ...",
-                process._STDOUT,
-                result.pid)
-            process._stdout_thread.start()
+            process._stdout_thread = process._start_reading(
+                process._popen.stdout, process._STDOUT)
 
         if capture_stderr:
-            process._stderr_thread = threading.Thread(
-                target=process._read_stream, args=(
-                    process._popen.stderr, process._STDERR)
-            )
-            log.debug(
-                "Starting reading from pipe '%s' [%s] ...",
-                process._STDERR,
-                result.pid)
-            process._stderr_thread.start()
+            process._stderr_thread = process._start_reading(
+                process._popen.stderr, process._STDERR)
 
         if not wait_on_completion:
             return process
 
-        while process.is_running:
-            time.sleep(1)
+        process._popen.wait()
+
+        process._pipes_closed.wait(process._PIPE_DRAIN_TIMEOUT)
 
         return process
 
+    def _start_reading(
+            self,
+            stream: IO[str],
+            name: str
+    ) -> threading.Thread | None:
+        """Starts reading lines from a pipe into the queue of this process.
+
+        On POSIX, the pipe is read by the shared `PipeReactor`. Otherwise, a
+        reader thread is started.
+
+        Returns:
+            threading.Thread | None: The reader thread, or `None` if the pipe
+                is read by the reactor.
+        """
+
+        log.debug("Starting reading from pipe '%s' [%s] ...",
+                  name, self._popen.pid)
+
+        with self._pipes_lock:
+            self._pipes_open += 1
+            self._pipes_closed.clear()
+
+        if self._USE_PIPE_REACTOR:
+            with self._pipes_lock:
+                self._reactor_streams.append(stream)
+
+            PipeReactor.Factory.get().register(
+                stream,
+                functools.partial(self._enqueue, name),
+                self._on_pipe_closed,
+                encoding=self._encoding)
+
+            return None
+
+        result = threading.Thread(
+            target=self._read_stream, args=(stream, name))
+        result.start()
+
+        return result
+
+    def _enqueue(self, name: str, value: str) -> None:
+        """Stores a line read from the pipe `name`."""
+
+        self._queue.enqueue((name, value))
+
+    def _on_pipe_closed(self) -> None:
+        """Signals `_pipes_closed` when the last captured pipe is closed."""
+
+        with self._pipes_lock:
+            self._pipes_open -= 1
+            if 0 == self._pipes_open:
+                self._pipes_closed.set()
+
     def _read_stream(self, stream: IO[str], name: str) -> None:
         """Reads data from a specified pipe.
         Args:
@@ -436,6 +697,9 @@ class Process:
                         self._popen.pid,
                         ex)
 
+        finally:
+            self._on_pipe_closed()
+
     @property
     def stdout(self) -> Sequence[str]:
         """Returns all `STDOUT` messages from the started process, if `start`
@@ -479,7 +743,21 @@ class Process:
             `STDERR` by the process.
         """
 
-        items = self._queue.dequeue_filter(lambda _: True)
+        items = self._queue.drain()
         result = [item[self._TUPLE_KEY_VALUE] for item in items]
 
         return result
+
+    def read_output(self, count: int) -> Sequence[tuple[str, str]]:
+        """Returns up to `count` of the oldest output lines of both pipes, so
+        consumers can process output in batches.
+
+        Args:
+            count (int): The maximum number of lines to return.
+
+        Returns:
+            Sequence[tuple[str, str]]: Tuples of pipe name (`"stdout"` or
+            `"stderr"`) and line, oldest first.
+        """
+
+        return self._queue.dequeue_many(count)
@@ -15,28 +15,41 @@
 
 """Module retry."""
 
+from contextvars import ContextVar
+import random
+import threading
 import time
 from typing import Any, Callable
 
 from biz.dfch.logging import log
 
 
+_DEADLINE: ContextVar[float | None] = ContextVar(
+    "biz.dfch.asyn.retry.deadline", default=None)
+
+
 class Retry:
     """Retries a callable until it returns True, with exponential backoff and
     attempt limit.
+
+    Retries started from within the action of another retry on the same
+    thread share the deadline of the outer retry: they never run longer than
+    the outer retry has left. A backoff can be cut short with `wake_event`.
     """
 
     _initial_wait_time_ms: int
     _first_wait_time_ms: int
     _max_wait_time_ms: int
+    _max_wait_time_interval_ms: int
     _factor_wait_time_interval: float
     _spin_attempts: int
-    _max_wait_time_ms: int
     _base_wait_time_interval_ms: int
     _max_attempts: int
+    _jitter: float
+    _wake_event: threading.Event | None
     _description: str
 
-    def __init__(
+    def __init__(  # pylint: disable=R0913
             self,
             initial_wait_time_ms: int = 0,
             first_wait_time_ms: int = 0,
@@ -47,14 +60,23 @@ class Retry:
             factor_wait_time_interval: float = 1.5,
             max_attempts: int = 0,
             description: str = "",
+            jitter: float = 0.0,
+            wake_event: threading.Event | None = None,
     ) -> None:
         """
         Initializes the retry handler.
 
         Args:
             wait_interval_ms: Initial wait interval in milliseconds.
+            max_wait_time_ms: Overall deadline in milliseconds, measured from
+                the start of `invoke`. Nested retries inherit the earlier of
+                their own and the outer deadline.
             max_attempts: Maximum number of attempts. Set to 0 for unlimited
                 attempts.
+            jitter: Fraction in [0, 1] by which every wait is randomly
+                shortened, so that concurrent retries do not run in lockstep.
+            wake_event: If set while waiting, the wait is cut short and the
+                action is retried immediately. The event is cleared then.
         """
 
         assert isinstance(initial_wait_time_ms,
@@ -75,30 +97,63 @@ class Retry:
         assert isinstance(base_wait_time_interval_ms,
                           int) and base_wait_time_interval_ms > 0
         assert isinstance(max_attempts, int) and max_attempts >= 0
+        assert isinstance(jitter, (int, float)) and 0 <= jitter <= 1
+        assert wake_event is None or isinstance(wake_event, threading.Event)
 
         self._initial_wait_time_ms = initial_wait_time_ms
         self._first_wait_time_ms = first_wait_time_ms
         self._max_wait_time_ms = max_wait_time_ms
         self._factor_wait_time_interval = factor_wait_time_interval
         self._spin_attempts = spin_attempts
-        self._max_wait_time_ms = max_wait_time_interval_ms
+        self._max_wait_time_interval_ms = max_wait_time_interval_ms
         self._base_wait_time_interval_ms = base_wait_time_interval_ms
         self._max_attempts = max_attempts
+        self._jitter = float(jitter)
+        self._wake_event = wake_event
         self._description = description
 
+    @staticmethod
+    def get_deadline() -> float | None:
+        """Returns the `time.monotonic()` deadline of the retry running on
+        the current thread, or None outside of a retry."""
+
+        return _DEADLINE.get()
+
+    def _wait(self, wait_time_ms: float, deadline: float) -> None:
+        """Waits for `wait_time_ms` reduced by jitter, but not beyond
+        `deadline`. Returns early if `wake_event` is set."""
+
+        if 0 < self._jitter:
+            wait_time_ms *= 1 - self._jitter * random.random()
+
+        timeout = min(wait_time_ms / 1000.0, deadline - time.monotonic())
+        if 0 >= timeout:
+            return
+
+        if self._wake_event is None:
+            time.sleep(timeout)
+            return
+
+        if self._wake_event.wait(timeout):
+            log.debug("Waking up '%s'.", self._description)
+            self._wake_event.clear()
+
     def invoke(
             self,
             action: Callable[..., bool],
             *args: Any,
             **kwargs: Any
-    ) -> None:
+    ) -> bool:
         """
-        Repeatedly calls `action` until it returns True or max attempts are
-        exhausted.
+        Repeatedly calls `action` until it returns True, max attempts are
+        exhausted or the deadline has passed.
 
         Args:
             action: Callable that returns a boolean.
             *args, **kwargs: Arguments to pass to the action.
+
+        Returns:
+            bool: True if `action` returned True; false otherwise.
         """
 
         assert callable(action)
@@ -112,50 +167,68 @@ class Retry:
         attempts = 0
         spin_attempts = 0
 
-        current_wait = min(self._base_wait_time_interval_ms,
-                           self._max_wait_time_ms)
+        current_wait = self._base_wait_time_interval_ms
+        if 0 != self._max_wait_time_interval_ms:
+            current_wait = min(current_wait, self._max_wait_time_interval_ms)
         start_time = time.monotonic()
 
-        if 0 < self._initial_wait_time_ms:
-            time.sleep(self._initial_wait_time_ms / 1000.0)
+        deadline = start_time + self._max_wait_time_ms / 1000.0
+        outer_deadline = _DEADLINE.get()
+        if outer_deadline is not None:
+            deadline = min(deadline, outer_deadline)
+        token = _DEADLINE.set(deadline)
 
-        while self._max_attempts == 0 or attempts < self._max_attempts:
+        try:
+            if 0 < self._initial_wait_time_ms:
+                self._wait(self._initial_wait_time_ms, deadline)
 
-            try:
-                elapsed_ms = int((time.monotonic() - start_time) * 1000.0)
-                if elapsed_ms > self._max_wait_time_ms:
+            while self._max_attempts == 0 or attempts < self._max_attempts:
+
+                now = time.monotonic()
+                if now > deadline:
                     break
 
-                log.debug("Trying '%s' [%s/%s] [elapsed: %sms] ...",
-                          self._description,
-                          attempts,
-                          self._max_attempts,
-                          elapsed_ms)
+                try:
+                    log.debug("Trying '%s' [%s/%s] [elapsed: %sms] ...",
+                              self._description,
+                              attempts,
+                              self._max_attempts,
+                              int((now - start_time) * 1000.0))
 
-                if action(*args, **kwargs):
-                    return
+                    if action(*args, **kwargs):
+                        return True
 
-                if 0 == attempts and 0 < self._first_wait_time_ms:
-                    time.sleep(self._first_wait_time_ms / 1000.0)
+                    if 0 == attempts and 0 < self._first_wait_time_ms:
+                        self._wait(self._first_wait_time_ms, deadline)
 
-            except Exception as ex:  # pylint: disable=W0718
-                log.error("An exception occurred while executing "
-                          "'%s' in '%s.%s'. [%s]",
-                          self._description,
-                          module_name,
-                          action_name,
-                          ex,
-                          exc_info=True
-                          )
+                except Exception as ex:  # pylint: disable=W0718
+                    log.error("An exception occurred while executing "
+                              "'%s' in '%s.%s'. [%s]",
+                              self._description,
+                              module_name,
+                              action_name,
+                              ex,
+                              exc_info=True
+                              )
 
-            finally:
-                time.sleep(current_wait / 1000.0)
+                self._wait(current_wait, deadline)
 
                 attempts += 1
 
                 if spin_attempts < self._spin_attempts:
                     spin_attempts += 1
                 else:
-                    current_wait = min(
-                        current_wait * self._factor_wait_time_interval,
-                        self._max_wait_time_ms)
+                    current_wait *= self._factor_wait_time_interval
+                    if 0 != self._max_wait_time_interval_ms:
+                        current_wait = min(
+                            current_wait, self._max_wait_time_interval_ms)
+
+            log.warning("Trying '%s' FAILED after %s attempts [%sms].",
+                        self._description,
+                        attempts,
+                        int((time.monotonic() - start_time) * 1000.0))
+
+            return False
+
+        finally:
+            _DEADLINE.reset(token)
@@ -16,48 +16,157 @@
 """Module thread_pool."""
 
 from __future__ import annotations
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from dataclasses import dataclass, fields
+from enum import Enum, IntEnum
 from typing import Any, Callable, ClassVar
 import threading
+import time
 
 from biz.dfch.logging import log
 
 
-class ThreadPool:  # pylint: disable=R0903
-    """Implements a simple thread pool."""
+class ThreadPool:
+    """Implements a priority-aware thread pool.
+
+    Jobs are queued per priority class and workers always take the oldest
+    job of the highest class. Workers are started on demand up to
+    `max_workers` and retire after being idle for `IDLE_TIMEOUT_S`.
+
+    Pools are unbounded unless a `max_queue_size` is given when the pool is
+    created. When the queue of a bounded pool is full, the pool's
+    `RejectionPolicy` decides what happens.
+    """
 
     MAX_WORKERS: int = 4
+    IDLE_TIMEOUT_S: float = 2.0
+
+    class Priority(IntEnum):
+        """Priority classes; lower values run first."""
+
+        REALTIME_RECOVERY = 0
+        UI = 1
+        BACKGROUND_IO = 2
+
+    class RejectionPolicy(Enum):
+        """Action taken when a job is submitted to a full queue."""
+
+        REJECT = "reject"
+        """The submitted job is rejected."""
+
+        DISCARD_LOWEST = "discard-lowest"
+        """The newest queued job of the lowest priority class is discarded
+        if its class is lower than the class of the submitted job; otherwise
+        the submitted job is rejected."""
+
+        CALLER_RUNS = "caller-runs"
+        """The submitted job runs on the thread of the caller."""
+
+    @dataclass(frozen=True)
+    class Counters:  # pylint: disable=R0902
+        """Counters of one priority class."""
+
+        queue_depth: int = 0
+        submitted: int = 0
+        rejected: int = 0
+        discarded: int = 0
+        completed: int = 0
+        failed: int = 0
+        wait_time_s: float = 0.0
+        max_wait_time_s: float = 0.0
+        run_time_s: float = 0.0
+        max_run_time_s: float = 0.0
+
+    @dataclass(frozen=True)
+    class Metrics:
+        """Snapshot of the state of a thread pool."""
+
+        name: str
+        max_workers: int
+        max_queue_size: int
+        workers: int
+        active: int
+        counters: dict[ThreadPool.Priority, ThreadPool.Counters]
+
+        @property
+        def queue_depth(self) -> int:
+            """Returns the number of queued jobs of all priority classes."""
+
+            return sum(e.queue_depth for e in self.counters.values())
 
-    _executor: ThreadPoolExecutor
+    _name: str
+    _max_workers: int
+    _max_queue_size: int
+    _rejection_policy: ThreadPool.RejectionPolicy
+    _sync_root: threading.Condition
+    _queues: dict[ThreadPool.Priority, deque[tuple]]
+    _queued: int
+    _workers: int
+    _active: int
+    _counters: dict[ThreadPool.Priority, dict[str, int | float]]
 
-    def __init__(self, max_workers: int):
+    def __init__(
+            self,
+            name: str,
+            max_workers: int,
+            max_queue_size: int,
+            rejection_policy: ThreadPool.RejectionPolicy,
+    ):
 
         if not ThreadPool.Factory._sync_root.locked():
             raise RuntimeError("Private ctor. Use Factory instead.")
 
         assert isinstance(
-            max_workers, int) and ThreadPool.MAX_WORKERS >= max_workers
+            max_workers, int) and 0 < max_workers <= ThreadPool.MAX_WORKERS
+        assert isinstance(max_queue_size, int) and 0 <= max_queue_size
+        assert isinstance(rejection_policy, ThreadPool.RejectionPolicy)
 
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._name = name
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._rejection_policy = rejection_policy
+        self._sync_root = threading.Condition()
+        self._queues = {e: deque() for e in ThreadPool.Priority}
+        self._queued = 0
+        self._workers = 0
+        self._active = 0
+        self._counters = {
+            e: dict.fromkeys(
+                (f.name for f in fields(ThreadPool.Counters)
+                 if "queue_depth" != f.name), 0)
+            for e in ThreadPool.Priority}
 
     class Factory:  # pylint: disable=R0903
         """Factory class."""
 
         DEFAULT_WORKERS: int = 2
+        DEFAULT_QUEUE_SIZE: int = 0
+        """Unbounded."""
 
         DEFAULT_NAME = "default"
 
+        RECOVERY_NAME = "recovery"
+        """Pool for long running retries, so that they do not occupy the
+        workers of the default pool. Get it with `ThreadPool.MAX_WORKERS`."""
+
         __thread_pools: ClassVar[dict[str, ThreadPool]] = {}
 
-        __instance: ClassVar[ThreadPool | None] = None
         _sync_root: ClassVar[threading.Lock] = threading.Lock()
 
         @staticmethod
         def get(
             name: str = DEFAULT_NAME,
-            max_workers: int = DEFAULT_WORKERS
+            max_workers: int = DEFAULT_WORKERS,
+            max_queue_size: int = DEFAULT_QUEUE_SIZE,
+            rejection_policy: ThreadPool.RejectionPolicy | None = None,
         ) -> ThreadPool:
-            """Creates or gets a named thread pool instance."""
+            """Creates or gets a named thread pool instance.
+
+            The sizing arguments are only applied when the pool is created.
+            A `max_queue_size` of 0 creates an unbounded pool, which never
+            rejects a job. The default rejection policy of a bounded pool is
+            `DISCARD_LOWEST`.
+            """
 
             assert isinstance(name, str) and name.strip()
             assert isinstance(
@@ -69,22 +178,191 @@ class ThreadPool:  # pylint: disable=R0903
                 if result is not None:
                     return result
 
-                result = ThreadPool(max_workers=max_workers)
+                result = ThreadPool(
+                    name=name,
+                    max_workers=max_workers,
+                    max_queue_size=max_queue_size,
+                    rejection_policy=(
+                        rejection_policy if rejection_policy is not None
+                        else ThreadPool.RejectionPolicy.DISCARD_LOWEST),
+                )
 
                 ThreadPool.Factory.__thread_pools[name] = result
 
                 return result
 
+        @staticmethod
+        def metrics() -> list[ThreadPool.Metrics]:
+            """Returns a snapshot of the metrics of all thread pools."""
+
+            with ThreadPool.Factory._sync_root:
+                pools = list(ThreadPool.Factory.__thread_pools.values())
+
+            return [e.metrics for e in pools]
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the pool."""
+
+        return self._name
+
+    @property
+    def metrics(self) -> ThreadPool.Metrics:
+        """Returns a snapshot of the metrics of this pool."""
+
+        with self._sync_root:
+            return ThreadPool.Metrics(
+                name=self._name,
+                max_workers=self._max_workers,
+                max_queue_size=self._max_queue_size,
+                workers=self._workers,
+                active=self._active,
+                counters={
+                    priority: ThreadPool.Counters(
+                        queue_depth=len(self._queues[priority]),
+                        **counters)
+                    for priority, counters in self._counters.items()},
+            )
+
     @staticmethod
-    def _action_invoker(func: Callable, *args: Any, **kwargs: Any) -> None:
+    def _action_invoker(func: Callable, *args: Any, **kwargs: Any) -> bool:
 
         try:
             func(*args, **kwargs)
+            return True
 
         except Exception as ex:  # pylint: disable=W0718
             log.error("An exception occurred. [%s]", ex, exc_info=True)
+            return False
+
+    def invoke(self, action: Callable, *args: Any, **kwargs: Any) -> bool:
+        """Executes an action on the thread pool with `Priority.UI`.
+
+        Returns:
+            bool: False if the action was rejected; true otherwise.
+        """
+
+        return self.submit(ThreadPool.Priority.UI, action, *args, **kwargs)
+
+    def submit(
+            self,
+            priority: ThreadPool.Priority,
+            action: Callable,
+            *args: Any,
+            **kwargs: Any
+    ) -> bool:
+        """Executes an action on the thread pool with the given priority.
+
+        Returns:
+            bool: False if the action was rejected; true otherwise.
+        """
+
+        assert isinstance(priority, ThreadPool.Priority)
+        assert callable(action)
+
+        job = (action, args, kwargs, time.monotonic())
+
+        with self._sync_root:
+            counters = self._counters[priority]
+            counters["submitted"] += 1
+
+            if 0 < self._max_queue_size \
+                    and self._queued >= self._max_queue_size \
+                    and not self._make_room(priority):
+
+                if ThreadPool.RejectionPolicy.CALLER_RUNS \
+                        != self._rejection_policy:
+                    counters["rejected"] += 1
+                    log.warning(
+                        "Thread pool '%s' is full. Rejected job '%s' [%s].",
+                        self._name,
+                        getattr(action, "__qualname__", action),
+                        priority.name)
+                    return False
+
+                self._active += 1
+
+            else:
+                self._queues[priority].append(job)
+                self._queued += 1
+
+                if self._queued > self._workers - self._active \
+                        and self._workers < self._max_workers:
+                    self._workers += 1
+                    threading.Thread(
+                        target=self._worker,
+                        name=f"ThreadPool-{self._name}-{self._workers}",
+                    ).start()
+                else:
+                    self._sync_root.notify()
+
+                return True
+
+        self._run(priority, job)
+
+        return True
+
+    def _make_room(self, priority: ThreadPool.Priority) -> bool:
+        """Discards the newest job of the lowest priority class if the
+        rejection policy permits. Caller must hold `_sync_root`."""
+
+        if ThreadPool.RejectionPolicy.DISCARD_LOWEST \
+                != self._rejection_policy:
+            return False
+
+        lowest = next((e for e in reversed(ThreadPool.Priority)
+                       if self._queues[e]), None)
+        if lowest is None or lowest <= priority:
+            return False
+
+        action = self._queues[lowest].pop()[0]
+        self._queued -= 1
+        self._counters[lowest]["discarded"] += 1
+
+        log.warning("Thread pool '%s' is full. Discarded job '%s' [%s].",
+                    self._name,
+                    getattr(action, "__qualname__", action),
+                    lowest.name)
+
+        return True
+
+    def _worker(self) -> None:
+        """Runs queued jobs until idle for `IDLE_TIMEOUT_S`."""
+
+        while True:
+            with self._sync_root:
+                if 0 == self._queued:
+                    self._sync_root.wait(ThreadPool.IDLE_TIMEOUT_S)
+
+                    if 0 == self._queued:
+                        self._workers -= 1
+                        return
+
+                priority = next(e for e in ThreadPool.Priority
+                                if self._queues[e])
+                job = self._queues[priority].popleft()
+                self._queued -= 1
+                self._active += 1
+
+            self._run(priority, job)
+
+    def _run(self, priority: ThreadPool.Priority, job: tuple) -> None:
+        """Runs a job and updates the counters of its priority class."""
+
+        action, args, kwargs, enqueued = job
+
+        started = time.monotonic()
+        is_ok = self._action_invoker(action, *args, **kwargs)
+        finished = time.monotonic()
 
-    def invoke(self, action: Callable, *args: Any, **kwargs: Any) -> None:
-        """Executes an action on the thread pool.."""
+        with self._sync_root:
+            self._active -= 1
 
-        self._executor.submit(self._action_invoker, action, *args, **kwargs)
+            counters = self._counters[priority]
+            counters["completed" if is_ok else "failed"] += 1
+            counters["wait_time_s"] += started - enqueued
+            counters["max_wait_time_s"] = max(
+                counters["max_wait_time_s"], started - enqueued)
+            counters["run_time_s"] += finished - started
+            counters["max_run_time_s"] = max(
+                counters["max_run_time_s"], finished - started)
@@ -0,0 +1,203 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module timer_wheel."""
+
+from __future__ import annotations
+from itertools import count
+import math
+from typing import Callable
+import threading
+import time
+
+from biz.dfch.logging import log
+
+__all__ = [
+    "TimerWheel",
+]
+
+
+class TimerWheel:
+    """Implements a hashed timer wheel.
+
+    Timers are hashed by their expiry tick into `slot_count` slots; a timer
+    further away than one revolution stays in its slot until its tick comes
+    around. Scheduling and cancelling are O(1). One daemon thread advances
+    the wheel every `tick_s` while timers are pending and retires after
+    being idle for `IDLE_TIMEOUT_S`.
+
+    Callbacks run on the thread of the wheel and must return quickly.
+    """
+
+    TICK_S: float = 0.01
+    SLOT_COUNT: int = 512
+    IDLE_TIMEOUT_S: float = 2.0
+
+    _tick_s: float
+    _slots: list[dict[int, tuple[int, Callable[[], None]]]]
+    _handles: dict[int, int]
+    _ids: count
+    _sync_root: threading.Condition
+    _start: float
+    _tick: int
+    _thread: threading.Thread | None
+
+    def __init__(
+            self,
+            tick_s: float = TICK_S,
+            slot_count: int = SLOT_COUNT,
+    ):
+        """Creates an instance of the object.
+
+        Args:
+            tick_s (float): The resolution of the wheel in seconds.
+            slot_count (int): The number of slots of one revolution.
+        """
+
+        assert isinstance(tick_s, (int, float)) and 0 < tick_s
+        assert isinstance(slot_count, int) and 0 < slot_count
+
+        self._tick_s = tick_s
+        self._slots = [{} for _ in range(slot_count)]
+        self._handles = {}
+        self._ids = count(1)
+        self._sync_root = threading.Condition()
+        self._start = time.monotonic()
+        self._tick = 0
+        self._thread = None
+
+    def _get_tick(self) -> int:
+        """Internal: returns the tick of the current time."""
+
+        return int((time.monotonic() - self._start) / self._tick_s)
+
+    def schedule(self, delay_s: float, callback: Callable[[], None]) -> int:
+        """Schedules a callback.
+
+        Args:
+            delay_s (float): The delay in seconds. The callback runs at the
+                earliest after `delay_s` and at the latest one tick later.
+            callback (Callable[[], None]): The callback to run.
+
+        Returns:
+            int: A handle to cancel the timer with.
+        """
+
+        assert isinstance(delay_s, (int, float)) and 0 <= delay_s
+        assert callable(callback)
+
+        with self._sync_root:
+            elapsed = time.monotonic() - self._start
+            if not self._handles:
+                self._tick = int(elapsed / self._tick_s)
+
+            expiry = max(
+                self._tick, math.ceil((elapsed + delay_s) / self._tick_s))
+            slot = expiry % len(self._slots)
+
+            handle = next(self._ids)
+            self._slots[slot][handle] = (expiry, callback)
+            self._handles[handle] = slot
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="TimerWheel", daemon=True)
+                self._thread.start()
+
+        return handle
+
+    def cancel(self, handle: int) -> bool:
+        """Cancels a timer.
+
+        Args:
+            handle (int): The handle returned by `schedule`.
+
+        Returns:
+            bool: True, if the timer was cancelled; false, if it already
+                expired or was cancelled before.
+        """
+
+        with self._sync_root:
+            slot = self._handles.pop(handle, None)
+            if slot is None:
+                return False
+
+            del self._slots[slot][handle]
+
+        return True
+
+    def _expire(self, now: int) -> list[Callable[[], None]]:
+        """Internal: removes the timers that expired up to tick `now`.
+        `_sync_root` must be held."""
+
+        result = []
+
+        while self._tick <= now and self._handles:
+            slot = self._slots[self._tick % len(self._slots)]
+
+            for handle, (expiry, callback) in list(slot.items()):
+                if expiry <= self._tick:
+                    del slot[handle]
+                    del self._handles[handle]
+                    result.append(callback)
+
+            self._tick += 1
+
+        return result
+
+    def _worker(self) -> None:
+        """Advances the wheel and runs expired callbacks.
+
+        The wheel keeps ticking while it is idle, so that `schedule` never
+        has to wake it up.
+        """
+
+        idle_since = None
+
+        while True:
+            with self._sync_root:
+                now = self._get_tick()
+                if now < self._tick:
+                    self._sync_root.wait(
+                        self._start + self._tick * self._tick_s
+                        - time.monotonic())
+                    continue
+
+                callbacks = self._expire(now)
+
+                if self._handles:
+                    idle_since = None
+                else:
+                    if idle_since is None:
+                        idle_since = time.monotonic()
+                    elif self.IDLE_TIMEOUT_S <= time.monotonic() - idle_since:
+                        self._thread = None
+                        return
+
+                    self._tick = now + 1
+
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as ex:  # pylint: disable=W0718
+                    log.error("TimerWheel: Callback failed: '%s'.",
+                              ex,
+                              exc_info=True)
+
+    def __len__(self) -> int:
+        """Returns the number of pending timers."""
+
+        return len(self._handles)
@@ -15,8 +15,10 @@
 
 """Package diagnostics."""
 
+from .histogram import Histogram
 from .scheduling_info import SchedulingInfo
 
 __all__ = [
+    "Histogram",
     "SchedulingInfo",
 ]
@@ -0,0 +1,137 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module histogram."""
+
+from __future__ import annotations
+import threading
+
+__all__ = [
+    "Histogram",
+]
+
+
+class Histogram:
+    """Log-scale histogram of durations.
+
+    Bucket `i` counts durations below `2**i` microseconds, so percentiles are
+    accurate to a factor of two from 1us to about half an hour at constant
+    memory and O(1) cost per recorded value. The last bucket also counts all
+    longer durations.
+    """
+
+    BUCKET_COUNT: int = 32
+
+    _sync_root: threading.Lock
+    _buckets: list[int]
+    _count: int
+    _total_s: float
+    _max_s: float
+
+    def __init__(self):
+        self._sync_root = threading.Lock()
+        self._buckets = [0] * Histogram.BUCKET_COUNT
+        self._count = 0
+        self._total_s = 0.0
+        self._max_s = 0.0
+
+    def record(self, value_s: float) -> None:
+        """Records a duration in seconds."""
+
+        index = min(max(int(value_s * 1_000_000), 0).bit_length(),
+                    Histogram.BUCKET_COUNT - 1)
+
+        with self._sync_root:
+            self._buckets[index] += 1
+            self._count += 1
+            self._total_s += value_s
+            if value_s > self._max_s:
+                self._max_s = value_s
+
+    @property
+    def count(self) -> int:
+        """Returns the number of recorded values."""
+
+        return self._count
+
+    @property
+    def total_s(self) -> float:
+        """Returns the sum of all recorded values in seconds."""
+
+        return self._total_s
+
+    @property
+    def max_s(self) -> float:
+        """Returns the largest recorded value in seconds."""
+
+        return self._max_s
+
+    @property
+    def mean_s(self) -> float:
+        """Returns the mean of all recorded values in seconds."""
+
+        return self._total_s / self._count if self._count else 0.0
+
+    def percentile(self, value: float) -> float:
+        """Returns an upper bound of the given percentile in seconds.
+
+        Args:
+            value (float): The percentile in [0, 100].
+
+        Returns:
+            float: The upper bound of the bucket that contains the
+                percentile, but at most the largest recorded value; 0 if
+                nothing was recorded.
+        """
+
+        assert 0 <= value <= 100
+
+        with self._sync_root:
+            if 0 == self._count:
+                return 0.0
+
+            rank = max(1, -(-self._count * value // 100))
+            seen = 0
+            for index, count in enumerate(self._buckets):
+                seen += count
+                if seen >= rank:
+                    if Histogram.BUCKET_COUNT - 1 == index:
+                        break
+                    return min((1 << index) / 1_000_000, self._max_s)
+
+            return self._max_s
+
+    def snapshot(self) -> Histogram:
+        """Returns a copy of this histogram."""
+
+        result = Histogram()
+        with self._sync_root:
+            result._buckets = list(self._buckets)
+            result._count = self._count
+            result._total_s = self._total_s
+            result._max_s = self._max_s
+
+        return result
+
+    def __str__(self):
+        return (
+            f"count: {self._count}; "
+            f"p50: {self.percentile(50) * 1000:.3f}ms; "
+            f"p99: {self.percentile(99) * 1000:.3f}ms; "
+            f"max: {self._max_s * 1000:.3f}ms"
+        )
+
+    def __repr__(self):
+        return self.__str__()
@@ -28,7 +28,7 @@ from .mixer import AudioMixer
 from .mixer import AudioMixerConfiguration
 from .mixer import JackSignalManager
 from .mixer import DeviceFactory
-from .system import SignalHandler, FuncExecutor
+from .system import SignalHandler, FuncExecutor, MessageBridge
 from .public.input import InputDevice
 from .public.audio import AudioDevice, Format, FileFormat
 from .public.storage.storage_device import StorageDevice
@@ -129,44 +129,54 @@ class App:  # pylint: disable=R0903
         if args.service:
             log.info("Arg 'service' detected.")
 
-            cfg = AudioMixerConfiguration.get_default()
-            mixer = AudioMixer.Factory.get()
-            mixer.initialise(cfg)
-
-            JackSignalManager.Factory.get().acquire()
-
-            mix_devices = DeviceFactory.create_mixbus_group()
-            for mx in mix_devices:
-                mx.acquire()
-                mixer.mixbus.add_device(mx)
-
-            log.info("Device names [%s]", [
-                e.name for e in mixer.mixbus.devices])
-            log.debug("Device source points [%s]", [
-                      e.name for e in mixer.mixbus.sources])
-            log.debug("Device sink points [%s]", [
-                      e.name for e in mixer.mixbus.sinks])
-
-            _dr0_sources = next(e.as_source_set().points
-                                for e in mixer.mixbus.devices
-                                if "DR0" in e.name)
-            for point in _dr0_sources:
-                log.debug("Point '%s'.", point.name)
-
-            points = [e
-                      for e in mixer.mixbus.get_device(
-                          "Mixbus:MX0").as_sink_set().points if e.name]
-            for point in points:
-                log.debug("Point '%s'", point)
-
-            StateMachine().start()
-
-            with FuncExecutor(
-                lambda _: True,
-                lambda e: isinstance(
-                    e,
-                    SystemMessage.StateMachine.StateMachineStopped)
-            ) as sync:
-                sync.wait(2**31)
+            bridge = None
+            if args.message_bridge:
+                bridge = MessageBridge(args.message_bridge)
+                bridge.start()
+
+            try:
+                cfg = AudioMixerConfiguration.get_default()
+                mixer = AudioMixer.Factory.get()
+                mixer.initialise(cfg)
+
+                JackSignalManager.Factory.get().acquire()
+
+                mix_devices = DeviceFactory.create_mixbus_group()
+                for mx in mix_devices:
+                    mx.acquire()
+                    mixer.mixbus.add_device(mx)
+
+                log.info("Device names [%s]", [
+                    e.name for e in mixer.mixbus.devices])
+                log.debug("Device source points [%s]", [
+                          e.name for e in mixer.mixbus.sources])
+                log.debug("Device sink points [%s]", [
+                          e.name for e in mixer.mixbus.sinks])
+
+                _dr0_sources = next(e.as_source_set().points
+                                    for e in mixer.mixbus.devices
+                                    if "DR0" in e.name)
+                for point in _dr0_sources:
+                    log.debug("Point '%s'.", point.name)
+
+                points = [e
+                          for e in mixer.mixbus.get_device(
+                              "Mixbus:MX0").as_sink_set().points if e.name]
+                for point in points:
+                    log.debug("Point '%s'", point)
+
+                StateMachine().start()
+
+                with FuncExecutor(
+                    lambda _: True,
+                    lambda e: isinstance(
+                        e,
+                        SystemMessage.StateMachine.StateMachineStopped)
+                ) as sync:
+                    sync.wait(2**31)
+
+            finally:
+                if bridge is not None:
+                    bridge.stop()
 
             log.debug("Signalling application shutdown OK.")
@@ -255,6 +255,15 @@ Copyright 2024-2026 d-fens GmbH. Licensed under GPLv3.
                   "'2009:7064' [iStorage datAshur Pro2 64GB].")
         )
 
+        # Diagnostics.
+        parser.add_argument(
+            "--message-bridge",
+            type=str,
+            default=None,
+            help=("Streams all messages to observers on the specified Unix "
+                  "domain socket; e.g. '/run/scnfmixr/bus.sock'.")
+        )
+
         result = parser.parse_args()
 
         return result
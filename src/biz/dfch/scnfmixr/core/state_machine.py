@@ -175,9 +175,9 @@ class StateMachine:
         self._thread = threading.Thread(target=self._worker, daemon=True)
         self._ctx = None
         self._fsm = None
-        self._message_queue.register(self._on_message, lambda e: isinstance(
-            e,
-            (SystemMessage.InputEvent, SystemMessage.Shutdown)))
+        self._message_queue.register(
+            self._on_message,
+            message_types=(SystemMessage.InputEvent, SystemMessage.Shutdown))
         self._menu = {}
 
     def start(self) -> None:
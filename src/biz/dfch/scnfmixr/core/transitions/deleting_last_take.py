@@ -52,7 +52,6 @@ class DeletingLastTake(TransitionBase):
 
         with FuncExecutor(
             lambda e: cast(msgt.DeleteLastRecordingNotification, e).value,
-            lambda e: isinstance(e, msgt.DeleteLastRecordingNotification)
         ) as sync:
             result = sync.invoke(
                 msgt.DeleteLastRecordingCommand(),
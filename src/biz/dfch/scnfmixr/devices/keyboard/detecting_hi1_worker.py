@@ -72,7 +72,7 @@ class DetectingHi1Worker(InterfaceDetectorBase):
                 candidate,
             ]
 
-            text, _ = Process.communicate(cmd)
+            text, _ = Process.communicate(cmd, capture_stderr=False)
 
             visitor = InputEventDeviceVisitor()
 
@@ -22,7 +22,7 @@ import os
 
 from text import TextUtils
 from biz.dfch.logging import log
-from biz.dfch.asyn import Process
+from biz.dfch.asyn import AsyncProcess, Process
 
 from ...app import ApplicationContext
 from ...public.storage import BlockDeviceType
@@ -43,6 +43,7 @@ class DetectingRcWorker(InterfaceDetectorBase):
     _UDEVADM_OPTION_ALL = "-a"
     _UDEVADM_OPTION_NOP_PAGER = "--no-pager"
     _UDEVADM_OPTION_NAME = "--name"
+    _UDEVADM_TIMEOUT_S: float = 5.0
 
     _LSBLK_FULLNAME = "/usr/bin/lsblk"
     _LSBLK_OPTION_JSON = "--json"
@@ -176,23 +177,29 @@ class DetectingRcWorker(InterfaceDetectorBase):
 
         devices = glob.glob(self._DEV_STORAGE_PATH_GLOB)
         # devices = [d.name for d in self._get_removable_devices()]
-        for full_name in devices:
 
-            log.debug("Retrieving udevadm info of device '%s' ...",
-                      full_name)
-            cmd: list[str] = [
-                self._UDEVADM_FULLNAME,
-                self._UDEVADM_OPTION_INFO,
-                self._UDEVADM_OPTION_NOP_PAGER,
-                self._UDEVADM_OPTION_ALL,
-                self._UDEVADM_OPTION_NAME,
-                full_name,
-            ]
-
-            process = Process.start(
-                cmd, wait_on_completion=True, capture_stdout=True)
-
-            text = process.stdout
+        # Retrieve the info of all devices concurrently.
+        log.debug("Retrieving udevadm info of devices %s ...", devices)
+        cmds: list[list[str]] = [[
+            self._UDEVADM_FULLNAME,
+            self._UDEVADM_OPTION_INFO,
+            self._UDEVADM_OPTION_NOP_PAGER,
+            self._UDEVADM_OPTION_ALL,
+            self._UDEVADM_OPTION_NAME,
+            full_name,
+        ] for full_name in devices]
+        infos = AsyncProcess.Factory.get().run_all_sync(
+            cmds, timeout=self._UDEVADM_TIMEOUT_S, capture_stderr=False)
+
+        for full_name, info in zip(devices, infos):
+
+            text = info.stdout
+            if not info.is_ok:
+                log.warning(
+                    "Retrieving udevadm info of device '%s' FAILED. [%s] %s",
+                    full_name, info.return_code, info.stderr)
+                continue
+
             log.info("Retrieving udevadm info of device '%s' OK. [%s]",
                      full_name, len(text))
 
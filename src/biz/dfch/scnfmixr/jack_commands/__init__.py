@@ -17,7 +17,9 @@ from .alsa_jack_base import AlsaJackBase
 from .alsa_to_jack import AlsaToJack
 from .jack_to_alsa import JackToAlsa
 from .jack_connection import JackConnection
+from .jack_connection_batch import JackConnectionBatch
 from .jack_port import JackPort
+from .jack_port_readiness import JackPortReadiness
 from .jack_client import JackClient
 from .jack_transport import JackTransport
 from .zita_bridge_alsa_to_jack import ZitaBridgeAlsaToJack
@@ -27,7 +29,9 @@ __all__ = [
     "AlsaJackBase",
     "AlsaToJack",
     "JackConnection",
+    "JackConnectionBatch",
     "JackPort",
+    "JackPortReadiness",
     "JackClient",
     "JackTransport",
     "JackToAlsa",
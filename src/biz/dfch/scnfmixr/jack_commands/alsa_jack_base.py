@@ -16,13 +16,12 @@
 """Module for creating a JACK / ALSA source or sink bridge."""
 
 from abc import ABC
-import time
 
 from biz.dfch.asyn import Process
 from biz.dfch.logging import log
 
-from .jack_connection import JackConnection
 from .jack_port import JackPort
+from .jack_port_readiness import JackPortReadiness
 
 
 class AlsaJackBase(ABC):
@@ -87,7 +86,8 @@ class AlsaJackBase(ABC):
 
         log.debug("Starting '%s' ...", cmd)
 
-        self._process = Process.start(cmd, False)
+        # stderr is captured, so that startup errors fail `get_ports` fast.
+        self._process = Process.start(cmd, False, capture_stderr=True)
 
         log.info("Started '%s' [pid=%s] [is_running=%s] ...",
                  cmd,
@@ -100,8 +100,22 @@ class AlsaJackBase(ABC):
 
         return self._process is not None and self._process.is_running
 
-    def get_ports(self) -> list[JackPort]:
-        """Retrieves all JACK ports for this bridge."""
+    def get_ports(
+            self,
+            deadline: float = JackPortReadiness.DEFAULT_DEADLINE_S,
+    ) -> list[JackPort]:
+        """Retrieves all JACK ports for this bridge.
+
+        Waits until the bridge has registered all of its ports.
+
+        Args:
+            deadline (float): The maximum time in seconds to wait for the
+                ports.
+
+        Returns:
+            list[JackPort]: The ports of this bridge, or an empty list if the
+                bridge failed or the ports were not registered in time.
+        """
 
         jack_base_name = f"{self.name}" \
             f"{self._JACK_PORT_INFIX}" \
@@ -110,19 +124,17 @@ class AlsaJackBase(ABC):
         if any(self._ports):
             return self._ports
 
-        while True:
-            result = JackConnection.get_ports(jack_base_name)
-
-            if result is None or self.channels != len(result):
-                time.sleep(0.5)
-                continue
+        result = JackPortReadiness(
+            jack_base_name,
+            self.channels,
+            self._process,
+            deadline).wait()
 
-            for port in result:
-                jack_port = JackPort(port)
-                self._ports.append(jack_port)
+        for port in result:
+            jack_port = JackPort(port)
+            self._ports.append(jack_port)
 
-            log.info("Jack ports for '%s': %s", jack_base_name, result)
-            break
+        log.info("Jack ports for '%s': %s", jack_base_name, result)
 
         return self._ports
 
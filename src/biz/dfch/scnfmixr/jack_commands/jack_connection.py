@@ -77,7 +77,8 @@ class JackConnection:
             JackConnection._JACK_LSP_FULLNAME
         ]
 
-        text, _ = Process.communicate(cmd, max_wait_time=0.25)
+        text, _ = Process.communicate(
+            cmd, max_wait_time=0.25, capture_stderr=False)
 
         return any(e for e in text if e.split(
             JackConnection._JACK_LSP_CLIENT_PORT_SEPARATOR)[0] == name)
@@ -94,7 +95,8 @@ class JackConnection:
             name
         ]
 
-        text, _ = Process.communicate(cmd, max_wait_time=0.25)
+        text, _ = Process.communicate(
+            cmd, max_wait_time=0.25, capture_stderr=False)
 
         return any(e == name for e in text)
 
@@ -107,7 +109,8 @@ class JackConnection:
             JackConnection._JACK_LSP_FULLNAME
         ]
 
-        text, _ = Process.communicate(cmd, max_wait_time=0.25)
+        text, _ = Process.communicate(
+            cmd, max_wait_time=0.25, capture_stderr=False)
 
         return list({
             e.split(JackConnection._JACK_LSP_CLIENT_PORT_SEPARATOR, 1)[0]
@@ -133,7 +136,8 @@ class JackConnection:
         cmd.append(JackConnection._JACK_LSP_FULLNAME)
         cmd.append(name)
 
-        text, _ = Process.communicate(cmd, max_wait_time=0.25)
+        text, _ = Process.communicate(
+            cmd, max_wait_time=0.25, capture_stderr=False)
 
         visitor = JackConnection.PortVisitor()
         dic = {
@@ -171,7 +175,7 @@ class JackConnection:
         cmd.append(name)
         cmd.append(JackConnection._JACK_LSP_OPTION_CONNECTIONS)
 
-        text, _ = Process.communicate(cmd)
+        text, _ = Process.communicate(cmd, capture_stderr=False)
 
         visitor = JackConnection.ConnectionVisitor()
         dic = {
@@ -198,7 +202,7 @@ class JackConnection:
             JackConnection._JACK_LSP_OPTION_CONNECTIONS,
         ]
 
-        text, _ = Process.communicate(cmd)
+        text, _ = Process.communicate(cmd, capture_stderr=False)
 
         visitor = JackConnection.ConnectionVisitor2()
 
@@ -227,7 +231,7 @@ class JackConnection:
             JackConnection._JACK_LSP_OPTION_PORTS,
         ]
 
-        text, _ = Process.communicate(cmd)
+        text, _ = Process.communicate(cmd, capture_stderr=False)
 
         visitor = JackConnection.ConnectionVisitor3()
 
@@ -314,7 +318,8 @@ class JackConnection:
             JackConnection._JACK_LSP_OPTION_CONNECTIONS,
         ]
 
-        text, _ = Process.communicate(cmd, max_wait_time=0.25)
+        text, _ = Process.communicate(
+            cmd, max_wait_time=0.25, capture_stderr=False)
 
         return list({
             e.split(JackConnection._JACK_LSP_CLIENT_PORT_SEPARATOR, 1)[0]
@@ -0,0 +1,357 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module jack_connection_batch."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import StrEnum, auto
+import shlex
+from typing import Any, Iterable, Self
+
+from biz.dfch.logging import log
+from biz.dfch.asyn import Process
+
+from .jack_connection import JackConnection
+
+__all__ = [
+    "JackConnectionBatch",
+]
+
+
+class JackConnectionBatch:
+    """Collects JACK connect and disconnect operations and applies them in a
+    single round trip.
+
+    Operations on the same edge are deduplicated (the last one wins) and
+    operations that would not change the current topology are skipped.
+    The batch is applied via an in-process JACK client (optional `jack`
+    module, https://pypi.org/project/JACK-Client/, extra `jack`) that is
+    opened and closed once per batch. If that is not available, a single
+    shell process reads one `jack_connect` or `jack_disconnect` command per
+    edge from stdin. The shell still forks one process per changed edge; it
+    only saves the `Process` setup and the `jack_lsp` call per edge, not the
+    per-edge process itself.
+
+    Example:
+        with JackConnectionBatch() as batch:
+            batch.connect("system:capture_1", "system:playback_1")
+
+        ok = batch.is_ok
+    """
+
+    _CLIENT_NAME = "scnfmixr-batch"
+    _JACK_CONNECT_FULLNAME = "/bin/jack_connect"
+    _JACK_DISCONNECT_FULLNAME = "/usr/bin/jack_disconnect"
+    _SHELL_FULLNAME = "/bin/sh"
+    _SHELL_OPTION_STDIN = "-s"
+    _MAX_WAIT_TIME_S: float = 5
+    _MAX_WAIT_TIME_PER_EDGE_S: float = 0.1
+
+    class Operation(StrEnum):
+        """Operation on an edge."""
+
+        CONNECT = auto()
+        DISCONNECT = auto()
+
+    class Status(StrEnum):
+        """Outcome of an operation."""
+
+        OK = auto()
+        SKIPPED = auto()
+        FAILED = auto()
+
+    @dataclass(frozen=True)
+    class Result:
+        """Result of an operation on an edge."""
+
+        source: str
+        sink: str
+        operation: JackConnectionBatch.Operation
+        status: JackConnectionBatch.Status
+
+    _operations: dict[tuple[str, str], Operation]
+    _connections: frozenset[tuple[str, str]] | None
+    _results: dict[tuple[str, str], Result]
+    _is_applied: bool
+
+    def __init__(
+            self,
+            connections: Iterable[tuple[str, str]] | None = None
+    ) -> None:
+        """Initialise an instance of this class.
+
+        Args:
+            connections (Iterable[tuple[str, str]] | None): The current
+                connections as tuples of source and sink (for example
+                `ConnectionInfo.edges`). If `None`, the connections are
+                retrieved from JACK when the batch is applied.
+        """
+
+        self._operations = {}
+        self._connections = (
+            None if connections is None else frozenset(connections))
+        self._results = {}
+        self._is_applied = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+
+        if exc_type is None:
+            self.apply()
+
+        return False
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def connect(self, source: str, sink: str) -> Self:
+        """Adds a connect operation from `source` to `sink`."""
+
+        return self._add(source, sink, JackConnectionBatch.Operation.CONNECT)
+
+    def disconnect(self, source: str, sink: str) -> Self:
+        """Adds a disconnect operation from `source` to `sink`."""
+
+        return self._add(
+            source, sink, JackConnectionBatch.Operation.DISCONNECT)
+
+    def _add(self, source: str, sink: str, operation: Operation) -> Self:
+
+        assert isinstance(source, str) and source.strip()
+        assert isinstance(sink, str) and sink.strip()
+
+        if self._is_applied:
+            raise RuntimeError("Batch already applied.")
+
+        # The last operation on an edge wins.
+        self._operations[(source, sink)] = operation
+
+        return self
+
+    @property
+    def results(self) -> dict[tuple[str, str], Result]:
+        """Returns the per edge results after the batch was applied."""
+
+        return {
+            key: self._results[key]
+            for key in self._operations
+            if key in self._results
+        }
+
+    @property
+    def is_ok(self) -> bool:
+        """Determines whether all operations succeeded or were skipped."""
+
+        return all(
+            JackConnectionBatch.Status.FAILED != e.status
+            for e in self._results.values())
+
+    def apply(self) -> dict[tuple[str, str], Result]:
+        """Applies all collected operations.
+
+        Returns:
+            dict[tuple[str, str], Result]: The result per edge.
+        """
+
+        if self._is_applied:
+            return self.results
+
+        self._is_applied = True
+
+        if 0 == len(self._operations):
+            return self.results
+
+        log.debug("Applying %s JACK connection operations ...",
+                  len(self._operations))
+
+        if not self._apply_client():
+            self._apply_process()
+
+        failed = sum(
+            1 for e in self._results.values()
+            if JackConnectionBatch.Status.FAILED == e.status)
+        skipped = sum(
+            1 for e in self._results.values()
+            if JackConnectionBatch.Status.SKIPPED == e.status)
+
+        if 0 == failed:
+            log.info("Applying %s JACK connection operations OK. "
+                     "[skipped: %s]", len(self._results), skipped)
+        else:
+            log.error("Applying %s JACK connection operations FAILED. "
+                      "[failed: %s] [skipped: %s]",
+                      len(self._results), failed, skipped)
+
+        return self.results
+
+    def _set_result(
+            self,
+            key: tuple[str, str],
+            status: Status
+    ) -> None:
+
+        source, sink = key
+        self._results[key] = JackConnectionBatch.Result(
+            source, sink, self._operations[key], status)
+
+    def _get_changes(
+            self,
+            connections: frozenset[tuple[str, str]]
+    ) -> list[tuple[str, str]]:
+        """Skips operations that would not change the topology.
+
+        Returns:
+            list[tuple[str, str]]: The edges that must be applied.
+        """
+
+        result: list[tuple[str, str]] = []
+
+        for key, operation in self._operations.items():
+
+            is_connected = key in connections
+            if (JackConnectionBatch.Operation.CONNECT == operation
+                    and is_connected):
+                self._set_result(key, JackConnectionBatch.Status.SKIPPED)
+                continue
+
+            if (JackConnectionBatch.Operation.DISCONNECT == operation
+                    and not is_connected):
+                self._set_result(key, JackConnectionBatch.Status.SKIPPED)
+                continue
+
+            result.append(key)
+
+        return result
+
+    @staticmethod
+    def _get_client_connections(
+            client: Any,
+            sources: Iterable[str],
+    ) -> frozenset[tuple[str, str]]:
+        """Gets the connections of the specified sources via a JACK client."""
+
+        result: set[tuple[str, str]] = set()
+
+        for source in set(sources):
+            try:
+                result.update(
+                    (source, e.name)
+                    for e in client.get_all_connections(source))
+            except Exception:  # pylint: disable=W0718
+                # Port does not exist (yet). Nothing is connected.
+                continue
+
+        return frozenset(result)
+
+    def _apply_client(self) -> bool:
+        """Applies the operations via an in-process JACK client.
+
+        Returns:
+            bool: True, if the operations were applied; false, if no client
+                could be created.
+        """
+
+        try:
+            import jack  # pylint: disable=C0415
+        except ImportError:
+            return False
+
+        try:
+            client = jack.Client(self._CLIENT_NAME, no_start_server=True)
+        except Exception as ex:  # pylint: disable=W0718
+            log.warning("Creating JACK client '%s' FAILED. [%s]",
+                        self._CLIENT_NAME, ex)
+            return False
+
+        try:
+            connections = self._connections
+            if connections is None:
+                connections = self._get_client_connections(
+                    client, (source for source, _ in self._operations))
+
+            for key in self._get_changes(connections):
+
+                source, sink = key
+
+                try:
+                    if (JackConnectionBatch.Operation.CONNECT
+                            == self._operations[key]):
+                        client.connect(source, sink)
+                    else:
+                        client.disconnect(source, sink)
+
+                    self._set_result(key, JackConnectionBatch.Status.OK)
+
+                except Exception as ex:  # pylint: disable=W0718
+                    log.error("Applying %s '%s' to '%s' FAILED. [%s]",
+                              self._operations[key], source, sink, ex)
+                    self._set_result(key, JackConnectionBatch.Status.FAILED)
+
+        finally:
+            client.close()
+
+        return True
+
+    def _apply_process(self) -> None:
+        """Applies the operations via a single shell process, which forks
+        one `jack_connect` or `jack_disconnect` per changed edge."""
+
+        connections = self._connections
+        if connections is None:
+            connections = frozenset(
+                (entry, other)
+                for (entry, is_sink), others
+                in JackConnection.get_connections3().items()
+                if not is_sink
+                for other in others)
+
+        changes = self._get_changes(connections)
+        if 0 == len(changes):
+            return
+
+        # One line per edge: run the command and echo its exit code.
+        stdin: list[str] = []
+        for key in changes:
+            source, sink = key
+            executable = (
+                self._JACK_CONNECT_FULLNAME
+                if JackConnectionBatch.Operation.CONNECT
+                == self._operations[key]
+                else self._JACK_DISCONNECT_FULLNAME)
+            stdin.append(
+                f"{shlex.quote(executable)} {shlex.quote(source)} "
+                f"{shlex.quote(sink)} >/dev/null 2>&1; echo $?")
+
+        stdout, _ = Process.communicate(
+            [self._SHELL_FULLNAME, self._SHELL_OPTION_STDIN],
+            stdin=stdin,
+            capture_stderr=False,
+            max_wait_time=(
+                self._MAX_WAIT_TIME_S
+                + self._MAX_WAIT_TIME_PER_EDGE_S * len(changes)))
+
+        for idx, key in enumerate(changes):
+
+            is_ok = idx < len(stdout) and "0" == stdout[idx].strip()
+            if not is_ok:
+                log.error("Applying %s '%s' to '%s' FAILED.",
+                          self._operations[key], key[0], key[1])
+
+            self._set_result(
+                key,
+                JackConnectionBatch.Status.OK if is_ok
+                else JackConnectionBatch.Status.FAILED)
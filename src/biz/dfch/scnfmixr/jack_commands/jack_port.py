@@ -191,7 +191,7 @@ class JackPort:
 
         log.debug("Connecting '%s' to '%s' ...", self.name, other)
 
-        Process.communicate(cmd)
+        Process.communicate(cmd, capture_stderr=False)
 
         conns = self.get_connections()
         if conns is None or not isinstance(conns, list):
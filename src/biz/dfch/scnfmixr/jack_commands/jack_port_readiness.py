@@ -0,0 +1,164 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module jack_port_readiness."""
+
+from __future__ import annotations
+import time
+
+from biz.dfch.logging import log
+from biz.dfch.asyn import Process
+
+from .jack_connection import JackConnection
+
+__all__ = [
+    "JackPortReadiness",
+]
+
+
+class JackPortReadiness:
+    """Waits until a JACK client has registered all of its expected ports.
+
+    The ports are probed with a short, increasing interval. If a process is
+    specified, its stderr is watched while waiting, so that startup errors
+    (e.g. `zita-a2j` not being able to open the ALSA device or to connect to
+    the JACK server) and a terminated process fail fast instead of waiting
+    for the deadline.
+
+    Example:
+        ports = JackPortReadiness("LCL:capture_", 2, process).wait()
+    """
+
+    DEFAULT_DEADLINE_S: float = 10.0
+
+    _POLL_INTERVAL_MIN_S: float = 0.02
+    _POLL_INTERVAL_MAX_S: float = 0.25
+
+    # Lower case fragments of fatal zita-a2j/zita-j2a startup lines.
+    _ERROR_PATTERNS: tuple[str, ...] = (
+        "can't",
+        "cannot",
+        "error",
+        "failed",
+        "unable",
+    )
+
+    _name: str
+    _count: int
+    _process: Process | None
+    _deadline: float
+    _error: str | None
+
+    def __init__(
+            self,
+            name: str,
+            count: int,
+            process: Process | None = None,
+            deadline: float = DEFAULT_DEADLINE_S,
+    ):
+        """Initialise an instance of this class.
+
+        Args:
+            name (str): The port name prefix (**`<client>:<suffix>`**), e.g.
+                **`LCL:capture_`**.
+            count (int): The number of expected ports.
+            process (Process | None): The process registering the ports.
+                The process must be started with `capture_stderr=True` for
+                error lines to be detected.
+            deadline (float): The maximum time in seconds to wait.
+        """
+
+        assert isinstance(name, str) and name.strip()
+        assert isinstance(count, int) and 0 < count
+        assert process is None or isinstance(process, Process)
+        assert isinstance(deadline, (int, float)) and 0 < deadline
+
+        self._name = name
+        self._count = count
+        self._process = process
+        self._deadline = deadline
+        self._error = None
+
+    @property
+    def error(self) -> str | None:
+        """Returns the reason of the last failed `wait`, or `None`."""
+        return self._error
+
+    def _check_process(self) -> str | None:
+        """Checks the process for termination and error lines.
+
+        Returns:
+            str | None: The reason for failing, or `None`.
+        """
+
+        if self._process is None:
+            return None
+
+        for line in self._process.stderr:
+
+            log.debug("'%s' stderr: %s", self._name, line)
+
+            value = line.lower()
+            if any(e in value for e in self._ERROR_PATTERNS):
+                return line
+
+        if not self._process.is_running:
+            return f"Process exited. [{self._process.exit_code}]"
+
+        return None
+
+    def wait(self) -> list[str]:
+        """Waits until all expected ports exist.
+
+        Returns:
+            list[str]: The port names, or an empty list if the ports were not
+                registered within the deadline or the process failed. See
+                `error` for the reason.
+        """
+
+        log.debug("Waiting for %s ports '%s' [%ss] ...",
+                  self._count, self._name, self._deadline)
+
+        self._error = None
+        start = time.monotonic()
+        end = start + self._deadline
+        interval = self._POLL_INTERVAL_MIN_S
+
+        while True:
+
+            error = self._check_process()
+            if error is not None:
+                self._error = error
+                break
+
+            result = JackConnection.get_ports(self._name)
+            if result is not None and self._count == len(result):
+                log.info("Waiting for %s ports '%s' OK. [%sms]",
+                         self._count, self._name,
+                         int((time.monotonic() - start) * 1000))
+                return result
+
+            now = time.monotonic()
+            if now >= end:
+                self._error = (
+                    f"Deadline exceeded. [{len(result or [])}/{self._count}]")
+                break
+
+            time.sleep(min(interval, end - now))
+            interval = min(interval * 2, self._POLL_INTERVAL_MAX_S)
+
+        log.error("Waiting for %s ports '%s' FAILED. [%s]",
+                  self._count, self._name, self._error)
+
+        return []
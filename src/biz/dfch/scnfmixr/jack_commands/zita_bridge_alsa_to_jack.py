@@ -17,13 +17,28 @@ __all__ = [
     "ZitaBridgeAlsaToJack",
 ]
 
+from .jack_port_readiness import JackPortReadiness
 from .zita_bridge_base import ZitaBridgeBase
 
 
 class ZitaBridgeAlsaToJack(ZitaBridgeBase):
     """Creates a JACK client from an ALSA capture device."""
 
+    _ZITA_PORT_SUFFIX = "capture_"
     _ZITA_A2J_FULLNAME = "/bin/zita-a2j"
 
-    def __init__(self, name: str, device: str, channel_count: int, sampling_rate: int):
-        super().__init__(self._ZITA_A2J_FULLNAME, name, device, channel_count, sampling_rate)
+    def __init__(
+            self,
+            name: str,
+            device: str,
+            channel_count: int,
+            sampling_rate: int,
+            deadline: float = JackPortReadiness.DEFAULT_DEADLINE_S,
+    ):
+        super().__init__(
+            self._ZITA_A2J_FULLNAME,
+            name,
+            device,
+            channel_count,
+            sampling_rate,
+            deadline)
@@ -13,11 +13,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import time
-
 from biz.dfch.logging import log
 from biz.dfch.asyn import Process
 
+from .jack_port_readiness import JackPortReadiness
+
 __all__ = [
     "ZitaBridgeBase",
 ]
@@ -28,6 +28,7 @@ class ZitaBridgeBase:
 
     _JACK_CONNECT_FULLNAME = "/bin/jack_connect"
     _SAMPLING_BASERATE = 16000
+    _ZITA_PORT_SUFFIX = "capture_"
 
     def __init__(
         self,
@@ -36,7 +37,18 @@ class ZitaBridgeBase:
         device: str,
         channel_count: int,
         sampling_rate: int,
+        deadline: float = JackPortReadiness.DEFAULT_DEADLINE_S,
     ):
+        """Starts the bridge and waits until its JACK ports are registered.
+
+        Args:
+            deadline (float): The maximum time in seconds to wait for the
+                JACK ports of the bridge.
+
+        Raises:
+            RuntimeError: If the bridge failed to start or did not register
+                its ports within `deadline`.
+        """
 
         assert cmd is not None and "" != cmd.strip()
         assert name is not None and "" != name.strip()
@@ -70,9 +82,21 @@ class ZitaBridgeBase:
             capture_stdout=False,
             capture_stderr=True)
 
-        assert self._process.is_running
-        stderr = self._process.stderr
-        assert 0 == len(stderr)
+        readiness = JackPortReadiness(
+            f"{self._name}:{self._ZITA_PORT_SUFFIX}",
+            self._channel_count,
+            self._process,
+            deadline)
+
+        if not readiness.wait():
+
+            message = (f"Creating JACK client '{self._name}' for device "
+                       f"'{self._device}' FAILED. [{readiness.error}]")
+            log.error(message)
+
+            self._process.stop(force=True)
+
+            raise RuntimeError(message)
 
         log.info(
             "Created JACK '%s' for device '%s' with PID [%s] "
@@ -84,9 +108,6 @@ class ZitaBridgeBase:
             self._sampling_rate
         )
 
-        # DFTODO - fix timing and the remove this
-        time.sleep(3)
-
     @property
     def process(self) -> Process:
         """Returns process information of the started process."""
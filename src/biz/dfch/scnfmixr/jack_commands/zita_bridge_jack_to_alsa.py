@@ -17,13 +17,28 @@ __all__ = [
     "ZitaBridgeJackToAlsa",
 ]
 
+from .jack_port_readiness import JackPortReadiness
 from .zita_bridge_base import ZitaBridgeBase
 
 
 class ZitaBridgeJackToAlsa(ZitaBridgeBase):
     """Creates a JACK client from an ALSA playback device."""
 
+    _ZITA_PORT_SUFFIX = "playback_"
     _ZITA_J2A_FULLNAME = "/bin/zita-j2a"
 
-    def __init__(self, name: str, device: str, channel_count: int, sampling_rate: int):
-        super().__init__(self._ZITA_J2A_FULLNAME, name, device, channel_count, sampling_rate)
+    def __init__(
+            self,
+            name: str,
+            device: str,
+            channel_count: int,
+            sampling_rate: int,
+            deadline: float = JackPortReadiness.DEFAULT_DEADLINE_S,
+    ):
+        super().__init__(
+            self._ZITA_J2A_FULLNAME,
+            name,
+            device,
+            channel_count,
+            sampling_rate,
+            deadline)
@@ -27,6 +27,7 @@ from .jack_sink_point import JackSinkPoint
 from .jack_terminal_source_point import JackTerminalSourcePoint
 from .jack_terminal_sink_point import JackTerminalSinkPoint
 from .time_conversion import TimeConversion
+from .flac_metadata_writer import FlacMetadataWriter
 
 
 __all__ = [
@@ -42,4 +43,5 @@ __all__ = [
     "JackTerminalSourcePoint",
     "JackTerminalSinkPoint",
     "TimeConversion",
+    "FlacMetadataWriter",
 ]
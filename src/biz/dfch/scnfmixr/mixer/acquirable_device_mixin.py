@@ -30,6 +30,9 @@ class AcquirableDeviceMixin(IAcquirable, ABC):
     Implements a resource manager with message queue notification.
     """
 
+    _MESSAGE_TYPES: tuple[type, ...] = (Topology.PointLostNotification,)
+    """Message types delivered to `_on_message` while acquired."""
+
     _resource_name: str
     _is_acquired: bool
     _mq: MessageQueue
@@ -51,7 +54,7 @@ class AcquirableDeviceMixin(IAcquirable, ABC):
 
             self._mq.register(
                 self._on_message,
-                lambda e: isinstance(e, Topology.PointLostNotification))
+                message_types=self._MESSAGE_TYPES)
 
             self._mq.publish(
                 Topology.DeviceAddingNotification(name))
@@ -49,10 +49,8 @@ class AcquirableManagerMixin(IAcquirable, ABC):
 
             self._mq.register(
                 self._on_message,
-                lambda e: isinstance(
-                    e,
-                    # (SystemMessage.Shutdown, Topology.ChangedNotification)))
-                    (SystemMessage.Shutdown)))
+                # (SystemMessage.Shutdown, Topology.ChangedNotification)
+                message_types=SystemMessage.Shutdown)
 
             self._mq.publish(
                 Topology.SignalManagerStartingNotification(str(type(self))))
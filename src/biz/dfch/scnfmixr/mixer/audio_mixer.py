@@ -312,7 +312,7 @@ class AudioMixer:
         self._mq = MessageQueue.Factory.get()
         self._mq.register(
             self._on_shutdown,
-            lambda e: isinstance(e, SystemMessage.Shutdown))
+            message_types=SystemMessage.Shutdown)
 
         self._mix_bus = Mixbus()
 
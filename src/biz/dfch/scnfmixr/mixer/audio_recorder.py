@@ -25,7 +25,7 @@ from typing import (
     cast
 )
 
-from biz.dfch.asyn import Process
+from biz.dfch.asyn import Process, ThreadPool
 from biz.dfch.logging import log
 
 from ..jack_commands import (
@@ -42,6 +42,7 @@ from ..mixer import AudioMixer
 from ..public.system.messages import SystemMessage
 from ..system import MessageQueue
 
+from .flac_metadata_writer import FlacMetadataWriter
 from .time_conversion import TimeConversion
 
 
@@ -71,6 +72,12 @@ class AudioRecorder:
     _JACK_OPT_CHANNEL_COUNT = "--channels"
     _JACK_OPT_PORT_NAME = "--port"
 
+    # Maximum time to wait for jack_capture to flush and exit after the
+    # transport stopped.
+    _CAPTURE_EXIT_TIMEOUT_S: float = 10.0
+    _FINALISATION_WORKERS: int = 3
+    _FINALISATION_POOL_NAME = "finalise"
+
     _message_queue: MessageQueue
     _sync_root: threading.Lock
     _callbacks: list[Callable[[threading.Event], None]]
@@ -78,6 +85,9 @@ class AudioRecorder:
 
     _recordings: list[list[FileName]]
     _recordings_lock: threading.Lock
+    _finaliser: ThreadPool
+    _finalisations: int
+    _finalisations_done: threading.Condition
 
     state: AudioRecorder.Event
 
@@ -136,6 +146,9 @@ class AudioRecorder:
             log.info("%s: Stopping result: %s", type(
                 message).__qualname__, is_deleted)
 
+            # Metadata must be written before the application exits.
+            self.wait_for_finalisation()
+
             return
 
         if isinstance(message, msgt.RecordingCuePointCommand):
@@ -184,41 +197,56 @@ class AudioRecorder:
 
             log.debug("DeleteLastRecordingCommand")
 
-            with self._recordings_lock:
-                if self._recordings:
-                    items = self._recordings.pop()
-                else:
-                    log.error("No recordings.")
-                    self._message_queue.publish(
-                        msgt.DeleteLastRecordingNotification(False))
-                    return
+            def _worker_delete():
+                # A take that is still being finalised would be restored by
+                # the finaliser replacing the file after it was deleted.
+                self.wait_for_finalisation()
+                self._delete_last_recording(message)
 
-            result = True
-            log.debug("Try to delete last take ...")
-            for item in items:
-                log.debug("Try to delete last take ['%s'] ...", item.fullname)
-                is_deleted = item.delete()
-                result &= is_deleted
-                if is_deleted:
-                    log.info(
-                        "Try to delete last take ['%s'] SUCCEEDED.",
-                        item.fullname)
-                else:
-                    log.error(
-                        "Try to delete last take ['%s'] FAILED.",
-                        item.fullname)
-
-            if result:
-                log.info("Try to delete last take SUCCEEDED.")
-            else:
-                log.error("Try to delete last take FAILED.")
-            self._message_queue.publish(
-                msgt.DeleteLastRecordingNotification(result))
+            threading.Thread(target=_worker_delete, daemon=True).start()
 
             return
 
         log.warning("Unrecognized message: '%s'", message.id)
 
+    def _delete_last_recording(
+            self, message: msgt.DeleteLastRecordingCommand) -> None:
+        """Deletes the files of the last recording and publishes the
+        result."""
+
+        with self._recordings_lock:
+            if self._recordings:
+                items = self._recordings.pop()
+            else:
+                log.error("No recordings.")
+                self._message_queue.publish(
+                    msgt.DeleteLastRecordingNotification(
+                        False).correlate(message))
+                return
+
+        result = True
+        log.debug("Try to delete last take ...")
+        for item in items:
+            log.debug("Try to delete last take ['%s'] ...", item.fullname)
+            is_deleted = item.delete()
+            result &= is_deleted
+            if is_deleted:
+                log.info(
+                    "Try to delete last take ['%s'] SUCCEEDED.",
+                    item.fullname)
+            else:
+                log.error(
+                    "Try to delete last take ['%s'] FAILED.",
+                    item.fullname)
+
+        if result:
+            log.info("Try to delete last take SUCCEEDED.")
+        else:
+            log.error("Try to delete last take FAILED.")
+        self._message_queue.publish(
+            msgt.DeleteLastRecordingNotification(
+                result).correlate(message))
+
     def __init__(self):
 
         if not AudioRecorder.Factory._sync_root.locked():
@@ -232,18 +260,22 @@ class AudioRecorder:
         self._processes = []
         self._recordings = []
         self._recordings_lock = threading.Lock()
+        self._finaliser = ThreadPool.Factory.get(
+            self._FINALISATION_POOL_NAME, self._FINALISATION_WORKERS)
+        self._finalisations = 0
+        self._finalisations_done = threading.Condition()
         self.state = AudioRecorder.Event.STOPPED
         self.items = []
         self._cue_points_times = []
 
         self._message_queue.register(
             self._on_message,
-            lambda e: isinstance(
-                e, (msgt.RecordingStartCommand,
-                    msgt.RecordingStopCommand,
-                    msgt.RecordingCuePointCommand,
-                    msgt.DeleteLastRecordingCommand,
-                    SystemMessage.Shutdown)))
+            message_types=(msgt.RecordingStartCommand,
+                           msgt.RecordingStopCommand,
+                           msgt.RecordingCuePointCommand,
+                           msgt.DeleteLastRecordingCommand,
+                           SystemMessage.Shutdown),
+            lane=MessageQueue.Lane.DEDICATED)
 
         log.info("Initializing OK.")
 
@@ -363,9 +395,12 @@ class AudioRecorder:
         return True
 
     def stop(self) -> bool:
-        """Stops a recording."""
+        """Stops a recording.
 
-        # DFTODO - adjust to process all filenames.
+        Returns as soon as the JACK transport is stopped and all capture
+        processes exited (i.e. flushed their files). Writing the metadata
+        is queued; a `RecordingFinalisedNotification` is published per file.
+        """
 
         if self.state != AudioRecorder.Event.STARTED:
             return False
@@ -379,88 +414,113 @@ class AudioRecorder:
                   e.fullname for e in filenames])
 
         JackTransport().stop()
-        # Here we use the time that is used by jack_capture to periodically
-        # flush its buffers.
-        time.sleep(4)
 
+        # jack_capture flushes its buffers and exits on transport stop.
+        end = time.monotonic() + self._CAPTURE_EXIT_TIMEOUT_S
         for process in self._processes:
             log.debug("Waiting for process [%s] ...", process.pid)
-            # DFTODO - why do not use here "stop" or expose wait in "Process"?
-            return_code = process._popen.wait()
+            return_code = process.wait(max(0, end - time.monotonic()))
+            if return_code is None:
+                log.warning("Waiting for process [%s] FAILED. Stopping ...",
+                            process.pid)
+                process.stop(force=True)
+                return_code = process.exit_code
             log.info(
                 "Waiting for process [%s] OK. [%s]", process.pid, return_code)
 
+        self._processes.clear()
+
+        with self._sync_root:
+            cue_points_times = list(self._cue_points_times)
+
         log.info("Stopping recording OK. [%s]", [
             e.fullname for e in filenames])
         self._set_state(AudioRecorder.Event.STOPPED)
 
-        self._processes.clear()
-
-        # DFTODO - the following section needs heavy cleanup.
-        # * Extract to function
-        # * Do seekpoint / cue marker calculation only once.
-        # * Use const for cmd line options.
-        # * Rethink section locking.
+        cue_points = self._get_cue_points(cue_points_times)
         for f in filenames:
+            with self._finalisations_done:
+                self._finalisations += 1
 
-            # DFTODO - extract to function.
-            _METAFLAC_FULLNAME = "/usr/bin/metaflac"  # pylint: disable=C0103
+            if not self._finaliser.submit(
+                    ThreadPool.Priority.BACKGROUND_IO,
+                    self._run_finalise, f, cue_points):
+                self._on_finalised()
 
-            filename = f.filename
-            fullname = f.fullname
-            sample_rate: int = SampleRate.R48000.value
-            samples: list[int] = []
-            lines: list[str] = []
+        return True
 
-            # DFTODO - why do we lock this section?
-            with self._sync_root:
+    def wait_for_finalisation(self, timeout: float | None = None) -> bool:
+        """Waits until all queued files are finalised.
 
-                start_offset = self._cue_points_times[0]
-                convert = TimeConversion(start_offset, sample_rate)
-
-                track_count = 1
-                lines.append(f'FILE "{filename}" WAVE')
-
-                for point in self._cue_points_times[1:]:
-
-                    sample = convert.get_samples_aligned(point)
-                    samples.append(sample)
-
-                    lines.append(f"TRACK {track_count:02} AUDIO")
-                    lines.append(
-                        f"INDEX 01 {convert.to_cuesheet_string(point)}")
-                    track_count += 1
-
-                text = '\n'.join(lines)
-
-            cmd = [
-                _METAFLAC_FULLNAME,
-                f'--set-tag="TITLE={filename}"',
-                fullname
-            ]
-            log.debug("Setting title: [%s]", cmd)
-            Process.communicate(cmd)
-
-            cuesheet_fullname = f"/tmp/{filename}.cue"
-            cmd = [
-                _METAFLAC_FULLNAME,
-                f"--import-cuesheet-from={cuesheet_fullname}",
-                fullname
-            ]
-            log.debug("Setting cue points: [%s]", text)
-            with open(cuesheet_fullname, 'w', encoding='utf-8') as file:
-                file.write(text)
-
-            log.debug("Setting cue points: [%s]", cmd)
-            Process.communicate(cmd)
-
-            cmd = [
-                _METAFLAC_FULLNAME,
-            ]
-            for sample in samples:
-                cmd.append(f"--add-seekpoint={sample}")
-            cmd.append(fullname)
-            log.debug("Setting seek points: [%s]", cmd)
-            Process.communicate(cmd)
+        Args:
+            timeout (float | None): The maximum number of seconds to wait, or
+                `None` (default) to wait indefinitely.
 
-        return True
+        Returns:
+            bool: True, if all files are finalised; false, otherwise.
+        """
+
+        with self._finalisations_done:
+            return self._finalisations_done.wait_for(
+                lambda: 0 == self._finalisations, timeout)
+
+    def _run_finalise(self, f: FileName, cue_points: list[int]) -> None:
+        """Finalises a file and marks its finalisation as completed."""
+
+        try:
+            self._finalise(f, cue_points)
+        finally:
+            self._on_finalised()
+
+    def _on_finalised(self) -> None:
+        """Marks a finalisation as completed."""
+
+        with self._finalisations_done:
+            self._finalisations -= 1
+            self._finalisations_done.notify_all()
+
+    @staticmethod
+    def _get_cue_points(cue_points_times: list[float]) -> list[int]:
+        """Converts cue point times to samples, aligned to both FLAC and cue
+        sheet frames.
+
+        The first entry of `cue_points_times` is the start of the recording.
+        """
+
+        if not cue_points_times:
+            return []
+
+        sample_rate: int = SampleRate.R48000.value
+        convert = TimeConversion(cue_points_times[0], sample_rate)
+
+        return [convert.get_samples_aligned(e) for e in cue_points_times[1:]]
+
+    def _finalise(self, f: FileName, cue_points: list[int]) -> bool:
+        """Writes title, cue sheet and seek points of a recorded file. Runs on
+        the finalisation queue."""
+
+        filename = f.filename
+        fullname = f.fullname
+
+        log.debug("Finalising '%s' [%s] ...", fullname, cue_points)
+
+        try:
+            writer = FlacMetadataWriter(fullname)
+            writer.set_tag("TITLE", filename)
+            writer.set_cuesheet(cue_points)
+            writer.add_seekpoints(cue_points)
+            is_in_place = writer.save()
+
+            log.info("Finalising '%s' OK. [in_place: %s]",
+                     fullname, is_in_place)
+            result = True
+
+        except Exception as ex:  # pylint: disable=W0718
+            log.error("Finalising '%s' FAILED. [%s]", fullname, ex,
+                      exc_info=True)
+            result = False
+
+        self._message_queue.publish(
+            msgt.RecordingFinalisedNotification(fullname, result))
+
+        return result
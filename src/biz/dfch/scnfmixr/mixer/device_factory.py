@@ -23,12 +23,15 @@ from ..public.mixer import (
 )
 from ..public.mixer import ConnectionPolicy
 from .jack_alsa_device import JackAlsaDevice
-from .jack_bus_device import JackBusDevice
+from .jack_bus_device import EcasoundBusGroup, JackBusDevice
+from .mixbus_group_starter import MixbusGroupStarter
 
 
 class DeviceFactory:
     """Createa audio and mixer devices and device groups."""
 
+    MIXBUS_GROUP_NAME = "GRP"
+
     @staticmethod
     def create_jack_alsa(
         name: str,
@@ -61,99 +64,93 @@ class DeviceFactory:
         return result
 
     @staticmethod
-    def create_mixbus_group() -> list[JackBusDevice]:
-        """Creates a JACK mixbus device group."""
-
-        result: list[JackBusDevice] = []
-
-        mx0 = JackBusDevice(MixbusDevice.MX0.name).acquire() \
-            # pylint: disable=E0110
-        mx1 = JackBusDevice(MixbusDevice.MX1.name,  # pylint: disable=E0110
-                            channel_count=len(IsoChannelDry)).acquire()
-        mx2 = JackBusDevice(MixbusDevice.MX2.name,  # pylint: disable=E0110
-                            channel_count=len(IsoChannelWet)).acquire()
-        mx3 = JackBusDevice(MixbusDevice.MX3.name).acquire() \
-            # pylint: disable=E0110
-        mx4 = JackBusDevice(MixbusDevice.MX4.name).acquire() \
-            # pylint: disable=E0110
-        mx5 = JackBusDevice(MixbusDevice.MX5.name).acquire() \
-            # pylint: disable=E0110
-        mx6 = JackBusDevice(MixbusDevice.MX6.name).acquire() \
-            # pylint: disable=E0110
-
-        dr0 = JackBusDevice(MixbusDevice.DR0.name).acquire() \
-            # pylint: disable=E0110
-        wt0 = JackBusDevice(MixbusDevice.WT0.name).acquire() \
-            # pylint: disable=E0110
-        dr1 = JackBusDevice(MixbusDevice.DR1.name).acquire() \
-            # pylint: disable=E0110
-        wt1 = JackBusDevice(MixbusDevice.WT1.name).acquire() \
-            # pylint: disable=E0110
-        dr2 = JackBusDevice(MixbusDevice.DR2.name).acquire() \
-            # pylint: disable=E0110
-        wt2 = JackBusDevice(MixbusDevice.WT2.name).acquire() \
-            # pylint: disable=E0110
-
-        dr0.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-        dr1.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-        dr2.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-
-        mx3.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-        mx4.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-        mx5.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-        mx6.connect_to(mx0.as_sink_set(), ConnectionPolicy.DUAL)
-
-        dr0.connect_to(wt0.as_sink_set(), ConnectionPolicy.DUAL)
-        dr1.connect_to(wt1.as_sink_set(), ConnectionPolicy.DUAL)
-        dr2.connect_to(wt2.as_sink_set(), ConnectionPolicy.DUAL)
-
-        dr1.connect_to(mx3.as_sink_set(), ConnectionPolicy.DUAL)
-        dr2.connect_to(mx3.as_sink_set(), ConnectionPolicy.DUAL)
-        dr0.connect_to(mx4.as_sink_set(), ConnectionPolicy.DUAL)
-        dr2.connect_to(mx4.as_sink_set(), ConnectionPolicy.DUAL)
-        dr0.connect_to(mx5.as_sink_set(), ConnectionPolicy.DUAL)
-        dr2.connect_to(mx5.as_sink_set(), ConnectionPolicy.DUAL)
-
-        mx0.connect_to(mx1.as_sink_set(), ConnectionPolicy.DUAL)
-        dr0.sources[IsoChannelDry.MST_LEFT].connect_to(
-            mx1.sinks[IsoChannelDry.DR0_LEFT])
-        dr0.sources[IsoChannelDry.MST_RIGHT].connect_to(
-            mx1.sinks[IsoChannelDry.DR0_RIGHT])
-        dr1.sources[IsoChannelDry.MST_LEFT].connect_to(
-            mx1.sinks[IsoChannelDry.DR1_LEFT])
-        dr1.sources[IsoChannelDry.MST_RIGHT].connect_to(
-            mx1.sinks[IsoChannelDry.DR1_RIGHT])
-        dr2.sources[IsoChannelDry.MST_LEFT].connect_to(
-            mx1.sinks[IsoChannelDry.DR2_LEFT])
-        dr2.sources[IsoChannelDry.MST_RIGHT].connect_to(
-            mx1.sinks[IsoChannelDry.DR2_RIGHT])
-
-        mx0.connect_to(mx2.as_sink_set(), ConnectionPolicy.DUAL)
-        wt0.sources[IsoChannelWet.MST_LEFT].connect_to(
-            mx2.sinks[IsoChannelWet.WT0_LEFT])
-        wt0.sources[IsoChannelWet.MST_RIGHT].connect_to(
-            mx2.sinks[IsoChannelWet.WT0_RIGHT])
-        wt1.sources[IsoChannelWet.MST_LEFT].connect_to(
-            mx2.sinks[IsoChannelWet.WT1_LEFT])
-        wt1.sources[IsoChannelWet.MST_RIGHT].connect_to(
-            mx2.sinks[IsoChannelWet.WT1_RIGHT])
-        wt2.sources[IsoChannelWet.MST_LEFT].connect_to(
-            mx2.sinks[IsoChannelWet.WT2_LEFT])
-        wt2.sources[IsoChannelWet.MST_RIGHT].connect_to(
-            mx2.sinks[IsoChannelWet.WT2_RIGHT])
-
-        result.append(mx0)
-        result.append(mx1)
-        result.append(mx2)
-        result.append(mx3)
-        result.append(mx4)
-        result.append(mx5)
-        result.append(mx6)
-        result.append(dr0)
-        result.append(wt0)
-        result.append(dr1)
-        result.append(wt1)
-        result.append(dr2)
-        result.append(wt2)
-
-        return result
+    def create_mixbus_group(
+        max_workers: int = MixbusGroupStarter.MAX_WORKERS,
+        single_engine: bool = False,
+    ) -> list[JackBusDevice]:
+        """Creates a JACK mixbus device group.
+
+        The buses are acquired concurrently and connected in a single batch
+        once all of their ports are registered.
+
+        Args:
+            max_workers (int): The maximum number of buses acquired
+                concurrently.
+            single_engine (bool): If True, all buses run as chains of a
+                single ecasound process with a single JACK client; if False
+                (default), every bus starts its own process.
+        """
+
+        starter = MixbusGroupStarter(max_workers=max_workers)
+
+        group = (EcasoundBusGroup(DeviceFactory.MIXBUS_GROUP_NAME)
+                 if single_engine else None)
+
+        mx0 = starter.add(MixbusDevice.MX0.name, group=group)
+        mx1 = starter.add(MixbusDevice.MX1.name,
+                          channel_count=len(IsoChannelDry), group=group)
+        mx2 = starter.add(MixbusDevice.MX2.name,
+                          channel_count=len(IsoChannelWet), group=group)
+        mx3 = starter.add(MixbusDevice.MX3.name, group=group)
+        mx4 = starter.add(MixbusDevice.MX4.name, group=group)
+        mx5 = starter.add(MixbusDevice.MX5.name, group=group)
+        mx6 = starter.add(MixbusDevice.MX6.name, group=group)
+
+        dr0 = starter.add(MixbusDevice.DR0.name, group=group)
+        wt0 = starter.add(MixbusDevice.WT0.name, group=group)
+        dr1 = starter.add(MixbusDevice.DR1.name, group=group)
+        wt1 = starter.add(MixbusDevice.WT1.name, group=group)
+        dr2 = starter.add(MixbusDevice.DR2.name, group=group)
+        wt2 = starter.add(MixbusDevice.WT2.name, group=group)
+
+        starter.connect(dr0, mx0)
+        starter.connect(dr1, mx0)
+        starter.connect(dr2, mx0)
+
+        starter.connect(mx3, mx0)
+        starter.connect(mx4, mx0)
+        starter.connect(mx5, mx0)
+        starter.connect(mx6, mx0)
+
+        starter.connect(dr0, wt0)
+        starter.connect(dr1, wt1)
+        starter.connect(dr2, wt2)
+
+        starter.connect(dr1, mx3)
+        starter.connect(dr2, mx3)
+        starter.connect(dr0, mx4)
+        starter.connect(dr2, mx4)
+        starter.connect(dr0, mx5)
+        starter.connect(dr2, mx5)
+
+        starter.connect(mx0, mx1)
+        starter.connect_channel(dr0, IsoChannelDry.MST_LEFT,
+                                mx1, IsoChannelDry.DR0_LEFT)
+        starter.connect_channel(dr0, IsoChannelDry.MST_RIGHT,
+                                mx1, IsoChannelDry.DR0_RIGHT)
+        starter.connect_channel(dr1, IsoChannelDry.MST_LEFT,
+                                mx1, IsoChannelDry.DR1_LEFT)
+        starter.connect_channel(dr1, IsoChannelDry.MST_RIGHT,
+                                mx1, IsoChannelDry.DR1_RIGHT)
+        starter.connect_channel(dr2, IsoChannelDry.MST_LEFT,
+                                mx1, IsoChannelDry.DR2_LEFT)
+        starter.connect_channel(dr2, IsoChannelDry.MST_RIGHT,
+                                mx1, IsoChannelDry.DR2_RIGHT)
+
+        starter.connect(mx0, mx2)
+        starter.connect_channel(wt0, IsoChannelWet.MST_LEFT,
+                                mx2, IsoChannelWet.WT0_LEFT)
+        starter.connect_channel(wt0, IsoChannelWet.MST_RIGHT,
+                                mx2, IsoChannelWet.WT0_RIGHT)
+        starter.connect_channel(wt1, IsoChannelWet.MST_LEFT,
+                                mx2, IsoChannelWet.WT1_LEFT)
+        starter.connect_channel(wt1, IsoChannelWet.MST_RIGHT,
+                                mx2, IsoChannelWet.WT1_RIGHT)
+        starter.connect_channel(wt2, IsoChannelWet.MST_LEFT,
+                                mx2, IsoChannelWet.WT2_LEFT)
+        starter.connect_channel(wt2, IsoChannelWet.MST_RIGHT,
+                                mx2, IsoChannelWet.WT2_RIGHT)
+
+        starter.start()
+
+        return starter.devices
@@ -0,0 +1,661 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module flac_metadata_writer."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import IntEnum
+import os
+import shutil
+import struct
+import tempfile
+from typing import BinaryIO
+
+from biz.dfch.logging import log
+
+
+class FlacMetadataWriter:
+    """Writes VORBIS_COMMENT, CUESHEET and SEEKTABLE metadata blocks of a FLAC
+    file in a single pass.
+
+    The metadata is rewritten in place if it fits into the existing metadata
+    blocks (including PADDING). Otherwise, the file is rewritten once with
+    `PADDING_SIZE` bytes of padding for subsequent updates.
+
+    Replaces `metaflac --set-tag`, `--import-cuesheet-from` and
+    `--add-seekpoint` for recorded files. Seek points are resolved by
+    bisecting the audio frames, so the audio does not have to be decoded.
+
+    Example:
+        writer = FlacMetadataWriter("/path/to/file.flac")
+        writer.set_tag("TITLE", "file")
+        writer.set_cuesheet([20480, 40960])
+        writer.add_seekpoints([20480, 40960])
+        writer.save()
+    """
+
+    PADDING_SIZE: int = 8192
+
+    _MAGIC = b"fLaC"
+    _HEADER_SIZE = 4
+    _LAST_BLOCK_FLAG = 0x80
+    _MAX_BLOCK_LENGTH = (1 << 24) - 1
+    _STREAMINFO_LENGTH = 34
+
+    _SEEKPOINT_PLACEHOLDER = 0xFFFFFFFFFFFFFFFF
+    _SEEKPOINT_FORMAT = ">QQH"
+
+    _CUESHEET_LEAD_OUT_TRACK = 255
+    _CUESHEET_CATALOG_LENGTH = 128
+    _CUESHEET_RESERVED_LENGTH = 258
+    _CUESHEET_ISRC_LENGTH = 12
+    _CUESHEET_TRACK_RESERVED_LENGTH = 13
+    _CUESHEET_INDEX_RESERVED_LENGTH = 3
+
+    _DEFAULT_VENDOR = "reference libFLAC 1.4.3 20230623"
+
+    _COPY_BUFFER_SIZE = 1 << 20
+    _SCAN_WINDOW_SIZE = 1 << 16
+
+    # Frame header sample size codes as defined in RFC 9639 9.1.4.
+    _SAMPLE_SIZE_CODES = {1: 8, 2: 12, 4: 16, 5: 20, 6: 24, 7: 32}
+
+    class BlockType(IntEnum):
+        """FLAC metadata block types."""
+
+        STREAMINFO = 0
+        PADDING = 1
+        APPLICATION = 2
+        SEEKTABLE = 3
+        VORBIS_COMMENT = 4
+        CUESHEET = 5
+        PICTURE = 6
+
+    @dataclass(frozen=True)
+    class Frame:
+        """An audio frame located in the file."""
+
+        offset: int
+        first_sample: int
+        block_size: int
+
+        def contains(self, sample: int) -> bool:
+            """Determines whether `sample` is in this frame."""
+
+            return self.first_sample <= sample < (
+                self.first_sample + self.block_size)
+
+    _fullname: str
+    _blocks: list[tuple[int, bytes]]
+    _audio_offset: int
+    _metadata_length: int
+    _vendor: str | None
+    _comments: list[str]
+    _seekpoints: list[tuple[int, int, int]]
+    _cuesheet: bytes | None
+
+    min_block_size: int
+    max_block_size: int
+    max_frame_size: int
+    sample_rate: int
+    bits_per_sample: int
+    total_samples: int
+
+    def __init__(self, fullname: str) -> None:
+        """Reads the metadata blocks of a FLAC file.
+
+        Args:
+            fullname (str): The full path of the FLAC file.
+
+        Raises:
+            ValueError: If the file is not a FLAC file.
+        """
+
+        assert fullname and fullname.strip()
+
+        self._fullname = fullname
+        self._blocks = []
+        self._vendor = None
+        self._comments = []
+        self._seekpoints = []
+        self._cuesheet = None
+
+        with open(fullname, "rb") as file:
+            self._read(file)
+
+    @property
+    def fullname(self) -> str:
+        """The full path of the FLAC file."""
+
+        return self._fullname
+
+    @property
+    def audio_offset(self) -> int:
+        """Byte offset of the first audio frame."""
+
+        return self._audio_offset
+
+    @property
+    def comments(self) -> list[str]:
+        """The Vorbis comments as `NAME=value`."""
+
+        return list(self._comments)
+
+    @property
+    def seekpoints(self) -> list[tuple[int, int, int]]:
+        """The seek points as `(sample, offset, frame_samples)`."""
+
+        return list(self._seekpoints)
+
+    def _read(self, file: BinaryIO) -> None:
+        """Parses all metadata blocks up to the first audio frame."""
+
+        if self._MAGIC != file.read(len(self._MAGIC)):
+            raise ValueError(f"Not a FLAC file: '{self._fullname}'.")
+
+        is_last = False
+        while not is_last:
+            header = file.read(self._HEADER_SIZE)
+            if self._HEADER_SIZE != len(header):
+                raise ValueError(
+                    f"Truncated metadata block: '{self._fullname}'.")
+
+            is_last = bool(header[0] & self._LAST_BLOCK_FLAG)
+            block_type = header[0] & ~self._LAST_BLOCK_FLAG
+            length = int.from_bytes(header[1:], "big")
+            data = file.read(length)
+            if length != len(data):
+                raise ValueError(
+                    f"Truncated metadata block: '{self._fullname}'.")
+
+            match block_type:
+                case self.BlockType.PADDING:
+                    continue
+                case self.BlockType.VORBIS_COMMENT:
+                    self._parse_vorbis_comment(data)
+                case self.BlockType.SEEKTABLE:
+                    self._seekpoints.extend(
+                        struct.iter_unpack(self._SEEKPOINT_FORMAT, data))
+                case self.BlockType.CUESHEET:
+                    self._cuesheet = data
+
+            self._blocks.append((block_type, data))
+
+        self._audio_offset = file.tell()
+        self._metadata_length = self._audio_offset - len(self._MAGIC)
+
+        if (not self._blocks
+                or self.BlockType.STREAMINFO != self._blocks[0][0]
+                or self._STREAMINFO_LENGTH != len(self._blocks[0][1])):
+            raise ValueError(f"Missing STREAMINFO: '{self._fullname}'.")
+
+        self._parse_streaminfo(self._blocks[0][1])
+
+    def _parse_streaminfo(self, data: bytes) -> None:
+        """Parses block and frame sizes, sample rate and sample count."""
+
+        self.min_block_size, self.max_block_size = struct.unpack(
+            ">HH", data[0:4])
+        self.max_frame_size = int.from_bytes(data[7:10], "big")
+
+        value = int.from_bytes(data[10:18], "big")
+        self.sample_rate = value >> 44
+        self.bits_per_sample = ((value >> 36) & 0x1F) + 1
+        self.total_samples = value & ((1 << 36) - 1)
+
+    def _parse_vorbis_comment(self, data: bytes) -> None:
+        """Parses vendor string and comments (little endian)."""
+
+        pos = 0
+
+        def read_string() -> str:
+            nonlocal pos
+            (length,) = struct.unpack_from("<I", data, pos)
+            pos += 4
+            result = data[pos:pos + length].decode("utf-8")
+            pos += length
+            return result
+
+        self._vendor = read_string()
+        (count,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        self._comments = [read_string() for _ in range(count)]
+
+    def set_tag(self, name: str, value: str) -> FlacMetadataWriter:
+        """Sets a Vorbis comment. Existing comments with the same name are
+        replaced.
+
+        Args:
+            name (str): The field name (e.g. "TITLE").
+            value (str): The value.
+
+        Returns:
+            FlacMetadataWriter: This instance.
+        """
+
+        assert name and "=" not in name
+        assert all(0x20 <= ord(e) <= 0x7D for e in name), name
+        assert isinstance(value, str)
+
+        prefix = f"{name.upper()}="
+        self._comments = [
+            e for e in self._comments if not e.upper().startswith(prefix)]
+        self._comments.append(f"{name}={value}")
+
+        return self
+
+    def set_cuesheet(self, offsets: list[int]) -> FlacMetadataWriter:
+        """Sets a non CD-DA cue sheet with one track per offset.
+
+        Every track has a single `INDEX 01` at the track offset. The lead-out
+        track is placed at `total_samples`. This is what `metaflac
+        --import-cuesheet-from` creates from a cue sheet with
+        `TRACK nn AUDIO` and `INDEX 01 mm:ss:ff` entries.
+
+        Args:
+            offsets (list[int]): Track offsets in samples. Offsets should be
+                aligned to the cue sheet frame size (see `TimeConversion`).
+
+        Returns:
+            FlacMetadataWriter: This instance.
+        """
+
+        assert isinstance(offsets, list)
+        assert all(isinstance(e, int) and 0 <= e for e in offsets)
+        assert offsets == sorted(offsets)
+        assert len(offsets) < self._CUESHEET_LEAD_OUT_TRACK
+
+        if not offsets:
+            self._cuesheet = None
+            return self
+
+        result = bytearray(self._CUESHEET_CATALOG_LENGTH)
+        # Lead-in, is_cd flag and reserved bits are zero for non CD-DA.
+        result += struct.pack(">Q", 0)
+        result += bytes(1 + self._CUESHEET_RESERVED_LENGTH)
+        result += struct.pack(">B", len(offsets) + 1)
+
+        for number, offset in enumerate(offsets, 1):
+            result += self._pack_cuesheet_track(offset, number, 1)
+            # Index offset is relative to the track offset.
+            result += struct.pack(">QB", 0, 1)
+            result += bytes(self._CUESHEET_INDEX_RESERVED_LENGTH)
+
+        result += self._pack_cuesheet_track(
+            self.total_samples, self._CUESHEET_LEAD_OUT_TRACK, 0)
+
+        self._cuesheet = bytes(result)
+
+        return self
+
+    def _pack_cuesheet_track(
+            self, offset: int, number: int, index_count: int) -> bytes:
+        """Packs an audio track without ISRC and pre-emphasis."""
+
+        return (struct.pack(">QB", offset, number)
+                + bytes(self._CUESHEET_ISRC_LENGTH)
+                + bytes(1 + self._CUESHEET_TRACK_RESERVED_LENGTH)
+                + struct.pack(">B", index_count))
+
+    def add_seekpoints(self, samples: list[int]) -> FlacMetadataWriter:
+        """Adds seek points for the specified samples.
+
+        Every seek point is resolved to the frame containing the sample.
+        Samples that cannot be resolved are added as placeholders.
+
+        Args:
+            samples (list[int]): The sample numbers.
+
+        Returns:
+            FlacMetadataWriter: This instance.
+        """
+
+        assert isinstance(samples, list)
+        assert all(isinstance(e, int) and 0 <= e for e in samples)
+
+        if not samples:
+            return self
+
+        with open(self._fullname, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            for sample in samples:
+                frame = self._find_frame(file, size, sample)
+                if frame is None:
+                    log.warning("Seek point [%s] not found: '%s'.",
+                                sample, self._fullname)
+                    self._seekpoints.append(
+                        (self._SEEKPOINT_PLACEHOLDER, 0, 0))
+                    continue
+
+                self._seekpoints.append((
+                    frame.first_sample,
+                    frame.offset - self._audio_offset,
+                    frame.block_size))
+
+        # Sorted and unique, placeholders last (as required by the format).
+        points = {e[0]: e for e in self._seekpoints
+                  if self._SEEKPOINT_PLACEHOLDER != e[0]}
+        placeholders = [e for e in self._seekpoints
+                        if self._SEEKPOINT_PLACEHOLDER == e[0]]
+        self._seekpoints = [points[e] for e in sorted(points)] + placeholders
+
+        return self
+
+    def _find_frame(
+            self,
+            file: BinaryIO,
+            size: int,
+            sample: int
+    ) -> FlacMetadataWriter.Frame | None:
+        """Bisects the audio frames for the frame containing `sample`."""
+
+        if sample >= self.total_samples > 0:
+            return None
+
+        lo = self._audio_offset
+        hi = size
+        while hi - lo > self._SCAN_WINDOW_SIZE:
+            mid = (lo + hi) // 2
+            frame = self._scan_frame(file, mid, size)
+            if frame is None or frame.first_sample > sample:
+                hi = mid
+            elif frame.contains(sample):
+                return frame
+            else:
+                lo = frame.offset + 1
+
+        pos = lo
+        while (frame := self._scan_frame(file, pos, size)) is not None:
+            if frame.contains(sample):
+                return frame
+            if frame.first_sample > sample:
+                return None
+            pos = frame.offset + 1
+
+        return None
+
+    def _scan_frame(
+            self,
+            file: BinaryIO,
+            pos: int,
+            size: int
+    ) -> FlacMetadataWriter.Frame | None:
+        """Returns the first valid frame header at or after `pos`."""
+
+        while pos < size:
+            file.seek(pos)
+            # Overlap windows by the maximum frame header size.
+            data = file.read(self._SCAN_WINDOW_SIZE + 16)
+            if not data:
+                return None
+
+            idx = data.find(b"\xFF")
+            while 0 <= idx < self._SCAN_WINDOW_SIZE:
+                result = self._parse_frame_header(data, idx)
+                if result is not None:
+                    first_sample, block_size = result
+                    return self.Frame(pos + idx, first_sample, block_size)
+                idx = data.find(b"\xFF", idx + 1)
+
+            pos += self._SCAN_WINDOW_SIZE
+
+        return None
+
+    def _parse_frame_header(
+            self,
+            data: bytes,
+            pos: int
+    ) -> tuple[int, int] | None:
+        """Parses and validates a frame header (RFC 9639 9.1).
+
+        Returns:
+            tuple[int, int] | None: First sample and block size of the frame,
+                or `None` if there is no valid header at `pos`.
+        """
+
+        end = len(data)
+        if pos + 6 > end or 0xF8 != (data[pos + 1] & 0xFE):
+            return None
+
+        is_variable = bool(data[pos + 1] & 0x01)
+        block_size_code = data[pos + 2] >> 4
+        sample_rate_code = data[pos + 2] & 0x0F
+        channels_code = data[pos + 3] >> 4
+        sample_size_code = (data[pos + 3] >> 1) & 0x07
+
+        if (0 == block_size_code or 0x0F == sample_rate_code
+                or 0x0A < channels_code or data[pos + 3] & 0x01):
+            return None
+
+        if (0 != sample_size_code and self._SAMPLE_SIZE_CODES.get(
+                sample_size_code) != self.bits_per_sample):
+            return None
+
+        # Coded number (UTF-8 like, up to 36 bits).
+        idx = pos + 4
+        first = data[idx]
+        if first < 0x80:
+            count = 0
+            number = first
+        elif 0xC0 <= first < 0xFF:
+            count = 1
+            while first & (0x40 >> count):
+                count += 1
+            number = first & (0x3F >> count)
+        else:
+            return None
+
+        if idx + 1 + count > end:
+            return None
+        for byte in data[idx + 1:idx + 1 + count]:
+            if 0x80 != (byte & 0xC0):
+                return None
+            number = (number << 6) | (byte & 0x3F)
+        idx += 1 + count
+
+        match block_size_code:
+            case 1:
+                block_size = 192
+            case code if 2 <= code <= 5:
+                block_size = 576 << (code - 2)
+            case 6:
+                if idx + 1 > end:
+                    return None
+                block_size = data[idx] + 1
+                idx += 1
+            case 7:
+                if idx + 2 > end:
+                    return None
+                block_size = int.from_bytes(data[idx:idx + 2], "big") + 1
+                idx += 2
+            case code:
+                block_size = 256 << (code - 8)
+
+        if 0 < self.max_block_size < block_size:
+            return None
+
+        match sample_rate_code:
+            case 12:
+                idx += 1
+            case 13 | 14:
+                idx += 2
+
+        if idx + 1 > end or data[idx] != self._crc8(data[pos:idx]):
+            return None
+
+        first_sample = number if is_variable else number * self.max_block_size
+
+        return first_sample, block_size
+
+    @staticmethod
+    def _crc8(data: bytes) -> int:
+        """CRC-8 with polynomial x^8 + x^2 + x + 1 (0x07)."""
+
+        result = 0
+        for byte in data:
+            result = _CRC8_TABLE[result ^ byte]
+
+        return result
+
+    def _serialize_blocks(self) -> list[tuple[int, bytes]]:
+        """Returns all blocks except PADDING in their final order.
+
+        STREAMINFO stays first; SEEKTABLE, VORBIS_COMMENT and CUESHEET
+        replace existing blocks in place or are appended.
+        """
+
+        replacements: dict[int, bytes | None] = {
+            self.BlockType.SEEKTABLE: b"".join(
+                struct.pack(self._SEEKPOINT_FORMAT, *e)
+                for e in self._seekpoints) if self._seekpoints else None,
+            self.BlockType.VORBIS_COMMENT: self._pack_vorbis_comment(),
+            self.BlockType.CUESHEET: self._cuesheet,
+        }
+
+        result: list[tuple[int, bytes]] = []
+        for block_type, data in self._blocks:
+            if block_type in replacements:
+                data = replacements.pop(block_type)
+                if data is None:
+                    continue
+            result.append((block_type, data))
+
+        for block_type, data in replacements.items():
+            if data is not None:
+                result.append((block_type, data))
+
+        for block_type, data in result:
+            if self._MAX_BLOCK_LENGTH < len(data):
+                raise ValueError(
+                    f"Metadata block [{block_type}] too large: "
+                    f"'{self._fullname}'.")
+
+        return result
+
+    def _pack_vorbis_comment(self) -> bytes | None:
+        """Packs vendor string and comments (little endian)."""
+
+        if self._vendor is None and not self._comments:
+            return None
+
+        def pack_string(value: str) -> bytes:
+            data = value.encode("utf-8")
+            return struct.pack("<I", len(data)) + data
+
+        return (pack_string(self._vendor or self._DEFAULT_VENDOR)
+                + struct.pack("<I", len(self._comments))
+                + b"".join(pack_string(e) for e in self._comments))
+
+    def _pack_metadata(
+            self,
+            blocks: list[tuple[int, bytes]],
+            padding: int
+    ) -> bytes:
+        """Packs all blocks followed by a PADDING block of `padding` bytes."""
+
+        if 0 <= padding:
+            blocks = blocks + [(self.BlockType.PADDING, bytes(padding))]
+
+        result = bytearray()
+        for idx, (block_type, data) in enumerate(blocks):
+            flag = self._LAST_BLOCK_FLAG if idx == len(blocks) - 1 else 0
+            result += bytes([flag | block_type])
+            result += len(data).to_bytes(3, "big")
+            result += data
+
+        return bytes(result)
+
+    def save(self) -> bool:
+        """Writes the metadata blocks.
+
+        Returns:
+            bool: True, if the metadata was written in place; false, if the
+                file was rewritten.
+        """
+
+        blocks = self._serialize_blocks()
+        length = sum(self._HEADER_SIZE + len(e) for _, e in blocks)
+        available = self._metadata_length - length
+
+        # A PADDING block needs at least its header.
+        if 0 == available or self._HEADER_SIZE <= available:
+            padding = available - self._HEADER_SIZE if available else -1
+            metadata = self._pack_metadata(blocks, padding)
+            assert len(metadata) == self._metadata_length
+
+            with open(self._fullname, "r+b") as file:
+                file.seek(len(self._MAGIC))
+                file.write(metadata)
+
+            log.debug("Writing metadata in place OK: '%s'.", self._fullname)
+            self._blocks = blocks
+
+            return True
+
+        metadata = self._pack_metadata(blocks, self.PADDING_SIZE)
+        self._rewrite(metadata)
+
+        log.debug("Rewriting file OK: '%s'.", self._fullname)
+        self._blocks = blocks
+
+        return False
+
+    def _rewrite(self, metadata: bytes) -> None:
+        """Rewrites the file with new metadata and the original audio."""
+
+        path = os.path.dirname(os.path.abspath(self._fullname))
+        fd, temp_fullname = tempfile.mkstemp(
+            suffix=".tmp", prefix=".flac-", dir=path)
+
+        try:
+            with (os.fdopen(fd, "wb") as dst,
+                  open(self._fullname, "rb") as src):
+                dst.write(self._MAGIC)
+                dst.write(metadata)
+                src.seek(self._audio_offset)
+                shutil.copyfileobj(src, dst, self._COPY_BUFFER_SIZE)
+
+            shutil.copymode(self._fullname, temp_fullname)
+            os.replace(temp_fullname, self._fullname)
+
+        except Exception:
+            if os.path.exists(temp_fullname):
+                os.remove(temp_fullname)
+            raise
+
+        offset = len(self._MAGIC) + len(metadata)
+        delta = offset - self._audio_offset
+        self._audio_offset = offset
+        self._metadata_length = len(metadata)
+
+        log.debug("Audio moved by [%s] bytes: '%s'.", delta, self._fullname)
+
+
+def _create_crc8_table() -> list[int]:
+    """Creates the CRC-8 lookup table for polynomial 0x07."""
+
+    result = []
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (
+                crc << 1) & 0xFF
+        result.append(crc)
+
+    return result
+
+
+_CRC8_TABLE = _create_crc8_table()
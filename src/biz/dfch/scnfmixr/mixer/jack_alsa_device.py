@@ -16,7 +16,7 @@
 """Module jack_alsa_device."""
 
 from __future__ import annotations
-from threading import Lock
+from threading import Event, Lock
 from typing import cast
 
 from biz.dfch.logging import log
@@ -52,6 +52,15 @@ __all__ = [
 class JackAlsaDevice(AlsaDevice, AcquirableDeviceMixin):
     """Represents a JACK ALSA audio device."""
 
+    _MESSAGE_TYPES = (
+        Topology.PointLostNotification,
+        Topology.PointFoundNotification,
+    )
+
+    _RECOVERY_JITTER: float = 0.2
+    # Deadline of a bridge recovery retry.
+    _RECOVERY_MAX_WAIT_TIME_MS: int = 5000
+
     _sync_root: Lock
     _mq: MessageQueue
     _mgr: JackSignalManager
@@ -68,6 +77,7 @@ class JackAlsaDevice(AlsaDevice, AcquirableDeviceMixin):
 
     _best_source_interface: AlsaInterfaceInfo
     _best_sink_interface: AlsaInterfaceInfo
+    _recovery_events: dict[str, Event]
 
     def __init__(
             self,
@@ -95,6 +105,7 @@ class JackAlsaDevice(AlsaDevice, AcquirableDeviceMixin):
 
         self._sync_root = Lock()
         self._mq = MessageQueue.Factory.get()
+        self._recovery_events = {}
 
         self._mgr = JackSignalManager.Factory.get()
 
@@ -142,22 +153,37 @@ class JackAlsaDevice(AlsaDevice, AcquirableDeviceMixin):
     def _on_message(self, message: MessageBase) -> None:
         """Message handler."""
 
-        name = cast(Topology.PointLostNotification, message).value
+        name = cast(Topology.TopologyValueNotificationBase, message).value
 
         if not any(name == e.name for e in self.points):
             return
 
+        if isinstance(message, Topology.PointFoundNotification):
+            event = self._recovery_events.get(name)
+            if event is not None:
+                event.set()
+            return
+
         point = next(e for e in self.points if e.name == name)
 
-        tp = ThreadPool.Factory.get()
-        rt = Retry(spin_attempts=25,
-                   description=name)
+        event = self._recovery_events.setdefault(name, Event())
+        event.clear()
+
+        tp = ThreadPool.Factory.get(
+            ThreadPool.Factory.RECOVERY_NAME, ThreadPool.MAX_WORKERS)
+        rt = Retry(max_wait_time_ms=self._RECOVERY_MAX_WAIT_TIME_MS,
+                   spin_attempts=25,
+                   description=name,
+                   jitter=self._RECOVERY_JITTER,
+                   wake_event=event)
         if not point.is_sink:
             log.warning("Lost source point notified: '%s'.", name)
-            tp.invoke(rt.invoke, self._recreate_source_bridge, name)
+            tp.submit(ThreadPool.Priority.REALTIME_RECOVERY,
+                      rt.invoke, self._recreate_source_bridge, name)
         else:
             log.warning("Lost sink point notified: '%s'.", name)
-            tp.invoke(rt.invoke, self._recreate_sink_bridge, name)
+            tp.submit(ThreadPool.Priority.REALTIME_RECOVERY,
+                      rt.invoke, self._recreate_sink_bridge, name)
 
         return False
 
@@ -16,6 +16,7 @@
 """Module signal_point."""
 
 from __future__ import annotations
+from collections.abc import Sequence
 from threading import Lock
 
 from biz.dfch.logging import log
@@ -24,6 +25,7 @@ from biz.dfch.asyn import ThreadPool, Process
 from ..public.mixer import (
     Connection,
     ConnectionInfo,
+    Constant,
     ConnectionPolicy,
     IConnectablePointOrSet,
     IConnectableDevice,
@@ -42,6 +44,7 @@ from .jack_signal_manager import JackSignalManager
 
 __all__ = [
     "JackBusDevice",
+    "EcasoundBusGroup",
     "EcasoundCommandLineBuilder",
 ]
 
@@ -90,6 +93,186 @@ class EcasoundCommandLineBuilder:
 
         return result
 
+    def create_bus_group(
+        self,
+        client: str,
+        chains: list[tuple[str, int]],
+        encoding: Format = Format.F32_LE,
+        sample_rate: SampleRate = SampleRate.R48000,
+    ) -> list[str]:
+        """Build an ecasound command line with one chain per bus.
+
+        All chains run inside a single ecasound engine and share a single
+        JACK client. The ports of each chain are prefixed with the chain
+        name (see `get_chain_source_port_prefix`).
+
+        Args:
+            client (str): The JACK client name of the engine.
+            chains (list[tuple[str, int]]): Chain names and channel counts.
+        """
+
+        assert isinstance(client, str) and client.strip()
+        assert isinstance(chains, list) and 0 < len(chains)
+        assert isinstance(encoding, Format)
+        assert isinstance(sample_rate, SampleRate)
+
+        result = [
+            self._ECASOUND_FULLNAME,
+            # Scheduling priority SCHED_FIFO: 80
+            '-r:80',
+            # Buffer mode: realtime
+            '-B:rt',
+            '-q',
+            f'-G:jack,":{client}",notransport',
+        ]
+
+        for chain, channel_count in chains:
+
+            assert isinstance(chain, str) and chain.strip()
+            assert isinstance(channel_count, int) and 0 < channel_count
+
+            sink_prefix = self.get_chain_sink_port_prefix(chain)
+            source_prefix = self.get_chain_source_port_prefix(chain)
+
+            result.extend([
+                f'-a:"{chain}"',
+                f'-f:{encoding.name.lower()},{channel_count},'
+                f'{sample_rate.value}',
+                # LowCut / High-pass filter 80Hz
+                '-efh:80',
+                f'-i:jack,,{sink_prefix}',
+                f'-o:jack,,{source_prefix}',
+            ])
+
+        return result
+
+    @staticmethod
+    def get_chain_source_port_prefix(chain: str) -> str:
+        """Returns **`<chain>-capture`**."""
+        return (f"{chain}{Constant.JACK_INFIX}"
+                f"{Connection.get_jack_source_port_prefix()}")
+
+    @staticmethod
+    def get_chain_sink_port_prefix(chain: str) -> str:
+        """Returns **`<chain>-playback`**."""
+        return (f"{chain}{Constant.JACK_INFIX}"
+                f"{Connection.get_jack_sink_port_prefix()}")
+
+
+class EcasoundBusGroup:
+    """A single ecasound engine hosting several buses as named chains.
+
+    Instead of one realtime process and JACK client per bus, all buses added
+    to the group share one process and one JACK client. The engine is
+    started when the first bus is acquired and stopped when the last bus is
+    released. All buses must be added before the first bus is acquired.
+    """
+
+    _client: str
+    _chains: dict[str, int]
+    _sync_root: Lock
+    _ref_count: int
+    _process: Process | None
+
+    def __init__(self, name: str):
+        """Initialise an instance of this class.
+
+        Args:
+            name (str): The logical name of the group (e.g. **`GRP`**). The
+                JACK client is named **`Mixbus:<name>`**.
+        """
+
+        assert isinstance(name, str) and name.strip()
+
+        self._client = Connection.jack_mixbus_client_from_base(name)
+        self._chains = {}
+        self._sync_root = Lock()
+        self._ref_count = 0
+        self._process = None
+
+    @property
+    def client(self) -> str:
+        """Returns the JACK client name of the engine."""
+        return self._client
+
+    def add(self, name: str, channel_count: int) -> None:
+        """Adds a bus as chain to the group."""
+
+        assert isinstance(name, str) and name.strip()
+        assert isinstance(channel_count, int) and 0 < channel_count
+
+        with self._sync_root:
+
+            if self._process is not None:
+                raise RuntimeError(
+                    f"Cannot add '{name}'. Engine '{self._client}' running.")
+
+            assert name not in self._chains, name
+
+            self._chains[name] = channel_count
+
+    def get_source_port_names(self, name: str) -> list[str]:
+        """Returns the entry names of the sources of the specified bus."""
+
+        return [
+            f"{self._client}{Constant.JACK_SEPARATOR}"
+            f"{EcasoundCommandLineBuilder.get_chain_source_port_prefix(name)}"
+            f"_{idx + 1}"
+            for idx in range(self._chains[name])
+        ]
+
+    def get_sink_port_names(self, name: str) -> list[str]:
+        """Returns the entry names of the sinks of the specified bus."""
+
+        return [
+            f"{self._client}{Constant.JACK_SEPARATOR}"
+            f"{EcasoundCommandLineBuilder.get_chain_sink_port_prefix(name)}"
+            f"_{idx + 1}"
+            for idx in range(self._chains[name])
+        ]
+
+    def acquire(self) -> None:
+        """Starts the engine, if not already running."""
+
+        with self._sync_root:
+
+            self._ref_count += 1
+
+            if self._process is not None:
+                return
+
+            cmd = EcasoundCommandLineBuilder().create_bus_group(
+                client=self._client,
+                chains=list(self._chains.items()),
+            )
+            log.debug("cmd [%s]", cmd)
+
+            self._process = Process.start(
+                cmd, wait_on_completion=False,
+                capture_stdout=True,
+                capture_stderr=True)
+
+            log.info("Starting engine '%s' with %s chains OK. [%s]",
+                     self._client, len(self._chains), self._process.pid)
+
+    def release(self) -> None:
+        """Stops the engine when the last bus was released."""
+
+        with self._sync_root:
+
+            if 0 == self._ref_count:
+                return
+
+            self._ref_count -= 1
+
+            if 0 < self._ref_count or self._process is None:
+                return
+
+            self._process.stop(force=True)
+            self._process = None
+
+            log.info("Stopping engine '%s' OK.", self._client)
+
 
 class JackBusDevice(IConnectableDevice, AcquirableDeviceMixin):
     """Represents a JACK ecasound mixbus device."""
@@ -106,12 +289,30 @@ class JackBusDevice(IConnectableDevice, AcquirableDeviceMixin):
     _thread_pool: ThreadPool
 
     _process: Process | None
+    _stopping: list[Process] | None
+    _group: EcasoundBusGroup | None
+
+    def __init__(
+            self,
+            name,
+            channel_count: int = 2,
+            group: EcasoundBusGroup | None = None,
+    ):
+        """Creates a mix bus.
+
+        Args:
+            name (str): The logical name of the bus (e.g. **`MX0`**).
+            channel_count (int): The number of channels.
+            group (EcasoundBusGroup | None): If specified, the bus is hosted
+                as a chain in the shared engine of the group; otherwise the
+                bus starts its own ecasound process.
+        """
 
-    def __init__(self, name, channel_count: int = 2):
         super().__init__(Connection.jack_mixbus_client_from_base(name))
 
         assert isinstance(name, str) and name.strip()
         assert isinstance(channel_count, int) and 0 < channel_count
+        assert group is None or isinstance(group, EcasoundBusGroup)
 
         self._sync_root = Lock()
         self._mq = MessageQueue.Factory.get()
@@ -124,30 +325,48 @@ class JackBusDevice(IConnectableDevice, AcquirableDeviceMixin):
         self._source_client_name = ""
         self._sink_client_name = ""
         self._process = None
+        self._stopping = None
+        self._group = group
+
+        if group is not None:
+            group.add(name, channel_count)
 
     def do_acquire(self):
 
         self._source_client_name = Connection.jack_mixbus_client_sink_prefix(  # noqa: E501 # pylint: disable=C0301
             self._logical_name)
 
-        client = Connection.jack_mixbus_client_from_base(self._logical_name)
-        cmd = EcasoundCommandLineBuilder().create_bus(
-            client=client,
-            channel_count=self._channel_count,
-        )
-        log.debug("cmd [%s]", cmd)
-        _process = Process.start(
-            cmd, wait_on_completion=False,
-            capture_stdout=True,
-            capture_stderr=True)
-
-        log.debug("exit_code '%s'", _process.exit_code)
-        log.debug("stdout '%s'", _process.stdout)
-        log.debug("stderr '%s'", _process.stderr)
-
-        items = Connection.get_jack_source_port_names(
-            self._channel_count, client)
-        for item in items:
+        if self._group is not None:
+
+            self._group.acquire()
+
+            sources = self._group.get_source_port_names(self._logical_name)
+            sinks = self._group.get_sink_port_names(self._logical_name)
+
+        else:
+
+            client = Connection.jack_mixbus_client_from_base(
+                self._logical_name)
+            cmd = EcasoundCommandLineBuilder().create_bus(
+                client=client,
+                channel_count=self._channel_count,
+            )
+            log.debug("cmd [%s]", cmd)
+            _process = Process.start(
+                cmd, wait_on_completion=False,
+                capture_stdout=True,
+                capture_stderr=True)
+
+            log.debug("exit_code '%s'", _process.exit_code)
+            log.debug("stdout '%s'", _process.stdout)
+            log.debug("stderr '%s'", _process.stderr)
+
+            sources = Connection.get_jack_source_port_names(
+                self._channel_count, client)
+            sinks = Connection.get_jack_sink_port_names(
+                self._channel_count, client)
+
+        for item in sources:
 
             log.debug("Creating source point '%s' ...", item)
             point = self._mgr.get_jack_source_point(
@@ -157,9 +376,7 @@ class JackBusDevice(IConnectableDevice, AcquirableDeviceMixin):
             log.debug(("Creating source point '%s' OK. "
                        "Need topology notification to reflect changes."), item)
 
-        items = Connection.get_jack_sink_port_names(
-            self._channel_count, client)
-        for item in items:
+        for item in sinks:
 
             log.debug("Creating sink point '%s' ...", item)
             point = self._mgr.get_jack_sink_point(
@@ -183,12 +400,52 @@ class JackBusDevice(IConnectableDevice, AcquirableDeviceMixin):
 
             self.points.clear()
 
+        if self._group is not None:
+            self._group.release()
+            return
+
         if self._process is None:
             return
 
-        self._process.stop(force=True)
+        process = self._process
         self._process = None
 
+        # Stopped by `release_all` together with the other buses.
+        if self._stopping is not None:
+            self._stopping.append(process)
+            return
+
+        process.stop(force=True)
+
+    @staticmethod
+    def release_all(
+        devices: Sequence[JackBusDevice],
+        max_wait_time: float = 5,
+    ) -> bool:
+        """Releases buses and stops their processes in parallel.
+
+        Args:
+            devices (Sequence[JackBusDevice]): The buses to release.
+            max_wait_time (float): Maximum number of seconds to wait for
+                graceful (and for forcible) termination of the processes.
+
+        Returns:
+            bool: True, if all processes are stopped; false, otherwise.
+        """
+
+        processes: list[Process] = []
+
+        for device in devices:
+            assert isinstance(device, JackBusDevice)
+
+            device._stopping = processes
+            try:
+                device.release()
+            finally:
+                device._stopping = None
+
+        return Process.stop_all(processes, max_wait_time, force=True)
+
     def _on_message(self, message):
 
         if isinstance(message, Topology.PointLostNotification):
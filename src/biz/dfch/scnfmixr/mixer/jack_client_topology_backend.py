@@ -0,0 +1,218 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module jack_client_topology_backend."""
+
+from __future__ import annotations
+import queue
+from typing import Any
+
+from biz.dfch.logging import log
+
+from ..public.mixer import ConnectionInfo
+
+from .topology_backend import TopologyBackend
+
+__all__ = [
+    "JackClientTopologyBackend",
+]
+
+
+class JackClientTopologyBackend(TopologyBackend):
+    """Event driven topology backend.
+
+    Keeps a single persistent in-process JACK client (via the optional `jack`
+    module, https://pypi.org/project/JACK-Client/, extra `jack`) and
+    registers for port registration, port connect, port rename and client
+    registration callbacks. The callbacks run on the JACK notification thread
+    and therefore only enqueue a change token; the snapshot is built on the
+    caller's thread in `wait_for_change`.
+
+    If the module is not installed, `start` fails and
+    `TopologyBackend.Factory.create` falls back to polling `jack_lsp`.
+    """
+
+    _CLIENT_NAME = "scnfmixr-topology"
+
+    # Time to wait for further events of the same burst (e.g. a client
+    # registering all of its ports) before a snapshot is taken.
+    _SETTLE_TIME_S: float = 0.005
+
+    _EVENT_SYNC = "sync"
+    _EVENT_STOP = "stop"
+    _EVENT_PORT = "port"
+    _EVENT_CONNECT = "connect"
+    _EVENT_CLIENT = "client"
+    _EVENT_RENAME = "rename"
+    _EVENT_SHUTDOWN = "shutdown"
+
+    _client: Any
+    _changes: queue.SimpleQueue[tuple[str, str]]
+    _is_alive: bool
+
+    def __init__(self):
+
+        self._client = None
+        self._changes = queue.SimpleQueue()
+        self._is_alive = False
+
+    @property
+    def name(self) -> str:
+        return self._CLIENT_NAME
+
+    @property
+    def is_alive(self) -> bool:
+        return self._is_alive
+
+    def _on_port_registration(self, port: Any, register: bool) -> None:
+        self._changes.put((self._EVENT_PORT, f"{port.name} [{register}]"))
+
+    def _on_port_connect(self, a: Any, b: Any, connect: bool) -> None:
+        self._changes.put(
+            (self._EVENT_CONNECT, f"{a.name} {b.name} [{connect}]"))
+
+    def _on_port_rename(self, _: Any, old: str, new: str) -> None:
+        self._changes.put((self._EVENT_RENAME, f"{old} {new}"))
+
+    def _on_client_registration(self, name: str, register: bool) -> None:
+        self._changes.put((self._EVENT_CLIENT, f"{name} [{register}]"))
+
+    def _on_shutdown(self, status: Any, reason: str) -> None:
+        self._is_alive = False
+        self._changes.put((self._EVENT_SHUTDOWN, f"{status} {reason}"))
+
+    def start(self) -> bool:
+
+        if self._is_alive:
+            return True
+
+        log.debug("Starting '%s' ...", self._CLIENT_NAME)
+
+        try:
+            import jack  # pylint: disable=C0415
+
+        except ImportError as ex:
+            log.warning("Starting '%s' FAILED. Module 'jack' not available. "
+                        "[%s]", self._CLIENT_NAME, ex)
+            return False
+
+        try:
+            client = jack.Client(self._CLIENT_NAME, no_start_server=True)
+
+            client.set_port_registration_callback(
+                self._on_port_registration)
+            client.set_port_connect_callback(self._on_port_connect)
+            client.set_port_rename_callback(self._on_port_rename)
+            client.set_client_registration_callback(
+                self._on_client_registration)
+            client.set_shutdown_callback(self._on_shutdown)
+
+            client.activate()
+
+        except Exception as ex:  # pylint: disable=W0718
+            log.warning("Starting '%s' FAILED. [%s]", self._CLIENT_NAME, ex)
+            return False
+
+        self._client = client
+        self._is_alive = True
+
+        # Deliver an initial snapshot on the first wait.
+        self._changes.put((self._EVENT_SYNC, ""))
+
+        log.info("Starting '%s' OK.", self._CLIENT_NAME)
+
+        return True
+
+    def stop(self) -> None:
+
+        client = self._client
+        self._client = None
+        self._is_alive = False
+
+        self._changes.put((self._EVENT_STOP, ""))
+
+        if client is None:
+            return
+
+        log.debug("Stopping '%s' ...", self._CLIENT_NAME)
+
+        try:
+            client.deactivate()
+            client.close()
+            log.info("Stopping '%s' OK.", self._CLIENT_NAME)
+
+        except Exception as ex:  # pylint: disable=W0718
+            log.warning("Stopping '%s' FAILED. [%s]", self._CLIENT_NAME, ex)
+
+    def _drain(self) -> bool:
+        """Consumes all further events of the current burst.
+
+        Returns:
+            bool: True, if processing should continue; false, if the backend
+                was stopped or JACK shut down in the meantime.
+        """
+
+        while True:
+            try:
+                event, _ = self._changes.get(timeout=self._SETTLE_TIME_S)
+            except queue.Empty:
+                return True
+
+            if event in (self._EVENT_STOP, self._EVENT_SHUTDOWN):
+                return False
+
+    def wait_for_change(self, timeout: float) -> ConnectionInfo | None:
+
+        assert isinstance(timeout, (int, float)) and 0 <= timeout
+
+        try:
+            event, value = self._changes.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        log.debug("Received topology event '%s' [%s].", event, value)
+
+        if event in (self._EVENT_STOP, self._EVENT_SHUTDOWN):
+            return None
+
+        if not self._drain():
+            return None
+
+        client = self._client
+        if client is None:
+            return None
+
+        return ConnectionInfo(self.get_snapshot(client))
+
+    @staticmethod
+    def get_snapshot(client: Any) -> dict[tuple[str, bool], list[str]]:
+        """Gets connections with source and sink information from a JACK
+        client in the same format as `JackConnection.get_connections3`.
+
+        Args:
+            client (jack.Client): An active JACK client.
+
+        Returns:
+            dict (tuple[str, bool], list[str])
+        """
+
+        result: dict[tuple[str, bool], list[str]] = {}
+
+        for port in client.get_ports():
+            # 'input' is sink, which is an "output", contraire ...
+            key = (port.name, bool(port.is_input))
+            result[key] = [e.name for e in client.get_all_connections(port)]
+
+        return result
@@ -16,7 +16,6 @@
 """Module signal_path_lazy_manager."""
 
 from __future__ import annotations
-import logging
 import threading
 from threading import Event, Lock, Thread
 import time
@@ -26,7 +25,6 @@ from biz.dfch.logging import log
 from biz.dfch.asyn import ThreadPool
 
 from ..system import MessageQueue
-from ..jack_commands import JackConnection
 from ..public.messages import SystemMessage, Topology
 from ..public.mixer import (
     ConnectionInfo,
@@ -37,6 +35,7 @@ from ..public.mixer import (
     IConnectableSink,
     ISignalPath,
     State,
+    TopologyDelta,
 )
 
 from .acquirable_manager_mixin import AcquirableManagerMixin
@@ -45,6 +44,8 @@ from .jack_source_point import JackSourcePoint
 from .jack_sink_point import JackSinkPoint
 from .jack_terminal_source_point import JackTerminalSourcePoint
 from .jack_terminal_sink_point import JackTerminalSinkPoint
+from .topology_backend import TopologyBackend
+from .polling_topology_backend import PollingTopologyBackend
 
 
 class JackSignalManager(AcquirableManagerMixin):
@@ -67,6 +68,11 @@ class JackSignalManager(AcquirableManagerMixin):
     _info: ConnectionInfo
     _paths: dict[str, tuple[State, ISignalPath]]
     _points: dict[str, tuple[State, IConnectablePoint]]
+    _paths_by_port: dict[str, set[str]]
+    _points_by_port: dict[str, set[str]]
+    _pending_paths: set[str]
+    _pending_points: set[str]
+    _backend: TopologyBackend | None
 
     _worker_signal_stop: Event
     _worker_thread: Thread
@@ -88,37 +94,31 @@ class JackSignalManager(AcquirableManagerMixin):
         self._info = ConnectionInfo({})
         self._paths = {}
         self._points = {}
+        self._paths_by_port = {}
+        self._points_by_port = {}
+        self._pending_paths = set()
+        self._pending_points = set()
+        self._backend = None
 
         self._worker_signal_stop = Event()
         self._worker_thread = Thread(target=self._worker, daemon=True)
 
-    class SuppressNoisyDebug(logging.Filter):
-        """Supress DEBUG level logging of module MultiLineTextParser
-        and process."""
-
-        def filter(self, record) -> bool:
-
-            if (record.levelno == logging.DEBUG
-                    and record.module in ("MultiLineTextParser")):
-                return False
-            if (record.levelno in (logging.DEBUG, logging.INFO)
-                    and record.module in ("process")):
-                return False
-            return True
-
     def _worker(self) -> None:
         """Worker continuously getting JACK connections."""
 
         log.debug("_worker: Initializing ...")
 
         start = time.monotonic()
-        log_filter = JackSignalManager.SuppressNoisyDebug()
 
-        log.info("_worker: Initializing OK.")
+        if self._backend is None:
+            self._backend = TopologyBackend.Factory.create(
+                self._WAIT_INTERVAL_S)
+
+        log.info("_worker: Initializing OK. [%s]", self._backend.name)
 
         log.debug("_worker: Processing ...")
 
-        while not self._worker_signal_stop.wait(self._WAIT_INTERVAL_S):
+        while not self._worker_signal_stop.is_set():
 
             try:
                 now = time.monotonic()
@@ -127,140 +127,301 @@ class JackSignalManager(AcquirableManagerMixin):
                     start = now
                     log.debug("_worker: Keep alive [%sms].", int(delta*1000))
 
-                # DFTODO: Quirky and not thread safe. Maybe subclass and lock?
-                log.addFilter(log_filter)
-                result = JackConnection.get_connections3()
-                log.removeFilter(log_filter)
-
-                if 0 == len(result.keys()):
-                    log.warning("JackConnection returned 0 keys. [%s]", result)
+                if not self._backend.is_alive:
+                    log.warning(
+                        "_worker: Topology backend '%s' lost. "
+                        "Falling back to polling.", self._backend.name)
+                    self._backend.stop()
+                    self._backend = PollingTopologyBackend(
+                        self._WAIT_INTERVAL_S)
+                    self._backend.start()
+
+                current = self._backend.wait_for_change(
+                    self._KEEP_ALIVE_INTERVAL_S)
+                if current is None:
                     continue
 
-                current = ConnectionInfo(result)
-                if current == self._info:
+                delta = TopologyDelta.create(self._info, current)
+                if delta.is_empty:
                     continue
 
                 self._info = current
 
                 self._mq.publish(
-                    Topology.ChangedNotification(self._info))
+                    Topology.ChangedNotification(self._info, delta))
                 log.debug("Topology changed: %s", self._info)
 
-                self._update_point_state(self._info)
-                self._update_path_state(self._info)
+                self._update_point_state(self._info, delta)
+                self._update_path_state(self._info, delta)
 
             except Exception as ex:  # pylint: disable=W0718
 
                 log.error("_worker: An exception occurred. [%s]",
                           ex, exc_info=True)
+                self._worker_signal_stop.wait(self._WAIT_INTERVAL_S)
+
+        self._backend.stop()
 
         log.info("_worker: Processing stopped.")
 
-    def _update_path_state(self, topo: ConnectionInfo) -> None:
-        """Updates path states."""
+    def _get_affected_keys(
+            self,
+            items: dict[str, tuple[State, object]],
+            by_port: dict[str, set[str]],
+            pending: set[str],
+            delta: TopologyDelta | None,
+    ) -> list[str]:
+        """Returns the keys of all items to evaluate for a topology change.
+
+        Must be called while holding `_sync_root`.
+
+        Args:
+            items (dict): Either `_paths` or `_points`.
+            by_port (dict): The reverse index of `items`.
+            pending (set): Keys of `items` not yet evaluated while acquired.
+            delta (TopologyDelta | None): The change; `None` selects all.
+
+        Returns:
+            list[str]: The keys to evaluate.
+        """
+
+        if delta is None:
+            return list(items.keys())
+
+        result = set(pending)
+        for port in delta.ports:
+            result.update(by_port.get(port, ()))
+
+        return list(result)
+
+    def _update_path(
+            self,
+            key: str,
+            state: State,
+            path: ISignalPath,
+            topo: ConnectionInfo,
+    ) -> bool:
+        """Applies the State flag transitions of a single path.
+
+        Returns:
+            bool: True, if the path was evaluated; false, if it was skipped.
+        """
+
+        if not state.is_acquired:
+            log.debug(
+                "Skipped '%s'. Path '%s' not acquired.", key, path.name)
+            return False
+
+        if not path.source.is_acquired:
+            log.debug(
+                "Skipped '%s'. Source '%s' not acquired.",
+                key, path.source.name)
+            return False
+
+        if not path.sink.is_acquired:
+            log.debug(
+                "Skipped '%s'. Sink '%s' not acquired.",
+                key, path.sink.name)
+            return False
+
+        if state.has_flag(State.Flag.INITIAL):
+            if topo.is_connected_to(path.source.name, path.sink.name):
+                state.set_flag(State.Flag.OK)
+                self._mq.publish(
+                    Topology.PathConnectedNotification(key))
+            return True
+
+        if state.has_flag(State.Flag.OK):
+            if not topo.is_connected_to(
+                    path.source.name, path.sink.name):
+                state.set_flag(State.Flag.STALE)
+                self._mq.publish(Topology.PathLostNotification(key))
+            return True
+
+        if state.has_flag(State.Flag.STALE):
+            if topo.is_connected_to(path.source.name, path.sink.name):
+                state.set_flag(State.Flag.OK)
+                self._mq.publish(Topology.PathFoundNotification(key))
+            return True
+
+        if state.has_flag(State.Flag.REMOVED):
+            if topo.is_connected_to(path.source.name, path.sink.name):
+                self._mq.publish(Topology.PathZombieNotification(key))
+                log.warning(
+                    "Path '%s' is REMOVED, but still active.", key)
+
+        return True
+
+    def _update_path_state(
+            self,
+            topo: ConnectionInfo,
+            delta: TopologyDelta | None = None,
+    ) -> None:
+        """Updates path states.
+
+        Args:
+            topo (ConnectionInfo): The current topology.
+            delta (TopologyDelta | None): The change that led to `topo`. Only
+                paths depending on an affected port (and paths not yet
+                evaluated) are updated. If `None`, all paths are updated.
+        """
 
         assert isinstance(topo, ConnectionInfo)
+        assert delta is None or isinstance(delta, TopologyDelta)
 
         log.debug("Updating signal path states ...")
 
         with self._sync_root:
 
-            for key, value in self._paths.items():
+            keys = self._get_affected_keys(
+                self._paths, self._paths_by_port, self._pending_paths, delta)
 
-                state, path = value
+            for key in keys:
 
-                if not state.is_acquired:
-                    log.debug(
-                        "Skipped '%s'. Path '%s' not acquired.", key, path.name)
+                value = self._paths.get(key)
+                if value is None:
+                    self._pending_paths.discard(key)
                     continue
 
-                if not path.source.is_acquired:
-                    log.debug(
-                        "Skipped '%s'. Source '%s' not acquired.",
-                        key, path.source.name)
-                    continue
+                state, path = value
 
-                if not path.sink.is_acquired:
-                    log.debug(
-                        "Skipped '%s'. Sink '%s' not acquired.",
-                        key, path.sink.name)
-                    continue
+                if self._update_path(key, state, path, topo):
+                    self._pending_paths.discard(key)
+                else:
+                    self._pending_paths.add(key)
 
-                if state.has_flag(State.Flag.INITIAL):
-                    if topo.is_connected_to(path.source.name, path.sink.name):
-                        state.set_flag(State.Flag.OK)
-                        self._mq.publish(
-                            Topology.PathConnectedNotification(key))
-                    continue
+        log.info("Updating signal path states OK. [%s]", len(keys))
 
-                if state.has_flag(State.Flag.OK):
-                    if not topo.is_connected_to(
-                            path.source.name, path.sink.name):
-                        state.set_flag(State.Flag.STALE)
-                        self._mq.publish(Topology.PathLostNotification(key))
-                    continue
+    def _update_point(
+            self,
+            key: str,
+            state: State,
+            point: IConnectablePoint,
+            topo: ConnectionInfo,
+    ) -> bool:
+        """Applies the State flag transitions of a single point.
+
+        Returns:
+            bool: True, if the point was evaluated; false, if it was skipped.
+        """
+
+        if not state.is_acquired:
+            log.debug(
+                "Skipped '%s'. Point '%s' not acquired.",
+                key, point.name)
+            return False
+
+        if state.has_flag(State.Flag.INITIAL):
+            if topo.is_entry(point.name):
+                state.set_flag(State.Flag.OK)
+                self._mq.publish(
+                    Topology.PointActivatedNotification(key))
+            return True
 
-                if state.has_flag(State.Flag.STALE):
-                    if topo.is_connected_to(path.source.name, path.sink.name):
-                        state.set_flag(State.Flag.OK)
-                        self._mq.publish(Topology.PathFoundNotification(key))
-                    continue
+        if state.has_flag(State.Flag.OK):
+            if not topo.is_entry(point.name):
+                state.set_flag(State.Flag.STALE)
+                self._mq.publish(Topology.PointLostNotification(key))
+            return True
 
-                if state.has_flag(State.Flag.REMOVED):
-                    if topo.is_connected_to(path.source.name, path.sink.name):
-                        self._mq.publish(Topology.PathZombieNotification(key))
-                        log.warning(
-                            "Path '%s' is REMOVED, but still active.", key)
-                    continue
+        if state.has_flag(State.Flag.STALE):
+            if topo.is_entry(point.name):
+                state.set_flag(State.Flag.OK)
+                self._mq.publish(Topology.PointFoundNotification(key))
+            return True
+
+        if state.has_flag(State.Flag.REMOVED):
+            if topo.is_entry(point.name):
+                self._mq.publish(Topology.PointZombieNotification(key))
+                log.warning(
+                    "Point '%s' is REMOVED, but still active.", key)
 
-        log.info("Updating signal path states OK.")
+        return True
 
-    def _update_point_state(self, topo: ConnectionInfo) -> None:
-        """Updates point topology information."""
+    def _update_point_state(
+            self,
+            topo: ConnectionInfo,
+            delta: TopologyDelta | None = None,
+    ) -> None:
+        """Updates point topology information.
+
+        Args:
+            topo (ConnectionInfo): The current topology.
+            delta (TopologyDelta | None): The change that led to `topo`. Only
+                points on an affected port (and points not yet evaluated) are
+                updated. If `None`, all points are updated.
+        """
 
         assert isinstance(topo, ConnectionInfo)
+        assert delta is None or isinstance(delta, TopologyDelta)
 
         log.debug("Updating signal point states ...")
 
         with self._sync_root:
 
-            for key, value in self._points.items():
+            keys = self._get_affected_keys(
+                self._points, self._points_by_port, self._pending_points,
+                delta)
 
-                state, point = value
+            for key in keys:
 
-                if not state.is_acquired:
-                    log.debug(
-                        "Skipped '%s'. Point '%s' not acquired.",
-                        key, point.name)
+                value = self._points.get(key)
+                if value is None:
+                    self._pending_points.discard(key)
                     continue
 
-                if state.has_flag(State.Flag.INITIAL):
-                    if topo.is_entry(point.name):
-                        state.set_flag(State.Flag.OK)
-                        self._mq.publish(
-                            Topology.PointActivatedNotification(key))
-                    continue
+                state, point = value
 
-                if state.has_flag(State.Flag.OK):
-                    if not topo.is_entry(point.name):
-                        state.set_flag(State.Flag.STALE)
-                        self._mq.publish(Topology.PointLostNotification(key))
-                    continue
+                if self._update_point(key, state, point, topo):
+                    self._pending_points.discard(key)
+                else:
+                    self._pending_points.add(key)
 
-                if state.has_flag(State.Flag.STALE):
-                    if topo.is_entry(point.name):
-                        state.set_flag(State.Flag.OK)
-                        self._mq.publish(Topology.PointFoundNotification(key))
-                    continue
+        log.info("Updating signal point states OK. [%s]", len(keys))
 
-                if state.has_flag(State.Flag.REMOVED):
-                    if topo.is_entry(point.name):
-                        self._mq.publish(Topology.PointZombieNotification(key))
-                        log.warning(
-                            "Point '%s' is REMOVED, but still active.", key)
-                    continue
+    def _add_path(self, key: str, value: tuple[State, ISignalPath]) -> None:
+        """Adds a path and indexes it by its source and sink port.
+
+        Must be called while holding `_sync_root`.
+        """
 
-        log.info("Updating signal point states OK.")
+        _, path = value
+
+        self._paths[key] = value
+        self._paths_by_port.setdefault(path.source.name, set()).add(key)
+        self._paths_by_port.setdefault(path.sink.name, set()).add(key)
+        self._pending_paths.add(key)
+
+    def _add_point(
+            self,
+            key: str,
+            value: tuple[State, IConnectablePoint]
+    ) -> None:
+        """Adds a point and indexes it by its port.
+
+        Must be called while holding `_sync_root`.
+        """
+
+        _, point = value
+
+        self._points[key] = value
+        self._points_by_port.setdefault(point.name, set()).add(key)
+        self._pending_points.add(key)
+
+    def _invalidate_path(self, key: str) -> None:
+        """Marks a path for evaluation on the next topology change."""
+
+        with self._sync_root:
+            if key in self._paths:
+                self._pending_paths.add(key)
+
+    def _invalidate_port(self, name: str) -> None:
+        """Marks all points and paths on a port for evaluation on the next
+        topology change."""
+
+        with self._sync_root:
+            self._pending_points.update(self._points_by_port.get(name, ()))
+            self._pending_paths.update(self._paths_by_port.get(name, ()))
 
     @property
     def path_information(self) -> dict[str, tuple[State, ISignalPath]]:
@@ -308,7 +469,7 @@ class JackSignalManager(AcquirableManagerMixin):
                     _, path = value
                     key = path.name
                     if key not in self._paths:
-                        self._paths[key] = value
+                        self._add_path(key, value)
 
         except ConnectionPolicyException as ex:
             log.warning("ConnectionPolicyException: "
@@ -342,7 +503,7 @@ class JackSignalManager(AcquirableManagerMixin):
             # But the class can be instantiated at runtime.
             result = JackSourcePoint(name, info)  # pylint: disable=E0110  # noqa: E501
 
-            self._points[name] = (result.state, result)
+            self._add_point(name, (result.state, result))
 
             return result
 
@@ -365,7 +526,7 @@ class JackSignalManager(AcquirableManagerMixin):
             # But the class can be instantiated at runtime.
             result = JackTerminalSourcePoint(name, info)  # pylint: disable=E0110  # noqa: E501
 
-            self._points[name] = (result.state, result)
+            self._add_point(name, (result.state, result))
 
             return result
 
@@ -388,7 +549,7 @@ class JackSignalManager(AcquirableManagerMixin):
             # But the class can be instantiated at runtime.
             result = JackSinkPoint(name, info)  # pylint: disable=E0110
 
-            self._points[name] = (result.state, result)
+            self._add_point(name, (result.state, result))
 
             return result
 
@@ -411,7 +572,7 @@ class JackSignalManager(AcquirableManagerMixin):
             # But the class can be instantiated at runtime.
             result = JackTerminalSinkPoint(name, info)  # pylint: disable=E0110
 
-            self._points[name] = (result.state, result)
+            self._add_point(name, (result.state, result))
 
             return result
 
@@ -447,8 +608,13 @@ class JackSignalManager(AcquirableManagerMixin):
         self._worker_signal_stop.clear()
         self._worker_thread.start()
 
-        self._mq.register(self._on_message, lambda e: isinstance(
-            e, SystemMessage.Shutdown))
+        self._mq.register(
+            self._on_message,
+            message_types=(
+                SystemMessage.Shutdown,
+                Topology.PointAddedNotification,
+                Topology.PathConnectingNotification,
+            ))
 
         self._is_acquired = True
 
@@ -458,6 +624,8 @@ class JackSignalManager(AcquirableManagerMixin):
             return
 
         self._worker_signal_stop.set()
+        if self._backend is not None:
+            self._backend.stop()
 
         self._mq.unregister(self._on_message)
 
@@ -472,6 +640,16 @@ class JackSignalManager(AcquirableManagerMixin):
 
             return
 
+        # An acquired point or path may already match the current topology,
+        # so it will not be part of the next delta.
+        if isinstance(message, Topology.PointAddedNotification):
+            self._invalidate_port(message.value)
+            return
+
+        if isinstance(message, Topology.PathConnectingNotification):
+            self._invalidate_path(message.value)
+            return
+
     @property
     def is_acquired(self):
         return self._is_acquired
@@ -34,7 +34,17 @@ from biz.dfch.scnfmixr.public.messages import MessageBase
 
 
 class JackSignalPath(ISignalPath, IAcquirable):
-    """A JACK signal path implementation."""
+    """A JACK signal path implementation.
+
+    Connecting and reconnecting retry for up to `_RETRY_MAX_WAIT_TIME_MS`
+    each. They run on the unbounded recovery thread pool, so that paths
+    waiting for their ports neither occupy the default thread pool nor get
+    rejected.
+    """
+
+    # Deadline of a connect or reconnect retry; a lost path is retried again
+    # on the next `PathLostNotification`.
+    _RETRY_MAX_WAIT_TIME_MS: int = 5000
 
     _thread_pool: ThreadPool
     _mq: MessageQueue
@@ -55,7 +65,8 @@ class JackSignalPath(ISignalPath, IAcquirable):
         assert isinstance(sink, IConnectableSink)
         assert isinstance(state, State)
 
-        self._thread_pool = ThreadPool.Factory.get()
+        self._thread_pool = ThreadPool.Factory.get(
+            ThreadPool.Factory.RECOVERY_NAME, ThreadPool.MAX_WORKERS)
         self._mq = MessageQueue.Factory.get()
         self._source = source
         self._sink = sink
@@ -144,8 +155,10 @@ class JackSignalPath(ISignalPath, IAcquirable):
     def _on_message(self, _: MessageBase):
         """Message handler."""
 
-        self._thread_pool.invoke(
-            Retry(base_wait_time_interval_ms=500,
+        self._thread_pool.submit(
+            ThreadPool.Priority.REALTIME_RECOVERY,
+            Retry(max_wait_time_ms=self._RETRY_MAX_WAIT_TIME_MS,
+                  base_wait_time_interval_ms=500,
                   description=self.name).invoke, self._reconnect_path)
 
     def acquire(self):
@@ -164,13 +177,15 @@ class JackSignalPath(ISignalPath, IAcquirable):
 
         self._thread_pool.invoke(
             Retry(first_wait_time_ms=350,
+                  max_wait_time_ms=self._RETRY_MAX_WAIT_TIME_MS,
                   base_wait_time_interval_ms=200,
                   spin_attempts=25,
                   description=self.name).invoke, self._connect_path)
 
         self._mq.register(
-            self._on_message, lambda e: isinstance(
-                e, Topology.PathLostNotification) and e.value == self.name)
+            self._on_message,
+            lambda e: e.value == self.name,
+            Topology.PathLostNotification)
 
         return self
 
@@ -23,6 +23,8 @@ from ..public.mixer import IConnectableDevice
 from ..public.mixer import IConnectableSourcePoint
 from ..public.mixer import IConnectableSinkPoint
 
+from .jack_bus_device import JackBusDevice
+
 
 class Mixbus():
     """Sets up the mix bus. **WIP**."""
@@ -154,13 +156,27 @@ class Mixbus():
         return True
 
     def stop(self) -> None:
-        """Stops the bus."""
+        """Stops the bus. The processes of all `JackBusDevice` devices are
+        stopped in parallel."""
 
         log.debug("Stopping ...")
 
+        buses: list[JackBusDevice] = []
+
         for device in self.devices:
+            if isinstance(device, JackBusDevice):
+                buses.append(device)
+                continue
+
             log.debug("Releasing device '%s' ...", device.name)
             device.release()
             log.info("Releasing device '%s' OK.", device.name)
 
+        if buses:
+            log.debug("Releasing %s mix buses ...", len(buses))
+            if JackBusDevice.release_all(buses):
+                log.info("Releasing %s mix buses OK.", len(buses))
+            else:
+                log.error("Releasing %s mix buses FAILED.", len(buses))
+
         log.info("Stopping OK.")
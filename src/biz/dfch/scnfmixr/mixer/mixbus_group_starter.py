@@ -0,0 +1,403 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module mixbus_group_starter."""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from threading import Event, Lock, Semaphore
+import time
+
+from biz.dfch.asyn import ThreadPool
+from biz.dfch.logging import log
+
+from ..jack_commands import JackConnection, JackConnectionBatch
+from ..system import MessageQueue
+from ..public.messages import Topology
+from ..public.mixer import (
+    ConnectionInfo,
+    ConnectionPolicy,
+    ISignalPath,
+    State,
+)
+
+from .jack_bus_device import EcasoundBusGroup, JackBusDevice
+from .jack_signal_manager import JackSignalManager
+
+__all__ = [
+    "MixbusGroupStarter",
+]
+
+
+class MixbusGroupStarter:
+    """Brings up a group of mix buses concurrently.
+
+    All buses are acquired with a bounded number of workers. Then the
+    starter waits until the JACK ports of all buses are registered, and
+    only then creates the signal paths between them and connects them in a
+    single `JackConnectionBatch`.
+
+    Example:
+        starter = MixbusGroupStarter()
+        mx0 = starter.add("MX0")
+        dr0 = starter.add("DR0")
+        starter.connect(dr0, mx0)
+        starter.start()
+    """
+
+    MAX_WORKERS: int = ThreadPool.MAX_WORKERS
+
+    _TIMEOUT_S: float = 15.0
+    _POLL_INTERVAL_S: float = 0.5
+
+    @dataclass
+    class _Bus:
+        """Startup information of a single bus."""
+
+        device: JackBusDevice
+        ports: set[str] = field(default_factory=set)
+        acquire_ms: int = 0
+        ready_ms: int = 0
+        is_ready: bool = False
+        is_failed: bool = False
+
+        @property
+        def is_done(self) -> bool:
+            """True, if the bus is ready or will never become ready."""
+
+            return self.is_ready or self.is_failed
+
+    @dataclass(frozen=True)
+    class _Request:
+        """A connection request, resolved after acquisition."""
+
+        source: JackBusDevice
+        sink: JackBusDevice
+        policy: ConnectionPolicy
+        idx_source: int | None = None
+        idx_sink: int | None = None
+
+    _max_workers: int
+    _timeout: float
+    _sync_root: Lock
+    _signal_ready: Event
+    _buses: dict[str, _Bus]
+    _requests: list[_Request]
+    _start: float
+
+    def __init__(
+            self,
+            max_workers: int = MAX_WORKERS,
+            timeout: float = _TIMEOUT_S,
+    ):
+        """Initialise an instance of this class.
+
+        Args:
+            max_workers (int): The maximum number of buses acquired
+                concurrently (at most `ThreadPool.MAX_WORKERS`).
+            timeout (float): The maximum time in seconds to wait for the
+                port registrations of all buses.
+        """
+
+        assert isinstance(
+            max_workers, int) and 0 < max_workers <= ThreadPool.MAX_WORKERS
+        assert isinstance(timeout, (int, float)) and 0 < timeout
+
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._sync_root = Lock()
+        self._signal_ready = Event()
+        self._buses = {}
+        self._requests = []
+        self._start = 0
+
+    def add(
+            self,
+            name: str,
+            channel_count: int = 2,
+            group: EcasoundBusGroup | None = None,
+    ) -> JackBusDevice:
+        """Adds a bus to the group.
+
+        Args:
+            name (str): The logical name of the bus (e.g. **`MX0`**).
+            channel_count (int): The number of channels of the bus.
+            group (EcasoundBusGroup | None): The shared engine hosting the
+                bus, or `None` to start a separate process for the bus.
+
+        Returns:
+            JackBusDevice: The (not yet acquired) bus.
+        """
+
+        assert isinstance(name, str) and name.strip()
+        assert name not in self._buses
+
+        device = JackBusDevice(  # pylint: disable=E0110
+            name, channel_count, group)
+        self._buses[name] = MixbusGroupStarter._Bus(device)
+
+        return device
+
+    def connect(
+            self,
+            source: JackBusDevice,
+            sink: JackBusDevice,
+            policy: ConnectionPolicy = ConnectionPolicy.DUAL,
+    ) -> None:
+        """Requests a connection from all sources of `source` to the sinks of
+        `sink` with the specified policy."""
+
+        assert isinstance(source, JackBusDevice)
+        assert isinstance(sink, JackBusDevice)
+        assert isinstance(policy, ConnectionPolicy)
+
+        self._requests.append(
+            MixbusGroupStarter._Request(source, sink, policy))
+
+    def connect_channel(
+            self,
+            source: JackBusDevice,
+            idx_source: int,
+            sink: JackBusDevice,
+            idx_sink: int,
+    ) -> None:
+        """Requests a connection from a single source to a single sink."""
+
+        assert isinstance(source, JackBusDevice)
+        assert isinstance(idx_source, int) and 0 <= idx_source
+        assert isinstance(sink, JackBusDevice)
+        assert isinstance(idx_sink, int) and 0 <= idx_sink
+
+        self._requests.append(MixbusGroupStarter._Request(
+            source, sink, ConnectionPolicy.MONO, idx_source, idx_sink))
+
+    @property
+    def devices(self) -> list[JackBusDevice]:
+        """Returns all buses in the order they were added."""
+
+        return [e.device for e in self._buses.values()]
+
+    def start(self) -> bool:
+        """Acquires all buses, waits for their ports and connects them.
+
+        Returns:
+            bool: True, if all buses were acquired and all ports registered
+                in time; false, otherwise. Connections are requested in any
+                case and retried by their signal paths.
+        """
+
+        log.debug("Starting %s mix buses [workers: %s] ...",
+                  len(self._buses), self._max_workers)
+
+        self._start = time.monotonic()
+
+        mq = MessageQueue.Factory.get()
+        mq.register(
+            self._on_message, message_types=Topology.ChangedNotification)
+
+        try:
+            result = self._acquire_all()
+
+            result = self._wait_for_ports() and result
+
+        finally:
+            mq.unregister(self._on_message)
+
+        ports_ms = self._elapsed_ms()
+
+        self._connect()
+
+        total_ms = self._elapsed_ms()
+
+        if result:
+            log.info("Starting %s mix buses OK. Mixer ready. "
+                     "[ports: %sms] [total: %sms]",
+                     len(self._buses), ports_ms, total_ms)
+        else:
+            log.error("Starting %s mix buses FAILED. "
+                      "[ports: %sms] [total: %sms]",
+                      len(self._buses), ports_ms, total_ms)
+
+        return result
+
+    def stop(self) -> bool:
+        """Releases all buses. Their processes are stopped in parallel.
+
+        Returns:
+            bool: True, if all processes are stopped; false, otherwise.
+        """
+
+        log.debug("Stopping %s mix buses ...", len(self._buses))
+
+        result = JackBusDevice.release_all(self.devices)
+
+        if result:
+            log.info("Stopping %s mix buses OK.", len(self._buses))
+        else:
+            log.error("Stopping %s mix buses FAILED.", len(self._buses))
+
+        return result
+
+    def _elapsed_ms(self) -> int:
+        return int((time.monotonic() - self._start) * 1000)
+
+    def _acquire_all(self) -> bool:
+        """Acquires all buses on the thread pool and waits for them.
+
+        Returns:
+            bool: True, if all buses were acquired; false, otherwise.
+        """
+
+        tp = ThreadPool.Factory.get(
+            f"{self.__class__.__name__}-{self._max_workers}",
+            self._max_workers)
+        buses = list(self._buses.values())
+        results: list[bool] = []
+        done = Semaphore(0)
+
+        def acquire(bus: MixbusGroupStarter._Bus) -> None:
+            try:
+                results.append(self._acquire(bus))
+            finally:
+                done.release()
+
+        for bus in buses:
+            if not tp.submit(ThreadPool.Priority.UI, acquire, bus):
+                with self._sync_root:
+                    bus.is_failed = True
+                results.append(False)
+                done.release()
+
+        for _ in buses:
+            done.acquire()
+
+        return len(buses) == len(results) and all(results)
+
+    def _acquire(self, bus: _Bus) -> bool:
+        """Acquires a single bus. Runs on a worker thread."""
+
+        start = time.monotonic()
+
+        try:
+            result = bus.device.acquire() is not None
+            ports = {e.name for e in bus.device.points}
+        except Exception as ex:  # pylint: disable=W0718
+            log.error("Acquiring mix bus '%s' FAILED. [%s]",
+                      bus.device.name, ex, exc_info=True)
+            result = False
+            ports = set()
+
+        with self._sync_root:
+            bus.acquire_ms = int((time.monotonic() - start) * 1000)
+            bus.ports = ports
+            # Nothing to wait for; do not hold up the other buses.
+            bus.is_failed = not result or 0 == len(ports)
+
+        if bus.is_failed:
+            log.error("Acquiring mix bus '%s' FAILED. [ports: %s] [%sms]",
+                      bus.device.name, len(ports), bus.acquire_ms)
+        else:
+            log.debug("Acquiring mix bus '%s' OK. [%sms]",
+                      bus.device.name, bus.acquire_ms)
+
+        return not bus.is_failed
+
+    def _on_message(self, message) -> None:
+        """Message handler."""
+
+        if isinstance(message, Topology.ChangedNotification):
+            self._update(message.value)
+
+    def _update(self, info: ConnectionInfo) -> None:
+        """Marks all buses whose ports are present in `info` as ready. Sets
+        `_signal_ready` once every bus is ready or failed."""
+
+        with self._sync_root:
+
+            for bus in self._buses.values():
+
+                if bus.is_done or 0 == len(bus.ports):
+                    continue
+
+                if not all(info.is_entry(e) for e in bus.ports):
+                    continue
+
+                bus.is_ready = True
+                bus.ready_ms = self._elapsed_ms()
+
+                log.info("Mix bus '%s' ready. [acquire: %sms] [ports: %sms]",
+                         bus.device.name, bus.acquire_ms, bus.ready_ms)
+
+            if all(e.is_done for e in self._buses.values()):
+                self._signal_ready.set()
+
+    def _wait_for_ports(self) -> bool:
+        """Waits until the ports of all buses are registered. Buses that
+        failed to acquire are not waited for.
+
+        `jack_lsp` is read once for ports that were registered before the
+        acquisition of their bus completed. After that, topology
+        notifications are used when the `JackSignalManager` is running;
+        otherwise `jack_lsp` is polled every `_POLL_INTERVAL_S`.
+        """
+
+        deadline = self._start + self._timeout
+        is_polling = not JackSignalManager.Factory.get().is_acquired
+
+        self._update(ConnectionInfo(JackConnection.get_connections3()))
+
+        while not self._signal_ready.wait(self._POLL_INTERVAL_S):
+
+            if time.monotonic() > deadline:
+                with self._sync_root:
+                    missing = [e.device.name for e in self._buses.values()
+                               if not e.is_done]
+                log.error("Waiting for mix bus ports FAILED. Timeout. [%s]",
+                          missing)
+                return False
+
+            if is_polling:
+                self._update(
+                    ConnectionInfo(JackConnection.get_connections3()))
+
+        return True
+
+    def _connect(self) -> None:
+        """Creates all requested signal paths and connects them at once."""
+
+        mgr = JackSignalManager.Factory.get()
+        paths: list[tuple[State, ISignalPath]] = []
+
+        for request in self._requests:
+
+            if request.idx_source is None:
+                source = request.source.as_source_set()
+                sink = request.sink.as_sink_set()
+            else:
+                source = request.source.sources[request.idx_source]
+                sink = request.sink.sinks[request.idx_sink]
+
+            paths.extend(mgr.get_signal_paths(source, sink, request.policy))
+
+        with JackConnectionBatch() as batch:
+            for _, path in paths:
+                batch.connect(path.source.name, path.sink.name)
+
+        log.debug("Connecting %s mix bus paths %s. [%sms]",
+                  len(paths), "OK" if batch.is_ok else "FAILED",
+                  self._elapsed_ms())
+
+        # Paths keep track of (and restore) their connections from now on.
+        for _, path in paths:
+            path.acquire()
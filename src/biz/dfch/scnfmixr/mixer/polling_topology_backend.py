@@ -0,0 +1,103 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module polling_topology_backend."""
+
+from __future__ import annotations
+import logging
+from threading import Event
+
+from biz.dfch.logging import log
+
+from ..jack_commands import JackConnection
+from ..public.mixer import ConnectionInfo
+
+from .topology_backend import TopologyBackend
+
+__all__ = [
+    "PollingTopologyBackend",
+]
+
+
+class PollingTopologyBackend(TopologyBackend):
+    """Topology backend periodically invoking `jack_lsp`."""
+
+    _interval: float
+    _signal_stop: Event
+    _is_started: bool
+
+    def __init__(self, interval: float):
+
+        assert isinstance(interval, (int, float)) and 0 < interval
+
+        self._interval = interval
+        self._signal_stop = Event()
+        self._is_started = False
+
+    class SuppressNoisyDebug(logging.Filter):
+        """Supress DEBUG level logging of module MultiLineTextParser
+        and process."""
+
+        def filter(self, record) -> bool:
+
+            if (record.levelno == logging.DEBUG
+                    and record.module in ("MultiLineTextParser")):
+                return False
+            if (record.levelno in (logging.DEBUG, logging.INFO)
+                    and record.module in ("process")):
+                return False
+            return True
+
+    @property
+    def name(self) -> str:
+        return "jack_lsp"
+
+    @property
+    def is_alive(self) -> bool:
+        return self._is_started
+
+    def start(self) -> bool:
+
+        self._signal_stop.clear()
+        self._is_started = True
+
+        return True
+
+    def stop(self) -> None:
+
+        self._is_started = False
+        self._signal_stop.set()
+
+    def wait_for_change(self, timeout: float) -> ConnectionInfo | None:
+
+        assert isinstance(timeout, (int, float)) and 0 <= timeout
+
+        if self._signal_stop.wait(min(timeout, self._interval)):
+            return None
+
+        log_filter = PollingTopologyBackend.SuppressNoisyDebug()
+
+        # DFTODO: Quirky and not thread safe. Maybe subclass and lock?
+        log.addFilter(log_filter)
+        try:
+            result = JackConnection.get_connections3()
+        finally:
+            log.removeFilter(log_filter)
+
+        if 0 == len(result.keys()):
+            log.warning("JackConnection returned 0 keys. [%s]", result)
+            return None
+
+        return ConnectionInfo(result)
@@ -98,10 +98,10 @@ class SignalPathManager:
         self._mq = MessageQueue.Factory.get()
         self._mq.register(
             self._on_message,
-            lambda e: isinstance(e, (
+            message_types=(
                 AudioMixer.StoppedNotification,
                 AudioMixer.StartedNotification,
-                SystemMessage.Shutdown)))
+                SystemMessage.Shutdown))
 
         self._worker_signal_stop = Event()
         self._worker_thread = Thread(target=self._worker, daemon=True)
@@ -0,0 +1,112 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module topology_backend."""
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+
+from biz.dfch.logging import log
+
+from ..public.mixer import ConnectionInfo
+
+__all__ = [
+    "TopologyBackend",
+]
+
+
+class TopologyBackend(ABC):
+    """Source of JACK topology snapshots for the `JackSignalManager`.
+
+    A backend is started once and then repeatedly asked for the current
+    topology via `wait_for_change`. Implementations either poll `jack_lsp` or
+    react on callbacks of an in-process JACK client.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Returns the display name of the backend."""
+
+    @property
+    @abstractmethod
+    def is_alive(self) -> bool:
+        """Determines whether the backend can still deliver topology changes.
+
+        Returns:
+            bool: True, if the backend is operational; false, otherwise.
+        """
+
+    @abstractmethod
+    def start(self) -> bool:
+        """Starts the backend.
+
+        Returns:
+            bool: True, if the backend could be started; false, otherwise.
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stops the backend and wakes up any pending `wait_for_change`."""
+
+    @abstractmethod
+    def wait_for_change(self, timeout: float) -> ConnectionInfo | None:
+        """Waits for a (possible) topology change.
+
+        Args:
+            timeout (float): The maximum time in seconds to wait.
+
+        Returns:
+            ConnectionInfo | None: The current topology, or `None` if nothing
+                changed within `timeout` or the backend was stopped.
+        """
+
+    class Factory:  # pylint: disable=R0903
+        """Factory class."""
+
+        @staticmethod
+        def create(interval: float) -> TopologyBackend:
+            """Creates and starts the best available topology backend.
+
+            An event driven backend on top of an in-process JACK client is
+            preferred. If that cannot be started (e.g. the `jack` module is
+            not installed), the `jack_lsp` polling backend is returned.
+
+            Args:
+                interval (float): The polling interval in seconds of the
+                    fallback backend.
+
+            Returns:
+                TopologyBackend: A started backend.
+            """
+
+            assert isinstance(interval, (int, float)) and 0 < interval
+
+            # pylint: disable=C0415
+            from .jack_client_topology_backend import (
+                JackClientTopologyBackend
+            )
+            from .polling_topology_backend import PollingTopologyBackend
+
+            result: TopologyBackend = JackClientTopologyBackend()
+            if result.start():
+                log.info("Using topology backend '%s'.", result.name)
+                return result
+
+            result = PollingTopologyBackend(interval)
+            result.start()
+            log.info("Using topology backend '%s'.", result.name)
+
+            return result
@@ -321,9 +321,8 @@ class AudioMenu(IAcquirable):
             self._worker_thread.start()
             self._mq.register(
                 self._on_message,
-                lambda e: isinstance(
-                    e, (SystemMessage.Shutdown,
-                        SystemMessage.UiEventInfoAudioMessage)))
+                message_types=(SystemMessage.Shutdown,
+                               SystemMessage.UiEventInfoAudioMessage))
 
             self._is_acquired = True
 
@@ -275,7 +275,7 @@ class AudioPlayback(IAcquirable):
             "--list",
             fullname,
         ]
-        text, _ = Process.communicate(cmd)
+        text, _ = Process.communicate(cmd, capture_stderr=False)
 
         visitor = MetaflacVisitor()
         dic = {
@@ -492,8 +492,8 @@ class AudioPlayback(IAcquirable):
             self._worker_thread.start()
             self._mq.register(
                 self._on_message,
-                lambda e: isinstance(e, (SystemMessage.Shutdown,
-                                         IAudioPlaybackMessage)))
+                message_types=(SystemMessage.Shutdown,
+                               IAudioPlaybackMessage))
 
             self._is_acquired = True
 
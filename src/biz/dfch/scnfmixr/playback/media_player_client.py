@@ -19,7 +19,7 @@ import re
 from threading import Lock
 from typing import Callable
 
-from biz.dfch.asyn import Process
+from biz.dfch.asyn import AsyncProcess, Process
 from biz.dfch.logging import log
 
 from biz.dfch.scnfmixr.public.mixer import IAcquirable
@@ -39,6 +39,8 @@ class MediaPlayerClient(IAcquirable):
 
     _MPC_FULLNAME = "/usr/bin/mpc"
     _MPD_HOST_ENV_NAME = "MPD_HOST"
+    _MPC_TIMEOUT_S: float = 5.0
+    _MPC_ADD_BATCH_SIZE: int = 256
 
     _type: MediaPlayerType
     _sync_root: Lock
@@ -56,9 +58,9 @@ class MediaPlayerClient(IAcquirable):
         self._is_acquired = False
         self._resource_files = []
 
-        self._env = {
+        self._env = Process.Environment.create({
             self._MPD_HOST_ENV_NAME: MediaPlayerType.get_value(_type),
-        }
+        })
 
     def _invoke(self, cmd: list[str]) -> tuple[list[str], list[str]]:
         """Invokes the specified command and displays its output."""
@@ -76,6 +78,30 @@ class MediaPlayerClient(IAcquirable):
 
         return (stdout, stderr)
 
+    def _invoke_async(self, cmd: list[str]) -> tuple[list[str], list[str]]:
+        """Invokes the specified command on the shared `AsyncProcess` loop
+        with a deadline and displays its output."""
+
+        assert isinstance(cmd, list)
+        assert all(isinstance(e, str) for e in cmd)
+
+        try:
+            result = AsyncProcess.Factory.get().run_sync(
+                cmd, timeout=self._MPC_TIMEOUT_S, env=self._env)
+        except OSError as ex:
+            log.error("[%s] Starting process '%s' FAILED. [%s]",
+                      self._type.name, cmd, ex)
+            return ([], [])
+
+        if 0 < len(result.stdout):
+            log.debug("[%s] stdout: [%s]", self._type.name, result.stdout)
+
+        if 0 < len(result.stderr) or not result.is_ok:
+            log.warning("[%s] stderr: [%s] [%s]", self._type.name,
+                        result.stderr, result.return_code)
+
+        return (result.stdout, result.stderr)
+
     def _get_resource_files(self) -> list[str]:
         """Loads all resources files."""
 
@@ -135,30 +161,32 @@ class MediaPlayerClient(IAcquirable):
             self._MPC_FULLNAME,
             MediaPlayerCommand.UPDATE,
         ]
-        self._invoke(cmd)
+        self._invoke_async(cmd)
 
         cmd = [
             self._MPC_FULLNAME,
             MediaPlayerCommand.LIST_AUDIO,
         ]
-        files, _ = self._invoke(cmd)
+        files, _ = self._invoke_async(cmd)
 
-        for file in sorted(files, reverse=True):
-            if not predicate(file):
-                continue
+        files = [e for e in sorted(files, reverse=True)
+                 if predicate is None or predicate(e)]
 
+        # The queue order is the order of the files, so files are added in
+        # batches (one process each) instead of concurrently.
+        for idx in range(0, len(files), self._MPC_ADD_BATCH_SIZE):
             cmd = [
                 self._MPC_FULLNAME,
                 MediaPlayerCommand.ADD,
-                file,
+                *files[idx:idx + self._MPC_ADD_BATCH_SIZE],
             ]
-            result, _ = self._invoke(cmd)
+            self._invoke_async(cmd)
 
         cmd = [
             self._MPC_FULLNAME,
             MediaPlayerCommand.PLAYLIST,
         ]
-        result, _ = self._invoke(cmd)
+        result, _ = self._invoke_async(cmd)
 
         return result
 
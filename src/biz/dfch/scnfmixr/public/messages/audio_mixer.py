@@ -32,6 +32,8 @@ __all__ = [
 class IAudioMixerMessage(ABC):
     """Base type for all audio mixer messages."""
 
+    __slots__ = ()
+
 
 class AudioMixer:
     """AudioMixer messages."""
@@ -44,6 +46,8 @@ class AudioMixer:
             value (str): The name of the new default output.
         """
 
+        __slots__ = ("value",)
+
         value: str
 
         def __init__(self, value: str):
@@ -53,25 +57,47 @@ class AudioMixer:
 
             self.value = value
 
+        @property
+        def coalescing_key(self):
+            return AudioMixer.DefaultOutputChangedNotification
+
     class StateChangedNotification(NotificationMedium, IAudioMixerMessage):
         """StateChanged"""
 
+        __slots__ = ()
+
+        @property
+        def coalescing_key(self):
+            return AudioMixer.StateChangedNotification
+
     class ConfigurationChangingNotification(
             NotificationMedium, IAudioMixerMessage):
         """ConfigurationChanging"""
 
+        __slots__ = ()
+
     class ConfigurationChangedNotification(
             NotificationMedium, IAudioMixerMessage):
         """ConfigurationChanged"""
 
+        __slots__ = ()
+
     class StartingNotification(NotificationMedium, IAudioMixerMessage):
         """Starting"""
 
+        __slots__ = ()
+
     class StartedNotification(NotificationMedium, IAudioMixerMessage):
         """Started"""
 
+        __slots__ = ()
+
     class StoppingNotification(NotificationMedium, IAudioMixerMessage):
         """Stopping"""
 
+        __slots__ = ()
+
     class StoppedNotification(NotificationMedium, IAudioMixerMessage):
         """Stopped"""
+
+        __slots__ = ()
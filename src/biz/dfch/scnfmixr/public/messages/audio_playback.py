@@ -33,6 +33,8 @@ __all__ = [
 class IAudioPlaybackMessage(MessageBase):
     """Base type for all audio mixer messages."""
 
+    __slots__ = ()
+
 
 class AudioPlayback:
     """AudioPlayback messages."""
@@ -40,33 +42,53 @@ class AudioPlayback:
     class PlaybackStartCommand(CommandMedium, IAudioPlaybackMessage):
         """PlaybackStopCommand"""
 
+        __slots__ = ()
+
     class PlaybackStopCommand(CommandMedium, IAudioPlaybackMessage):
         """PlaybackStopCommand"""
 
+        __slots__ = ()
+
     class PauseResumeCommand(CommandMedium, IAudioPlaybackMessage):
         """PauseResumeNotification"""
 
+        __slots__ = ()
+
     class ClipStartCommand(CommandMedium, IAudioPlaybackMessage):
         """ClipStartCommand"""
 
+        __slots__ = ()
+
     class ClipEndCommand(CommandMedium, IAudioPlaybackMessage):
         """ClipEndCommand"""
 
+        __slots__ = ()
+
     class ClipPreviousCommand(CommandMedium, IAudioPlaybackMessage):
         """ClipPreviousCommand"""
 
+        __slots__ = ()
+
     class ClipNextCommand(CommandMedium, IAudioPlaybackMessage):
         """ClipNextCommand"""
 
+        __slots__ = ()
+
     class CuePointPreviousCommand(CommandMedium, IAudioPlaybackMessage):
         """CuePointPreviousCommand"""
 
+        __slots__ = ()
+
     class CuePointNextCommand(CommandMedium, IAudioPlaybackMessage):
         """CuePointNextCommand"""
 
+        __slots__ = ()
+
     class SeekAbsoluteCommand(CommandMedium, IAudioPlaybackMessage):
         """SeekAbsoluteCommand"""
 
+        __slots__ = ("value",)
+
         value: int
 
         def __init__(self, value: int):
@@ -79,6 +101,8 @@ class AudioPlayback:
     class SeekRelativeCommand(CommandMedium, IAudioPlaybackMessage):
         """SeekRelativeCommand"""
 
+        __slots__ = ("value",)
+
         value: int
 
         def __init__(self, value: int):
@@ -91,6 +115,8 @@ class AudioPlayback:
     class SeekPreviousCommand(SeekRelativeCommand, IAudioPlaybackMessage):
         """SeekPreviousCommand"""
 
+        __slots__ = ()
+
         SEEK_VALUE: int = -10
 
         value: int
@@ -105,6 +131,8 @@ class AudioPlayback:
     class SeekNextCommand(SeekRelativeCommand, IAudioPlaybackMessage):
         """SeekNextCommand"""
 
+        __slots__ = ()
+
         SEEK_VALUE: int = 30
 
         value: int
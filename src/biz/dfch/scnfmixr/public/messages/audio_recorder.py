@@ -36,6 +36,8 @@ __all__ = [
 class IAudioRecorderMessage(ABC):
     """Base type for all audio recorder messages."""
 
+    __slots__ = ()
+
 
 class AudioRecorder:
     """AudioRecorder messages."""
@@ -43,33 +45,76 @@ class AudioRecorder:
     class StateErrorMessage(NotificationMedium, IAudioRecorderMessage):
         """State Error."""
 
+        __slots__ = ()
+
     class ConfigurationChangingNotification(
             NotificationMedium, IAudioRecorderMessage):
         """Configuration Changing."""
 
+        __slots__ = ()
+
     class RecordingCrashedNotification(
             NotificationHigh, IAudioRecorderMessage):
         """RecordingCrashed."""
 
+        __slots__ = ()
+
     class ConfigurationChangedNotification(
             NotificationMedium, IAudioRecorderMessage):
         """Configuration Changed."""
 
+        __slots__ = ()
+
     class StartingNotification(NotificationMedium, IAudioRecorderMessage):
         """Status Starting."""
 
+        __slots__ = ()
+
     class StartedNotification(NotificationMedium, IAudioRecorderMessage):
         """Status Started."""
 
+        __slots__ = ()
+
     class StoppingNotification(NotificationMedium, IAudioRecorderMessage):
         """Status Stopping."""
 
+        __slots__ = ()
+
     class StoppedNotification(NotificationMedium, IAudioRecorderMessage):
         """Status Stopped."""
 
+        __slots__ = ()
+
+    class RecordingFinalisedNotification(
+            NotificationMedium, IAudioRecorderMessage):
+        """Metadata (title, cue sheet, seek points) of a recorded file was
+        written.
+
+        Attributes:
+            value (str): The full name of the file.
+            is_ok (bool): True, if all metadata could be written; false,
+                otherwise.
+        """
+
+        __slots__ = ("value", "is_ok")
+
+        value: str
+        is_ok: bool
+
+        def __init__(self, value: str, is_ok: bool = True):
+            super().__init__()
+
+            assert isinstance(value, str) and value.strip()
+            assert isinstance(is_ok, bool)
+
+            self.value = value
+            self.is_ok = is_ok
+
     class RecordingCuePointCommand(CommandMedium, IAudioRecorderMessage):
         """Request for creating a cue marker."""
 
+        __slots__ = ("value",)
+
         value: float
 
         def __init__(self, value: float = time.monotonic()):
@@ -83,6 +128,8 @@ class AudioRecorder:
                                           IAudioRecorderMessage):
         """Notification result of the DeleteLastRecording command."""
 
+        __slots__ = ("value",)
+
         value: bool
 
         def __init__(self, value: bool):
@@ -95,12 +142,18 @@ class AudioRecorder:
     class DeleteLastRecordingCommand(CommandMedium, IAudioRecorderMessage):
         """Delete the last recording."""
 
+        __slots__ = ()
+
     class RecordingStopCommand(CommandMedium, IAudioRecorderMessage):
         """Stop recording."""
 
+        __slots__ = ()
+
     class RecordingStartCommand(CommandMedium, IAudioRecorderMessage):
         """Start recording."""
 
+        __slots__ = ("items",)
+
         items: dict[str, list[FileName]]
 
         def __init__(self, items: dict[str, list[FileName]]):
@@ -118,5 +171,9 @@ class AudioRecorder:
     class RecordingPauseCommand(CommandMedium, IAudioRecorderMessage):
         """Pause recording."""
 
+        __slots__ = ()
+
     class RecordingResumeCommand(CommandMedium, IAudioRecorderMessage):
         """Resume recording."""
+
+        __slots__ = ()
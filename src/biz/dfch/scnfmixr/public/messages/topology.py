@@ -20,7 +20,7 @@ from __future__ import annotations
 from ..system import (
     NotificationMedium,
 )
-from ...public.mixer import ConnectionInfo
+from ...public.mixer import ConnectionInfo, TopologyDelta
 
 __all__ = [
     "Topology",
@@ -31,20 +31,52 @@ class Topology:
     """Topology related messages."""
 
     class ChangedNotification(NotificationMedium):
-        """Notifies about a change in topology."""
+        """Notifies about a change in topology.
+
+        Attributes:
+            value (ConnectionInfo): The current topology.
+            delta (TopologyDelta | None): The difference to the previously
+                published topology, or `None` if unknown.
+        """
+
+        __slots__ = ("value", "delta")
 
         value: ConnectionInfo
+        delta: TopologyDelta | None
 
-        def __init__(self, value: ConnectionInfo):
+        def __init__(
+                self,
+                value: ConnectionInfo,
+                delta: TopologyDelta | None = None):
             super().__init__()
 
             assert isinstance(value, ConnectionInfo)
+            assert delta is None or isinstance(delta, TopologyDelta)
 
             self.value = ConnectionInfo(value.clone())
+            self.delta = delta
+
+        @property
+        def coalescing_key(self):
+            return Topology.ChangedNotification
+
+        def coalesce(self, older):
+            """Keeps the newest topology and combines both deltas. The delta
+            is unknown if either delta is unknown."""
+
+            assert isinstance(older, Topology.ChangedNotification)
+
+            delta = None
+            if older.delta is not None and self.delta is not None:
+                delta = older.delta.merge(self.delta)
+
+            return Topology.ChangedNotification(self.value, delta)
 
     class TopologyValueNotificationBase(NotificationMedium):
         """Base notification with a value property."""
 
+        __slots__ = ("value",)
+
         value: str
 
         def __init__(self, value: str):
@@ -57,39 +89,75 @@ class Topology:
     class DeviceErrorNotification(TopologyValueNotificationBase):
         """Notification when an device error occurred."""
 
+        __slots__ = ()
+
     class DeviceAddingNotification(TopologyValueNotificationBase):
         """Notification when a new device is being added."""
 
+        __slots__ = ()
+
     class DeviceAddedNotification(TopologyValueNotificationBase):
         """Notification when a new device is added."""
 
+        __slots__ = ()
+
     class DeviceRemovingNotification(TopologyValueNotificationBase):
         """Notification when an existing device is being removed."""
 
+        __slots__ = ()
+
     class DeviceRemovedNotification(TopologyValueNotificationBase):
         """Notification when an existing device is removed."""
 
+        __slots__ = ()
+
     class PointErrorNotification(TopologyValueNotificationBase):
         """Notification when an point error occurred."""
 
+        __slots__ = ()
+
     class PointAddingNotification(TopologyValueNotificationBase):
         """Notification when a new point is being added."""
 
+        __slots__ = ()
+
     class PointAddedNotification(TopologyValueNotificationBase):
         """Notification when a new point is added."""
 
-    class PointLostNotification(TopologyValueNotificationBase):
+        __slots__ = ()
+
+    class PointStateNotificationBase(TopologyValueNotificationBase):
+        """Base notification for the availability of a point.
+
+        Only the latest availability of a point is dispatched.
+        """
+
+        __slots__ = ()
+
+        @property
+        def coalescing_key(self):
+            return (Topology.PointStateNotificationBase, self.value)
+
+    class PointLostNotification(PointStateNotificationBase):
         """Notification when a point was lost."""
 
-    class PointFoundNotification(TopologyValueNotificationBase):
+        __slots__ = ()
+
+    class PointFoundNotification(PointStateNotificationBase):
         """Notification when a point was found."""
 
+        __slots__ = ()
+
     class PointRemovingNotification(TopologyValueNotificationBase):
         """Notification when an existing point is being removed."""
 
+        __slots__ = ()
+
     class PointRemovedNotification(TopologyValueNotificationBase):
         """Notification when an existing point is removed."""
 
+        __slots__ = ()
+
     # Point: new lifecycle definitions.
     # Defining - > Defined - > Activated ->
     # possibly: Lost/Found
@@ -97,60 +165,100 @@ class Topology:
     class PointActivatedNotification(TopologyValueNotificationBase):
         """Notification when a new point has been activated."""
 
+        __slots__ = ()
+
     class PointDeactivatedNotification(TopologyValueNotificationBase):
         """Notification when an existing point has been deactivated."""
 
+        __slots__ = ()
+
     class PointZombieNotification(TopologyValueNotificationBase):
         """Notification when a removed point is stil found."""
 
+        __slots__ = ()
+
     # Path: lifecycle definitions.
     class PathErrorNotification(TopologyValueNotificationBase):
         """Notification when a new path is being added."""
 
+        __slots__ = ()
+
     class PathDefiningNotification(TopologyValueNotificationBase):
         """Notification when a new path is being defined."""
 
+        __slots__ = ()
+
     class PathDefinedNotification(TopologyValueNotificationBase):
         """Notification when a new path is defined."""
 
+        __slots__ = ()
+
     class PathConnectingNotification(TopologyValueNotificationBase):
         """Notification when a new path is waiting to be connected."""
 
+        __slots__ = ()
+
     class PathConnectedNotification(TopologyValueNotificationBase):
         """Notification when a new path is connected."""
 
+        __slots__ = ()
+
     class PathUndefiningNotification(TopologyValueNotificationBase):
         """Notification when a path is being undefined."""
 
+        __slots__ = ()
+
     class PathUndefinedNotification(TopologyValueNotificationBase):
         """Notification when a path is undefined."""
 
+        __slots__ = ()
+
     class PathDisconnectingNotification(TopologyValueNotificationBase):
         """Notification when an existing path is being disconnected."""
 
+        __slots__ = ()
+
     class PathDisconnectedNotification(TopologyValueNotificationBase):
         """Notification when an existing path is disconnected."""
 
+        __slots__ = ()
+
     class PathLostNotification(TopologyValueNotificationBase):
         """Notification when an existing path is lost."""
 
+        __slots__ = ()
+
     class PathFoundNotification(TopologyValueNotificationBase):
         """Notification when a lost path is found."""
 
+        __slots__ = ()
+
     class PathZombieNotification(TopologyValueNotificationBase):
         """Notification when a removed path is stil found."""
 
+        __slots__ = ()
+
     class SignalManagerErrorNotification(TopologyValueNotificationBase):
         """Notification when the point and path manager is in an error state."""
 
+        __slots__ = ()
+
     class SignalManagerStartingNotification(TopologyValueNotificationBase):
         """Notification when the point and path manager is starting."""
 
+        __slots__ = ()
+
     class SignalManagerStartedNotification(TopologyValueNotificationBase):
         """Notification when the point and path manager is started."""
 
+        __slots__ = ()
+
     class SignalManagerStoppingNotification(TopologyValueNotificationBase):
         """Notification when the point and path manager is stopping."""
 
+        __slots__ = ()
+
     class SignalManagerStoppedNotification(TopologyValueNotificationBase):
         """Notification when the point and path manager is stopped."""
+
+        __slots__ = ()
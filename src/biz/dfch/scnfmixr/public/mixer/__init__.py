@@ -29,6 +29,7 @@ from .file_input_or_output import FileInputOrOutput
 from .file_input import FileInput
 from .file_output import FileOutput
 from .connection_info import ConnectionInfo
+from .topology_delta import TopologyDelta
 
 from .iacquirable import IAcquirable
 
@@ -107,6 +108,7 @@ __all__ = [
 
     "Connection",
     "ConnectionInfo",
+    "TopologyDelta",
     "Constant",
     "InputOrOutput",
     "Input",
@@ -15,9 +15,11 @@
 
 """Module audio_input."""
 
+from typing import Iterable
+
 from biz.dfch.logging import log
 
-from ...jack_commands import AlsaToJack, JackPort
+from ...jack_commands import AlsaToJack, JackConnectionBatch, JackPort
 
 from ..audio import AlsaInterfaceInfo
 from ..audio import Constant
@@ -135,22 +137,7 @@ class AudioInput(AudioInputOrOutput, Input):  # pylint: disable=R0903
     ) -> bool:
         """Connect from all to all."""
 
-        for source, sink in zip(sources, sinks):
-
-            log.debug("Connecting '%s' to '%s' ...",
-                      source.name, sink.name)
-
-            result = source.connect_to(sink.name)
-
-            if not result:
-                log.error("Connecting '%s' to '%s' FAILED.",
-                          source.name, sink.name)
-                return False
-
-            log.info("Connecting '%s' to '%s' OK.",
-                     source.name, sink.name)
-
-        return True
+        return self._connect(zip(sources, sinks))
 
     def _connect_source_one_sink_all(
             self,
@@ -174,21 +161,7 @@ class AudioInput(AudioInputOrOutput, Input):  # pylint: disable=R0903
                 source_name, idx_source)
             return False
 
-        for sink in sinks:
-
-            log.debug("Connecting '%s' to '%s' ...",
-                      source.name, sink.name)
-
-            result = source.connect_to(sink.name)
-            if not result:
-                log.error("Connecting '%s' to '%s' FAILED.",
-                          source.name, sink.name)
-                return False
-
-            log.info("Connecting '%s' to '%s' OK.",
-                     source.name, sink.name)
-
-        return True
+        return self._connect((source, sink) for sink in sinks)
 
     def _connect_source_all_sink_one(
             self,
@@ -209,21 +182,7 @@ class AudioInput(AudioInputOrOutput, Input):  # pylint: disable=R0903
                         sink_name, idx_sink)
             return False
 
-        for source in sources:
-
-            log.debug("Connecting '%s' to '%s' ...",
-                      source.name, sink.name)
-
-            result = source.connect_to(sink.name)
-            if not result:
-                log.error("Connecting '%s' to '%s' FAILED.",
-                          source.name, sink.name)
-                return False
-
-            log.info("Connecting '%s' to '%s' OK.",
-                     source.name, sink.name)
-
-        return True
+        return self._connect((source, sink) for source in sources)
 
     def _connect_source_one_sink_one(
             self,
@@ -260,20 +219,30 @@ class AudioInput(AudioInputOrOutput, Input):  # pylint: disable=R0903
                         sink_name, idx_sink)
             return False
 
-        log.debug("Connecting '%s' to '%s' ...",
-                  source.name, sink.name)
+        return self._connect([(source, sink)])
 
-        result = source.connect_to(sink.name)
+    def _connect(self, edges: Iterable[tuple[JackPort, JackPort]]) -> bool:
+        """Connects all edges in a single batch.
 
-        if not result:
-            log.error("Connecting '%s' to '%s' FAILED.",
-                      source.name, sink.name)
-            return False
+        Returns:
+            bool: True, if all connections exist afterwards; false otherwise.
+        """
+
+        with JackConnectionBatch() as batch:
+            for source, sink in edges:
+                log.debug("Connecting '%s' to '%s' ...",
+                          source.name, sink.name)
+                batch.connect(source.name, sink.name)
 
-        log.info("Connecting '%s' to '%s' OK.",
-                 source.name, sink.name)
+        for result in batch.results.values():
+            if JackConnectionBatch.Status.FAILED == result.status:
+                log.error("Connecting '%s' to '%s' FAILED.",
+                          result.source, result.sink)
+            else:
+                log.info("Connecting '%s' to '%s' OK.",
+                         result.source, result.sink)
 
-        return True
+        return batch.is_ok
 
     def invoke(self):
         raise NotImplementedError
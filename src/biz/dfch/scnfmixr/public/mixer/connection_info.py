@@ -34,11 +34,23 @@ class ConnectionInfo:
     * `abcd:efgh:ijkl_1`
 
     The format of the items in the value of a key have the same format.
+
+    All indexes are built once in the constructor. Queries are answered in
+    O(1) or O(degree) time.
     """
 
     _SEPARATOR = ':'
 
     _values: dict[tuple[str, bool], list[str]]
+    _entries: frozenset[str]
+    _edges: frozenset[tuple[str, str]]
+    _sources: tuple[str, ...]
+    _sinks: tuple[str, ...]
+    _entries_by_client: dict[str, tuple[str, ...]]
+    _sources_by_client: dict[str, tuple[str, ...]]
+    _sinks_by_client: dict[str, tuple[str, ...]]
+    _connections_by_client: dict[str, tuple[tuple[str, str], ...]]
+    _adjacency: dict[str, frozenset[str]]
 
     IDX_CLIENT = 0
     IDX_PORT = 1
@@ -62,6 +74,59 @@ class ConnectionInfo:
         self._values = values
         self._values = self.clone()
 
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Builds the immutable lookup indexes from `_values`."""
+
+        entries: dict[str, None] = {}
+        sources: list[str] = []
+        sinks: list[str] = []
+        entries_by_client: dict[str, list[str]] = {}
+        sources_by_client: dict[str, list[str]] = {}
+        sinks_by_client: dict[str, list[str]] = {}
+        connections_by_client: dict[str, list[tuple[str, str]]] = {}
+        adjacency: dict[str, frozenset[str]] = {}
+
+        for (entry, is_sink), others in self._values.items():
+            client, _ = ConnectionInfo.from_entry(entry)
+
+            entries[entry] = None
+            entries_by_client.setdefault(client, []).append(entry)
+            connections = connections_by_client.setdefault(client, [])
+
+            if is_sink:
+                sinks.append(entry)
+                sinks_by_client.setdefault(client, []).append(entry)
+                connections.extend((other, entry) for other in others)
+            else:
+                sources.append(entry)
+                sources_by_client.setdefault(client, []).append(entry)
+                connections.extend((entry, other) for other in others)
+
+        # An entry is looked up as source first, then as sink.
+        for (entry, is_sink), others in self._values.items():
+            if is_sink and (entry, False) in self._values:
+                continue
+            adjacency[entry] = frozenset(others)
+
+        self._entries = frozenset(entries)
+        self._edges = frozenset(
+            edge
+            for connections in connections_by_client.values()
+            for edge in connections)
+        self._sources = tuple(sources)
+        self._sinks = tuple(sinks)
+        self._entries_by_client = {
+            k: tuple(v) for k, v in entries_by_client.items()}
+        self._sources_by_client = {
+            k: tuple(v) for k, v in sources_by_client.items()}
+        self._sinks_by_client = {
+            k: tuple(v) for k, v in sinks_by_client.items()}
+        self._connections_by_client = {
+            k: tuple(v) for k, v in connections_by_client.items()}
+        self._adjacency = adjacency
+
     @staticmethod
     def to_entry(client: str, port: str) -> str:
         """Returns the full JACK name.
@@ -110,17 +175,28 @@ class ConnectionInfo:
             list (tuple[str, str]): A list of tuples containing source and sink.
         """
 
-        result: set[tuple[str, str]] = set()
+        return list(self._edges)
 
-        for entry_type, others in self._values.items():
-            entry, is_sink = entry_type
-            for other in others:
-                if is_sink:
-                    result.add((other, entry))
-                else:
-                    result.add((entry, other))
+    @property
+    def entries(self) -> frozenset[str]:
+        """Returns all entry names (**`system:capture_1`**).
+
+        Returns:
+            frozenset (str): The names of all sources and sinks.
+        """
+
+        return self._entries
+
+    @property
+    def edges(self) -> frozenset[tuple[str, str]]:
+        """Returns all connections.
 
-        return list(result)
+        Returns:
+            frozenset (tuple[str, str]): A set of tuples containing source and
+                sink.
+        """
+
+        return self._edges
 
     @property
     def clients(self) -> dict[str, list[tuple[str, str]]]:
@@ -135,56 +211,33 @@ class ConnectionInfo:
                 value list tuple contains source/sink names.
         """
 
-        result: dict[str, list[str]] = {}
-
-        for entry_type, others in self._values.items():
-            entry, is_sink = entry_type
-            client, _ = ConnectionInfo.from_entry(entry)
-
-            if client not in result:
-                result[client] = []
-
-            for other in others:
-                if is_sink:
-                    result[client].append((other, entry))
-                else:
-                    result[client].append((entry, other))
-
-        return [(k, v) for k, v in result.items() if 0 < len(v)]
+        return [(k, list(v))
+                for k, v in self._connections_by_client.items()
+                if 0 < len(v)]
 
     @property
     def sources(self) -> list[str]:
         """Returns sources."""
-        return [e[self.IDX_NAME]
-                for e in self._values.keys() if not e[self.IDX_TYPE]]
+        return list(self._sources)
 
     def get_sources(self, value: str) -> list[str]:
         """Returns sources of specified client (eg. **`system`**)."""
 
         assert isinstance(value, str) and value.strip()
 
-        return [e[self.IDX_NAME]
-                for e in self._values.keys()
-                if not e[self.IDX_TYPE]
-                and ConnectionInfo.from_entry(
-                    e[self.IDX_CLIENT])[self.IDX_CLIENT] == value]
+        return list(self._sources_by_client.get(value, ()))
 
     @property
     def sinks(self) -> list[str]:
         """Returns sinks."""
-        return [e[self.IDX_NAME]
-                for e in self._values.keys() if e[self.IDX_TYPE]]
+        return list(self._sinks)
 
     def get_sinks(self, value: str) -> list[str]:
         """Returns sinks of specified client (eg. **`system`**)."""
 
         assert isinstance(value, str) and value.strip()
 
-        return [e[self.IDX_NAME]
-                for e in self._values.keys()
-                if e[self.IDX_TYPE]
-                and ConnectionInfo.from_entry(
-                    e[self.IDX_CLIENT])[self.IDX_CLIENT] == value]
+        return list(self._sinks_by_client.get(value, ()))
 
     def is_client(self, value: str) -> bool:
         """Determines wheter the specified client name (**`system`**) exists.
@@ -198,10 +251,7 @@ class ConnectionInfo:
 
         assert isinstance(value, str) and value.strip()
 
-        return any(
-            ConnectionInfo.from_entry(
-                e[self.IDX_NAME])[self.IDX_CLIENT] == value
-            for e in self._values)
+        return value in self._entries_by_client
 
     def is_entry(self, value: str) -> bool:
         """Determines wheter the specified entry name (**`system:capture_1`**)
@@ -216,7 +266,7 @@ class ConnectionInfo:
 
         assert isinstance(value, str) and value.strip()
 
-        return any(e[self.IDX_NAME] == value for e in self._values.keys())
+        return value in self._entries
 
     def is_source(self, value: str) -> bool:
         """Determines wheter the specified entry name (**`system:capture_1`**)
@@ -231,9 +281,7 @@ class ConnectionInfo:
 
         assert isinstance(value, str) and value.strip()
 
-        return any(e[self.IDX_NAME] == value
-                   and not e[self.IDX_TYPE]
-                   for e in self._values.keys())
+        return (value, False) in self._values
 
     def is_sink(self, value: str) -> bool:
         """Determines wheter the specified entry name (**`system:capture_1`**)
@@ -248,9 +296,7 @@ class ConnectionInfo:
 
         assert isinstance(value, str) and value.strip()
 
-        return any(e[self.IDX_NAME] == value
-                   and e[self.IDX_TYPE]
-                   for e in self._values.keys())
+        return (value, True) in self._values
 
     def has_connections(self, client: str) -> bool:
         """Determines whether the specified client name (**`system`**) has
@@ -279,11 +325,7 @@ class ConnectionInfo:
 
         assert isinstance(client, str) and client.strip()
 
-        if not self.is_client(client):
-            return []
-
-        result = self._group_by_client()[client]
-        return result
+        return list(self._connections_by_client.get(client, ()))
 
     def get_connection_entries(self, entry: str) -> list[str]:
         """Returns the connections entries for this entry name
@@ -298,14 +340,14 @@ class ConnectionInfo:
 
         assert isinstance(entry, str) and entry.strip()
 
-        if not self.is_entry(entry):
+        if entry not in self._entries:
             result: list[str] = []
             return result
 
         # Check either key combination, or default.
-        return self._values.get((entry, False),
-                                self._values.get((entry, True),
-                                                 None))
+        return list(self._values.get((entry, False),
+                                     self._values.get((entry, True),
+                                                      [])))
 
     def is_connected(self, entry: str) -> bool:
         """Determines whether the specified entry name (**`system:capture_1`**)
@@ -320,14 +362,7 @@ class ConnectionInfo:
 
         assert isinstance(entry, str) and entry.strip()
 
-        if not self.is_entry(entry):
-            return False
-
-        # Check either key combination, or default.
-        others = self._values.get((entry, False),
-                                  self._values.get((entry, True),
-                                                   None))
-        return bool(others)
+        return bool(self._adjacency.get(entry))
 
     def is_connected_to(self, entry: str, other: str) -> bool:
         """Determines whether the specified entry name (**`system:capture_1`**)
@@ -344,13 +379,10 @@ class ConnectionInfo:
         assert isinstance(entry, str) and entry.strip()
         assert isinstance(other, str) and other.strip()
 
-        if not self.is_entry(entry):
+        others = self._adjacency.get(entry)
+        if others is None:
             return False
 
-        # Check either key combination, or default.
-        others = self._values.get((entry, False),
-                                  self._values.get((entry, True),
-                                                   None))
         return other in others
 
     def get_ports(self, client: str) -> list[str]:
@@ -363,13 +395,8 @@ class ConnectionInfo:
 
         assert isinstance(client, str) and client.strip()
 
-        if not self.is_client(client):
-            return []
-
-        result = [ConnectionInfo.from_entry(e[self.IDX_NAME])[self.IDX_PORT]
-                  for e in self._values.keys()
-                  if ConnectionInfo.from_entry(
-                      e[self.IDX_NAME])[self.IDX_CLIENT] == client]
+        result = [ConnectionInfo.from_entry(e)[self.IDX_PORT]
+                  for e in self._entries_by_client.get(client, ())]
         return result
 
     def get_entries(self, client: str) -> list[str]:
@@ -382,14 +409,7 @@ class ConnectionInfo:
 
         assert isinstance(client, str) and client.strip()
 
-        if not self.is_client(client):
-            return []
-
-        result = [e[self.IDX_NAME]
-                  for e in self._values.keys()
-                  if ConnectionInfo.from_entry(
-                      e[self.IDX_NAME])[self.IDX_CLIENT] == client]
-        return result
+        return list(self._entries_by_client.get(client, ()))
 
     def _group_by_client(
             self,
@@ -411,22 +431,7 @@ class ConnectionInfo:
                 value list tuple contains port/entry or entry/entry names.
         """
 
-        result: dict[str, list[str]] = {}
-
-        for entry_type, others in self._values.items():
-            entry, is_sink = entry_type
-            client, _ = ConnectionInfo.from_entry(entry)
-
-            if client not in result:
-                result[client] = []
-
-            for other in others:
-
-                if is_sink:
-                    result[client].append((other, entry))
-                else:
-                    result[client].append((entry, other))
-        return result
+        return {k: list(v) for k, v in self._connections_by_client.items()}
 
     def clone(self) -> dict[tuple[str, bool], list[str]]:
         """Deep clone and sort the connection info."""
@@ -0,0 +1,126 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module topology_delta."""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+from .connection_info import ConnectionInfo
+
+__all__ = [
+    "TopologyDelta",
+]
+
+
+@dataclass(frozen=True)
+class TopologyDelta:
+    """Difference between two consecutive topology snapshots.
+
+    Attributes:
+        ports_added (frozenset[str]): Entries (**`system:capture_1`**) only
+            present in the current snapshot.
+        ports_removed (frozenset[str]): Entries only present in the previous
+            snapshot.
+        edges_added (frozenset[tuple[str, str]]): Connections as tuples of
+            source and sink only present in the current snapshot.
+        edges_removed (frozenset[tuple[str, str]]): Connections only present
+            in the previous snapshot.
+    """
+
+    ports_added: frozenset[str] = field(default_factory=frozenset)
+    ports_removed: frozenset[str] = field(default_factory=frozenset)
+    edges_added: frozenset[tuple[str, str]] = field(default_factory=frozenset)
+    edges_removed: frozenset[tuple[str, str]] = field(
+        default_factory=frozenset)
+
+    @staticmethod
+    def create(
+            previous: ConnectionInfo,
+            current: ConnectionInfo,
+    ) -> TopologyDelta:
+        """Computes the difference between two snapshots.
+
+        Args:
+            previous (ConnectionInfo): The previous topology.
+            current (ConnectionInfo): The current topology.
+
+        Returns:
+            TopologyDelta: The difference from `previous` to `current`.
+        """
+
+        assert isinstance(previous, ConnectionInfo)
+        assert isinstance(current, ConnectionInfo)
+
+        return TopologyDelta(
+            ports_added=current.entries - previous.entries,
+            ports_removed=previous.entries - current.entries,
+            edges_added=current.edges - previous.edges,
+            edges_removed=previous.edges - current.edges,
+        )
+
+    def merge(self, newer: TopologyDelta) -> TopologyDelta:
+        """Combines this delta with the delta of the following snapshot.
+
+        Args:
+            newer (TopologyDelta): The difference from the snapshot this
+                delta leads to, to a later snapshot.
+
+        Returns:
+            TopologyDelta: The difference from the previous snapshot of this
+                delta to the current snapshot of `newer`.
+        """
+
+        assert isinstance(newer, TopologyDelta)
+
+        return TopologyDelta(
+            ports_added=(self.ports_added - newer.ports_removed)
+            | (newer.ports_added - self.ports_removed),
+            ports_removed=(self.ports_removed - newer.ports_added)
+            | (newer.ports_removed - self.ports_added),
+            edges_added=(self.edges_added - newer.edges_removed)
+            | (newer.edges_added - self.edges_removed),
+            edges_removed=(self.edges_removed - newer.edges_added)
+            | (newer.edges_removed - self.edges_added),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Determines whether the topology did not change."""
+
+        return not (self.ports_added
+                    or self.ports_removed
+                    or self.edges_added
+                    or self.edges_removed)
+
+    @property
+    def ports(self) -> frozenset[str]:
+        """Returns the names of all entries affected by this change.
+
+        This includes added and removed entries as well as both ends of every
+        added or removed connection.
+        """
+
+        result = set(self.ports_added)
+        result.update(self.ports_removed)
+
+        for source, sink in self.edges_added:
+            result.add(source)
+            result.add(sink)
+
+        for source, sink in self.edges_removed:
+            result.add(source)
+            result.add(sink)
+
+        return frozenset(result)
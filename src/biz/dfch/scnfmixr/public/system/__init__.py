@@ -40,6 +40,7 @@ from .message_low import (
     NotificationLow,
 )
 from .message_priority import MessagePriority
+from .overflow_policy import OverflowPolicy
 
 
 __all__ = [
@@ -58,5 +59,6 @@ __all__ = [
     "CommandLow",
     "NotificationLow",
     "MessagePriority",
+    "OverflowPolicy",
     "SystemTime",
 ]
@@ -17,9 +17,13 @@
 
 from __future__ import annotations
 from abc import ABC
-from dataclasses import dataclass
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field, FrozenInstanceError
+from itertools import count
+from typing import ClassVar, Self
 
 from .message_priority import MessagePriority
+from .overflow_policy import OverflowPolicy
 
 
 __all__ = [
@@ -32,29 +36,51 @@ __all__ = [
 class IMessage:
     """Base interface for all messages."""
 
+    __slots__ = ()
+
 
 class ICommand(IMessage):
     """Base interface for all commands."""
 
+    __slots__ = ()
+
 
 class INotification(IMessage):
     """Base interface for all notifications."""
 
+    __slots__ = ()
+
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=False)
 class MessageBase(ABC, IMessage):
     """A base class for messages.
 
+    Messages are slotted: a subclass must declare its attributes in
+    `__slots__`, or its instances get a `__dict__`. The fields of this class
+    are read-only. Messages compare by identity.
+
     Attributes:
+        id (int): A unique, increasing number.
         name (str): The full qualified type name.
         priority (MessagePriority): The message priority.
             Default: `MessagePriority.DEFAULT`.
+        correlation_id (int | None): Pairs a request with its reply. Set by
+            the `ReplyRouter` on requests and by `correlate` on replies.
     """
 
-    id: str
-    name: str
+    VALIDATE: ClassVar[bool] = False
+    """Enables type checks of messages on creation and on publish. The checks
+    cost time on every message; enable them while debugging."""
+
+    _IDS: ClassVar[Iterator[int]] = count(1)
+    _NAMES: ClassVar[dict[type, str]] = {}
+    _FIELDS: ClassVar[frozenset[str]] = frozenset(
+        ("id", "priority", "correlation_id", "_children"))
+
+    id: int
     priority: MessagePriority
-    children: list[MessageBase]
+    correlation_id: int | None
+    _children: list[MessageBase] | None = field(default=None, repr=False)
 
     def __init__(
             self,
@@ -67,15 +93,25 @@ class MessageBase(ABC, IMessage):
                 Default: `MessagePriority.DEFAULT`.
         """
 
-        assert priority and isinstance(priority, MessagePriority)
+        if MessageBase.VALIDATE:
+            assert priority and isinstance(priority, MessagePriority)
+
         object.__setattr__(self, "priority", priority)
+        object.__setattr__(self, "id", next(MessageBase._IDS))
+        object.__setattr__(self, "correlation_id", None)
+        object.__setattr__(self, "_children", None)
 
-        _type = type(self)
-        object.__setattr__(self, "name", MessageBase.get_fqcn(_type))
+    def __setattr__(self, name: str, value) -> None:
+        """Makes the fields of this class read-only.
 
-        object.__setattr__(self, "id", str(id(self)))
+        `frozen=True` cannot be combined with `slots=True` for subclasses
+        that set attributes of their own in Python 3.11.
+        """
 
-        object.__setattr__(self, "children", [])
+        if name in MessageBase._FIELDS:
+            raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+        object.__setattr__(self, name, value)
 
     @staticmethod
     def get_fqcn(_type: type) -> str:
@@ -84,3 +120,89 @@ class MessageBase(ABC, IMessage):
         assert _type
 
         return f"{_type.__module__}.{_type.__qualname__}"
+
+    @property
+    def name(self) -> str:
+        """Returns the full qualified type name."""
+
+        _type = type(self)
+
+        result = MessageBase._NAMES.get(_type)
+        if result is None:
+            result = MessageBase._NAMES.setdefault(
+                _type, MessageBase.get_fqcn(_type))
+
+        return result
+
+    @property
+    def children(self) -> list[MessageBase]:
+        """Returns the child messages. The list is created on first use."""
+
+        if self._children is None:
+            object.__setattr__(self, "_children", [])
+
+        return self._children
+
+    @property
+    def coalescing_key(self) -> Hashable | None:
+        """Returns the key of the state this message describes.
+
+        A queued, not yet dispatched message with the same key is superseded
+        by this message. Messages that describe an event rather than a state
+        must not be coalesced.
+
+        Returns:
+            Hashable | None: The key, or `None` (default) to never coalesce.
+        """
+
+        return None
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """Returns what the message queue does with this message when its
+        queue is full.
+
+        Messages that are worthless once stale, such as UI prompts, should
+        drop the oldest queued message of their type instead of blocking the
+        publisher.
+
+        Returns:
+            OverflowPolicy: The policy. Default: `OverflowPolicy.BLOCK`.
+        """
+
+        return OverflowPolicy.BLOCK
+
+    def coalesce(self, older: MessageBase) -> MessageBase:
+        """Returns the message to dispatch instead of `older` and this
+        message. The default returns this message unchanged.
+
+        Args:
+            older (MessageBase): The queued message with the same
+                `coalescing_key`.
+
+        Returns:
+            MessageBase: The merged message.
+        """
+
+        assert older is not None
+
+        return self
+
+    def correlate(self, request: MessageBase | int) -> Self:
+        """Marks this message as the reply to a request.
+
+        Args:
+            request (MessageBase | int): The request or its correlation id.
+
+        Returns:
+            Self: This message.
+        """
+
+        if isinstance(request, MessageBase):
+            request = request.correlation_id
+
+        assert request is None or isinstance(request, int)
+
+        object.__setattr__(self, "correlation_id", request)
+
+        return self
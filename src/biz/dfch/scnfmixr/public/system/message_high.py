@@ -37,6 +37,8 @@ class MessageHigh(MessageBase, IMessage):  # pylint: disable=R0903
     Attributes:
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(MessagePriority.HIGH)
 
@@ -44,6 +46,10 @@ class MessageHigh(MessageBase, IMessage):  # pylint: disable=R0903
 class CommandHigh(MessageHigh, ICommand):  # pylint: disable=R0903
     """A command message with priority `MessagePriority.HIGH`"""
 
+    __slots__ = ()
+
 
 class NotificationHigh(MessageHigh, INotification):  # pylint: disable=R0903
     """A notification message with priority `MessagePriority.HIGH`"""
+
+    __slots__ = ()
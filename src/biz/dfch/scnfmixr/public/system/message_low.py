@@ -36,6 +36,8 @@ class MessageLow(MessageBase):  # pylint: disable=R0903
     Attributes:
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(MessagePriority.LOW)
 
@@ -43,6 +45,10 @@ class MessageLow(MessageBase):  # pylint: disable=R0903
 class CommandLow(MessageLow, ICommand):  # pylint: disable=R0903
     """A command message with priority `MessagePriority.LOW`"""
 
+    __slots__ = ()
+
 
 class NotificationLow(MessageLow, INotification):  # pylint: disable=R0903
     """A notification message with priority `MessagePriority.LOW`"""
+
+    __slots__ = ()
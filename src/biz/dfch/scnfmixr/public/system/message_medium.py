@@ -40,6 +40,8 @@ class MessageMedium(MessageBase, IMessage):  # pylint: disable=R0903
     Attributes:
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(MessagePriority.MEDIUM)
 
@@ -51,6 +53,10 @@ Message = MessageMedium
 class CommandMedium(MessageMedium, ICommand):  # pylint: disable=R0903
     """A command message with priority `MessagePriority.MEDIUM`"""
 
+    __slots__ = ()
+
 
 class NotificationMedium(MessageMedium, INotification):  # pylint: disable=R0903
     """A notification message with priority `MessagePriority.MEDIUM`"""
+
+    __slots__ = ()
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 from ..message_medium import NotificationMedium
+from ..overflow_policy import OverflowPolicy
 from ...ui import UiEventInfo
 
 
@@ -31,6 +32,8 @@ class SystemMessage:
             None: This message does not have any parameters.
         """
 
+        __slots__ = ()
+
     class StateMachine:
         """StateMachine status messages."""
 
@@ -41,6 +44,8 @@ class SystemMessage:
                 value (str): The event (state or transition).
             """
 
+            __slots__ = ("value",)
+
             value: str
 
             def __init__(self, value: str):
@@ -55,6 +60,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__("")
 
@@ -65,6 +72,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__("")
 
@@ -75,6 +84,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__("")
 
@@ -85,6 +96,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__("")
 
@@ -95,6 +108,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
             def __init__(self):
                 super().__init__("")
 
@@ -105,6 +120,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
         class StateMachineStateLeave(StateMachineMessageBase):
             """StateMachine leaves a state.
 
@@ -112,6 +129,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
         class StateMachineTransitionEnter(StateMachineMessageBase):
             """StateMachine enters a transition.
 
@@ -119,6 +138,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
         class StateMachineTransitionLeave(StateMachineMessageBase):
             """StateMachine leaves a transition.
 
@@ -126,6 +147,8 @@ class SystemMessage:
                 None: This message does not have any parameters.
             """
 
+            __slots__ = ()
+
     class InputEvent(NotificationMedium):
         """Translated input event.
 
@@ -133,6 +156,8 @@ class SystemMessage:
             value (str): The translated input event.
         """
 
+        __slots__ = ("value",)
+
         value: str
 
         def __init__(self, value: str):
@@ -147,6 +172,8 @@ class SystemMessage:
             value (str): The translated input event.
         """
 
+        __slots__ = ()
+
     class InputEventClear(InputEvent):
         """Translated input event that also clears the queue.
 
@@ -154,9 +181,13 @@ class SystemMessage:
             value (str): The translated input event.
         """
 
+        __slots__ = ()
+
     class UiEventInfoMessageBase(NotificationMedium):
         """UiEventInfo"""
 
+        __slots__ = ("value",)
+
         value: UiEventInfo
 
         def __init__(self, value: UiEventInfo):
@@ -166,27 +197,45 @@ class SystemMessage:
 
             self.value = value
 
+        @property
+        def overflow_policy(self) -> OverflowPolicy:
+            return OverflowPolicy.DROP_OLDEST
+
     class UiEventInfoStateMessage(UiEventInfoMessageBase):
         """UiEventInfoStateMessage"""
 
+        __slots__ = ()
+
     class UiEventInfoStateEnterMessage(UiEventInfoStateMessage):
         """UiEventInfoStateMessage"""
 
+        __slots__ = ()
+
     class UiEventInfoStateLeaveMessage(UiEventInfoStateMessage):
         """UiEventInfoStateMessage"""
 
+        __slots__ = ()
+
     class UiEventInfoTransitionMessage(UiEventInfoMessageBase):
         """UiEventInfoTransitionMessage"""
 
+        __slots__ = ()
+
     class UiEventInfoTransitionEnterMessage(UiEventInfoTransitionMessage):
         """UiEventInfoTransitionMessage"""
 
+        __slots__ = ()
+
     class UiEventInfoTransitionLeaveMessage(UiEventInfoTransitionMessage):
         """UiEventInfoTransitionMessage"""
 
+        __slots__ = ()
+
     class UiEventInfoAudioMessage(NotificationMedium):
         """UiEventInfoAudioMessage"""
 
+        __slots__ = ("type", "path", "value")
+
         type: type
         path: str
         value: UiEventInfo
@@ -206,3 +255,7 @@ class SystemMessage:
             self.type = _type
             self.path = path
             self.value = message
+
+        @property
+        def overflow_policy(self) -> OverflowPolicy:
+            return OverflowPolicy.DROP_OLDEST
@@ -0,0 +1,47 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module overflow_policy."""
+
+from enum import Enum
+
+
+__all__ = [
+    "OverflowPolicy",
+]
+
+
+class OverflowPolicy(Enum):
+    """Defines what happens to a message published to a full queue.
+
+    Subscriber lanes of the message queue never block and never raise; see
+    `SubscriberLane`.
+    """
+
+    BLOCK = "block"
+    """The publisher waits for space up to the block timeout of the queue;
+    then the published message is dropped. The default of all messages."""
+
+    DROP_OLDEST = "drop-oldest"
+    """The oldest queued message of the same type is dropped. If there is
+    none, the published message is dropped."""
+
+    DROP_NEWEST = "drop-newest"
+    """The published message is dropped."""
+
+    REJECT = "reject"
+    """The published message is rejected and the publisher gets a
+    `queue.Full` exception. Only for publishers that handle it."""
@@ -16,12 +16,17 @@
 """Package system."""
 
 from .message_queue import MessageQueue
+from .reply_router import ReplyRouter
+from .message_bridge import MessageBridge, MessageBridgeClient
 from .func_executor import FuncExecutor
 from .action_executor import ActionExecutor
 from .signal_handler import SignalHandler
 
 __all__ = [
     "MessageQueue",
+    "ReplyRouter",
+    "MessageBridge",
+    "MessageBridgeClient",
     "FuncExecutor",
     "ActionExecutor",
     "SignalHandler",
@@ -29,17 +29,7 @@ class ActionExecutor(FuncExecutor[None]):
             max_wait_time: float = 5,
     ) -> None:
 
-        assert 0 < max_wait_time
-        assert isinstance(message, IMessage)
-
-        self._result = None
-        self._signal.clear()
-
-        self._mq.publish(message)
-
-        self._signal.wait(max_wait_time)
-
-        self.get_result()
+        super().invoke(message, max_wait_time)
 
     def wait(
             self,
@@ -21,6 +21,7 @@ from typing import Callable, Generic, Self, TypeVar
 
 from ..public.system.message_base import MessageBase
 from .message_queue import MessageQueue
+from .reply_router import ReplyRouter
 
 __all__ = [
     "FuncExecutor"
@@ -32,7 +33,13 @@ T = TypeVar("T")
 
 class FuncExecutor(Generic[T]):
     """Publishes a message, waits for a return message and executes a specified
-    func returning the result."""
+    func returning the result.
+
+    Without a predicate, `invoke` sends the message as a request via the
+    `ReplyRouter` and waits for the reply with the same correlation id. With
+    a predicate, a callback is registered on the message queue while the
+    executor is acquired and the first matching message is the reply.
+    """
 
     _exception: Exception | None
     _is_acquired: bool
@@ -40,16 +47,16 @@ class FuncExecutor(Generic[T]):
     _result: T | None
     _mq: MessageQueue
     _func: Callable[[MessageBase], T]
-    _predicate: Callable[[MessageBase], bool]
+    _predicate: Callable[[MessageBase], bool] | None
 
     def __init__(
             self,
             func: Callable[[MessageBase], T],
-            predicate: Callable[[MessageBase], bool],
+            predicate: Callable[[MessageBase], bool] | None = None,
     ):
 
         assert callable(func)
-        assert callable(predicate)
+        assert predicate is None or callable(predicate)
 
         self._exception = None
         self._is_acquired = False
@@ -86,7 +93,8 @@ class FuncExecutor(Generic[T]):
         if self._is_acquired:
             return self
 
-        self._mq.register(self._on_message, self._predicate)
+        if self._predicate is not None:
+            self._mq.register(self._on_message, self._predicate)
         self._is_acquired = True
 
         return self
@@ -97,7 +105,8 @@ class FuncExecutor(Generic[T]):
         if not self._is_acquired:
             return
 
-        self._mq.unregister(self._on_message)
+        if self._predicate is not None:
+            self._mq.unregister(self._on_message)
         self._is_acquired = False
 
     def get_result(self) -> T | None:
@@ -119,6 +128,9 @@ class FuncExecutor(Generic[T]):
         assert 0 < max_wait_time
         assert isinstance(message, MessageBase)
 
+        if self._predicate is None:
+            return self._request(message, max_wait_time)
+
         self._exception = None
         self._result = None
         self._signal.clear()
@@ -129,6 +141,27 @@ class FuncExecutor(Generic[T]):
 
         return self.get_result()
 
+    def _request(
+            self,
+            message: MessageBase,
+            max_wait_time: float,
+    ) -> T | None:
+        """Internal: sends a request and executes the func on its reply."""
+
+        self._exception = None
+        self._result = None
+
+        future = ReplyRouter.Factory.get().request(message, max_wait_time)
+
+        try:
+            reply = future.result()
+        except TimeoutError:
+            return None
+
+        self._result = self._func(reply)
+
+        return self._result
+
     def wait(
             self,
             max_wait_time: float = 5,
@@ -136,6 +169,7 @@ class FuncExecutor(Generic[T]):
         """Waits for a message."""
 
         assert 0 < max_wait_time
+        assert self._predicate is not None, "Waiting requires a predicate."
 
         self._exception = None
         self._result = None
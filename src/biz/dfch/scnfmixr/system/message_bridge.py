@@ -0,0 +1,511 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module message_bridge."""
+
+from __future__ import annotations
+from collections import deque
+from enum import Enum
+import json
+import os
+import socket
+import struct
+from threading import Condition, Lock, Thread
+from typing import Any, ClassVar
+
+from biz.dfch.logging import log
+
+from ..public.system.message_base import MessageBase
+from .message_queue import MessageQueue
+
+__all__ = [
+    "MessageBridge",
+    "MessageBridgeClient",
+]
+
+
+def _to_json(value: Any) -> Any:
+    """Internal: converts values `json` cannot encode."""
+
+    if isinstance(value, Enum):
+        return value.name
+
+    if isinstance(value, (set, frozenset, deque)):
+        return list(value)
+
+    return str(value)
+
+
+class MessageBridge:
+    """Streams messages of the message queue to external observers over a
+    Unix domain socket.
+
+    Each frame is a 4 byte big endian length followed by a UTF-8 encoded
+    JSON object with the `id`, `name`, `priority` and `correlation_id` of a
+    message and its own attributes in `fields`.
+
+    The bridge only subscribes to the message queue while at least one
+    observer is connected, on a dedicated lane, so that messages are encoded
+    off the worker of the message queue. A message is encoded once and
+    appended to the bounded ring buffer of every observer; each observer is
+    served by a thread of its own. When an observer does not keep up, its
+    oldest frames are dropped; the message queue never waits for an
+    observer. Messages the bridge cannot encode in time are dropped by its
+    lane and counted in `MessageQueue.metrics.lane_dropped`.
+    """
+
+    RING_SIZE: ClassVar[int] = 1024
+    """Default number of frames buffered per observer."""
+
+    _ACCEPT_TIMEOUT_S: ClassVar[float] = 0.5
+    _FRAME_HEADER: ClassVar[struct.Struct] = struct.Struct(">I")
+    _ENCODER: ClassVar[json.JSONEncoder] = json.JSONEncoder(
+        default=_to_json, separators=(",", ":"))
+    _BASE_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        ("id", "priority", "correlation_id"))
+
+    _sync_root: Lock
+    _path: str
+    _message_types: tuple[type, ...] | None
+    _ring_size: int
+    _clients: list[_Client]
+    _fields: dict[type, tuple[str, ...]]
+    _listener: socket.socket | None
+    _thread: Thread | None
+    _is_registered: bool
+    _mq: MessageQueue
+
+    class _Client:
+        """Internal: a connected observer and its ring buffer."""
+
+        bridge: MessageBridge
+        connection: socket.socket
+        ring: deque[bytes]
+        sync: Condition
+        dropped: int
+        is_closed: bool
+
+        def __init__(
+                self,
+                bridge: MessageBridge,
+                connection: socket.socket,
+                ring_size: int,
+        ) -> None:
+
+            self.bridge = bridge
+            self.connection = connection
+            self.ring = deque(maxlen=ring_size)
+            self.sync = Condition()
+            self.dropped = 0
+            self.is_closed = False
+
+            Thread(target=self._worker, daemon=True,
+                   name=f"MessageBridge-{connection.fileno()}").start()
+
+        def put(self, frame: bytes) -> None:
+            """Appends a frame. Drops the oldest frame if the ring is full."""
+
+            with self.sync:
+                if not self.ring:
+                    self.sync.notify()
+
+                elif len(self.ring) == self.ring.maxlen:
+                    self.dropped += 1
+
+                self.ring.append(frame)
+
+        def close(self) -> None:
+            """Closes the connection and stops the worker."""
+
+            with self.sync:
+                self.is_closed = True
+                self.sync.notify()
+
+            # Unblocks a worker that waits for a slow observer.
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        def _worker(self) -> None:
+            """Sends buffered frames until the observer disconnects."""
+
+            try:
+                while True:
+                    with self.sync:
+                        self.sync.wait_for(
+                            lambda: self.ring or self.is_closed)
+
+                        if self.is_closed:
+                            break
+
+                        frames = list(self.ring)
+                        self.ring.clear()
+
+                    self.connection.sendall(b"".join(frames))
+
+            except OSError as ex:
+                log.info("Observer disconnected. [%s]", ex)
+
+            finally:
+                self.is_closed = True
+                self.connection.close()
+                self.bridge._remove(self)  # pylint: disable=W0212
+
+    def __init__(
+            self,
+            path: str,
+            message_types: type | tuple[type, ...] | None = None,
+            ring_size: int = RING_SIZE,
+    ) -> None:
+        """Creates an instance of the object.
+
+        Args:
+            path (str): The path of the Unix domain socket.
+            message_types (type | tuple[type, ...] | None): The message type
+                or types (including their subclasses) to stream. If `None`,
+                all messages are streamed.
+            ring_size (int): The number of frames buffered per observer.
+        """
+
+        assert path and path.strip()
+        assert isinstance(ring_size, int) and 0 < ring_size
+
+        if isinstance(message_types, type):
+            message_types = (message_types,)
+
+        assert message_types is None or (
+            isinstance(message_types, tuple)
+            and all(issubclass(e, MessageBase) for e in message_types))
+
+        self._sync_root = Lock()
+        self._path = path
+        self._message_types = message_types
+        self._ring_size = ring_size
+        self._clients = []
+        self._fields = {}
+        self._listener = None
+        self._thread = None
+        self._is_registered = False
+        self._mq = MessageQueue.Factory.get()
+
+    def __enter__(self) -> MessageBridge:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def path(self) -> str:
+        """Returns the path of the Unix domain socket."""
+        return self._path
+
+    @property
+    def clients(self) -> int:
+        """Returns the number of connected observers."""
+        return len(self._clients)
+
+    @property
+    def dropped(self) -> int:
+        """Returns the number of frames dropped for connected observers."""
+        return sum(e.dropped for e in tuple(self._clients))
+
+    def start(self) -> bool:
+        """Starts listening for observers.
+
+        Returns:
+            bool: True, if the bridge is listening; false, otherwise.
+        """
+
+        with self._sync_root:
+
+            if self._listener is not None:
+                return True
+
+            log.debug("Starting message bridge '%s' ...", self._path)
+
+            try:
+                if os.path.exists(self._path):
+                    os.unlink(self._path)
+
+                listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                # Create the socket file as 0600 right away; with `chmod`
+                # after `bind` other users could connect in between.
+                umask = os.umask(0o177)
+                try:
+                    listener.bind(self._path)
+                finally:
+                    os.umask(umask)
+                listener.listen()
+                listener.settimeout(self._ACCEPT_TIMEOUT_S)
+
+            except OSError as ex:
+                log.error("Starting message bridge '%s' FAILED. [%s]",
+                          self._path, ex)
+                return False
+
+            self._listener = listener
+            self._thread = Thread(
+                target=self._worker, args=(listener,), daemon=True,
+                name="MessageBridge")
+            self._thread.start()
+
+        log.info("Starting message bridge '%s' OK.", self._path)
+
+        return True
+
+    def stop(self) -> None:
+        """Disconnects all observers and stops listening."""
+
+        with self._sync_root:
+
+            listener = self._listener
+            if listener is None:
+                return
+
+            log.debug("Stopping message bridge '%s' ...", self._path)
+
+            self._listener = None
+            clients = tuple(self._clients)
+            self._clients.clear()
+            self._update_registration()
+
+        for client in clients:
+            client.close()
+
+        # Wakes up the worker waiting in `accept`.
+        try:
+            listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+        self._thread.join()
+        listener.close()
+
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
+
+        log.info("Stopping message bridge '%s' OK.", self._path)
+
+    def _worker(self, listener: socket.socket) -> None:
+        """Internal: accepts observers until the bridge is stopped."""
+
+        while self._listener is listener:
+
+            try:
+                connection, _ = listener.accept()
+
+            except TimeoutError:
+                continue
+
+            except OSError as ex:
+                if self._listener is not listener:
+                    break
+
+                log.error("Accepting observer FAILED. [%s]", ex)
+                continue
+
+            connection.settimeout(None)
+
+            with self._sync_root:
+                if self._listener is not listener:
+                    connection.close()
+                    break
+
+                self._clients.append(
+                    MessageBridge._Client(self, connection, self._ring_size))
+                self._update_registration()
+
+                log.info("Observer connected [%s].", len(self._clients))
+
+    def _remove(self, client: _Client) -> None:
+        """Internal: removes a disconnected observer."""
+
+        with self._sync_root:
+            if client in self._clients:
+                self._clients.remove(client)
+                self._update_registration()
+
+    def _update_registration(self) -> None:
+        """Internal: subscribes to the message queue while observers are
+        connected. `_sync_root` must be held."""
+
+        if self._clients and not self._is_registered:
+            self._mq.register(
+                self._on_message,
+                message_types=self._message_types,
+                lane=MessageQueue.Lane.DEDICATED)
+            self._is_registered = True
+
+        elif not self._clients and self._is_registered:
+            self._mq.unregister(self._on_message)
+            self._is_registered = False
+
+    def _on_message(self, message: MessageBase) -> None:
+        """Message handler. Encodes a message once and buffers it for every
+        observer."""
+
+        clients = self._clients
+        if not clients:
+            return
+
+        frame = self.encode(message)
+
+        for client in tuple(clients):
+            client.put(frame)
+
+    def get_fields(self, _type: type) -> tuple[str, ...]:
+        """Returns the names of the attributes of a message type that are
+        streamed in `fields`."""
+
+        result = self._fields.get(_type)
+        if result is not None:
+            return result
+
+        names: list[str] = []
+        for item in reversed(_type.__mro__):
+            slots = item.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+
+            names.extend(e for e in slots
+                         if not e.startswith("_")
+                         and e not in self._BASE_FIELDS
+                         and e not in names)
+
+        result = tuple(names)
+        self._fields[_type] = result
+
+        return result
+
+    def encode(self, message: MessageBase) -> bytes:
+        """Returns the length prefixed frame of a message."""
+
+        fields = {e: getattr(message, e, None)
+                  for e in self.get_fields(type(message))}
+
+        # Subclasses without `__slots__` keep their attributes here.
+        attributes = getattr(message, "__dict__", None)
+        if attributes:
+            fields.update((k, v) for k, v in attributes.items()
+                          if not k.startswith("_"))
+
+        payload = self._ENCODER.encode({
+            "id": message.id,
+            "name": message.name,
+            "priority": int(message.priority),
+            "correlation_id": message.correlation_id,
+            "fields": fields,
+        }).encode()
+
+        return self._FRAME_HEADER.pack(len(payload)) + payload
+
+
+class MessageBridgeClient:
+    """Observes the messages streamed by a `MessageBridge`.
+
+    Example:
+        with MessageBridgeClient(path) as client:
+            for frame in client:
+                print(frame["name"])
+    """
+
+    _FRAME_HEADER: ClassVar[struct.Struct] = struct.Struct(">I")
+
+    _connection: socket.socket
+    _buffer: bytearray
+
+    def __init__(self, path: str, timeout_s: float | None = None) -> None:
+        """Connects to a `MessageBridge`.
+
+        Args:
+            path (str): The path of the Unix domain socket.
+            timeout_s (float | None): The time to wait for a frame in
+                seconds. If `None`, waits forever.
+
+        Raises:
+            OSError: If the bridge cannot be reached.
+        """
+
+        assert path and path.strip()
+        assert timeout_s is None or (
+            isinstance(timeout_s, (int, float)) and 0 < timeout_s)
+
+        self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._connection.settimeout(timeout_s)
+        self._connection.connect(path)
+        self._buffer = bytearray()
+
+    def __enter__(self) -> MessageBridgeClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            result = self.receive()
+            if result is None:
+                return
+
+            yield result
+
+    def close(self) -> None:
+        """Disconnects from the bridge."""
+
+        self._connection.close()
+
+    def _read(self, size: int) -> bytes | None:
+        """Internal: reads exactly `size` bytes. Returns `None` when the
+        bridge closed the connection."""
+
+        while len(self._buffer) < size:
+            data = self._connection.recv(max(65536, size))
+            if not data:
+                return None
+
+            self._buffer.extend(data)
+
+        result = bytes(self._buffer[:size])
+        del self._buffer[:size]
+
+        return result
+
+    def receive(self) -> dict[str, Any] | None:
+        """Returns the next frame.
+
+        Returns:
+            dict[str, Any] | None: The decoded frame; or `None`, if the bridge
+                closed the connection.
+
+        Raises:
+            TimeoutError: If no frame arrived within `timeout_s`.
+        """
+
+        header = self._read(self._FRAME_HEADER.size)
+        if header is None:
+            return None
+
+        (size,) = self._FRAME_HEADER.unpack(header)
+
+        payload = self._read(size)
+        if payload is None:
+            return None
+
+        return json.loads(payload)
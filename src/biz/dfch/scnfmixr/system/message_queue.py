@@ -16,21 +16,26 @@
 """Module message_queue."""
 
 from __future__ import annotations
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+import logging
+import queue
 import time
 from typing import (
     ClassVar,
     Callable,
 )
-from threading import Event, Lock, Thread
+from threading import Condition, Lock, Thread, current_thread
 
 from biz.dfch.logging import log
-from biz.dfch.asyn import ConcurrentDoubleSideQueueT
+from biz.dfch.asyn import ThreadPool
+from biz.dfch.diagnostics import Histogram
 from ..public.system import (
     MessageBase,
 )
-from ..public.system import MessagePriority
+from ..public.system import MessagePriority, OverflowPolicy
 
 
 __all__ = [
@@ -38,6 +43,167 @@ __all__ = [
 ]
 
 
+class SubscriberLane:
+    """Ordered execution lane of a single subscriber.
+
+    Messages are invoked one after the other in the order they were posted;
+    HIGH priority messages are invoked before queued default messages. A
+    dedicated lane runs on its own thread, which is started on demand and
+    retires when idle. A shared lane runs on the `MessageQueue` thread pool.
+
+    A lane holds at most `MAX_SIZE` messages. As the worker of the message
+    queue must not wait for a stalled subscriber, the overflow policy of a
+    message only applies in part to a full lane: with
+    `OverflowPolicy.DROP_OLDEST` the oldest queued message of its type is
+    dropped; with any other policy, including the default `BLOCK`, the
+    posted message is dropped. Lanes never block and never raise.
+    """
+
+    IDLE_TIMEOUT_S: float = 2.0
+    BATCH_SIZE: int = 32
+    MAX_SIZE: int = 1024
+
+    _invoke: Callable[[MessageBase], None]
+    _name: str
+    _is_dedicated: bool
+    _sync_root: Condition
+    _queue_high: deque[MessageBase]
+    _queue_default: deque[MessageBase]
+    _is_running: bool
+    _is_closed: bool
+    dropped: int
+
+    def __init__(
+            self,
+            invoke: Callable[[MessageBase], None],
+            name: str,
+            is_dedicated: bool,
+    ):
+        self._invoke = invoke
+        self._name = name
+        self._is_dedicated = is_dedicated
+        self._sync_root = Condition()
+        self._queue_high = deque()
+        self._queue_default = deque()
+        self._is_running = False
+        self._is_closed = False
+        self.dropped = 0
+
+    def post(self, message: MessageBase) -> None:
+        """Queues a message for invocation on this lane."""
+
+        is_high = MessagePriority.HIGH <= message.priority
+
+        with self._sync_root:
+            if self._is_closed:
+                return
+
+            queue_ = self._queue_high if is_high else self._queue_default
+
+            if SubscriberLane.MAX_SIZE <= (
+                    len(self._queue_high) + len(self._queue_default)):
+                self.dropped += 1
+                log.warning("Lane '%s' is full. Dropping '%s'.",
+                            self._name, message.name)
+
+                if OverflowPolicy.DROP_OLDEST != message.overflow_policy:
+                    return
+
+                _type = type(message)
+                index = next((i for i, e in enumerate(queue_)
+                              if type(e) is _type), None)
+                if index is None:
+                    return
+                del queue_[index]
+
+            queue_.append(message)
+
+            if self._is_running:
+                self._sync_root.notify()
+                return
+
+            self._is_running = True
+
+        self._start(is_high)
+
+    def close(self) -> None:
+        """Discards queued messages and stops accepting new ones."""
+
+        with self._sync_root:
+            self._is_closed = True
+            self._queue_high.clear()
+            self._queue_default.clear()
+            self._sync_root.notify()
+
+    def _start(self, is_high: bool) -> None:
+        """Starts the lane thread or schedules the lane on the pool."""
+
+        if self._is_dedicated:
+            Thread(target=self._run_dedicated, name=self._name,
+                   daemon=True).start()
+            return
+
+        # The pool is unbounded. Never run the lane on the caller, which is
+        # the worker of the message queue: if the pool rejects the lane
+        # nevertheless, it is scheduled again on the next post.
+        if not ThreadPool.Factory.get(
+            MessageQueue.THREAD_POOL_NAME,
+            ThreadPool.MAX_WORKERS,
+        ).submit(
+            ThreadPool.Priority.UI if is_high
+            else ThreadPool.Priority.BACKGROUND_IO,
+            self._run_shared,
+        ):
+            with self._sync_root:
+                self._is_running = False
+
+    def _next(self) -> MessageBase | None:
+        """Returns the next message. Lock must be held."""
+
+        if self._queue_high:
+            return self._queue_high.popleft()
+        if self._queue_default:
+            return self._queue_default.popleft()
+        return None
+
+    def _run_dedicated(self) -> None:
+        """Runs messages until idle for `IDLE_TIMEOUT_S`."""
+
+        while True:
+            with self._sync_root:
+                message = self._next()
+                if message is None and not self._is_closed:
+                    self._sync_root.wait(SubscriberLane.IDLE_TIMEOUT_S)
+                    message = self._next()
+
+                if message is None:
+                    self._is_running = False
+                    return
+
+            self._invoke(message)
+
+    def _run_shared(self) -> None:
+        """Runs up to `BATCH_SIZE` messages, then yields the pool worker to
+        other lanes and reschedules itself."""
+
+        for _ in range(SubscriberLane.BATCH_SIZE):
+            with self._sync_root:
+                message = self._next()
+                if message is None:
+                    self._is_running = False
+                    return
+
+            self._invoke(message)
+
+        with self._sync_root:
+            if not (self._queue_high or self._queue_default):
+                self._is_running = False
+                return
+            is_high = bool(self._queue_high)
+
+        self._start(is_high)
+
+
 @dataclass(frozen=True)
 class ActionDescriptor:
     """A item in the callback list.
@@ -45,10 +211,20 @@ class ActionDescriptor:
     Attributes:
         action: The callback to invoke.
         predicate: The filter to determine, if the callback shall be invoked.
+        message_types: The message types (including subclasses) the callback
+            subscribes to, or `None` for all messages.
+        order: The registration sequence number; determines dispatch order.
+        lane: The lane the callback is invoked on, or `None` to invoke it on
+            the worker thread of the message queue.
+        durations: Histogram of the durations of the callback.
     """
 
     action: Callable[[MessageBase], None]
     predicate: Callable[[MessageBase], bool] | None = None
+    message_types: tuple[type, ...] | None = None
+    order: int = 0
+    lane: SubscriberLane | None = field(default=None, compare=False)
+    durations: Histogram = field(default_factory=Histogram, compare=False)
 
     def get_key(self, action) -> str:
         """Gets the full qualified name of the action."""
@@ -74,12 +250,49 @@ class MessageQueue():  # pylint: disable=R0902
     _WORKER_SIGNAL_WAIT_TIME_MS = 5000
     _EXCEPTION_TIMEOUT_MS = 1000
 
+    MAX_SIZE_HIGH: int = 1024
+    """Default capacity of the queue of HIGH messages."""
+
+    MAX_SIZE_DEFAULT: int = 4096
+    """Default capacity of the queue of all other messages."""
+
+    BLOCK_TIMEOUT_S: float = 1.0
+    """Default time a publisher waits for space with `OverflowPolicy.BLOCK`.
+    """
+
+    THREAD_POOL_NAME = "MessageQueue"
+    """Name of the thread pool that runs shared lanes."""
+
+    class Lane(Enum):
+        """Where the callback of a subscriber is invoked."""
+
+        INLINE = "inline"
+        """On the worker thread of the message queue (default)."""
+
+        DEDICATED = "dedicated"
+        """On a thread of its own, in order."""
+
+        SHARED = "shared"
+        """On the `THREAD_POOL_NAME` thread pool, in order."""
+
     _sync_root: Lock
-    _queue_high: ConcurrentDoubleSideQueueT[MessageBase]
-    _queue_default: ConcurrentDoubleSideQueueT[MessageBase]
+    _queue_sync: Condition
+    _queue_not_full: Condition
+    _queue_high: deque[tuple[MessageBase, float]]
+    _queue_default: deque[tuple[MessageBase, float]]
+    _max_size: dict[MessagePriority, int]
+    _block_timeout_s: float
+    _high_water_mark: dict[MessagePriority, int]
+    _dropped: dict[str, int]
+    _rejected: dict[str, int]
     _callbacks: list[ActionDescriptor]
-    _is_processing: bool
-    _signal: Event
+    _callbacks_by_type: dict[type, list[ActionDescriptor]]
+    _callbacks_any: list[ActionDescriptor]
+    _dispatch_cache: dict[type, tuple[ActionDescriptor, ...]]
+    _order: int
+    _pending: dict[Hashable, tuple[MessageBase, MessageBase]]
+    _coalesced: dict[str, int]
+    _latencies: dict[str, Histogram]
     _worker_do_stop: bool
     _worker_thread: Thread
 
@@ -96,17 +309,73 @@ class MessageQueue():  # pylint: disable=R0902
         log.debug("Initializing ...")
 
         self._sync_root = Lock()
-        self._queue_high = ConcurrentDoubleSideQueueT[MessageBase]()
-        self._queue_default = ConcurrentDoubleSideQueueT[MessageBase]()
+        queue_lock = Lock()
+        self._queue_sync = Condition(queue_lock)
+        self._queue_not_full = Condition(queue_lock)
+        self._queue_high = deque()
+        self._queue_default = deque()
+        self._max_size = {
+            MessagePriority.HIGH: MessageQueue.MAX_SIZE_HIGH,
+            MessagePriority.DEFAULT: MessageQueue.MAX_SIZE_DEFAULT,
+        }
+        self._block_timeout_s = MessageQueue.BLOCK_TIMEOUT_S
+        self._high_water_mark = dict.fromkeys(self._max_size, 0)
+        self._dropped = {}
+        self._rejected = {}
         self._callbacks = []
-        self._is_processing = False
-        self._signal = Event()
+        self._callbacks_by_type = {}
+        self._callbacks_any = []
+        self._dispatch_cache = {}
+        self._order = 0
+        self._pending = {}
+        self._coalesced = {}
+        self._latencies = {}
         self._worker_do_stop = False
         self._worker_thread = Thread(target=self._worker, daemon=True)
         self._worker_thread.start()
 
         log.info("Initializing OK.")
 
+    @dataclass(frozen=True)
+    class Metrics:
+        """Snapshot of the message queue counters.
+
+        Attributes:
+            coalesced (dict[str, int]): Number of messages per message name
+                that were superseded by a newer message before dispatch.
+            handler_durations (dict[str, Histogram]): Durations per
+                subscriber.
+            dispatch_latencies (dict[str, Histogram]): Time from publish to
+                dispatch per message name.
+            queue_depth (dict[MessagePriority, int]): Number of queued
+                messages of the HIGH and the DEFAULT queue.
+            high_water_mark (dict[MessagePriority, int]): Maximum number of
+                queued messages of the HIGH and the DEFAULT queue.
+            dropped (dict[str, int]): Number of messages per message name
+                that were dropped from or not admitted to a full queue.
+            rejected (dict[str, int]): Number of messages per message name
+                whose publisher got a `queue.Full` exception.
+            lane_dropped (dict[str, int]): Number of messages per subscriber
+                that were dropped from its full lane.
+        """
+
+        coalesced: dict[str, int] = field(default_factory=dict)
+        handler_durations: dict[str, Histogram] = field(default_factory=dict)
+        dispatch_latencies: dict[str, Histogram] = field(
+            default_factory=dict)
+        queue_depth: dict[MessagePriority, int] = field(default_factory=dict)
+        high_water_mark: dict[MessagePriority, int] = field(
+            default_factory=dict)
+        dropped: dict[str, int] = field(default_factory=dict)
+        rejected: dict[str, int] = field(default_factory=dict)
+        lane_dropped: dict[str, int] = field(default_factory=dict)
+
+        @property
+        def coalesced_total(self) -> int:
+            """Returns the number of superseded messages of all types."""
+
+            return sum(self.coalesced.values())
+
     class Factory:  # pylint: disable=R0903
         """Factory class."""
 
@@ -137,78 +406,205 @@ class MessageQueue():  # pylint: disable=R0902
 
         return f"{_type.__module__}.{_type.__qualname__}"
 
+    def _get_callbacks(self, _type: type) -> tuple[ActionDescriptor, ...]:
+        """Returns the callbacks subscribed to the specified message type.
+
+        The result contains all callbacks registered for `_type` or any of its
+        base classes plus all callbacks registered without a message type, in
+        registration order. Results are cached per message type until the next
+        `register` or `unregister`.
+        """
+
+        result = self._dispatch_cache.get(_type)
+        if result is not None:
+            return result
+
+        with self._sync_root:
+
+            items = {id(e): e for e in self._callbacks_any}
+            for base in _type.__mro__:
+                for item in self._callbacks_by_type.get(base, []):
+                    items[id(item)] = item
+
+            result = tuple(sorted(items.values(), key=lambda e: e.order))
+            self._dispatch_cache[_type] = result
+
+        return result
+
     def _process_message(
             self,
             message: MessageBase,
-            callbacks: list[ActionDescriptor]
+            callbacks: Iterable[ActionDescriptor]
     ) -> None:
         """Processes a single message."""
 
-        assert message and isinstance(message, MessageBase)
+        if MessageBase.VALIDATE:
+            assert message and isinstance(message, MessageBase)
 
         for item in callbacks:
 
             try:
-                action = item.action
                 if callable(item.predicate) and not item.predicate(message):
                     continue
 
-                log.debug("Dispatching type '%s' [%s] to '%s' ...",
-                          message.name,
-                          message.priority,
-                          MessageQueue.get_fqcn(action))
-
-                action(message)
-
-                log.info("Dispatching type '%s' [%s] to '%s' OK.",
-                         message.name,
-                         message.priority,
-                         MessageQueue.get_fqcn(action))
-
             except Exception as ex:  # pylint: disable=W0718
                 log.info("Dispatching type '%s' [%s] to '%s' FAILED. [%s]",
                          message.name,
                          message.priority,
-                         action,
+                         item.action,
                          ex,
                          exc_info=True)
+                continue
 
-    def _process_messages(self) -> None:
-        """Process messages."""
+            if item.lane is not None:
+                item.lane.post(message)
+                continue
 
-        self._is_processing = True
+            MessageQueue._invoke(item.action, item.durations, message)
 
-        log.debug("Processing messages ... [%s]",
-                  len(self._callbacks))
+    @staticmethod
+    def _invoke(
+            action: Callable[[MessageBase], None],
+            durations: Histogram,
+            message: MessageBase,
+    ) -> None:
+        """Invokes a callback and records its duration."""
+
+        start = time.perf_counter()
 
         try:
-            with self._sync_root:
+            log.debug("Dispatching type '%s' [%s] to '%s' ...",
+                      message.name,
+                      message.priority,
+                      MessageQueue.get_fqcn(action))
 
-                queue_high = list(self._queue_high)
-                self._queue_high.clear()
-                queue_default = list(self._queue_default)
-                self._queue_default.clear()
-                callback_item = list(self._callbacks)
+            action(message)
 
-            if 0 == len(callback_item):
-                log.debug("No actions registered. Discarding messages.")
-                return
+            log.info("Dispatching type '%s' [%s] to '%s' OK.",
+                     message.name,
+                     message.priority,
+                     MessageQueue.get_fqcn(action))
+
+        except Exception as ex:  # pylint: disable=W0718
+            log.info("Dispatching type '%s' [%s] to '%s' FAILED. [%s]",
+                     message.name,
+                     message.priority,
+                     action,
+                     ex,
+                     exc_info=True)
+
+        finally:
+            durations.record(time.perf_counter() - start)
+
+    def _take_messages(
+            self
+    ) -> tuple[deque[tuple[MessageBase, float]],
+               deque[tuple[MessageBase, float]]]:
+        """Internal: takes all queued messages. `_queue_sync` must be held.
+
+        Returns:
+            tuple: The HIGH and the default messages with the time they were
+                published.
+        """
+
+        queue_high = self._queue_high
+        self._queue_high = deque()
+        queue_default = self._queue_default
+        self._queue_default = deque()
+
+        if self._pending:
+            queue_default = deque(
+                (self._resolve(message), published)
+                for message, published in queue_default)
+
+        return queue_high, queue_default
+
+    def _dispatch(self, message: MessageBase, published: float) -> None:
+        """Internal: records the latency of and dispatches a message."""
+
+        latencies = self._latencies.get(message.name)
+        if latencies is None:
+            with self._queue_sync:
+                latencies = self._latencies.setdefault(
+                    message.name, Histogram())
+        latencies.record(time.perf_counter() - published)
+
+        self._process_message(message, self._get_callbacks(type(message)))
+
+    def _process_messages(
+            self,
+            queue_high: deque[tuple[MessageBase, float]],
+            queue_default: deque[tuple[MessageBase, float]],
+    ) -> None:
+        """Process messages.
+
+        HIGH messages published meanwhile preempt the remaining default
+        messages, which are put back to the top of the queue.
+        """
+
+        try:
+            for message, published in queue_high:
+                self._dispatch(message, published)
 
-            for message in queue_high:
-                self._process_message(message, callback_item)
+            while queue_default:
+                if self._queue_high:
+                    with self._queue_sync:
+                        self._put_back(queue_default)
+                    return
 
-            for message in queue_default:
-                self._process_message(message, callback_item)
+                self._dispatch(*queue_default.popleft())
 
         except Exception as ex:  # pylint: disable=W0718
             log.error("_process_messages: An error occurred: '%s'.",
                       ex,
                       exc_info=True)
-        finally:
-            self._is_processing = False
+
+    def _put_back(self, queue_default: deque[tuple[MessageBase, float]]):
+        """Internal: puts preempted default messages back to the top of the
+        queue. `_queue_sync` must be held.
+
+        The messages were resolved when they were taken, so newer messages
+        with the same key are coalesced into them again; unless a newer
+        message with that key was enqueued meanwhile, which then keeps
+        receiving the newer messages.
+        """
+
+        for message, _ in queue_default:
+            key = message.coalescing_key
+            if key is not None:
+                self._pending.setdefault(key, (message, message))
+
+        self._queue_default.extendleft(reversed(queue_default))
+
+    def _resolve(self, message: MessageBase) -> MessageBase:
+        """Internal: returns the latest message superseding a dequeued
+        message. `_queue_sync` must be held."""
+
+        key = message.coalescing_key
+        if key is None:
+            return message
+
+        item = self._pending.get(key)
+        if item is None or item[0] is not message:
+            return message
+
+        del self._pending[key]
+
+        return item[1]
+
+    def _has_work(self) -> bool:
+        """Internal: predicate of `_queue_sync`."""
+
+        return bool(
+            self._queue_high or self._queue_default or self._worker_do_stop)
 
     def _worker(self) -> None:
-        """Worker thread for processing published message."""
+        """Worker thread for processing published message.
+
+        Waits on `_queue_sync` with a queue-size predicate, so a message
+        published while a batch is being processed is picked up right after
+        that batch.
+        """
 
         log.debug("_worker: Initializing ...")
 
@@ -220,21 +616,25 @@ class MessageQueue():  # pylint: disable=R0902
 
         while not self._worker_do_stop:
             try:
-                now = time.monotonic()
-                if now > start + signal_wait_time_s:
-                    delta = now - start
+                with self._queue_sync:
+                    has_work = self._queue_sync.wait_for(
+                        self._has_work, signal_wait_time_s)
+
+                if not has_work:
+                    now = time.monotonic()
+                    log.debug("_worker: Waiting [%sms].",
+                              int((now - start) * 1000))
                     start = now
-                    log.debug("_worker: Waiting [%sms].", int(delta*1000))
-
-                result = self._signal.wait(signal_wait_time_s)
-                self._signal.clear()
-                if not result:
                     continue
 
-                if self._is_processing:
-                    continue
+                log.debug("Processing messages ... [%s]",
+                          len(self._callbacks))
+
+                with self._queue_sync:
+                    queue_high, queue_default = self._take_messages()
+                    self._queue_not_full.notify_all()
 
-                self._process_messages()
+                self._process_messages(queue_high, queue_default)
 
             except Exception as ex:  # pylint: disable=W0718
                 log.error("_worker: An error occurred: '%s'. Waiting %sms ...",
@@ -255,51 +655,257 @@ class MessageQueue():  # pylint: disable=R0902
             at_first (bool): True, if the messages should be enqueued at the
                 top of the queueu; false, otherwise (defaulT).
         """
-        assert items is not None and isinstance(items, (Iterable, MessageBase))
+        if isinstance(items, MessageBase):
+            items = (items,)
 
-        if not isinstance(items, Iterable):
-            items = [items]
+        if MessageBase.VALIDATE:
+            assert items is not None and isinstance(items, Iterable)
+            assert all(isinstance(e, MessageBase) for e in items)
 
-        for item in items:
+        if log.isEnabledFor(logging.DEBUG):
+            for item in items:
+                log.debug("Received '%s' [%s].", item.name, item.priority)
 
-            assert isinstance(item, MessageBase)
+        published = time.perf_counter()
 
-            log.debug("Received '%s' [%s].", item.name, item.priority)
+        with self._queue_sync:
+            try:
+                for item in items:
+                    if MessagePriority.HIGH <= item.priority:
+                        priority = MessagePriority.HIGH
+                        key = None
+                    else:
+                        priority = MessagePriority.DEFAULT
+                        key = item.coalescing_key
+                        if key is not None and self._coalesce(item, key):
+                            continue
 
-            if MessagePriority.HIGH <= item.priority:
-                if at_first:
-                    self._queue_high.enqueue_first(item)
-                else:
-                    self._queue_high.enqueue(item)
-            else:
-                if at_first:
-                    self._queue_default.enqueue_first(item)
-                else:
-                    self._queue_default.enqueue(item)
+                    if not self._admit(item, priority):
+                        continue
+
+                    # The worker may have swapped the queues while waiting.
+                    queue_ = self._get_queue(priority)
+
+                    if at_first:
+                        queue_.appendleft((item, published))
+                    else:
+                        queue_.append((item, published))
+
+                    if key is not None:
+                        self._pending[key] = (item, item)
 
-        self._signal.set()
+                    if self._high_water_mark[priority] < len(queue_):
+                        self._high_water_mark[priority] = len(queue_)
+
+            finally:
+                self._queue_sync.notify()
+
+    def _get_queue(
+            self,
+            priority: MessagePriority
+    ) -> deque[tuple[MessageBase, float]]:
+        """Internal: returns the queue of a priority class. `_queue_sync`
+        must be held, as the worker swaps the queues."""
+
+        if MessagePriority.HIGH == priority:
+            return self._queue_high
+
+        return self._queue_default
+
+    def _admit(self, item: MessageBase, priority: MessagePriority) -> bool:
+        """Internal: applies the overflow policy of a message published to a
+        full queue. `_queue_sync` must be held.
+
+        The worker never waits for space, as it is the one to make space;
+        messages it publishes with `OverflowPolicy.BLOCK` are admitted.
+
+        Returns:
+            bool: True, if the message is to be enqueued; false, if it is
+                dropped.
+
+        Raises:
+            queue.Full: If the message has `OverflowPolicy.REJECT`.
+        """
+
+        max_size = self._max_size[priority]
+        if 0 == max_size or len(self._get_queue(priority)) < max_size:
+            return True
+
+        policy = item.overflow_policy
+
+        if OverflowPolicy.BLOCK == policy:
+            if current_thread() is self._worker_thread:
+                return True
+
+            self._queue_sync.notify()
+            if self._queue_not_full.wait_for(
+                    lambda: len(self._get_queue(priority)) < max_size,
+                    self._block_timeout_s):
+                return True
+
+        elif OverflowPolicy.DROP_OLDEST == policy:
+            if self._drop_oldest(type(item), self._get_queue(priority)):
+                return True
+
+        if OverflowPolicy.REJECT != policy:
+            self._dropped[item.name] = self._dropped.get(item.name, 0) + 1
+            log.warning("Queue full. Dropping '%s' [%s].", item.name, policy)
+            return False
+
+        self._rejected[item.name] = self._rejected.get(item.name, 0) + 1
+        log.error("Queue full. Rejecting '%s' [%s].", item.name, policy)
+
+        raise queue.Full(f"Message queue full. Rejecting '{item.name}'.")
+
+    def _drop_oldest(
+            self,
+            _type: type,
+            queue_: deque[tuple[MessageBase, float]]
+    ) -> bool:
+        """Internal: drops the oldest queued message of a type. `_queue_sync`
+        must be held.
+
+        Returns:
+            bool: True, if a message was dropped; false, otherwise.
+        """
+
+        for i, (message, _) in enumerate(queue_):
+            if type(message) is not _type:
+                continue
+
+            del queue_[i]
+
+            key = message.coalescing_key
+            if key is not None and message is self._pending.get(
+                    key, (None,))[0]:
+                del self._pending[key]
+
+            self._dropped[message.name] = self._dropped.get(
+                message.name, 0) + 1
+            log.warning("Queue full. Dropping '%s'.", message.name)
+
+            return True
+
+        return False
+
+    def _coalesce(self, item: MessageBase, key: Hashable) -> bool:
+        """Internal: supersedes a queued message with the same key. Then
+        that message keeps its position and is dispatched with the content
+        of the newer one. `_queue_sync` must be held.
+
+        Returns:
+            bool: True if the item was coalesced; false if it must be
+                enqueued.
+        """
+
+        entry = self._pending.get(key)
+
+        if entry is None:
+            return False
+
+        queued, older = entry
+        self._pending[key] = (queued, item.coalesce(older))
+        self._coalesced[older.name] = self._coalesced.get(older.name, 0) + 1
+
+        return True
+
+    @property
+    def metrics(self) -> MessageQueue.Metrics:
+        """Returns a snapshot of the message queue counters."""
+
+        with self._sync_root:
+            handler_durations = {
+                MessageQueue.get_fqcn(e.action): e.durations.snapshot()
+                for e in self._callbacks}
+            lane_dropped = {
+                MessageQueue.get_fqcn(e.action): e.lane.dropped
+                for e in self._callbacks
+                if e.lane is not None and e.lane.dropped}
+
+        with self._queue_sync:
+            return MessageQueue.Metrics(
+                coalesced=dict(self._coalesced),
+                handler_durations=handler_durations,
+                dispatch_latencies={
+                    name: e.snapshot()
+                    for name, e in self._latencies.items()},
+                queue_depth={
+                    e: len(self._get_queue(e)) for e in self._max_size},
+                high_water_mark=dict(self._high_water_mark),
+                dropped=dict(self._dropped),
+                rejected=dict(self._rejected),
+                lane_dropped=lane_dropped,
+            )
+
+    def set_capacity(
+            self,
+            max_size_high: int | None = None,
+            max_size_default: int | None = None,
+            block_timeout_s: float | None = None,
+    ) -> None:
+        """Sets the capacity of the queues.
+
+        Args:
+            max_size_high (int | None): The capacity of the queue of HIGH
+                messages; 0 for unbounded.
+            max_size_default (int | None): The capacity of the queue of all
+                other messages; 0 for unbounded.
+            block_timeout_s (float | None): The time a publisher waits for
+                space with `OverflowPolicy.BLOCK`.
+
+            `None` keeps the current value.
+        """
+
+        assert max_size_high is None or (
+            isinstance(max_size_high, int) and 0 <= max_size_high)
+        assert max_size_default is None or (
+            isinstance(max_size_default, int) and 0 <= max_size_default)
+        assert block_timeout_s is None or (
+            isinstance(block_timeout_s, (int, float)) and 0 <= block_timeout_s)
+
+        with self._queue_sync:
+            if max_size_high is not None:
+                self._max_size[MessagePriority.HIGH] = max_size_high
+            if max_size_default is not None:
+                self._max_size[MessagePriority.DEFAULT] = max_size_default
+            if block_timeout_s is not None:
+                self._block_timeout_s = block_timeout_s
+
+            self._queue_not_full.notify_all()
 
     def publish(self, *items: MessageBase | Iterable[MessageBase]) -> None:
         """Publishes an item to the respective queue.
 
+        If the queue is full, the `overflow_policy` of each message decides
+        whether the caller waits, a message is dropped, or the message is
+        rejected. Only messages with `OverflowPolicy.REJECT` raise.
+
         Args:
             item (Message | Iterable[MessageBase]): Message to publish.
+
+        Raises:
+            queue.Full: If a message with `OverflowPolicy.REJECT` is
+                rejected. Messages before it are published.
         """
 
         assert items
 
+        if 1 == len(items) and isinstance(items[0], MessageBase):
+            self._publish(items, at_first=False)
+            return
+
         normalised: list[MessageBase] = []
 
         for item in items:
 
-            assert isinstance(item, (MessageBase, Iterable))
-
             if isinstance(item, MessageBase):
                 normalised.append(item)
+                continue
+
+            if MessageBase.VALIDATE:
+                assert isinstance(item, Iterable)
 
-            elif isinstance(item, Iterable):
-                assert all(isinstance(e, MessageBase) for e in item)
-                normalised.extend(item)
+            normalised.extend(item)
 
         self._publish(normalised, at_first=False)
 
@@ -308,18 +914,26 @@ class MessageQueue():  # pylint: disable=R0902
 
         Args:
             item (Message | Iterable[MessageBase]): Message to publish.
+
+        Raises:
+            queue.Full: If a message with `OverflowPolicy.REJECT` is
+                rejected.
         """
 
-        assert items is not None and isinstance(items, (Iterable, MessageBase))
+        if MessageBase.VALIDATE:
+            assert items is not None and isinstance(
+                items, (Iterable, MessageBase))
 
         self._publish(items, at_first=True)
 
     def clear(self) -> None:
         """Clears all messages from queue."""
 
-        with self._sync_root:
+        with self._queue_sync:
             self._queue_high.clear()
             self._queue_default.clear()
+            self._pending.clear()
+            self._queue_not_full.notify_all()
 
     def _is_registered(
         self, action: Callable[[MessageBase], None],
@@ -352,17 +966,33 @@ class MessageQueue():  # pylint: disable=R0902
     def register(
             self,
             action: Callable[[MessageBase], None],
-            predicate: Callable[[], bool] | None = None
+            predicate: Callable[[], bool] | None = None,
+            message_types: type | tuple[type, ...] | None = None,
+            lane: MessageQueue.Lane = Lane.INLINE,
     ) -> bool:
         """Registers a callback on the message queue.
 
         Calling the method with the same action twice will only register the
         callback once.
 
+        Prefer `message_types` over an `isinstance` predicate: typed callbacks
+        are looked up by message type and are not invoked at all for other
+        messages. A `predicate` is only evaluated for messages that match
+        `message_types`.
+
+        Callbacks that block, for example because they spawn processes,
+        should use a `DEDICATED` or `SHARED` lane, so that they do not delay
+        the dispatch to other subscribers. Messages are still delivered in
+        order per subscriber and HIGH priority messages first.
+
         Args:
             action (Callable): The action to invoke.
             predicate (Callable | None): The optional filter to determine if
                 an action should be invoked.
+            message_types (type | tuple[type, ...] | None): The optional
+                message type or types (including their subclasses) the action
+                subscribes to. If `None`, the action receives all messages.
+            lane (MessageQueue.Lane): Where the action is invoked.
 
         Returns:
             bool: True, if the action was sucessfully registered; false,
@@ -371,6 +1001,14 @@ class MessageQueue():  # pylint: disable=R0902
 
         assert action and callable(action)
         assert predicate is None or predicate and callable(predicate)
+        assert isinstance(lane, MessageQueue.Lane)
+
+        if isinstance(message_types, type):
+            message_types = (message_types,)
+        assert message_types is None or (
+            isinstance(message_types, tuple)
+            and message_types
+            and all(isinstance(e, type) for e in message_types))
 
         log.debug("Registering action '%s' ... [%s]",
                   MessageQueue.get_fqcn(action),
@@ -385,7 +1023,28 @@ class MessageQueue():  # pylint: disable=R0902
                     len(self._callbacks))
                 return False
 
-            self._callbacks.append(ActionDescriptor(action, predicate))
+            self._order += 1
+            durations = Histogram()
+            subscriber_lane = None
+            if MessageQueue.Lane.INLINE != lane:
+                subscriber_lane = SubscriberLane(
+                    lambda message: MessageQueue._invoke(
+                        action, durations, message),
+                    f"MessageQueue-{getattr(action, '__qualname__', '')}",
+                    MessageQueue.Lane.DEDICATED == lane)
+            item = ActionDescriptor(
+                action, predicate, message_types, self._order,
+                subscriber_lane, durations)
+
+            self._callbacks.append(item)
+            if message_types is None:
+                self._callbacks_any.append(item)
+            else:
+                for message_type in message_types:
+                    self._callbacks_by_type.setdefault(
+                        message_type, []).append(item)
+
+            self._dispatch_cache = {}
 
         log.info("Registering action '%s' OK [%s].",
                  MessageQueue.get_fqcn(action),
@@ -393,6 +1052,23 @@ class MessageQueue():  # pylint: disable=R0902
 
         return True
 
+    def _remove_from_index(self, item: ActionDescriptor) -> None:
+        """Internal: removes a callback from the type index. Lock must be
+        held."""
+
+        if item.message_types is None:
+            self._callbacks_any = [
+                e for e in self._callbacks_any if e is not item]
+            return
+
+        for message_type in item.message_types:
+            items = [e for e in self._callbacks_by_type.get(message_type, [])
+                     if e is not item]
+            if items:
+                self._callbacks_by_type[message_type] = items
+            else:
+                self._callbacks_by_type.pop(message_type, None)
+
     def unregister(self, action: Callable[[MessageBase], None]) -> bool:
         """Unregisters a callback on the message queue
 
@@ -417,6 +1093,10 @@ class MessageQueue():  # pylint: disable=R0902
                     continue
 
                 del self._callbacks[i]
+                self._remove_from_index(item)
+                if item.lane is not None:
+                    item.lane.close()
+                self._dispatch_cache = {}
                 result = True
                 break
 
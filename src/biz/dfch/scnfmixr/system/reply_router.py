@@ -0,0 +1,176 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module reply_router."""
+
+from __future__ import annotations
+from concurrent.futures import Future
+from itertools import count
+from threading import Lock
+from typing import ClassVar
+
+from biz.dfch.logging import log
+from biz.dfch.asyn import TimerWheel
+
+from ..public.system.message_base import MessageBase
+from .message_queue import MessageQueue
+
+__all__ = [
+    "ReplyRouter",
+]
+
+
+class ReplyRouter:
+    """Routes replies to pending requests by correlation id.
+
+    `request` assigns a `correlation_id` to a message, publishes it and
+    returns a future. A responder marks its reply with
+    `reply.correlate(request)`. One callback on the message queue resolves
+    the pending future with the same id, and one shared `TimerWheel` fails
+    it with a `TimeoutError` when no reply arrives in time. No callback is
+    registered or unregistered per request.
+    """
+
+    _sync_root: Lock
+    _ids: count
+    _pending: dict[int, tuple[MessageBase, Future, int]]
+    _timers: TimerWheel
+    _mq: MessageQueue
+
+    def __init__(self):
+        """Private ctor.
+
+        Raises:
+            AssertionError: If called directly.
+        """
+
+        if not ReplyRouter.Factory._sync_root.locked():
+            raise AssertionError("Private ctor. Use Factory instead.")
+
+        self._sync_root = Lock()
+        self._ids = count(1)
+        self._pending = {}
+        self._timers = TimerWheel()
+        self._mq = MessageQueue.Factory.get()
+        self._mq.register(
+            self._on_message, lambda e: e.correlation_id is not None)
+
+    class Factory:  # pylint: disable=R0903
+        """Factory class."""
+
+        __instance: ClassVar[ReplyRouter | None] = None
+        _sync_root: ClassVar[Lock] = Lock()
+
+        @staticmethod
+        def get() -> ReplyRouter:
+            """Creates or gets the instance of the reply router."""
+
+            if ReplyRouter.Factory.__instance is not None:
+                return ReplyRouter.Factory.__instance
+
+            with ReplyRouter.Factory._sync_root:
+
+                if ReplyRouter.Factory.__instance is not None:
+                    return ReplyRouter.Factory.__instance
+
+                ReplyRouter.Factory.__instance = ReplyRouter()
+
+            return ReplyRouter.Factory.__instance
+
+    def request(
+            self,
+            message: MessageBase,
+            timeout_s: float = 5,
+    ) -> Future[MessageBase]:
+        """Publishes a request and returns a future of its reply.
+
+        Args:
+            message (MessageBase): The request to publish.
+            timeout_s (float): The time to wait for the reply in seconds.
+
+        Returns:
+            Future[MessageBase]: The reply, or a `TimeoutError` if no reply
+                arrived in time. Cancelling the future discards the request.
+        """
+
+        assert isinstance(message, MessageBase)
+        assert isinstance(timeout_s, (int, float)) and 0 < timeout_s
+
+        correlation_id = next(self._ids)
+        message.correlate(correlation_id)
+
+        result: Future[MessageBase] = Future()
+
+        with self._sync_root:
+            timer = self._timers.schedule(
+                timeout_s, lambda: self._expire(correlation_id))
+            self._pending[correlation_id] = (message, result, timer)
+
+        result.add_done_callback(lambda _: self._discard(correlation_id))
+
+        self._mq.publish(message)
+
+        return result
+
+    def _discard(self, correlation_id: int) -> None:
+        """Internal: removes a request that completed or was cancelled."""
+
+        with self._sync_root:
+            item = self._pending.pop(correlation_id, None)
+
+        if item is not None:
+            self._timers.cancel(item[2])
+
+    def _expire(self, correlation_id: int) -> None:
+        """Internal: fails a request that did not receive a reply."""
+
+        with self._sync_root:
+            item = self._pending.pop(correlation_id, None)
+
+        if item is None:
+            return
+
+        message, future, _ = item
+
+        log.warning("Request '%s' [%s] timed out.",
+                    message.name, correlation_id)
+
+        if future.set_running_or_notify_cancel():
+            future.set_exception(TimeoutError(
+                f"No reply to '{message.name}' [{correlation_id}]."))
+
+    def _on_message(self, message: MessageBase) -> None:
+        """Message handler. Resolves the pending request of a reply."""
+
+        correlation_id = message.correlation_id
+
+        with self._sync_root:
+            item = self._pending.get(correlation_id)
+            if item is None or item[0] is message:
+                return
+
+            del self._pending[correlation_id]
+
+        _, future, timer = item
+        self._timers.cancel(timer)
+
+        if future.set_running_or_notify_cancel():
+            future.set_result(message)
+
+    def __len__(self) -> int:
+        """Returns the number of pending requests."""
+
+        return len(self._pending)
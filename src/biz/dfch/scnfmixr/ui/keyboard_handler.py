@@ -77,7 +77,7 @@ class KeyboardHandler(EventHandlerBase):
 
         MessageQueue.Factory.get().register(
             self._on_shutdown,
-            lambda msg: isinstance(msg, SystemMessage.Shutdown)
+            message_types=SystemMessage.Shutdown
         )
 
     def dispose(self):
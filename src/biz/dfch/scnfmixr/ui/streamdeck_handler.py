@@ -130,9 +130,9 @@ class StreamdeckHandler(EventHandlerBase):
         self._mq = MessageQueue.Factory.get()
         self._mq.register(
             self._on_message,
-            lambda e: isinstance(e, (
+            message_types=(
                 SystemMessage.StateMachine.StateMachineStateEnter,
-                SystemMessage.Shutdown)))
+                SystemMessage.Shutdown))
 
         # Initialize image library and resolver.
         self._resolver = StreamdeckInputResolver()
@@ -58,7 +58,7 @@ class UserInteractionAudio(UserInteractionBase):
 
         self._message_queue.register(
             self._on_message,
-            lambda e: isinstance(e, SystemMessage.UiEventInfoMessageBase))
+            message_types=SystemMessage.UiEventInfoMessageBase)
 
     def _on_message(self, message):
 
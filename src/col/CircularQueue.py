@@ -102,18 +102,57 @@ class CircularQueue(Generic[T]):
 
             return self._queue.popleft()
 
+    def dequeue_many(self, count: int) -> Sequence[T]:
+        """Returns up to `count` oldest items from the queue.
+
+        Args:
+            count (int): The maximum number of items to dequeue.
+
+        Returns:
+            Sequence[T]: The dequeued items, oldest first.
+        """
+
+        assert isinstance(count, int) and 0 <= count
+
+        with self._lock:
+            count = min(count, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def drain(self) -> Sequence[T]:
+        """Returns all items and empties the queue.
+
+        Returns:
+            Sequence[T]: The dequeued items, oldest first.
+        """
+
+        with self._lock:
+            result = list(self._queue)
+            self._queue.clear()
+
+        return result
+
     def dequeue_filter(self, predicate: Callable[[T], bool]) -> Sequence[T]:
+        """Returns all items matching `predicate` and removes them from the
+        queue. Items not matching remain in their order.
+
+        Runs in a single pass, O(n), while holding the lock.
+
+        Args:
+            predicate (Callable[[T], bool]): Selects the items to dequeue.
+
+        Returns:
+            Sequence[T]: The dequeued items, oldest first.
+        """
 
         result = []
         with self._lock:
-            for i in range(len(self._queue) - 1, -1, -1):
-
-                candidate = self._queue[i]
-                if not predicate(candidate):
-                    continue
+            remaining: Deque[T] = deque(maxlen=self._queue.maxlen)
+            for item in self._queue:
+                if predicate(item):
+                    result.append(item)
+                else:
+                    remaining.append(item)
 
-                result.append(candidate)
-                del self._queue[i]
+            self._queue = remaining
 
-        result.reverse()
         return result
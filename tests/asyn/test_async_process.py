@@ -0,0 +1,233 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_async_process."""
+
+import logging
+import os
+import random
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+
+from biz.dfch.asyn import AsyncProcess, Process
+
+from tests.benchmark import benchmark
+
+
+def _create(max_concurrency: int) -> AsyncProcess:
+    # pylint: disable=W0212
+    with AsyncProcess.Factory._sync_root:
+        return AsyncProcess(max_concurrency)
+
+
+class TestAsyncProcess(unittest.TestCase):
+    """Testing AsyncProcess."""
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+        self.sut = AsyncProcess.Factory.get()
+
+    def test_run_sync_returns_output(self):
+        """stdin is sent; stdout and exit code are returned."""
+
+        result = self.sut.run_sync(["/bin/cat"], stdin=["a", "b"])
+
+        self.assertTrue(result.is_ok)
+        self.assertEqual(["a", "b"], result.stdout)
+        self.assertEqual([], result.stderr)
+
+    def test_run_sync_with_exit_code(self):
+        """A failing process is not ok."""
+
+        result = self.sut.run_sync(
+            ["/bin/sh", "-c", "echo err >&2; exit 3"])
+
+        self.assertFalse(result.is_ok)
+        self.assertEqual(3, result.return_code)
+        self.assertEqual(["err"], result.stderr)
+
+    def test_run_sync_terminates_on_deadline(self):
+        """The process is terminated when the deadline passes."""
+
+        start = time.monotonic()
+        result = self.sut.run_sync(["/bin/sleep", "10"], timeout=0.2)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result.is_timed_out)
+        self.assertFalse(result.is_ok)
+        self.assertIsNotNone(result.return_code)
+        self.assertLess(elapsed, 1)
+
+    def test_run_sync_keeps_output_on_deadline(self):
+        """Output read before the deadline is returned."""
+
+        result = self.sut.run_sync(
+            ["/bin/sh", "-c", "echo out; echo err >&2; exec sleep 10"],
+            timeout=0.5)
+
+        self.assertTrue(result.is_timed_out)
+        self.assertEqual(["out"], result.stdout)
+        self.assertEqual(["err"], result.stderr)
+
+    def test_cancel_terminates_process(self):
+        """Cancelling the future terminates the process."""
+
+        fd, pid_file = tempfile.mkstemp()
+        os.close(fd)
+        future = self.sut.submit(
+            ["/bin/sh", "-c", f"echo $$ > {pid_file}.tmp; "
+             f"mv {pid_file}.tmp {pid_file}; exec sleep 10"])
+
+        end = time.monotonic() + 5
+        while 0 == os.path.getsize(pid_file) and time.monotonic() < end:
+            time.sleep(0.01)
+        with open(pid_file, encoding="utf-8") as file:
+            pid = int(file.read())
+        os.remove(pid_file)
+
+        self.assertTrue(future.cancel())
+
+        end = time.monotonic() + 5
+        while time.monotonic() < end:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.01)
+        else:
+            self.fail(f"Process [{pid}] still running.")
+
+    def test_run_all_sync_keeps_order(self):
+        """Results are in the order of the commands."""
+
+        cmds = [["/bin/sh", "-c", f"sleep 0.0{9 - e}; echo {e}"]
+                for e in range(5)]
+        cmds.append(["/nonexistent"])
+
+        result = self.sut.run_all_sync(cmds, timeout=5)
+
+        self.assertEqual([[str(e)] for e in range(5)],
+                         [e.stdout for e in result[:5]])
+        self.assertIsNone(result[5].return_code)
+        self.assertFalse(result[5].is_ok)
+
+    def test_limiter_bounds_concurrency(self):
+        """No more than `max_concurrency` processes run at the same time."""
+
+        sut = _create(2)
+
+        start = time.monotonic()
+        result = sut.run_all_sync([["/bin/sleep", "0.2"]] * 6)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(all(e.is_ok for e in result))
+        self.assertGreaterEqual(elapsed, 0.6)
+        self.assertLess(elapsed, 0.6 + 0.3)
+
+    def test_run_with_environment(self):
+        """The environment is passed as is."""
+
+        env = Process.Environment.create({"SCNFMIXR_TEST": "1"})
+
+        result = self.sut.run_sync(["/usr/bin/env"], env=env)
+
+        self.assertIn("SCNFMIXR_TEST=1", result.stdout)
+
+
+@benchmark
+class TestAsyncProcessBenchmark(unittest.TestCase):
+    """End-to-end flows with stub binaries of 20-80ms latency.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    _DEVICES = 8
+    _FILES = 40
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+        logging.disable(logging.CRITICAL)
+        self.path = tempfile.mkdtemp()
+        random.seed(42)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.path)
+
+    def _stub(self, name: str) -> str:
+        """A stub that answers after 20-80ms."""
+
+        fullname = os.path.join(self.path, name)
+        with open(fullname, "w", encoding="utf-8") as file:
+            file.write("#!/bin/sh\n"
+                       "sleep 0.0$(( $$ % 7 + 2 ))\n"
+                       "echo \"$@\"\n")
+        os.chmod(fullname, os.stat(fullname).st_mode | stat.S_IEXEC)
+
+        return fullname
+
+    def test_benchmark(self):
+        """Prints sequential and concurrent durations per flow."""
+
+        udevadm = self._stub("udevadm")
+        mpc = self._stub("mpc")
+        devices = [f"/dev/sd{chr(ord('a') + e)}" for e in range(self._DEVICES)]
+        files = [f"file{e}.flac" for e in range(self._FILES)]
+        sut = AsyncProcess.Factory.get()
+
+        # Device detection: one udevadm call per device.
+        start = time.perf_counter()
+        for device in devices:
+            Process.communicate([udevadm, "info", "--name", device])
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sut.run_all_sync([[udevadm, "info", "--name", e] for e in devices])
+        concurrent = time.perf_counter() - start
+
+        print(f"\ndetection ({self._DEVICES} devices): "
+              f"sequential {sequential * 1000:.0f}ms, "
+              f"async {concurrent * 1000:.0f}ms")
+
+        # Playback queue: update, list, add per file, playlist.
+        start = time.perf_counter()
+        Process.communicate([mpc, "update"])
+        Process.communicate([mpc, "listall"])
+        for file in files:
+            Process.communicate([mpc, "add", file])
+        Process.communicate([mpc, "playlist"])
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sut.run_sync([mpc, "update"])
+        sut.run_sync([mpc, "listall"])
+        sut.run_sync([mpc, "add", *files])
+        sut.run_sync([mpc, "playlist"])
+        concurrent = time.perf_counter() - start
+
+        print(f"playback queue ({self._FILES} files): "
+              f"sequential {sequential * 1000:.0f}ms, "
+              f"async {concurrent * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
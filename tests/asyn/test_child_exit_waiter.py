@@ -0,0 +1,196 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_child_exit_waiter."""
+
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+from biz.dfch.asyn import ChildExitWaiter, Process
+
+# A child that ignores SIGTERM and signals when the handler is installed.
+STUB_IGNORING_SIGTERM = [
+    sys.executable, "-c",
+    "import signal, time; "
+    "signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+    "print('ready', flush=True); "
+    "time.sleep(60)",
+]
+
+STUB = [
+    sys.executable, "-c",
+    "import time; print('ready', flush=True); time.sleep(60)",
+]
+
+
+class TestChildExitWaiter(unittest.TestCase):
+    """Testing event-driven exit detection and the stop deadline schedule."""
+
+    # Wall-clock tolerance against the configured deadline.
+    _TOLERANCE = 0.010
+    _DEADLINE = 0.3
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+    def _start(self, cmd: list[str]) -> Process:
+        result = Process.start(cmd, capture_stdout=True)
+
+        end = time.monotonic() + 10
+        while time.monotonic() < end:
+            if "ready" in result.stdout:
+                return result
+            time.sleep(0.01)
+
+        self.fail("Stub child did not start.")
+
+    def test_wait_returns_when_child_exits(self):
+        """Waiting returns on exit, not on the deadline."""
+
+        sut = Process.start(["/bin/sleep", "0.1"])
+
+        start = time.monotonic()
+        # pylint: disable=W0212
+        result = ChildExitWaiter.wait([sut._popen], start + 5)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result)
+        self.assertEqual(0, sut.exit_code)
+        self.assertLess(elapsed, 0.1 + 0.05)
+
+    def test_wait_returns_false_on_deadline(self):
+        """A running child makes waiting return at the deadline."""
+
+        sut = self._start(STUB)
+
+        start = time.monotonic()
+        # pylint: disable=W0212
+        result = ChildExitWaiter.wait([sut._popen], start + self._DEADLINE)
+        elapsed = time.monotonic() - start
+
+        self.assertFalse(result)
+        self.assertAlmostEqual(self._DEADLINE, elapsed, delta=self._TOLERANCE)
+
+        sut.stop()
+
+    def test_wait_without_pidfd_polls(self):
+        """Without pidfds, children are polled."""
+
+        sut = Process.start(["/bin/sleep", "0.1"])
+
+        with patch.object(ChildExitWaiter, "_open_pidfd", return_value=None):
+            # pylint: disable=W0212
+            result = ChildExitWaiter.wait(
+                [sut._popen], time.monotonic() + 5)
+
+        self.assertTrue(result)
+        self.assertEqual(0, sut.exit_code)
+
+    def test_stop_child_ignoring_sigterm_takes_deadline(self):
+        """SIGTERM is ignored; SIGKILL is sent at the deadline."""
+
+        sut = self._start(STUB_IGNORING_SIGTERM)
+
+        start = time.monotonic()
+        result = sut.stop(max_wait_time=self._DEADLINE, force=True)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result)
+        self.assertFalse(sut.is_running)
+        self.assertAlmostEqual(self._DEADLINE, elapsed, delta=self._TOLERANCE)
+
+    def test_stop_child_ignoring_sigterm_without_force_throws(self):
+        """Without force, stopping fails at the deadline."""
+
+        sut = self._start(STUB_IGNORING_SIGTERM)
+
+        start = time.monotonic()
+        with self.assertRaises(RuntimeError):
+            sut.stop(max_wait_time=self._DEADLINE)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(sut.is_running)
+        self.assertAlmostEqual(self._DEADLINE, elapsed, delta=self._TOLERANCE)
+
+        sut.stop(max_wait_time=1, force=True)
+
+    def test_stop_with_force_returns_false_if_child_survives(self):
+        """With force, a child that cannot be stopped returns False."""
+
+        sut = self._start(STUB)
+
+        with patch.object(Process, "_escalate", return_value=False):
+            result = sut.stop(max_wait_time=self._DEADLINE, force=True)
+
+        self.assertFalse(result)
+        self.assertTrue(sut.is_running)
+
+        sut.stop(max_wait_time=1, force=True)
+
+    def test_stop_returns_when_child_exits(self):
+        """A child that handles SIGTERM is stopped without delay."""
+
+        sut = self._start(STUB)
+
+        start = time.monotonic()
+        result = sut.stop(max_wait_time=5, force=True)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result)
+        self.assertLess(elapsed, 0.1)
+
+    def test_stop_all_takes_slowest_deadline(self):
+        """13 children in parallel: one deadline, not 13."""
+
+        processes = [
+            self._start(STUB_IGNORING_SIGTERM if 0 == idx % 2 else STUB)
+            for idx in range(13)]
+
+        start = time.monotonic()
+        result = Process.stop_all(
+            processes, max_wait_time=self._DEADLINE, force=True)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result)
+        self.assertTrue(all(not e.is_running for e in processes))
+        self.assertAlmostEqual(self._DEADLINE, elapsed, delta=self._TOLERANCE)
+
+    def test_communicate_escalates_on_schedule(self):
+        """communicate sends the next signal after each step's deadline."""
+
+        schedule = ((15, 0.1), (2, 0.1), (9, 1.0))
+
+        start = time.monotonic()
+        with patch.object(Process, "_COMMUNICATE_SCHEDULE", schedule):
+            stdout, _ = Process.communicate(
+                STUB_IGNORING_SIGTERM[:2] + [
+                    "import signal, time; "
+                    "signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+                    "signal.signal(signal.SIGINT, signal.SIG_IGN); "
+                    "print('ready', flush=True); "
+                    "time.sleep(60)"],
+                max_wait_time=0.5)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(["ready"], stdout)
+        self.assertAlmostEqual(0.5 + 0.1 + 0.1, elapsed, delta=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_concurrent_queue."""
+
+import logging
+import queue
+import threading
+import time
+import unittest
+
+from biz.dfch.asyn import ConcurrentQueue, ConcurrentQueueT
+
+from tests.benchmark import benchmark
+
+
+class _LockedQueue:
+    """The previous design: a `queue.Queue` wrapped in a lock that is held
+    across the blocking `get`."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._sync_root = threading.Lock()
+
+    def enqueue(self, item):
+        with self._sync_root:
+            self._queue.put(item)
+
+    def dequeue(self, timeout_ms):
+        with self._sync_root:
+            try:
+                return self._queue.get(block=True, timeout=timeout_ms / 1000)
+            except queue.Empty:
+                return None
+
+
+class TestConcurrentQueue(unittest.TestCase):
+    """Testing `ConcurrentQueue`."""
+
+    def test_dequeue_is_fifo(self):
+
+        sut = ConcurrentQueue()
+        for item in range(3):
+            sut.enqueue(item)
+
+        self.assertEqual(3, sut.size)
+        self.assertEqual([0, 1, 2], [sut.dequeue() for _ in range(3)])
+        self.assertTrue(sut.is_empty)
+
+    def test_dequeue_empty_returns_none(self):
+
+        sut = ConcurrentQueue()
+
+        self.assertIsNone(sut.dequeue())
+        self.assertIsNone(sut.dequeue(10))
+
+    def test_dequeue_empty_with_do_raise_throws(self):
+
+        sut = ConcurrentQueue(do_raise=True)
+
+        with self.assertRaises(queue.Empty):
+            sut.dequeue()
+        with self.assertRaises(queue.Empty):
+            sut.dequeue(10)
+
+    def test_dequeue_timeout_elapses(self):
+
+        sut = ConcurrentQueue()
+
+        start = time.monotonic()
+        result = sut.dequeue(100)
+        elapsed = time.monotonic() - start
+
+        self.assertIsNone(result)
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 1)
+
+    def test_waiting_dequeue_does_not_block_producer(self):
+
+        sut = ConcurrentQueue()
+        results = []
+
+        consumer = threading.Thread(
+            target=lambda: results.append(sut.dequeue(5000)))
+        consumer.start()
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        self.assertTrue(sut.is_empty)
+        self.assertEqual(0, sut.size)
+        sut.enqueue("item")
+        elapsed = time.monotonic() - start
+
+        consumer.join(1)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(["item"], results)
+        self.assertLess(elapsed, 0.5)
+
+    def test_enqueue_on_full_queue_returns_false(self):
+
+        sut = ConcurrentQueue(max_size=2)
+
+        self.assertTrue(sut.enqueue(1))
+        self.assertTrue(sut.enqueue(2))
+        self.assertFalse(sut.enqueue(3, 0))
+        self.assertFalse(sut.enqueue(3, 10))
+        self.assertEqual(2, sut.size)
+
+    def test_enqueue_on_full_queue_with_do_raise_throws(self):
+
+        sut = ConcurrentQueue(do_raise=True, max_size=1)
+        sut.enqueue(1)
+
+        with self.assertRaises(queue.Full):
+            sut.enqueue(2, 10)
+
+    def test_blocked_enqueue_resumes_after_dequeue(self):
+
+        sut = ConcurrentQueue(max_size=1)
+        sut.enqueue(1)
+        results = []
+
+        producer = threading.Thread(
+            target=lambda: results.append(sut.enqueue(2, 5000)))
+        producer.start()
+        time.sleep(0.05)
+
+        self.assertEqual([], results)
+        self.assertEqual(1, sut.dequeue())
+
+        producer.join(1)
+
+        self.assertEqual([True], results)
+        self.assertEqual(2, sut.dequeue())
+
+    def test_clear_wakes_blocked_producer(self):
+
+        sut = ConcurrentQueue(max_size=1)
+        sut.enqueue(1)
+
+        producer = threading.Thread(target=sut.enqueue, args=(2,))
+        producer.start()
+        time.sleep(0.05)
+
+        sut.clear()
+        producer.join(1)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(2, sut.dequeue())
+
+    def test_enqueue_none_throws(self):
+
+        sut = ConcurrentQueue()
+
+        with self.assertRaises(AssertionError):
+            sut.enqueue(None)
+
+    def test_typed_queue_checks_type(self):
+
+        sut = ConcurrentQueueT[int](int, max_size=1)
+
+        self.assertTrue(sut.enqueue(1))
+        self.assertFalse(sut.enqueue(2, 0))
+        with self.assertRaises(AssertionError):
+            sut.enqueue("1")
+        self.assertEqual(1, sut.dequeue())
+
+    def test_producers_and_consumers_transfer_all_items(self):
+
+        sut = ConcurrentQueue(max_size=16)
+        count = 2000
+        received = []
+        lock = threading.Lock()
+
+        def produce(offset):
+            for item in range(count):
+                sut.enqueue(offset + item)
+
+        def consume():
+            while True:
+                item = sut.dequeue(200)
+                if item is None:
+                    return
+                with lock:
+                    received.append(item)
+
+        threads = [threading.Thread(target=produce, args=(e * count,))
+                   for e in range(4)]
+        threads += [threading.Thread(target=consume) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(list(range(4 * count)), sorted(received))
+
+
+@benchmark
+class TestConcurrentQueueBenchmark(unittest.TestCase):
+    """Contention with 4 producers and 4 consumers.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    PRODUCERS = 4
+    CONSUMERS = 4
+    ITEMS_PER_PRODUCER = 10_000
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _run(self, sut) -> tuple[float, float]:
+        """Returns throughput in items/s and p99 enqueue latency in us."""
+
+        latencies = [[] for _ in range(self.PRODUCERS)]
+        total = self.PRODUCERS * self.ITEMS_PER_PRODUCER
+        received = [0] * self.CONSUMERS
+        done = threading.Event()
+
+        def produce(index):
+            samples = latencies[index]
+            for item in range(self.ITEMS_PER_PRODUCER):
+                start = time.perf_counter()
+                sut.enqueue(item + 1)
+                samples.append(time.perf_counter() - start)
+
+        def consume(index):
+            while not done.is_set():
+                if sut.dequeue(50) is not None:
+                    received[index] += 1
+                    if total <= sum(received):
+                        done.set()
+
+        consumers = [threading.Thread(target=consume, args=(e,))
+                     for e in range(self.CONSUMERS)]
+        producers = [threading.Thread(target=produce, args=(e,))
+                     for e in range(self.PRODUCERS)]
+
+        start = time.perf_counter()
+        for thread in consumers + producers:
+            thread.start()
+        done.wait(60)
+        elapsed = time.perf_counter() - start
+        for thread in consumers + producers:
+            thread.join(1)
+
+        samples = sorted(e for sample in latencies for e in sample)
+        p99 = samples[int(len(samples) * 0.99)]
+
+        return total / elapsed, p99 * 1_000_000
+
+    def test_benchmark(self):
+        """Prints throughput and p99 enqueue latency."""
+
+        for name, sut in (
+                ("lock around queue.Queue", _LockedQueue()),
+                ("condition", ConcurrentQueue()),
+                ("condition, max_size=64", ConcurrentQueue(max_size=64))):
+            throughput, p99 = self._run(sut)
+            print(f"\n{name}: {throughput:,.0f} items/s, "
+                  f"p99 enqueue {p99:,.1f}us")
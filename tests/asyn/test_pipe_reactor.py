@@ -0,0 +1,296 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_pipe_reactor."""
+
+import logging
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from biz.dfch.asyn import PipeReactor, Process
+
+from tests.benchmark import benchmark
+
+
+class TestPipeReactor(unittest.TestCase):
+    """Testing PipeReactor."""
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+        self.lines = []
+        self.closed = threading.Event()
+
+        read_fd, self.write_fd = os.pipe()
+        # pylint: disable=R1732
+        self.stream = os.fdopen(read_fd, "rb")
+
+        PipeReactor.Factory.get().register(
+            self.stream, self.lines.append, self.closed.set)
+
+    def tearDown(self):
+        self.stream.close()
+
+    def _write(self, *chunks: bytes) -> None:
+        for chunk in chunks:
+            os.write(self.write_fd, chunk)
+            # Let the reactor read every chunk separately.
+            time.sleep(0.02)
+        os.close(self.write_fd)
+
+        self.assertTrue(self.closed.wait(5))
+
+    def test_lines_split_across_reads(self):
+        """Partial lines are joined; all newline styles terminate a line."""
+
+        self._write(b"a\nb", b"c\r", b"\nd\re", b"\r\n\nf")
+
+        self.assertEqual(["a", "bc", "d", "e", "", "f"], self.lines)
+
+    def test_multibyte_characters_split_across_reads(self):
+        """Incomplete UTF-8 sequences are decoded with the next read."""
+
+        data = "grüezi\n".encode("utf-8")
+
+        self._write(data[:3], data[3:])
+
+        self.assertEqual(["grüezi"], self.lines)
+
+    def test_callback_exception_does_not_stop_reactor(self):
+        """A failing callback is logged; later lines are delivered."""
+
+        def on_line(value: str):
+            if "boom" == value:
+                raise ValueError(value)
+            self.lines.append(value)
+
+        read_fd, write_fd = os.pipe()
+        closed = threading.Event()
+        with os.fdopen(read_fd, "rb") as stream:
+            PipeReactor.Factory.get().register(stream, on_line, closed.set)
+
+            os.write(write_fd, b"boom\nok\n")
+            os.close(write_fd)
+
+            self.assertTrue(closed.wait(5))
+
+        self.assertEqual(["ok"], self.lines)
+        self._write()
+
+    def test_failed_registration_does_not_stop_reactor(self):
+        """A pipe that cannot be registered is reported as closed."""
+
+        closed = threading.Event()
+
+        # The pipe is already registered.
+        PipeReactor.Factory.get().register(
+            self.stream, self.lines.append, closed.set)
+
+        self.assertTrue(closed.wait(5))
+
+        self._write(b"ok\n")
+
+        self.assertEqual(["ok"], self.lines)
+
+    def test_failed_read_does_not_stop_reactor(self):
+        """A pipe that cannot be read is reported as closed."""
+
+        read_fd, write_fd = os.pipe()
+        closed = threading.Event()
+        with (os.fdopen(read_fd, "rb") as stream,
+              patch.object(PipeReactor, "_read", side_effect=ValueError)):
+            PipeReactor.Factory.get().register(
+                stream, self.lines.append, closed.set)
+
+            os.write(write_fd, b"lost\n")
+
+            self.assertTrue(closed.wait(5))
+            os.close(write_fd)
+
+        self._write(b"ok\n")
+
+        self.assertEqual(["ok"], self.lines)
+
+    def test_unregister_allows_reuse_of_file_descriptor(self):
+        """A pipe closed before EOF does not affect a pipe reusing its fd."""
+
+        sut = PipeReactor.Factory.get()
+
+        read_fd, write_fd = os.pipe()
+        closed = threading.Event()
+        stream = os.fdopen(read_fd, "rb")  # pylint: disable=R1732
+        sut.register(stream, self.lines.append, closed.set)
+
+        sut.unregister(stream)
+        self.assertTrue(closed.is_set())
+        stream.close()
+        os.close(write_fd)
+
+        reused_fd, write_fd = os.pipe()
+        self.assertEqual(read_fd, reused_fd)
+        lines = []
+        closed = threading.Event()
+        with os.fdopen(reused_fd, "rb") as stream:
+            sut.register(stream, lines.append, closed.set)
+
+            os.write(write_fd, b"reused\n")
+            os.close(write_fd)
+
+            self.assertTrue(closed.wait(5))
+
+        self.assertEqual(["reused"], lines)
+        self._write()
+
+    def test_unregister_unknown_pipe_does_nothing(self):
+        """Unregistering a pipe that is not registered is ignored."""
+
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as stream:
+            PipeReactor.Factory.get().unregister(stream)
+        os.close(write_fd)
+
+        self._write(b"ok\n")
+
+        self.assertEqual(["ok"], self.lines)
+
+
+class TestProcessWithPipeReactor(unittest.TestCase):
+    """Testing Process reading pipes through the reactor."""
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+    def test_start_reads_stdout_and_stderr_without_threads(self):
+        """Output is available after completion; no reader threads."""
+
+        args = ["/bin/sh", "-c", "echo out1; echo err >&2; printf out2"]
+
+        sut = Process.start(args, wait_on_completion=True,
+                            capture_stdout=True, capture_stderr=True)
+
+        # pylint: disable=W0212
+        self.assertIsNone(sut._stdout_thread)
+        self.assertIsNone(sut._stderr_thread)
+        self.assertEqual(["out1", "out2"], sut.stdout)
+        self.assertEqual(["err"], sut.stderr)
+
+    def test_wait_returns_after_output_is_read(self):
+        """`wait` returns when the exit code and all output are there."""
+
+        args = ["/bin/sh", "-c", "seq 1 1000"]
+
+        sut = Process.start(args, capture_stdout=True)
+        result = sut.wait(5)
+
+        self.assertEqual(0, result)
+        self.assertEqual([str(e) for e in range(1, 1001)], sut.stdout)
+
+    def test_stop_closes_pipes_inherited_by_children(self):
+        """Pipes kept open by a child are unregistered and closed."""
+
+        args = ["/bin/sh", "-c", "sleep 3 & echo ready"]
+
+        sut = Process.start(args, capture_stdout=True)
+        sut.wait(5)
+
+        result = sut.stop()
+
+        self.assertFalse(result)
+        # pylint: disable=W0212
+        self.assertTrue(sut._popen.stdout.closed)
+        self.assertTrue(sut._pipes_closed.is_set())
+        self.assertEqual(["ready"], sut.stdout)
+
+    def test_start_without_reactor_uses_threads(self):
+        """The thread based readers are still available."""
+
+        args = ["/bin/sh", "-c", "echo out"]
+
+        with patch.object(Process, "_USE_PIPE_REACTOR", False):
+            sut = Process.start(args, capture_stdout=True)
+            sut.wait(5)
+
+        # pylint: disable=W0212
+        self.assertIsInstance(sut._stdout_thread, threading.Thread)
+        self.assertEqual(["out"], sut.stdout)
+
+
+def _get_rss_kib() -> int:
+    """Returns the resident set size of this process."""
+
+    with open("/proc/self/status", encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+    return 0
+
+
+@benchmark
+class TestPipeReactorBenchmark(unittest.TestCase):
+    """Threads and RSS for long-lived children with captured pipes.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    # Roughly a running bus group: ecasound, zita bridges, jack_capture.
+    _CHILDREN = 20
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _measure(self, use_reactor: bool) -> tuple[int, int]:
+        threads = threading.active_count()
+        rss = _get_rss_kib()
+
+        with patch.object(Process, "_USE_PIPE_REACTOR", use_reactor):
+            processes = [
+                Process.start(["/bin/sleep", "30"],
+                              capture_stdout=True, capture_stderr=True)
+                for _ in range(self._CHILDREN)]
+
+        time.sleep(0.5)
+        result = (threading.active_count() - threads, _get_rss_kib() - rss)
+
+        for process in processes:
+            process.stop(force=True)
+            process.wait(5)
+
+        return result
+
+    def test_benchmark(self):
+        """Prints additional threads and RSS per mode."""
+
+        # The reactor adds a single thread for all children.
+        for use_reactor in (False, True):
+            threads, rss = self._measure(use_reactor)
+            print(f"\n{'reactor' if use_reactor else 'threads'}: "
+                  f"{self._CHILDREN} children, +{threads} threads, "
+                  f"+{rss} KiB RSS")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,11 +15,34 @@
 
 """Contains platform specific tests."""
 
+import logging
+import statistics
+import time
 import unittest
+from unittest.mock import patch
 import os
+import subprocess
+import sys
+import tempfile
 
 from biz.dfch.asyn import Process
 
+from tests.benchmark import benchmark
+
+# Prints a `jack_lsp` like port list.
+JACK_LSP_STUB = [
+    "/usr/bin/printf",
+    "%s\\n",
+    "system:capture_1",
+    "system:capture_2",
+    "system:playback_1",
+    "system:playback_2",
+    "Mixbus:MX0-capture_1",
+    "Mixbus:MX0-capture_2",
+    "Mixbus:MX0-playback_1",
+    "Mixbus:MX0-playback_2",
+]
+
 
 class TestProcess(unittest.TestCase):
     """Testing Process class."""
@@ -300,6 +323,24 @@ class TestProcess(unittest.TestCase):
         result = sut.stop(max_wait_time=1, force=True)
         self.assertFalse(result)
 
+    def test_wait_linux_returns_exit_code(self):
+        """This test is **OS/platform specific**"""
+
+        if self._POSIX != os.name:
+            self.skipTest(f"This test needs to run on {self._POSIX}.")
+
+        sut = Process.start(["/usr/bin/sleep", "15"])
+
+        result = sut.wait(0.1)
+        self.assertIsNone(result)
+
+        sut.stop(max_wait_time=1, force=True)
+
+        sut = Process.start(["/usr/bin/sleep", "0.1"])
+
+        result = sut.wait(5)
+        self.assertEqual(0, result)
+
     def test_stdin_with_input_succeeds(self):
         """Testing stdin with input succeeds."""
 
@@ -332,3 +373,175 @@ class TestProcess(unittest.TestCase):
         stdout, stderr = Process.communicate(cmd)
 
         self.assertTrue("system:capture_1" in stdout[0])
+
+    def test_read_output_returns_batches(self):
+        """Output of both pipes is returned in batches, oldest first."""
+
+        if self._POSIX != os.name:
+            self.skipTest(f"This test needs to run on {self._POSIX}.")
+
+        args = ["/bin/sh", "-c", "echo 1; echo 2 >&2; echo 3"]
+
+        sut = Process.start(args, capture_stdout=True, capture_stderr=True)
+        sut.wait(5)
+
+        result = sut.read_output(2) + sut.read_output(2)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual(
+            ["1", "3"], [e[1] for e in result if "stdout" == e[0]])
+        self.assertEqual(["2"], [e[1] for e in result if "stderr" == e[0]])
+        self.assertEqual([], sut.output)
+
+
+class TestProcessCommunicateFastPath(unittest.TestCase):
+    """Testing the spawn fast path of `communicate`."""
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+    def test_communicate_resolves_executable(self):
+        """Relative executable names are resolved and spawned."""
+
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as mock:
+            stdout, _ = Process.communicate(["printf", "ok"])
+
+        self.assertTrue(os.path.isabs(mock.call_args.kwargs["args"][0]))
+        self.assertEqual(["ok"], stdout)
+
+    def test_communicate_with_cwd_does_not_resolve_executable(self):
+        """A working directory needs the regular path."""
+
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as mock:
+            stdout, _ = Process.communicate(["printf", "ok"], cwd="/")
+
+        self.assertEqual("printf", mock.call_args.kwargs["args"][0])
+        self.assertEqual(["ok"], stdout)
+
+    def test_resolve_executable_uses_path_of_env(self):
+        """The executable is searched on `PATH` of the environment passed."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            name = "scnfmixr-test-executable"
+            path = os.path.join(directory, name)
+
+            self.assertEqual(name, Process._resolve_executable(
+                name, {"PATH": directory}))
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("#!/bin/sh\necho ok\n")
+            os.chmod(path, 0o755)
+
+            self.assertEqual(path, Process._resolve_executable(
+                name, {"PATH": directory}))
+            self.assertEqual(name, Process._resolve_executable(name, None))
+
+            stdout, _ = Process.communicate(
+                [name], env=Process.Environment({"PATH": directory}))
+            self.assertEqual(["ok"], stdout)
+
+            os.remove(path)
+
+            self.assertEqual(name, Process._resolve_executable(
+                name, {"PATH": directory}))
+
+    def test_communicate_starts_new_session(self):
+        """The fast path keeps the process in its own session."""
+
+        cmd = [sys.executable, "-c",
+               "import os; print(os.getsid(0) == os.getpid())"]
+
+        stdout, _ = Process.communicate(cmd)
+
+        self.assertEqual(["True"], stdout)
+
+    def test_communicate_closes_inheritable_descriptors(self):
+        """Inheritable descriptors (e.g. opened by C libraries) are closed."""
+
+        read_fd, write_fd = os.pipe()
+        try:
+            os.set_inheritable(write_fd, True)
+            cmd = [sys.executable, "-c",
+                   f"import os\ntry:\n    os.fstat({write_fd})\n"
+                   "    print('open')\nexcept OSError:\n    print('closed')"]
+
+            stdout, _ = Process.communicate(cmd)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        self.assertEqual(["closed"], stdout)
+
+    def test_communicate_without_stderr_capture(self):
+        """`stderr` is discarded."""
+
+        cmd = ["/bin/sh", "-c", "echo out; echo err >&2"]
+
+        stdout, stderr = Process.communicate(cmd, capture_stderr=False)
+
+        self.assertEqual(["out"], stdout)
+        self.assertEqual([], stderr)
+
+    def test_communicate_with_environment(self):
+        """Precomputed and ad hoc environments are both merged."""
+
+        env = Process.Environment.create({"SCNFMIXR_TEST": "precomputed"})
+
+        stdout, _ = Process.communicate(["/usr/bin/env"], env=env)
+        self.assertIn("SCNFMIXR_TEST=precomputed", stdout)
+        self.assertIn(f"PATH={os.environ['PATH']}", stdout)
+
+        stdout, _ = Process.communicate(
+            ["/usr/bin/env"], env={"SCNFMIXR_TEST": "merged"})
+        self.assertIn("SCNFMIXR_TEST=merged", stdout)
+        self.assertIn(f"PATH={os.environ['PATH']}", stdout)
+
+
+@benchmark
+class TestProcessCommunicateBenchmark(unittest.TestCase):
+    """Per call latency of `communicate` with a `jack_lsp` like stub.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    _ITERATIONS = 1000
+
+    def setUp(self):
+        if "posix" != os.name:
+            self.skipTest("This test needs to run on posix.")
+
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _measure(self, **kwargs) -> list[float]:
+        result = []
+        for _ in range(self._ITERATIONS):
+            start = time.perf_counter()
+            Process.communicate(JACK_LSP_STUB, **kwargs)
+            result.append((time.perf_counter() - start) * 1000)
+
+        return result
+
+    def test_benchmark(self):
+        """Prints the latency distribution per path."""
+
+        env = {"MPD_HOST": "localhost"}
+
+        with patch.object(Process, "_USE_SPAWN_FAST_PATH", False):
+            legacy = self._measure(env=env)
+
+        fast = self._measure(
+            env=Process.Environment.create(env), capture_stderr=False)
+
+        for name, values in (("legacy", legacy), ("fast path", fast)):
+            quantiles = statistics.quantiles(values, n=100)
+            print(f"\n{name}: {self._ITERATIONS} calls, "
+                  f"p50 {quantiles[49]:.3f}ms, p90 {quantiles[89]:.3f}ms, "
+                  f"p99 {quantiles[98]:.3f}ms, max {max(values):.3f}ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
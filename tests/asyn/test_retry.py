@@ -0,0 +1,199 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_retry."""
+
+import logging
+import threading
+import time
+import unittest
+
+from biz.dfch.asyn import Retry
+
+from tests.benchmark import benchmark
+
+
+class _StubBridge:
+    """Simulates an ALSA JACK bridge on a USB interface that is unplugged and
+    replugged after `replug_after_s`."""
+
+    def __init__(self, replug_after_s: float, event: threading.Event | None):
+        self._event = event
+        self.recovered_at: float | None = None
+        self.replugged_at = time.monotonic() + replug_after_s
+        self._timer = threading.Timer(replug_after_s, self._on_replug)
+        self._timer.start()
+
+    def _on_replug(self) -> None:
+        if self._event is not None:
+            self._event.set()
+
+    def recreate(self) -> bool:
+        """Stands in for `JackAlsaDevice._recreate_source_bridge`."""
+
+        if time.monotonic() < self.replugged_at:
+            return False
+
+        self.recovered_at = time.monotonic()
+        return True
+
+
+class TestRetry(unittest.TestCase):
+    """Testing `Retry`."""
+
+    def test_success_returns_immediately(self):
+
+        sut = Retry(base_wait_time_interval_ms=1000)
+
+        start = time.monotonic()
+        result = sut.invoke(lambda: True)
+
+        self.assertTrue(result)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_max_attempts_returns_false(self):
+
+        calls = []
+        sut = Retry(base_wait_time_interval_ms=1, max_attempts=3)
+
+        result = sut.invoke(lambda: calls.append(1))
+
+        self.assertFalse(result)
+        self.assertEqual(3, len(calls))
+
+    def test_deadline_is_not_overridden_by_max_interval(self):
+
+        sut = Retry(max_wait_time_ms=150,
+                    base_wait_time_interval_ms=10,
+                    max_wait_time_interval_ms=5000)
+
+        start = time.monotonic()
+        result = sut.invoke(lambda: False)
+        elapsed = time.monotonic() - start
+
+        self.assertFalse(result)
+        self.assertGreaterEqual(elapsed, 0.14)
+        self.assertLess(elapsed, 0.5)
+
+    def test_wait_does_not_exceed_deadline(self):
+
+        sut = Retry(max_wait_time_ms=100,
+                    base_wait_time_interval_ms=2000,
+                    max_wait_time_interval_ms=5000)
+
+        start = time.monotonic()
+        sut.invoke(lambda: False)
+
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_nested_retry_inherits_outer_deadline(self):
+
+        inner_deadlines = []
+
+        def inner():
+            inner_deadlines.append(Retry.get_deadline())
+            return False
+
+        def outer():
+            Retry(base_wait_time_interval_ms=10).invoke(inner)
+            return False
+
+        sut = Retry(max_wait_time_ms=200, base_wait_time_interval_ms=10)
+
+        start = time.monotonic()
+        sut.invoke(outer)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1)
+        self.assertLess(max(inner_deadlines), start + 0.25)
+        self.assertIsNone(Retry.get_deadline())
+
+    def test_jitter_shortens_waits(self):
+
+        sut = Retry(base_wait_time_interval_ms=50,
+                    factor_wait_time_interval=1.0,
+                    max_attempts=10,
+                    jitter=1.0)
+
+        start = time.monotonic()
+        sut.invoke(lambda: False)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.5)
+
+    def test_wake_event_cuts_backoff_short(self):
+
+        event = threading.Event()
+        calls = []
+        sut = Retry(base_wait_time_interval_ms=5000,
+                    max_wait_time_interval_ms=5000,
+                    wake_event=event)
+
+        def action():
+            calls.append(time.monotonic())
+            return 2 <= len(calls)
+
+        threading.Timer(0.05, event.set).start()
+
+        start = time.monotonic()
+        result = sut.invoke(action)
+
+        self.assertTrue(result)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertFalse(event.is_set())
+
+    def test_recovery_after_replug_with_wake_event(self):
+
+        event = threading.Event()
+        bridge = _StubBridge(0.2, event)
+        sut = Retry(spin_attempts=25, wake_event=event)
+
+        result = sut.invoke(bridge.recreate)
+
+        self.assertTrue(result)
+        self.assertLess(bridge.recovered_at - bridge.replugged_at, 0.05)
+
+
+@benchmark
+class TestRetryBenchmark(unittest.TestCase):
+    """Recovery time after a simulated USB unplug/replug.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    RUNS = 10
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_benchmark(self):
+        """Prints the delay from replug to recovered bridge."""
+
+        for name, use_event in (("sleep", False), ("wake event", True)):
+            delays = []
+            for run in range(self.RUNS):
+                event = threading.Event() if use_event else None
+                bridge = _StubBridge(0.1 + 0.037 * run, event)
+                Retry(spin_attempts=25, jitter=0.2,
+                      wake_event=event).invoke(bridge.recreate)
+                delays.append(bridge.recovered_at - bridge.replugged_at)
+
+            delays.sort()
+            print(f"\n{name}: replug to recovery "
+                  f"p50 {delays[len(delays) // 2] * 1000:.1f}ms, "
+                  f"max {delays[-1] * 1000:.1f}ms")
@@ -0,0 +1,219 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_thread_pool."""
+
+import threading
+import time
+import unittest
+import uuid
+
+from biz.dfch.asyn import ThreadPool
+
+
+def _get_pool(**kwargs) -> ThreadPool:
+    return ThreadPool.Factory.get(f"test-{uuid.uuid4()}", **kwargs)
+
+
+class TestThreadPool(unittest.TestCase):
+    """Testing `ThreadPool`."""
+
+    RUN_TIME_S = 0.05
+
+    def test_ctor_throws(self):
+
+        with self.assertRaises(RuntimeError):
+            ThreadPool("name", 1, 1, ThreadPool.RejectionPolicy.REJECT)
+
+    def test_factory_returns_same_instance(self):
+
+        sut = _get_pool()
+
+        self.assertIs(sut, ThreadPool.Factory.get(sut.name))
+        self.assertIn(sut.name, [e.name for e in ThreadPool.Factory.metrics()])
+
+    def test_invoke_runs_action(self):
+
+        sut = _get_pool()
+        done = threading.Event()
+
+        result = sut.invoke(done.set)
+
+        self.assertTrue(result)
+        self.assertTrue(done.wait(1))
+
+    def test_default_pool_is_unbounded(self):
+
+        sut = _get_pool(max_workers=1)
+        release = threading.Event()
+        ran = []
+
+        self.assertTrue(sut.invoke(release.wait, 2))
+        results = [sut.invoke(ran.append, i) for i in range(100)]
+
+        release.set()
+        time.sleep(0.1)
+
+        self.assertTrue(all(results))
+        self.assertEqual(list(range(100)), ran)
+        self.assertEqual(0, sut.metrics.max_queue_size)
+
+    def test_high_priority_job_is_delayed_by_at_most_one_job(self):
+
+        sut = _get_pool(max_workers=1, max_queue_size=64)
+        started = threading.Event()
+        high_started_at = []
+        high_done = threading.Event()
+
+        def low():
+            started.set()
+            time.sleep(self.RUN_TIME_S)
+
+        def high():
+            high_started_at.append(time.monotonic())
+            high_done.set()
+
+        for _ in range(20):
+            sut.submit(ThreadPool.Priority.BACKGROUND_IO, low)
+        self.assertTrue(started.wait(1))
+
+        submitted_at = time.monotonic()
+        sut.submit(ThreadPool.Priority.REALTIME_RECOVERY, high)
+
+        self.assertTrue(high_done.wait(2))
+        delay = high_started_at[0] - submitted_at
+        self.assertLessEqual(delay, self.RUN_TIME_S + 0.03)
+
+        metrics = sut.metrics
+        self.assertEqual(
+            1, metrics.counters[
+                ThreadPool.Priority.REALTIME_RECOVERY].completed)
+        self.assertLess(
+            1, metrics.counters[ThreadPool.Priority.BACKGROUND_IO].queue_depth)
+
+    def test_reject_policy_rejects_when_full(self):
+
+        sut = _get_pool(max_workers=1, max_queue_size=1,
+                        rejection_policy=ThreadPool.RejectionPolicy.REJECT)
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(2)
+
+        self.assertTrue(sut.invoke(block))
+        self.assertTrue(started.wait(1))
+        self.assertTrue(sut.invoke(block))
+
+        result = sut.submit(ThreadPool.Priority.REALTIME_RECOVERY, block)
+
+        release.set()
+        self.assertFalse(result)
+        self.assertEqual(
+            1, sut.metrics.counters[
+                ThreadPool.Priority.REALTIME_RECOVERY].rejected)
+
+    def test_discard_lowest_policy_discards_lower_priority_job(self):
+
+        sut = _get_pool(max_workers=1, max_queue_size=1)
+        release = threading.Event()
+        started = threading.Event()
+        ran = []
+
+        def block():
+            started.set()
+            release.wait(2)
+
+        self.assertTrue(sut.invoke(block))
+        self.assertTrue(started.wait(1))
+        self.assertTrue(sut.submit(
+            ThreadPool.Priority.BACKGROUND_IO, ran.append, "low"))
+        self.assertTrue(sut.submit(
+            ThreadPool.Priority.UI, ran.append, "ui"))
+        self.assertFalse(sut.submit(
+            ThreadPool.Priority.BACKGROUND_IO, ran.append, "low"))
+
+        release.set()
+        time.sleep(0.1)
+
+        self.assertEqual(["ui"], ran)
+        counters = sut.metrics.counters
+        self.assertEqual(
+            1, counters[ThreadPool.Priority.BACKGROUND_IO].discarded)
+        self.assertEqual(
+            1, counters[ThreadPool.Priority.BACKGROUND_IO].rejected)
+
+    def test_caller_runs_policy_runs_on_caller_thread(self):
+
+        sut = _get_pool(
+            max_workers=1, max_queue_size=1,
+            rejection_policy=ThreadPool.RejectionPolicy.CALLER_RUNS)
+        release = threading.Event()
+        started = threading.Event()
+        threads = []
+
+        def block():
+            started.set()
+            release.wait(2)
+
+        sut.invoke(block)
+        self.assertTrue(started.wait(1))
+        sut.invoke(block)
+
+        result = sut.invoke(
+            lambda: threads.append(threading.current_thread()))
+
+        release.set()
+        self.assertTrue(result)
+        self.assertEqual([threading.current_thread()], threads)
+
+    def test_metrics_count_failures_and_times(self):
+
+        sut = _get_pool(max_workers=1)
+        done = threading.Event()
+
+        def fail():
+            raise ValueError("expected")
+
+        sut.invoke(fail)
+        sut.invoke(time.sleep, self.RUN_TIME_S)
+        sut.invoke(done.set)
+        self.assertTrue(done.wait(1))
+        time.sleep(0.01)
+
+        metrics = sut.metrics
+        counters = metrics.counters[ThreadPool.Priority.UI]
+        self.assertEqual(3, counters.submitted)
+        self.assertEqual(2, counters.completed)
+        self.assertEqual(1, counters.failed)
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertGreaterEqual(counters.max_run_time_s, self.RUN_TIME_S)
+        self.assertGreaterEqual(counters.wait_time_s, self.RUN_TIME_S)
+
+    def test_workers_are_bounded(self):
+
+        sut = _get_pool(max_workers=2)
+        release = threading.Event()
+
+        for _ in range(5):
+            sut.invoke(release.wait, 2)
+        time.sleep(0.05)
+
+        metrics = sut.metrics
+        release.set()
+        self.assertEqual(2, metrics.workers)
+        self.assertEqual(2, metrics.active)
+        self.assertEqual(3, metrics.queue_depth)
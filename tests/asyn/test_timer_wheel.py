@@ -0,0 +1,109 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module test_timer_wheel."""
+
+import threading
+import time
+import unittest
+
+from biz.dfch.asyn import TimerWheel
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Testing `TimerWheel`."""
+
+    def test_callback_runs_after_delay(self):
+
+        done = threading.Event()
+        sut = TimerWheel()
+
+        start = time.monotonic()
+        sut.schedule(0.05, done.set)
+
+        self.assertTrue(done.wait(1))
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertEqual(0, len(sut))
+
+    def test_cancelled_callback_does_not_run(self):
+
+        done = threading.Event()
+        sut = TimerWheel()
+
+        handle = sut.schedule(0.05, done.set)
+
+        self.assertTrue(sut.cancel(handle))
+        self.assertFalse(sut.cancel(handle))
+        self.assertFalse(done.wait(0.1))
+        self.assertEqual(0, len(sut))
+
+    def test_callbacks_run_in_order_of_expiry(self):
+
+        result = []
+        done = threading.Event()
+        sut = TimerWheel()
+
+        sut.schedule(0.06, lambda: (result.append(3), done.set()))
+        sut.schedule(0.02, lambda: result.append(1))
+        sut.schedule(0.04, lambda: result.append(2))
+
+        self.assertTrue(done.wait(1))
+        self.assertEqual([1, 2, 3], result)
+
+    def test_timer_beyond_one_revolution_waits_for_its_round(self):
+
+        done = threading.Event()
+        sut = TimerWheel(tick_s=0.01, slot_count=4)
+
+        start = time.monotonic()
+        sut.schedule(0.1, done.set)
+
+        self.assertTrue(done.wait(1))
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_failing_callback_does_not_stop_wheel(self):
+
+        def fail():
+            raise ValueError("arbitrary")
+
+        done = threading.Event()
+        sut = TimerWheel()
+
+        sut.schedule(0.01, fail)
+        sut.schedule(0.03, done.set)
+
+        self.assertTrue(done.wait(1))
+
+    def test_worker_retires_when_idle_and_restarts(self):
+
+        done = threading.Event()
+        sut = TimerWheel()
+        sut.IDLE_TIMEOUT_S = 0.05
+
+        sut.schedule(0.01, lambda: None)
+        time.sleep(0.2)
+
+        self.assertIsNone(sut._thread)  # pylint: disable=W0212
+
+        sut.schedule(0.01, done.set)
+
+        self.assertTrue(done.wait(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module benchmark."""
+
+import os
+import unittest
+
+__all__ = ["benchmark"]
+
+BENCHMARK_ENV_NAME = "SCNFMIXR_BENCHMARK"
+
+benchmark = unittest.skipUnless(
+    os.environ.get(BENCHMARK_ENV_NAME),
+    f"Set {BENCHMARK_ENV_NAME}=1 to run benchmarks.")
+"""Class decorator for benchmark test cases. They only run if
+`SCNFMIXR_BENCHMARK` is set."""
@@ -13,11 +13,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections import deque
+import time
 import unittest
 from typing import Tuple
 
 from col import CircularQueue
 
+from tests.benchmark import benchmark
+
 
 class TestCircularQueue(unittest.TestCase):
     """Testing `CircularQueue` class."""
@@ -131,3 +135,91 @@ class TestCircularQueue(unittest.TestCase):
         self.assertEqual(1, len(result))
         self.assertEqual(expected_key, result[0][0])
         self.assertEqual(expected_value, result[0][1])
+
+    def test_dequeue_filter_keeps_order_and_max_size(self):
+        """Matching and remaining items keep their order; the size limit
+        still applies after filtering."""
+
+        sut = CircularQueue[int](4)
+        for value in range(6):
+            sut.enqueue(value)
+
+        result = sut.dequeue_filter(lambda e: 0 == e % 2)
+
+        self.assertEqual([2, 4], result)
+        self.assertEqual([3, 5], sut.drain())
+
+        for value in range(6):
+            sut.enqueue(value)
+        self.assertEqual(4, len(sut))
+
+    def test_dequeue_many_returns_oldest_items(self):
+        """At most `count` items are dequeued, oldest first."""
+
+        sut = CircularQueue[int]()
+        for value in range(5):
+            sut.enqueue(value)
+
+        self.assertEqual([0, 1], sut.dequeue_many(2))
+        self.assertEqual([], sut.dequeue_many(0))
+        self.assertEqual([2, 3, 4], sut.dequeue_many(10))
+        self.assertEqual([], sut.dequeue_many(10))
+
+    def test_drain_empties_queue(self):
+        """All items are returned, the queue is empty."""
+
+        sut = CircularQueue[int]()
+        for value in range(3):
+            sut.enqueue(value)
+
+        self.assertEqual([0, 1, 2], sut.drain())
+        self.assertFalse(sut.has_items)
+        self.assertEqual([], sut.drain())
+
+
+def _dequeue_filter_in_place(queue: deque, predicate) -> list:
+    """The previous implementation: `del` per match, O(n^2)."""
+
+    result = []
+    for i in range(len(queue) - 1, -1, -1):
+        candidate = queue[i]
+        if not predicate(candidate):
+            continue
+        result.append(candidate)
+        del queue[i]
+
+    result.reverse()
+    return result
+
+
+@benchmark
+class TestCircularQueueBenchmark(unittest.TestCase):
+    """`dequeue_filter` on a full queue of interleaved stdout/stderr lines.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    def test_benchmark(self):
+        """Prints the time to take all `stdout` lines."""
+
+        def predicate(e):
+            return "stdout" == e[0]
+
+        for size in (4096, 65536):
+            items = [("stdout" if 0 == e % 2 else "stderr", str(e))
+                     for e in range(size)]
+
+            queue = deque(items, maxlen=size)
+            start = time.perf_counter()
+            _dequeue_filter_in_place(queue, predicate)
+            in_place = time.perf_counter() - start
+
+            sut = CircularQueue[Tuple[str, str]](size)
+            for item in items:
+                sut.enqueue(item)
+            start = time.perf_counter()
+            sut.dequeue_filter(predicate)
+            single_pass = time.perf_counter() - start
+
+            print(f"\n{size} entries: in place {in_place * 1000:.2f}ms, "
+                  f"single pass {single_pass * 1000:.2f}ms")
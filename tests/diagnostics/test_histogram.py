@@ -0,0 +1,76 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_histogram."""
+
+import unittest
+
+from biz.dfch.diagnostics import Histogram
+
+
+class TestHistogram(unittest.TestCase):
+    """Testing `Histogram`."""
+
+    def test_empty_histogram_returns_zero(self):
+
+        sut = Histogram()
+
+        self.assertEqual(0, sut.count)
+        self.assertEqual(0.0, sut.percentile(99))
+        self.assertEqual(0.0, sut.mean_s)
+
+    def test_percentiles_are_within_factor_two(self):
+
+        sut = Histogram()
+        for _ in range(99):
+            sut.record(0.001)
+        sut.record(0.1)
+
+        self.assertEqual(100, sut.count)
+        self.assertAlmostEqual(0.199, sut.total_s)
+        self.assertEqual(0.1, sut.max_s)
+
+        p50 = sut.percentile(50)
+        self.assertGreaterEqual(p50, 0.001)
+        self.assertLess(p50, 0.002 + 1e-9)
+        self.assertLess(sut.percentile(99), 0.002 + 1e-9)
+        self.assertEqual(0.1, sut.percentile(100))
+
+    def test_percentile_does_not_exceed_max(self):
+
+        sut = Histogram()
+        sut.record(0.0003)
+
+        self.assertEqual(0.0003, sut.percentile(50))
+
+    def test_large_and_negative_values_are_clamped(self):
+
+        sut = Histogram()
+        sut.record(-1)
+        sut.record(1e9)
+
+        self.assertEqual(2, sut.count)
+        self.assertEqual(1e9, sut.percentile(100))
+
+    def test_snapshot_is_independent(self):
+
+        sut = Histogram()
+        sut.record(0.001)
+
+        result = sut.snapshot()
+        sut.record(0.001)
+
+        self.assertEqual(1, result.count)
+        self.assertEqual(2, sut.count)
@@ -42,6 +42,7 @@ class MockProcessJackConnectSucceeds():
     @staticmethod
     def communicate(cmd: list[str],
                     max_wait_time: float = 0,
+                    capture_stderr: bool = True,
                     ) -> tuple[list[str],
                                list[str]]:
         """communicate"""
@@ -109,6 +110,7 @@ class MockProcessJackDisconnectFails():
     @staticmethod
     def communicate(cmd: list[str],
                     max_wait_time: float = 0,
+                    capture_stderr: bool = True,
                     ) -> tuple[list[str],
                                list[str]]:
         """communicate"""
@@ -132,6 +134,7 @@ class MockProcessGetConnections2():
     @staticmethod
     def communicate(cmd: list[str],
                     max_wait_time: float = 0,
+                    capture_stderr: bool = True,
                     ) -> tuple[list[str],
                                list[str]]:
         """communicate"""
@@ -177,6 +180,7 @@ class MockProcessGetConnections3():
     @staticmethod
     def communicate(cmd: list[str],
                     max_wait_time: float = 0,
+                    capture_stderr: bool = True,
                     ) -> tuple[list[str],
                                list[str]]:
         """communicate"""
@@ -0,0 +1,199 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_jack_connection_batch."""
+
+import logging
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from biz.dfch.asyn import Process
+from biz.dfch.scnfmixr.jack_commands import JackConnectionBatch
+
+from tests.benchmark import benchmark
+
+
+_MODULE = "biz.dfch.scnfmixr.jack_commands.jack_connection_batch"
+
+
+class TestJackConnectionBatch(unittest.TestCase):
+    """Testing JackConnectionBatch."""
+
+    def test_duplicates_and_no_ops_are_skipped(self):
+        """Only edges changing the topology are applied."""
+
+        with patch.dict(sys.modules, {"jack": None}), \
+                patch(f"{_MODULE}.Process.communicate") as mock:
+            mock.return_value = (["0", "0"], [])
+
+            with JackConnectionBatch([("a:out", "b:in")]) as sut:
+                sut.connect("a:out", "b:in")
+                sut.connect("a:out", "c:in")
+                sut.connect("a:out", "c:in")
+                sut.disconnect("x:out", "y:in")
+                sut.connect("x:out", "b:in")
+
+        mock.assert_called_once()
+        stdin = mock.call_args.kwargs["stdin"]
+        self.assertEqual(2, len(stdin))
+        self.assertIn("a:out c:in", stdin[0])
+        self.assertIn("x:out b:in", stdin[1])
+
+        self.assertTrue(sut.is_ok)
+        self.assertEqual(4, len(sut.results))
+        self.assertEqual(
+            JackConnectionBatch.Status.SKIPPED,
+            sut.results[("a:out", "b:in")].status)
+        self.assertEqual(
+            JackConnectionBatch.Status.SKIPPED,
+            sut.results[("x:out", "y:in")].status)
+        self.assertEqual(
+            JackConnectionBatch.Status.OK,
+            sut.results[("a:out", "c:in")].status)
+
+    def test_last_operation_on_edge_wins(self):
+        """A disconnect after a connect on the same edge replaces it."""
+
+        sut = JackConnectionBatch([("a:out", "b:in")])
+        sut.connect("a:out", "b:in")
+        sut.disconnect("a:out", "b:in")
+
+        with patch.dict(sys.modules, {"jack": None}), \
+                patch(f"{_MODULE}.Process.communicate") as mock:
+            mock.return_value = (["1"], [])
+            result = sut.apply()
+
+        self.assertEqual(1, len(sut))
+        self.assertIn("jack_disconnect", mock.call_args.kwargs["stdin"][0])
+        self.assertEqual(
+            JackConnectionBatch.Operation.DISCONNECT,
+            result[("a:out", "b:in")].operation)
+        self.assertEqual(
+            JackConnectionBatch.Status.FAILED,
+            result[("a:out", "b:in")].status)
+        self.assertFalse(sut.is_ok)
+
+    def test_missing_output_marks_edge_as_failed(self):
+        """Edges without an exit code are reported as failed."""
+
+        with patch.dict(sys.modules, {"jack": None}), \
+                patch(f"{_MODULE}.Process.communicate") as mock:
+            mock.return_value = (["0"], [])
+
+            with JackConnectionBatch([]) as sut:
+                sut.connect("a:out", "b:in")
+                sut.connect("a:out", "c:in")
+
+        self.assertEqual(
+            [JackConnectionBatch.Status.OK, JackConnectionBatch.Status.FAILED],
+            [e.status for e in sut.results.values()])
+
+    def test_apply_via_client(self):
+        """An in-process JACK client is used when available."""
+
+        jack = MagicMock()
+        client = jack.Client.return_value
+        client.get_all_connections.return_value = []
+        client.disconnect.side_effect = RuntimeError("no such port")
+
+        with patch.dict(sys.modules, {"jack": jack}), \
+                patch(f"{_MODULE}.Process.communicate") as mock:
+
+            with JackConnectionBatch() as sut:
+                sut.connect("a:out", "b:in")
+                sut.disconnect("a:out", "c:in")
+                sut.connect("d:out", "e:in")
+
+        mock.assert_not_called()
+        self.assertEqual(2, client.connect.call_count)
+        client.disconnect.assert_not_called()
+        client.close.assert_called_once()
+        self.assertEqual(
+            JackConnectionBatch.Status.SKIPPED,
+            sut.results[("a:out", "c:in")].status)
+        self.assertTrue(sut.is_ok)
+
+    def test_exception_in_block_does_not_apply(self):
+        """Nothing is applied if the `with` block raises."""
+
+        with patch(f"{_MODULE}.Process.communicate") as mock:
+            with self.assertRaises(ValueError):
+                with JackConnectionBatch([]) as sut:
+                    sut.connect("a:out", "b:in")
+                    raise ValueError()
+
+        mock.assert_not_called()
+        self.assertEqual({}, sut.results)
+
+    def test_add_after_apply_raises(self):
+        """A batch can only be applied once."""
+
+        sut = JackConnectionBatch([])
+        sut.apply()
+
+        with self.assertRaises(RuntimeError):
+            sut.connect("a:out", "b:in")
+
+
+@benchmark
+class TestJackConnectionBatchBenchmark(unittest.TestCase):
+    """Spawn benchmarks. Set `SCNFMIXR_BENCHMARK=1` to run.
+
+    `/bin/true` stands in for `jack_connect`, so only the process overhead
+    is measured. The batch runs the shell fallback: one shell that still
+    forks one `/bin/true` per edge.
+    """
+
+    _EDGE_COUNT = 200
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_batch_vs_one_spawn_per_edge(self):
+        """Compares one `Process` per edge with one shell forking one
+        process per edge."""
+
+        edges = [(f"src:out_{i}", f"dst:in_{i}")
+                 for i in range(self._EDGE_COUNT)]
+
+        start = time.perf_counter()
+        for source, sink in edges:
+            Process.communicate(["/bin/true", source, sink])
+        per_edge = time.perf_counter() - start
+
+        with patch.dict(sys.modules, {"jack": None}), \
+                patch.object(JackConnectionBatch,
+                             "_JACK_CONNECT_FULLNAME", "/bin/true"):
+
+            start = time.perf_counter()
+            with JackConnectionBatch([]) as sut:
+                for source, sink in edges:
+                    sut.connect(source, sink)
+            batch = time.perf_counter() - start
+
+        self.assertTrue(sut.is_ok)
+
+        print(f"\n{self._EDGE_COUNT} edges: one Process per edge "
+              f"{per_edge * 1000:.0f}ms, one shell with "
+              f"{self._EDGE_COUNT} forks {batch * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
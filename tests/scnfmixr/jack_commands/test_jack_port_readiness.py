@@ -0,0 +1,117 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_jack_port_readiness."""
+
+import time
+import unittest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from biz.dfch.asyn import Process
+from biz.dfch.scnfmixr.jack_commands import JackPortReadiness
+
+
+_GET_PORTS = ("biz.dfch.scnfmixr.jack_commands.jack_port_readiness."
+              "JackConnection.get_ports")
+
+_PORTS = ["LCL:capture_1", "LCL:capture_2"]
+
+
+def create_process(stderr: list[list[str]], is_running: bool = True):
+    """Creates a fake process returning `stderr` chunk by chunk."""
+
+    result = MagicMock(spec=Process)
+    type(result).stderr = PropertyMock(side_effect=stderr + [[]] * 100)
+    type(result).is_running = PropertyMock(return_value=is_running)
+    type(result).exit_code = PropertyMock(
+        return_value=None if is_running else 1)
+
+    return result
+
+
+class TestJackPortReadiness(unittest.TestCase):
+    """Testing JackPortReadiness."""
+
+    @patch(_GET_PORTS)
+    def test_wait_returns_as_soon_as_ports_exist(self, mock):
+        """Ports are returned as soon as all of them are registered."""
+
+        mock.side_effect = [[], _PORTS[:1], _PORTS]
+        process = create_process([["Playback device information:"]])
+
+        sut = JackPortReadiness("LCL:capture_", 2, process, deadline=5)
+
+        start = time.monotonic()
+        result = sut.wait()
+
+        self.assertEqual(_PORTS, result)
+        self.assertIsNone(sut.error)
+        self.assertEqual(3, mock.call_count)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    @patch(_GET_PORTS)
+    def test_wait_fails_fast_on_error_line(self, mock):
+        """An error on stderr stops waiting."""
+
+        mock.return_value = []
+        process = create_process([
+            [],
+            ["Can't open ALSA capture device 'hw:CARD=LCL'."],
+        ])
+
+        sut = JackPortReadiness("LCL:capture_", 2, process, deadline=5)
+
+        start = time.monotonic()
+        result = sut.wait()
+
+        self.assertEqual([], result)
+        self.assertIn("Can't open ALSA", sut.error)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    @patch(_GET_PORTS)
+    def test_wait_fails_fast_on_exited_process(self, mock):
+        """A terminated bridge stops waiting."""
+
+        mock.return_value = []
+        process = create_process([], is_running=False)
+
+        sut = JackPortReadiness("LCL:capture_", 2, process, deadline=5)
+
+        result = sut.wait()
+
+        self.assertEqual([], result)
+        self.assertIn("exited", sut.error)
+        mock.assert_not_called()
+
+    @patch(_GET_PORTS)
+    def test_wait_stops_at_deadline(self, mock):
+        """Missing ports fail after the deadline."""
+
+        mock.return_value = _PORTS[:1]
+
+        sut = JackPortReadiness("LCL:capture_", 2, deadline=0.3)
+
+        start = time.monotonic()
+        result = sut.wait()
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([], result)
+        self.assertIn("1/2", sut.error)
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertLess(elapsed, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_audio_recorder."""
+
+from datetime import datetime
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from biz.dfch.scnfmixr.public.messages import AudioRecorder as msgt
+from biz.dfch.scnfmixr.public.storage import FileName
+from biz.dfch.scnfmixr.mixer.audio_recorder import AudioRecorder
+
+
+class TestAudioRecorderStop(unittest.TestCase):
+    """Testing non-blocking stop and background finalisation."""
+
+    _MODULE = "biz.dfch.scnfmixr.mixer.audio_recorder"
+
+    def setUp(self):
+        # pylint: disable=W0212
+        with patch(f"{self._MODULE}.MessageQueue.Factory.get") as mock:
+            mock.return_value = MagicMock()
+            with AudioRecorder.Factory._sync_root:
+                self.sut = AudioRecorder()
+
+        self.mq = self.sut._message_queue
+
+        self.file = FileName(
+            "/tmp", "00000001", datetime(2025, 1, 2, 3, 4, 5), "LCL")
+        self.process = MagicMock()
+        self.process.wait.return_value = 0
+
+        self.sut.state = AudioRecorder.Event.STARTED
+        self.sut.items = {"LCL": [self.file]}
+        self.sut._processes = [self.process]
+        self.sut._cue_points_times = [100.0, 101.0, 102.5]
+
+    def _published(self, message_type: type) -> list:
+        return [e.args[0] for e in self.mq.publish.call_args_list
+                if isinstance(e.args[0], message_type)]
+
+    def test_stop_returns_before_finalisation(self):
+        """Stopped is published before metaflac runs."""
+
+        release = threading.Event()
+
+        def save():
+            release.wait(5)
+            return True
+
+        with (patch(f"{self._MODULE}.JackTransport"),
+              patch(f"{self._MODULE}.FlacMetadataWriter") as mock):
+            writer = mock.return_value
+            writer.save.side_effect = save
+
+            result = self.sut.stop()
+
+            self.assertTrue(result)
+            self.assertEqual(AudioRecorder.Event.STOPPED, self.sut.state)
+            self.assertEqual(1, len(self._published(msgt.StoppedNotification)))
+            self.assertFalse(self.sut.wait_for_finalisation(0.05))
+
+            release.set()
+
+            self.assertTrue(self.sut.wait_for_finalisation(5))
+
+        self.process.wait.assert_called_once()
+        self.process.stop.assert_not_called()
+        mock.assert_called_once_with(self.file.fullname)
+        writer.set_tag.assert_called_once_with("TITLE", self.file.filename)
+        writer.set_cuesheet.assert_called_once_with([40960, 102400])
+        writer.add_seekpoints.assert_called_once_with([40960, 102400])
+
+        result = self._published(msgt.RecordingFinalisedNotification)
+        self.assertEqual(1, len(result))
+        self.assertEqual(self.file.fullname, result[0].value)
+        self.assertTrue(result[0].is_ok)
+
+    def test_delete_last_recording_waits_for_finalisation(self):
+        """A take is only deleted after its finalisation completed."""
+
+        release = threading.Event()
+        deleted = threading.Event()
+        item = MagicMock()
+        item.delete.side_effect = lambda: deleted.set() or True
+        self.sut._recordings = [[item]]  # pylint: disable=W0212
+
+        def save():
+            release.wait(5)
+            return True
+
+        with (patch(f"{self._MODULE}.JackTransport"),
+              patch(f"{self._MODULE}.FlacMetadataWriter") as mock):
+            mock.return_value.save.side_effect = save
+
+            self.assertTrue(self.sut.stop())
+
+            self.sut._on_message(  # pylint: disable=W0212
+                msgt.DeleteLastRecordingCommand())
+
+            self.assertFalse(deleted.wait(0.1))
+
+            release.set()
+
+            self.assertTrue(deleted.wait(5))
+
+        self.assertTrue(self.sut.wait_for_finalisation(5))
+        end = time.monotonic() + 5
+        while not self._published(msgt.DeleteLastRecordingNotification) \
+                and time.monotonic() < end:
+            time.sleep(0.01)
+        result = self._published(msgt.DeleteLastRecordingNotification)
+        self.assertEqual(1, len(result))
+        self.assertTrue(result[0].value)
+
+    def test_stop_terminates_hanging_capture_process(self):
+        """A capture process that does not exit is stopped."""
+
+        self.process.wait.return_value = None
+
+        with (patch(f"{self._MODULE}.JackTransport"),
+              patch(f"{self._MODULE}.FlacMetadataWriter",
+                    side_effect=ValueError("Not a FLAC file"))):
+
+            result = self.sut.stop()
+
+            self.assertTrue(self.sut.wait_for_finalisation(5))
+
+        self.assertTrue(result)
+        self.process.stop.assert_called_once_with(force=True)
+
+        result = self._published(msgt.RecordingFinalisedNotification)
+        self.assertEqual(1, len(result))
+        self.assertFalse(result[0].is_ok)
+
+    def test_stop_when_not_started_returns_false(self):
+        """Stopping an idle recorder does nothing."""
+
+        self.sut.state = AudioRecorder.Event.STOPPED
+
+        self.assertFalse(self.sut.stop())
+        self.process.wait.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_flac_metadata_writer."""
+
+import logging
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+
+from biz.dfch.scnfmixr.mixer import FlacMetadataWriter, TimeConversion
+
+from tests.benchmark import benchmark
+
+SAMPLES = Path(__file__).resolve().parents[2] / "integration"
+METAFLAC = shutil.which("metaflac")
+
+
+class TestFlacMetadataWriter(unittest.TestCase):
+    """Testing FlacMetadataWriter against the integration samples."""
+
+    # 4096 frame alignment and 75 fps at 48kHz (see TimeConversion).
+    _CUE_POINTS = [20480, 40960, 102400]
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.fullname = os.path.join(self.path, "item.flac")
+        shutil.copy(SAMPLES / "item-5s-1.flac", self.fullname)
+
+        self.audio = self._read_audio(self.fullname)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    @staticmethod
+    def _read_audio(fullname: str) -> bytes:
+        sut = FlacMetadataWriter(fullname)
+        with open(fullname, "rb") as file:
+            file.seek(sut.audio_offset)
+            return file.read()
+
+    def _write(self, fullname: str) -> bool:
+        sut = FlacMetadataWriter(fullname)
+        sut.set_tag("TITLE", "item")
+        sut.set_cuesheet(self._CUE_POINTS)
+        sut.add_seekpoints(self._CUE_POINTS)
+        return sut.save()
+
+    def test_reading_streaminfo(self):
+        """STREAMINFO of the samples is parsed."""
+
+        sut = FlacMetadataWriter(self.fullname)
+
+        self.assertEqual(48000, sut.sample_rate)
+        self.assertEqual(24, sut.bits_per_sample)
+        self.assertEqual(4096, sut.max_block_size)
+        self.assertEqual(245760, sut.total_samples)
+        self.assertEqual(86, sut.audio_offset)
+        self.assertEqual([], sut.comments)
+
+    def test_reading_invalid_file_throws(self):
+        """Non FLAC files are rejected."""
+
+        fullname = os.path.join(self.path, "invalid.flac")
+        with open(fullname, "wb") as file:
+            file.write(b"RIFF")
+
+        with self.assertRaises(ValueError):
+            FlacMetadataWriter(fullname)
+
+    def test_save_without_padding_rewrites_file_once(self):
+        """Metadata is written with padding; audio is unchanged."""
+
+        result = self._write(self.fullname)
+
+        self.assertFalse(result)
+        self.assertEqual(self.audio, self._read_audio(self.fullname))
+
+        sut = FlacMetadataWriter(self.fullname)
+        self.assertEqual(["TITLE=item"], sut.comments)
+        self.assertEqual([
+            (20480, 80, 4096),
+            (40960, 160, 4096),
+            (102400, 400, 4096),
+        ], sut.seekpoints)
+        self.assertEqual(["item.flac"], os.listdir(self.path))
+
+    def test_save_with_padding_writes_in_place(self):
+        """The second pass fits into the padding."""
+
+        self._write(self.fullname)
+        offset = FlacMetadataWriter(self.fullname).audio_offset
+
+        sut = FlacMetadataWriter(self.fullname)
+        sut.set_tag("TITLE", "other")
+        result = sut.save()
+
+        self.assertTrue(result)
+        sut = FlacMetadataWriter(self.fullname)
+        self.assertEqual(["TITLE=other"], sut.comments)
+        self.assertEqual(offset, sut.audio_offset)
+        self.assertEqual(self.audio, self._read_audio(self.fullname))
+
+    def test_cuesheet_layout(self):
+        """Tracks start at the cue points, lead-out at the end."""
+
+        sut = FlacMetadataWriter(self.fullname)
+        sut.set_cuesheet(self._CUE_POINTS)
+        sut.save()
+
+        sut = FlacMetadataWriter(self.fullname)
+        # pylint: disable=W0212
+        data = sut._cuesheet
+        # Catalog, lead-in, flags and reserved.
+        self.assertEqual(bytes(395), data[:395])
+        self.assertEqual(4, data[395])
+        self.assertEqual(396 + 3 * (36 + 12) + 36, len(data))
+
+        tracks = [(int.from_bytes(data[pos:pos + 8], "big"), data[pos + 8])
+                  for pos in (396, 444, 492, 540)]
+        self.assertEqual([
+            (20480, 1), (40960, 2), (102400, 3), (245760, 255)
+        ], tracks)
+
+    def test_seekpoint_outside_stream_is_placeholder(self):
+        """Unresolvable seek points are placeholders at the end."""
+
+        sut = FlacMetadataWriter(self.fullname)
+        sut.add_seekpoints([sut.total_samples, 4096, 4097])
+
+        self.assertEqual([
+            (4096, 16, 4096),
+            (0xFFFFFFFFFFFFFFFF, 0, 0),
+        ], sut.seekpoints)
+
+    def test_cue_points_from_time_conversion_are_frame_aligned(self):
+        """Cue points from TimeConversion start on a frame."""
+
+        convert = TimeConversion(100.0, 48000)
+        samples = [convert.get_samples_aligned(e) for e in (101.0, 102.5)]
+
+        sut = FlacMetadataWriter(self.fullname)
+        sut.add_seekpoints(samples)
+
+        self.assertEqual(samples, [e[0] for e in sut.seekpoints])
+
+    @unittest.skipUnless(METAFLAC, "metaflac not installed")
+    def test_metadata_equals_metaflac(self):
+        """`metaflac --list` output matches the metaflac written file."""
+
+        expected = os.path.join(self.path, "expected.flac")
+        shutil.copy(self.fullname, expected)
+        _write_with_metaflac(expected, "item", self._CUE_POINTS, self.path)
+
+        self._write(self.fullname)
+
+        def list_blocks(fullname: str) -> list[str]:
+            result = subprocess.run(
+                [METAFLAC, "--list", "--except-block-type=PADDING",
+                 fullname],
+                capture_output=True, text=True, check=True)
+            return [e for e in result.stdout.splitlines()
+                    if not e.startswith(("METADATA block #", "  length:",
+                                         "  is last:", "  vendor string:"))]
+
+        self.assertEqual(list_blocks(expected), list_blocks(self.fullname))
+
+
+def _write_with_metaflac(
+        fullname: str,
+        title: str,
+        cue_points: list[int],
+        path: str
+) -> None:
+    """The three process path `AudioRecorder` used before."""
+
+    convert = TimeConversion(0.0, 48000)
+    lines = [f'FILE "{title}" WAVE']
+    for idx, sample in enumerate(cue_points, 1):
+        lines.append(f"TRACK {idx:02} AUDIO")
+        lines.append(
+            f"INDEX 01 {convert.to_cuesheet_string(sample / 48000)}")
+
+    cuesheet = os.path.join(path, f"{title}.cue")
+    with open(cuesheet, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines))
+
+    subprocess.run([METAFLAC, f"--set-tag=TITLE={title}", fullname],
+                   check=True)
+    subprocess.run([METAFLAC, f"--import-cuesheet-from={cuesheet}",
+                    fullname], check=True)
+    subprocess.run([METAFLAC] + [f"--add-seekpoint={e}" for e in cue_points]
+                   + [fullname], check=True)
+
+
+@benchmark
+class TestFlacMetadataWriterBenchmark(unittest.TestCase):
+    """Per file: native writer vs. three metaflac processes.
+
+    Run with `SCNFMIXR_BENCHMARK=1`.
+    """
+
+    _ITERATIONS = 200
+    _CUE_POINTS = [20480 * e for e in range(1, 11)]
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.path)
+
+    def _measure(self, func) -> float:
+        total = 0.0
+        for idx in range(self._ITERATIONS):
+            fullname = os.path.join(self.path, f"{idx}.flac")
+            shutil.copy(SAMPLES / "item-5s-1.flac", fullname)
+
+            start = time.perf_counter()
+            func(fullname)
+            total += time.perf_counter() - start
+
+        return total / self._ITERATIONS * 1000
+
+    def test_benchmark(self):
+        """Prints the mean time per file."""
+
+        def native(fullname: str):
+            sut = FlacMetadataWriter(fullname)
+            sut.set_tag("TITLE", "item")
+            sut.set_cuesheet(self._CUE_POINTS)
+            sut.add_seekpoints(self._CUE_POINTS)
+            sut.save()
+
+        print(f"\nFlacMetadataWriter: {self._measure(native):.3f}ms/file")
+
+        if not METAFLAC:
+            print("metaflac: not installed")
+            return
+
+        def metaflac(fullname: str):
+            _write_with_metaflac(
+                fullname, "item", self._CUE_POINTS, self.path)
+
+        print(f"metaflac (3 processes): {self._measure(metaflac):.3f}ms/file")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -186,9 +186,42 @@ class MockMessageQueue(MagicMock):
             return MockMessageQueue()
 
 
+class ALostTerminalSourcePoint(ATerminalSourcePoint):
+    """ALostTerminalSourcePoint"""
+
+    @property
+    def is_sink(self):
+        return False
+
+
 class TestJackAlsaDevice(unittest.TestCase):
     """Testing JackAlsaDevice."""
 
+    @patch("biz.dfch.scnfmixr.mixer.jack_alsa_device.ThreadPool")
+    def test_point_found_wakes_up_bridge_recovery(self, thread_pool):
+        """A PointFoundNotification cuts the recovery backoff short."""
+
+        name = "a-lost-terminal-source-point"
+        card_id = 2
+        sut = JackAlsaDevice("XYZ", card_id, 0,
+                             MockAlsaStreamInfoParser(card_id))
+        sut.add(ALostTerminalSourcePoint(name))
+
+        # Simulating queue notifications. Direct access ok.
+        sut._on_message(  # pylint: disable=W0212
+            Topology.PointLostNotification(name))
+
+        submit = thread_pool.Factory.get.return_value.submit
+        submit.assert_called_once()
+        retry = submit.call_args.args[1].__self__
+        event = retry._wake_event  # pylint: disable=W0212
+        self.assertFalse(event.is_set())
+
+        sut._on_message(  # pylint: disable=W0212
+            Topology.PointFoundNotification(name))
+
+        self.assertTrue(event.is_set())
+
     def test_main_characteristics(self):
         """Testing main characteristics."""
 
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_jack_bus_device."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from biz.dfch.scnfmixr.mixer.jack_bus_device import (
+    EcasoundBusGroup,
+    EcasoundCommandLineBuilder,
+    JackBusDevice,
+)
+
+
+_MODULE = "biz.dfch.scnfmixr.mixer.jack_bus_device"
+
+
+class TestEcasoundCommandLineBuilder(unittest.TestCase):
+    """Testing EcasoundCommandLineBuilder."""
+
+    def test_create_bus_group_has_one_chain_per_bus(self):
+        """All buses are chains of a single engine."""
+
+        result = EcasoundCommandLineBuilder().create_bus_group(
+            "Mixbus:GRP", [("MX0", 2), ("MX1", 8)])
+
+        self.assertEqual(1, result.count('-G:jack,":Mixbus:GRP",notransport'))
+        self.assertEqual(1, result.count("-B:rt"))
+        self.assertIn('-a:"MX0"', result)
+        self.assertIn("-f:f32_le,2,48000", result)
+        self.assertIn("-i:jack,,MX0-playback", result)
+        self.assertIn("-o:jack,,MX0-capture", result)
+        self.assertIn('-a:"MX1"', result)
+        self.assertIn("-f:f32_le,8,48000", result)
+
+        # Chain selection precedes the chain's format and objects.
+        idx = result.index('-a:"MX1"')
+        self.assertLess(idx, result.index("-f:f32_le,8,48000"))
+        self.assertLess(idx, result.index("-i:jack,,MX1-playback"))
+
+
+class TestEcasoundBusGroup(unittest.TestCase):
+    """Testing EcasoundBusGroup."""
+
+    def test_port_names_are_prefixed_with_chain(self):
+        """Points map onto the chain ports of the shared client."""
+
+        sut = EcasoundBusGroup("GRP")
+        sut.add("MX0", 2)
+
+        self.assertEqual(
+            ["Mixbus:GRP:MX0-capture_1", "Mixbus:GRP:MX0-capture_2"],
+            sut.get_source_port_names("MX0"))
+        self.assertEqual(
+            ["Mixbus:GRP:MX0-playback_1", "Mixbus:GRP:MX0-playback_2"],
+            sut.get_sink_port_names("MX0"))
+
+    @patch(f"{_MODULE}.Process")
+    def test_engine_is_started_once_and_stopped_by_last_release(self, mock):
+        """The engine is reference counted."""
+
+        sut = EcasoundBusGroup("GRP")
+        sut.add("MX0", 2)
+        sut.add("DR0", 2)
+
+        sut.acquire()
+        sut.acquire()
+
+        mock.start.assert_called_once()
+        process = mock.start.return_value
+
+        sut.release()
+        process.stop.assert_not_called()
+
+        sut.release()
+        process.stop.assert_called_once_with(force=True)
+
+    @patch(f"{_MODULE}.Process")
+    def test_add_while_running_raises(self, _):
+        """Chains cannot be added to a running engine."""
+
+        sut = EcasoundBusGroup("GRP")
+        sut.add("MX0", 2)
+        sut.acquire()
+
+        with self.assertRaises(RuntimeError):
+            sut.add("MX1", 2)
+
+
+
+class TestJackBusDevice(unittest.TestCase):
+    """Testing JackBusDevice."""
+
+    @patch(f"{_MODULE}.JackSignalManager")
+    @patch(f"{_MODULE}.Process")
+    def test_release_all_stops_processes_in_parallel(self, mock, _):
+        """All processes are stopped with a single `stop_all`."""
+
+        devices = [JackBusDevice(e) for e in ("MX0", "MX1")]
+        processes = [MagicMock(), MagicMock()]
+        for device, process in zip(devices, processes):
+            device._process = process  # pylint: disable=W0212
+            device.is_acquired = True
+
+        result = JackBusDevice.release_all(devices)
+
+        self.assertIs(mock.stop_all.return_value, result)
+        mock.stop_all.assert_called_once_with(processes, 5, force=True)
+        for device, process in zip(devices, processes):
+            process.stop.assert_not_called()
+            self.assertFalse(device.is_acquired)
+
+    @patch(f"{_MODULE}.JackSignalManager")
+    def test_release_stops_own_process(self, _):
+        """A single release still stops its process."""
+
+        sut = JackBusDevice("MX0")
+        process = MagicMock()
+        sut._process = process  # pylint: disable=W0212
+        sut.is_acquired = True
+
+        sut.release()
+
+        process.stop.assert_called_once_with(force=True)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_jack_signal_manager."""
+
+from dataclasses import dataclass
+import unittest
+from unittest.mock import MagicMock
+
+from biz.dfch.scnfmixr.public.messages import Topology
+from biz.dfch.scnfmixr.public.mixer import (
+    ConnectionInfo,
+    State,
+    TopologyDelta,
+)
+from biz.dfch.scnfmixr.mixer.jack_signal_manager import JackSignalManager
+
+
+@dataclass
+class FakeEndpoint:
+    """FakeEndpoint"""
+
+    name: str
+    is_acquired: bool = True
+
+
+@dataclass
+class FakePath:
+    """FakePath"""
+
+    name: str
+    source: FakeEndpoint
+    sink: FakeEndpoint
+
+
+class TestJackSignalManager(unittest.TestCase):
+    """Testing targeted state updates of JackSignalManager."""
+
+    _CONNECTED = {
+        ("system:capture_1", False): ["system:playback_1"],
+        ("system:capture_2", False): [],
+        ("system:playback_1", True): ["system:capture_1"],
+        ("system:playback_2", True): [],
+    }
+
+    _DISCONNECTED = {
+        ("system:capture_1", False): [],
+        ("system:capture_2", False): ["system:playback_2"],
+        ("system:playback_1", True): [],
+        ("system:playback_2", True): ["system:capture_2"],
+    }
+
+    def setUp(self):
+        # pylint: disable=W0212
+        with JackSignalManager.Factory._sync_root:
+            self.sut = JackSignalManager()
+        self.sut._mq = MagicMock()
+
+        self.state = State()
+        self.state.is_acquired = True
+        self.path = FakePath(
+            "path1",
+            FakeEndpoint("system:capture_1"),
+            FakeEndpoint("system:playback_1"))
+
+        with self.sut._sync_root:
+            self.sut._add_path(self.path.name, (self.state, self.path))
+
+    def _apply(self, previous: dict, current: dict) -> None:
+        previous = ConnectionInfo(previous)
+        current = ConnectionInfo(current)
+        delta = TopologyDelta.create(previous, current)
+        self.sut._update_path_state(current, delta)  # pylint: disable=W0212
+
+    def _published(self) -> list[tuple[type, str]]:
+        return [(type(e.args[0]), e.args[0].value)
+                for e in self.sut._mq.publish.call_args_list]
+
+    def test_pending_path_is_evaluated_without_delta_on_its_ports(self):
+        """A new path is evaluated on the next change, wherever it happens."""
+
+        current = dict(self._CONNECTED)
+        current[("other:capture_1", False)] = []
+
+        self._apply(self._CONNECTED, current)
+
+        self.assertTrue(self.state.has_flag(State.Flag.OK))
+        # pylint: disable=W0212
+        self.assertEqual(set(), self.sut._pending_paths)
+        self.assertEqual(
+            [(Topology.PathConnectedNotification, "path1")], self._published())
+
+    def test_unrelated_change_does_not_evaluate_path(self):
+        """Paths not depending on a changed port keep their state."""
+
+        self._apply({}, self._CONNECTED)
+        self.assertTrue(self.state.has_flag(State.Flag.OK))
+        self.sut._mq.reset_mock()
+
+        # The path disappears from the snapshot but the delta only reports
+        # the unrelated 'capture_2' connection.
+        unrelated = dict(self._CONNECTED)
+        unrelated[("system:capture_2", False)] = ["system:playback_2"]
+        unrelated[("system:playback_2", True)] = ["system:capture_2"]
+        self._apply(self._CONNECTED, unrelated)
+
+        self.assertTrue(self.state.has_flag(State.Flag.OK))
+        self.sut._mq.publish.assert_not_called()
+
+    def test_lost_edge_marks_path_stale(self):
+        """Removing the connection of a path marks it as STALE."""
+
+        self._apply({}, self._CONNECTED)
+        self.sut._mq.reset_mock()
+
+        self._apply(self._CONNECTED, self._DISCONNECTED)
+
+        self.assertTrue(self.state.has_flag(State.Flag.STALE))
+        self.assertEqual(
+            [(Topology.PathLostNotification, "path1")], self._published())
+
+    def test_not_acquired_endpoint_keeps_path_pending(self):
+        """A skipped path is evaluated again on the next change."""
+
+        self.path.sink.is_acquired = False
+
+        self._apply({}, self._CONNECTED)
+
+        self.assertTrue(self.state.has_flag(State.Flag.INITIAL))
+        self.assertIn(
+            "path1", self.sut._pending_paths)  # pylint: disable=W0212
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_mixbus_group_starter."""
+
+from dataclasses import dataclass
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from biz.dfch.scnfmixr.public.mixer import ConnectionInfo, ConnectionPolicy
+from biz.dfch.scnfmixr.mixer.mixbus_group_starter import MixbusGroupStarter
+
+
+_MODULE = "biz.dfch.scnfmixr.mixer.mixbus_group_starter"
+
+
+@dataclass
+class FakePoint:
+    """FakePoint"""
+
+    name: str
+
+
+class FakeBusDevice:
+    """A stand-in for `JackBusDevice` without ecasound."""
+
+    sync_root = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def __init__(self, name, channel_count=2, _=None):
+        self.name = f"Mixbus:{name}"
+        self.points = []
+        self.sources = [FakePoint(f"{self.name}-O:capture_{i + 1}")
+                        for i in range(channel_count)]
+        self.sinks = [FakePoint(f"{self.name}-I:playback_{i + 1}")
+                      for i in range(channel_count)]
+
+    def acquire(self):
+        """acquire"""
+
+        with FakeBusDevice.sync_root:
+            FakeBusDevice.active += 1
+            FakeBusDevice.max_active = max(
+                FakeBusDevice.max_active, FakeBusDevice.active)
+
+        time.sleep(0.05)
+        self.points = self.sources + self.sinks
+
+        with FakeBusDevice.sync_root:
+            FakeBusDevice.active -= 1
+
+        return self
+
+    def as_source_set(self):
+        """as_source_set"""
+        return self.sources
+
+    def as_sink_set(self):
+        """as_sink_set"""
+        return self.sinks
+
+
+class FakePath:  # pylint: disable=R0903
+    """FakePath"""
+
+    def __init__(self, source, sink):
+        self.source = source
+        self.sink = sink
+        self.acquire = MagicMock()
+
+
+def get_signal_paths(source, sink, _):
+    """Pairs sources and sinks like `ConnectionPolicy.DUAL`."""
+
+    if not isinstance(source, list):
+        return [(None, FakePath(source, sink))]
+
+    return [(None, FakePath(a, b)) for a, b in zip(source, sink)]
+
+
+class TestMixbusGroupStarter(unittest.TestCase):
+    """Testing MixbusGroupStarter."""
+
+    def setUp(self):
+        FakeBusDevice.active = 0
+        FakeBusDevice.max_active = 0
+
+        patchers = [
+            patch(f"{_MODULE}.JackBusDevice", new=FakeBusDevice),
+            patch(f"{_MODULE}.JackSignalManager"),
+            patch(f"{_MODULE}.JackConnectionBatch"),
+            patch(f"{_MODULE}.JackConnection.get_connections3"),
+        ]
+        mocks = [e.start() for e in patchers]
+        for e in patchers:
+            self.addCleanup(e.stop)
+
+        _, mgr, self.batch, self.get_connections3 = mocks
+        self.mgr = mgr.Factory.get.return_value
+        self.mgr.is_acquired = False
+        self.mgr.get_signal_paths.side_effect = get_signal_paths
+
+    def test_start_acquires_buses_concurrently_and_bounded(self):
+        """Buses are acquired in parallel, but not more than allowed."""
+
+        sut = MixbusGroupStarter(max_workers=3, timeout=5)
+        for i in range(7):
+            sut.add(f"MX{i}")
+
+        self.get_connections3.side_effect = (
+            lambda: {(e.name, False): []
+                     for d in sut.devices for e in d.points})
+
+        result = sut.start()
+
+        self.assertTrue(result)
+        self.assertEqual(3, FakeBusDevice.max_active)
+
+    def test_start_connects_in_single_batch_after_ports(self):
+        """All connections are created in one batch."""
+
+        sut = MixbusGroupStarter(timeout=5)
+        mx0 = sut.add("MX0")
+        mx1 = sut.add("MX1", channel_count=8)
+        dr0 = sut.add("DR0")
+
+        sut.connect(dr0, mx0)
+        sut.connect(mx0, mx1, ConnectionPolicy.DUAL)
+        sut.connect_channel(dr0, 0, mx1, 2)
+        sut.connect_channel(dr0, 1, mx1, 3)
+
+        self.get_connections3.side_effect = (
+            lambda: {(e.name, False): []
+                     for d in sut.devices for e in d.points})
+
+        result = sut.start()
+
+        self.assertTrue(result)
+        self.batch.assert_called_once()
+        batch = self.batch.return_value.__enter__.return_value
+        self.assertEqual(6, batch.connect.call_count)
+        batch.connect.assert_any_call(
+            "Mixbus:DR0-O:capture_1", "Mixbus:MX1-I:playback_3")
+
+    def test_start_with_missing_ports_times_out(self):
+        """Missing port registrations fail the start, but still connect."""
+
+        sut = MixbusGroupStarter(timeout=0.6)
+        mx0 = sut.add("MX0")
+        dr0 = sut.add("DR0")
+        sut.connect(dr0, mx0)
+
+        self.get_connections3.return_value = {}
+
+        result = sut.start()
+
+        self.assertFalse(result)
+        self.batch.assert_called_once()
+
+    def test_start_with_failed_bus_does_not_wait_for_timeout(self):
+        """A bus that could not be acquired does not hold up the others."""
+
+        sut = MixbusGroupStarter(timeout=5)
+        sut.add("MX0")
+        dr0 = sut.add("DR0")
+        dr0.acquire = MagicMock(return_value=None)
+
+        self.get_connections3.side_effect = (
+            lambda: {(e.name, False): []
+                     for d in sut.devices for e in d.points})
+
+        start = time.monotonic()
+        result = sut.start()
+
+        self.assertFalse(result)
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_start_with_signal_manager_does_not_poll(self):
+        """Topology notifications are used instead of polling `jack_lsp`."""
+
+        self.mgr.is_acquired = True
+
+        sut = MixbusGroupStarter(timeout=5)
+        sut.add("MX0")
+        sut.add("DR0")
+
+        self.get_connections3.return_value = {}
+
+        def notify():
+            time.sleep(0.6)
+            # pylint: disable=W0212
+            sut._update(ConnectionInfo(
+                {(e.name, False): [] for d in sut.devices for e in d.points}))
+
+        thread = threading.Thread(target=notify)
+        thread.start()
+        result = sut.start()
+        thread.join()
+
+        self.assertTrue(result)
+        self.get_connections3.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_topology_backend."""
+
+from dataclasses import dataclass
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+from biz.dfch.scnfmixr.public.mixer import ConnectionInfo
+from biz.dfch.scnfmixr.mixer.topology_backend import TopologyBackend
+from biz.dfch.scnfmixr.mixer.polling_topology_backend import (
+    PollingTopologyBackend
+)
+from biz.dfch.scnfmixr.mixer.jack_client_topology_backend import (
+    JackClientTopologyBackend
+)
+
+
+@dataclass(frozen=True)
+class FakePort:
+    """FakePort"""
+
+    name: str
+    is_input: bool
+
+
+class FakeClient:
+    """A minimal stand-in for `jack.Client`."""
+
+    def __init__(self):
+        self.ports = [
+            FakePort("system:capture_1", False),
+            FakePort("system:playback_1", True),
+        ]
+        self.connections = {
+            "system:capture_1": ["system:playback_1"],
+            "system:playback_1": ["system:capture_1"],
+        }
+
+    def get_ports(self):
+        """get_ports"""
+        return self.ports
+
+    def get_all_connections(self, port):
+        """get_all_connections"""
+        return [FakePort(e, False) for e in self.connections[port.name]]
+
+
+class TestPollingTopologyBackend(unittest.TestCase):
+    """Testing PollingTopologyBackend."""
+
+    _CONNECTIONS = {
+        ("system:capture_1", False): ["system:playback_1"],
+        ("system:playback_1", True): ["system:capture_1"],
+    }
+
+    @patch("biz.dfch.scnfmixr.mixer.polling_topology_backend."
+           "JackConnection.get_connections3")
+    def test_wait_for_change_returns_snapshot(self, mock):
+        """Polling returns the current topology."""
+
+        mock.return_value = dict(self._CONNECTIONS)
+
+        sut = PollingTopologyBackend(0.01)
+        self.assertTrue(sut.start())
+        self.assertTrue(sut.is_alive)
+
+        result = sut.wait_for_change(1)
+
+        self.assertIsInstance(result, ConnectionInfo)
+        self.assertTrue(result.is_connected_to(
+            "system:capture_1", "system:playback_1"))
+        mock.assert_called_once()
+
+    @patch("biz.dfch.scnfmixr.mixer.polling_topology_backend."
+           "JackConnection.get_connections3")
+    def test_wait_for_change_without_keys_returns_none(self, mock):
+        """Empty jack_lsp output is not a topology."""
+
+        mock.return_value = {}
+
+        sut = PollingTopologyBackend(0.01)
+        sut.start()
+
+        result = sut.wait_for_change(1)
+
+        self.assertIsNone(result)
+
+    @patch("biz.dfch.scnfmixr.mixer.polling_topology_backend."
+           "JackConnection.get_connections3")
+    def test_stop_returns_none(self, mock):
+        """A stopped backend does not poll."""
+
+        sut = PollingTopologyBackend(10)
+        sut.start()
+        sut.stop()
+
+        start = time.monotonic()
+        result = sut.wait_for_change(10)
+
+        self.assertIsNone(result)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertFalse(sut.is_alive)
+        mock.assert_not_called()
+
+
+class TestJackClientTopologyBackend(unittest.TestCase):
+    """Testing JackClientTopologyBackend."""
+
+    def test_get_snapshot_matches_jack_lsp_format(self):
+        """Snapshot has the same format as `get_connections3`."""
+
+        result = JackClientTopologyBackend.get_snapshot(FakeClient())
+
+        self.assertEqual({
+            ("system:capture_1", False): ["system:playback_1"],
+            ("system:playback_1", True): ["system:capture_1"],
+        }, result)
+
+    def test_wait_for_change_coalesces_events(self):
+        """A burst of callbacks results in a single snapshot."""
+
+        sut = JackClientTopologyBackend()
+        sut._client = FakeClient()  # pylint: disable=W0212
+        sut._is_alive = True  # pylint: disable=W0212
+
+        port = FakePort("system:capture_1", False)
+        sut._on_client_registration("system", True)  # pylint: disable=W0212
+        sut._on_port_registration(port, True)  # pylint: disable=W0212
+        sut._on_port_connect(port, port, True)  # pylint: disable=W0212
+
+        result = sut.wait_for_change(1)
+
+        self.assertIsInstance(result, ConnectionInfo)
+        self.assertTrue(result.is_entry("system:capture_1"))
+
+        result = sut.wait_for_change(0.01)
+        self.assertIsNone(result)
+
+    def test_shutdown_marks_backend_as_not_alive(self):
+        """JACK shutting down makes the manager fall back."""
+
+        sut = JackClientTopologyBackend()
+        sut._client = FakeClient()  # pylint: disable=W0212
+        sut._is_alive = True  # pylint: disable=W0212
+
+        sut._on_shutdown(0, "jackd stopped")  # pylint: disable=W0212
+
+        self.assertFalse(sut.is_alive)
+        self.assertIsNone(sut.wait_for_change(1))
+
+    def test_factory_without_jack_module_returns_polling_backend(self):
+        """Missing `jack` module falls back to polling."""
+
+        with patch.dict(sys.modules, {"jack": None}):
+            result = TopologyBackend.Factory.create(0.5)
+
+        self.assertIsInstance(result, PollingTopologyBackend)
+        self.assertTrue(result.is_alive)
+
+        result.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_media_player_client."""
+
+import unittest
+from unittest.mock import patch
+
+from biz.dfch.asyn import AsyncProcess
+from biz.dfch.scnfmixr.playback.media_player_client import MediaPlayerClient
+from biz.dfch.scnfmixr.playback.media_player_type import MediaPlayerType
+
+
+class TestMediaPlayerClient(unittest.TestCase):
+    """Testing MediaPlayerClient."""
+
+    _MODULE = "biz.dfch.scnfmixr.playback.media_player_client"
+
+    def test_load_playback_queue_adds_files_in_order_in_batches(self):
+        """Matching files are added newest first with one `mpc add` per
+        batch."""
+
+        files = [f"2025-01-{e:02}.flac" for e in range(1, 6)]
+
+        def run_sync(cmd, **_):
+            stdout = {"listall": files, "playlist": ["queue"]}.get(cmd[1], [])
+            return AsyncProcess.Result(cmd, 0, stdout)
+
+        sut = MediaPlayerClient(MediaPlayerType.PLAYBACK)
+
+        with (patch(f"{self._MODULE}.AsyncProcess.Factory.get") as mock,
+              patch.object(MediaPlayerClient, "_MPC_ADD_BATCH_SIZE", 2)):
+            mock.return_value.run_sync.side_effect = run_sync
+
+            result = sut.load_playback_queue(lambda e: "03" not in e)
+
+        self.assertEqual(["queue"], result)
+
+        cmds = [e.args[0][1:] for e in
+                mock.return_value.run_sync.call_args_list]
+        self.assertEqual([
+            ["update"],
+            ["listall"],
+            ["add", "2025-01-05.flac", "2025-01-04.flac"],
+            ["add", "2025-01-02.flac", "2025-01-01.flac"],
+            ["playlist"],
+        ], cmds)
+
+        timeout = MediaPlayerClient._MPC_TIMEOUT_S  # pylint: disable=W0212
+        for call in mock.return_value.run_sync.call_args_list:
+            self.assertEqual(timeout, call.kwargs["timeout"])
+
+    def test_invoke_async_returns_empty_output_if_mpc_is_missing(self):
+        """A process that cannot be started is logged, not raised."""
+
+        sut = MediaPlayerClient(MediaPlayerType.PLAYBACK)
+
+        with patch(f"{self._MODULE}.AsyncProcess.Factory.get") as mock:
+            mock.return_value.run_sync.side_effect = FileNotFoundError("mpc")
+
+            result = sut.load_playback_queue(lambda _: True)
+
+        self.assertEqual([], result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,8 @@
 
 """Module test_connection_info."""
 
+import random
+import time
 import unittest
 from unittest.mock import patch
 
@@ -22,6 +24,8 @@ from biz.dfch.scnfmixr.jack_commands.jack_connection import JackConnection
 from biz.dfch.scnfmixr.public.mixer.connection_info import ConnectionInfo
 from ...jack_commands.mock_process import MockProcessGetConnections3
 
+from tests.benchmark import benchmark
+
 
 class TestConnectionInfo(unittest.TestCase):
     """TestConnectionInfo"""
@@ -371,3 +375,80 @@ class TestConnectionInfo(unittest.TestCase):
         self.assertEqual(2, len(result), result)
         self.assertEqual("Alsa:LCL-O:playback_1", result[0])
         self.assertEqual("Alsa:LCL-O:playback_2", result[1])
+
+    def test_sink_entry_is_connected_to_source(self):
+        """Sink entries resolve their connections via the sink key."""
+
+        sut = ConnectionInfo({
+            ("system:capture_1", False): ["system:playback_1"],
+            ("system:playback_1", True): ["system:capture_1"],
+            ("system:playback_2", True): [],
+        })
+
+        self.assertTrue(sut.is_connected_to(
+            "system:playback_1", "system:capture_1"))
+        self.assertFalse(sut.is_connected("system:playback_2"))
+        self.assertFalse(sut.is_connected_to(
+            "system:playback_2", "system:capture_1"))
+        self.assertEqual(
+            ["system:capture_1"],
+            sut.get_connection_entries("system:playback_1"))
+        self.assertEqual(
+            [("system:capture_1", "system:playback_1"),
+             ("system:capture_1", "system:playback_1")],
+            sut.get_connections("system"))
+
+
+@benchmark
+class TestConnectionInfoBenchmark(unittest.TestCase):
+    """ConnectionInfo benchmarks. Set `SCNFMIXR_BENCHMARK=1` to run."""
+
+    _CLIENT_COUNT = 100
+    _PORT_COUNT = 2_000
+    _CONNECTION_COUNT = 10_000
+
+    def test_update_path_state_pass(self):
+        """Queries of one `_update_path_state`/`_update_point_state` pass
+        with 2,000 ports and 10,000 connections."""
+
+        rnd = random.Random(42)
+
+        ports_per_client = self._PORT_COUNT // self._CLIENT_COUNT
+        sources = [f"client{i}:capture_{j}"
+                   for i in range(self._CLIENT_COUNT)
+                   for j in range(ports_per_client // 2)]
+        sinks = [f"client{i}:playback_{j}"
+                 for i in range(self._CLIENT_COUNT)
+                 for j in range(ports_per_client // 2)]
+
+        edges: set[tuple[str, str]] = set()
+        while len(edges) < self._CONNECTION_COUNT:
+            edges.add((rnd.choice(sources), rnd.choice(sinks)))
+
+        values: dict[tuple[str, bool], list[str]] = {}
+        for name in sources:
+            values[(name, False)] = []
+        for name in sinks:
+            values[(name, True)] = []
+        for source, sink in edges:
+            values[(source, False)].append(sink)
+            values[(sink, True)].append(source)
+
+        start = time.perf_counter()
+        sut = ConnectionInfo(values)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for name in sources + sinks:
+            sut.is_entry(name)
+        for source, sink in edges:
+            sut.is_connected_to(source, sink)
+        pass_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\nConnectionInfo [{self._PORT_COUNT} ports, "
+              f"{self._CONNECTION_COUNT} connections]: "
+              f"build {build_ms:.1f}ms, "
+              f"update pass {pass_ms:.1f}ms "
+              f"({pass_ms * 1000 / (len(edges) + len(values)):.2f}us/query)")
+
+        self.assertEqual(self._PORT_COUNT, len(sut.sources + sut.sinks))
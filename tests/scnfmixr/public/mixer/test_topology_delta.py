@@ -0,0 +1,122 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module test_topology_delta."""
+
+import unittest
+
+from biz.dfch.scnfmixr.public.mixer import ConnectionInfo, TopologyDelta
+
+
+class TestTopologyDelta(unittest.TestCase):
+    """Testing TopologyDelta."""
+
+    _PREVIOUS = {
+        ("system:capture_1", False): ["system:playback_1"],
+        ("system:capture_2", False): [],
+        ("system:playback_1", True): ["system:capture_1"],
+    }
+
+    _CURRENT = {
+        ("system:capture_1", False): [],
+        ("system:capture_2", False): ["Mixbus:IN-I:playback_1"],
+        ("system:playback_1", True): [],
+        ("Mixbus:IN-I:playback_1", True): ["system:capture_2"],
+    }
+
+    def test_create_returns_ports_and_edges(self):
+        """Added and removed ports and edges are detected."""
+
+        sut = TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(self._CURRENT))
+
+        self.assertFalse(sut.is_empty)
+        self.assertEqual(frozenset({"Mixbus:IN-I:playback_1"}),
+                         sut.ports_added)
+        self.assertEqual(frozenset(), sut.ports_removed)
+        self.assertEqual(
+            frozenset({("system:capture_2", "Mixbus:IN-I:playback_1")}),
+            sut.edges_added)
+        self.assertEqual(
+            frozenset({("system:capture_1", "system:playback_1")}),
+            sut.edges_removed)
+
+    def test_create_reverse_swaps_added_and_removed(self):
+        """The reverse delta swaps added and removed."""
+
+        forward = TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(self._CURRENT))
+        sut = TopologyDelta.create(
+            ConnectionInfo(self._CURRENT), ConnectionInfo(self._PREVIOUS))
+
+        self.assertEqual(forward.ports_added, sut.ports_removed)
+        self.assertEqual(forward.edges_added, sut.edges_removed)
+        self.assertEqual(forward.edges_removed, sut.edges_added)
+
+    def test_create_with_same_topology_is_empty(self):
+        """Identical snapshots result in an empty delta."""
+
+        sut = TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(self._PREVIOUS))
+
+        self.assertTrue(sut.is_empty)
+        self.assertEqual(frozenset(), sut.ports)
+        self.assertEqual(TopologyDelta(), sut)
+
+    def test_ports_contains_both_ends_of_changed_edges(self):
+        """All affected ports are returned."""
+
+        sut = TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(self._CURRENT))
+
+        self.assertEqual(frozenset({
+            "system:capture_1",
+            "system:capture_2",
+            "system:playback_1",
+            "Mixbus:IN-I:playback_1",
+        }), sut.ports)
+
+    def test_merge_equals_delta_across_both_snapshots(self):
+        """Merging consecutive deltas equals the delta of first to last."""
+
+        _next = {
+            ("system:capture_1", False): ["system:playback_1"],
+            ("system:playback_1", True): ["system:capture_1"],
+            ("Mixbus:IN-I:playback_1", True): [],
+        }
+
+        first = TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(self._CURRENT))
+        second = TopologyDelta.create(
+            ConnectionInfo(self._CURRENT), ConnectionInfo(_next))
+
+        sut = first.merge(second)
+
+        self.assertEqual(TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(_next)), sut)
+
+    def test_merge_with_reverse_is_empty(self):
+        """A change that is undone results in an empty delta."""
+
+        forward = TopologyDelta.create(
+            ConnectionInfo(self._PREVIOUS), ConnectionInfo(self._CURRENT))
+        reverse = TopologyDelta.create(
+            ConnectionInfo(self._CURRENT), ConnectionInfo(self._PREVIOUS))
+
+        self.assertTrue(forward.merge(reverse).is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
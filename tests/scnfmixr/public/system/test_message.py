@@ -16,8 +16,12 @@
 """Module test_message."""
 
 from __future__ import annotations
+from dataclasses import FrozenInstanceError
+import gc
+import tracemalloc
 import unittest
 
+from biz.dfch.scnfmixr.public.messages import AudioRecorder, Topology
 from biz.dfch.scnfmixr.public.system import MessagePriority
 
 from biz.dfch.scnfmixr.public.system.message_medium import Message
@@ -25,6 +29,8 @@ from biz.dfch.scnfmixr.public.system.message_high import NotificationHigh
 from biz.dfch.scnfmixr.public.system.message_medium import NotificationMedium
 from biz.dfch.scnfmixr.public.system.message_low import NotificationLow
 
+from tests.benchmark import benchmark
+
 
 class TestMessage(unittest.TestCase):
     """Class message types."""
@@ -146,6 +152,90 @@ class TestMessage(unittest.TestCase):
         self.assertEqual(expected_priority, sut.priority)
         self.assertEqual(expected_description, sut.description)
 
+    def test_message_is_slotted(self):
+        """Testing messages without instance dictionary."""
+
+        sut = Topology.PointFoundNotification("arbitrary-point")
+
+        self.assertFalse(hasattr(sut, "__dict__"))
+        self.assertEqual("arbitrary-point", sut.value)
+
+    def test_message_ids_are_unique(self):
+        """Testing ids increase per message."""
+
+        first = TestMessage.ArbitraryMessage("arbitrary-description")
+        second = TestMessage.ArbitraryMessage("arbitrary-description")
+
+        self.assertIsInstance(first.id, int)
+        self.assertLess(first.id, second.id)
+        self.assertNotEqual(first, second)
+
+    def test_setting_field_throws(self):
+        """Testing base fields are read-only."""
+
+        sut = TestMessage.ArbitraryMessage("arbitrary-description")
+
+        with self.assertRaises(FrozenInstanceError):
+            sut.priority = MessagePriority.HIGH
+
+        with self.assertRaises(FrozenInstanceError):
+            sut.id = 42
+
+    def test_children_are_created_on_first_use(self):
+        """Testing children list."""
+
+        sut = TestMessage.ArbitraryMessage("arbitrary-description")
+
+        result = sut.children
+        result.append(TestMessage.ArbitraryMessage("arbitrary-child"))
+
+        self.assertIs(result, sut.children)
+        self.assertEqual(1, len(sut.children))
+
+
+@benchmark
+class TestMessageBenchmark(unittest.TestCase):
+    """Message size benchmarks. Set `SCNFMIXR_BENCHMARK=1` to run."""
+
+    _COUNT = 100_000
+
+    def _get_bytes_per_message(self, factory) -> float:
+        """Returns the traced allocation per message."""
+
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            items = [factory() for _ in range(self._COUNT)]
+            after, _ = tracemalloc.get_traced_memory()
+
+        finally:
+            tracemalloc.stop()
+
+        # The list holding the messages is not part of a message.
+        overhead = len(items) * 8
+
+        return (after - before - overhead) / len(items)
+
+    def test_bytes_per_message(self):
+        """Measures the size of messages with and without attributes."""
+
+        factories = {
+            "StartedNotification": AudioRecorder.StartedNotification,
+            "PointFoundNotification":
+                lambda: Topology.PointFoundNotification("system:capture_1"),
+            "ArbitraryMessageMedium":
+                lambda: TestMessage.ArbitraryMessageMedium("description"),
+        }
+
+        for name, factory in factories.items():
+            result = self._get_bytes_per_message(factory)
+
+            print(f"\n{name}: {result:.0f} bytes per message")
+
+            self.assertGreater(result, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
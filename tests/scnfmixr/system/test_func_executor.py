@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import logging
 import unittest
 from threading import Thread
 import time
@@ -28,6 +29,8 @@ from biz.dfch.scnfmixr.public.system import (
     CommandMedium
 )
 
+from tests.benchmark import benchmark
+
 
 class TestFuncExecutor(unittest.TestCase):
     """Test"""
@@ -137,3 +140,111 @@ class TestFuncExecutor(unittest.TestCase):
             self.assertEqual(expected, exc.msg)
 
             log.debug(exc.msg)
+
+    def _on_command(self, message: MessageBase) -> None:
+        """Replies to `ACommand`."""
+
+        MessageQueue.Factory.get().publish(
+            TestFuncExecutor.ANotification(42).correlate(message))
+
+    def test_invoke_without_predicate_uses_correlated_reply(self):
+        """test"""
+
+        mq = MessageQueue.Factory.get()
+        mq.register(self._on_command, message_types=TestFuncExecutor.ACommand)
+
+        try:
+            with FuncExecutor(self.funcenstein) as sync:
+                result = sync.invoke(TestFuncExecutor.ACommand())
+
+        finally:
+            mq.unregister(self._on_command)
+
+        self.assertEqual(42, result)
+
+    def test_invoke_without_predicate_and_reply_returns_none(self):
+        """test"""
+
+        with FuncExecutor(self.funcenstein) as sync:
+            result = sync.invoke(TestFuncExecutor.ACommand(), 0.05)
+
+        self.assertIsNone(result)
+
+    def test_invoke_action_without_predicate_throws(self):
+        """test"""
+
+        mq = MessageQueue.Factory.get()
+        mq.register(self._on_command, message_types=TestFuncExecutor.ACommand)
+
+        try:
+            with self.assertRaises(ValueError):
+                with ActionExecutor(self.action_throws) as sync:
+                    sync.invoke(TestFuncExecutor.ACommand())
+
+        finally:
+            mq.unregister(self._on_command)
+
+
+@benchmark
+class TestFuncExecutorBenchmark(unittest.TestCase):
+    """Round trip benchmarks. Set `SCNFMIXR_BENCHMARK=1` to run."""
+
+    _ROUND_TRIPS = 10_000
+    _SUBSCRIBER_COUNT = 200
+
+    class Unrelated(NotificationMedium):
+        """Message type of the idle subscribers."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_round_trips_predicate_vs_correlated(self):
+        """Runs 10k round trips with 200 subscribers registered."""
+
+        mq = MessageQueue.Factory.get()
+
+        def on_command(message: MessageBase) -> None:
+            mq.publish(TestFuncExecutor.ANotification(
+                message.correlation_id or 0).correlate(message))
+
+        actions = []
+        for i in range(self._SUBSCRIBER_COUNT):
+            def action(_: MessageBase) -> None:
+                pass
+            action.__qualname__ = f"benchmark_subscriber_{i}"
+            actions.append(action)
+            mq.register(
+                action, message_types=TestFuncExecutorBenchmark.Unrelated)
+
+        mq.register(on_command, message_types=TestFuncExecutor.ACommand)
+
+        results: dict[str, float] = {}
+
+        try:
+            for mode in ("predicate", "correlated"):
+                predicate = None
+                if "predicate" == mode:
+                    def predicate(e: MessageBase) -> bool:
+                        return isinstance(e, TestFuncExecutor.ANotification)
+
+                start = time.perf_counter()
+                for _ in range(self._ROUND_TRIPS):
+                    with FuncExecutor(lambda e: e.value, predicate) as sync:
+                        result = sync.invoke(TestFuncExecutor.ACommand())
+                        assert result is not None
+                results[mode] = time.perf_counter() - start
+
+        finally:
+            mq.unregister(on_command)
+            for action in actions:
+                mq.unregister(action)
+
+        print(f"\nFuncExecutor [{self._ROUND_TRIPS} round trips, "
+              f"{self._SUBSCRIBER_COUNT} subscribers]: "
+              f"predicate {results['predicate'] * 1000:.0f}ms "
+              f"({results['predicate'] / self._ROUND_TRIPS * 1e6:.0f}us), "
+              f"correlated {results['correlated'] * 1000:.0f}ms "
+              f"({results['correlated'] / self._ROUND_TRIPS * 1e6:.0f}us)")
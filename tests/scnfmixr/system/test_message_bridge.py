@@ -0,0 +1,273 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module test_message_bridge."""
+
+import logging
+import os
+import subprocess
+import sys
+import stat
+import tempfile
+from threading import Event
+import time
+import unittest
+
+from biz.dfch.scnfmixr.public.system import MessageBase, NotificationMedium
+from biz.dfch.scnfmixr.system import (
+    MessageBridge,
+    MessageBridgeClient,
+    MessageQueue,
+)
+
+from tests.benchmark import benchmark
+
+
+class SelectedNotification(NotificationMedium):
+    """A streamed message."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str):
+        super().__init__()
+
+        self.value = value
+
+
+class OtherNotification(NotificationMedium):
+    """A message that is not streamed."""
+
+
+class MarkerNotification(NotificationMedium):
+    """Marks the end of a test sequence."""
+
+
+def _wait_for(predicate, timeout_s: float = 5) -> bool:
+    """Polls `predicate` until it is true or `timeout_s` elapsed."""
+
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        if deadline < time.monotonic():
+            return False
+        time.sleep(0.005)
+
+    return True
+
+
+def _publish_and_drain(mq: MessageQueue, messages: list[MessageBase]) -> None:
+    """Publishes messages and waits until all were dispatched."""
+
+    done = Event()
+
+    def on_marker(_: MessageBase) -> None:
+        done.set()
+
+    mq.register(on_marker, message_types=MarkerNotification)
+    try:
+        mq.publish(messages)
+        mq.publish(MarkerNotification())
+        assert done.wait(30)
+    finally:
+        mq.unregister(on_marker)
+
+
+class TestMessageBridge(unittest.TestCase):
+    """Testing `MessageBridge`."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, "bridge.sock")
+        self._mq = MessageQueue.Factory.get()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_streams_message_to_observer(self):
+
+        with MessageBridge(self._path) as sut:
+            with MessageBridgeClient(self._path, timeout_s=5) as client:
+                self.assertTrue(_wait_for(lambda: 1 == sut.clients))
+
+                message = SelectedNotification("arbitrary-value")
+                self._mq.publish(message)
+
+                result = client.receive()
+
+        self.assertEqual(message.id, result["id"])
+        self.assertEqual(message.name, result["name"])
+        self.assertEqual(int(message.priority), result["priority"])
+        self.assertIsNone(result["correlation_id"])
+        self.assertEqual({"value": "arbitrary-value"}, result["fields"])
+
+    def test_streams_selected_types_only(self):
+
+        with MessageBridge(self._path, SelectedNotification) as sut:
+            with MessageBridgeClient(self._path, timeout_s=5) as client:
+                self.assertTrue(_wait_for(lambda: 1 == sut.clients))
+
+                self._mq.publish(
+                    OtherNotification(),
+                    SelectedNotification("arbitrary-value"))
+
+                result = client.receive()
+
+        self.assertEqual(
+            MessageBase.get_fqcn(SelectedNotification), result["name"])
+
+    def test_streams_to_all_observers(self):
+
+        with MessageBridge(self._path) as sut:
+            with MessageBridgeClient(self._path, timeout_s=5) as first, \
+                    MessageBridgeClient(self._path, timeout_s=5) as second:
+                self.assertTrue(_wait_for(lambda: 2 == sut.clients))
+
+                message = SelectedNotification("arbitrary-value")
+                self._mq.publish(message)
+
+                self.assertEqual(message.id, first.receive()["id"])
+                self.assertEqual(message.id, second.receive()["id"])
+
+    def test_slow_observer_drops_frames_without_blocking(self):
+
+        value = "x" * 4096
+        messages = [SelectedNotification(value) for _ in range(2000)]
+
+        with MessageBridge(self._path, ring_size=4) as sut:
+            with MessageBridgeClient(self._path, timeout_s=5):
+                self.assertTrue(_wait_for(lambda: 1 == sut.clients))
+
+                start = time.monotonic()
+                _publish_and_drain(self._mq, messages)
+                elapsed = time.monotonic() - start
+
+                self.assertLess(0, sut.dropped)
+
+        self.assertLess(elapsed, 5)
+
+    def test_disconnected_observer_is_removed(self):
+
+        with MessageBridge(self._path) as sut:
+            client = MessageBridgeClient(self._path, timeout_s=5)
+            self.assertTrue(_wait_for(lambda: 1 == sut.clients))
+
+            client.close()
+            self._mq.publish(SelectedNotification("arbitrary-value"))
+
+            self.assertTrue(_wait_for(lambda: 0 == sut.clients))
+
+    def test_socket_is_created_private(self):
+        """The socket is created as 0600 regardless of the umask, which is
+        restored afterwards."""
+
+        umask = os.umask(0o022)
+        try:
+            with MessageBridge(self._path):
+                mode = stat.S_IMODE(os.stat(self._path).st_mode)
+                current = os.umask(0o022)
+        finally:
+            os.umask(umask)
+
+        self.assertEqual(0o600, mode)
+        self.assertEqual(0o022, current)
+
+    def test_stop_disconnects_observers_and_removes_socket(self):
+
+        sut = MessageBridge(self._path)
+        self.assertTrue(sut.start())
+        self.assertTrue(os.path.exists(self._path))
+
+        with MessageBridgeClient(self._path, timeout_s=5) as client:
+            self.assertTrue(_wait_for(lambda: 1 == sut.clients))
+
+            sut.stop()
+
+            self.assertIsNone(client.receive())
+
+        self.assertEqual(0, sut.clients)
+        self.assertFalse(os.path.exists(self._path))
+
+
+@benchmark
+class TestMessageBridgeBenchmark(unittest.TestCase):
+    """Dispatch overhead benchmarks. Set `SCNFMIXR_BENCHMARK=1` to run."""
+
+    _MESSAGE_COUNT = 50_000
+
+    _OBSERVER = (
+        "import socket, sys\n"
+        "s = socket.socket(socket.AF_UNIX)\n"
+        "s.connect(sys.argv[1])\n"
+        "while s.recv(1 << 16):\n"
+        "    pass\n")
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, "bridge.sock")
+        self._mq = MessageQueue.Factory.get()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+        logging.disable(logging.NOTSET)
+
+    def _measure(self) -> float:
+        """Returns the time to dispatch `_MESSAGE_COUNT` messages."""
+
+        messages = [SelectedNotification(f"value-{i}")
+                    for i in range(self._MESSAGE_COUNT)]
+
+        start = time.perf_counter()
+        _publish_and_drain(self._mq, messages)
+
+        return time.perf_counter() - start
+
+    def test_dispatch_with_observers(self):
+        """Dispatches 50k messages with 0, 1 and 10 observers attached."""
+
+        results: dict[str, tuple[float, int, int]] = {
+            "no bridge": (self._measure(), 0, 0),
+        }
+
+        for count in (0, 1, 10):
+            with MessageBridge(self._path) as bridge:
+                # Observers run out of process, as they would in production.
+                observers = [subprocess.Popen(
+                    [sys.executable, "-c", self._OBSERVER, self._path])
+                    for _ in range(count)]
+
+                try:
+                    assert _wait_for(lambda: count == bridge.clients)
+
+                    elapsed = self._measure()
+                    lane_dropped = sum(
+                        self._mq.metrics.lane_dropped.values())
+
+                    results[f"{count} observers"] = (
+                        elapsed, lane_dropped, bridge.dropped)
+
+                finally:
+                    for observer in observers:
+                        observer.kill()
+                        observer.wait()
+
+        print(f"\nMessageBridge dispatch [{self._MESSAGE_COUNT} messages]:")
+        for name, (elapsed, lane_dropped, dropped) in results.items():
+            print(f"  {name:>12}: "
+                  f"{elapsed / self._MESSAGE_COUNT * 1_000_000:.2f}us "
+                  f"per message, {lane_dropped} dropped by the lane, "
+                  f"{dropped} frames dropped")
@@ -16,17 +16,31 @@
 """Module test_message_queue."""
 
 from __future__ import annotations
+import logging
+import os
+import queue
+import resource
+import time
 import unittest
-from threading import Event
+from threading import Event, Thread, current_thread
 
+from biz.dfch.asyn import ThreadPool
 from biz.dfch.scnfmixr.public.system import Message
 from biz.dfch.scnfmixr.public.system import MessageBase
 from biz.dfch.scnfmixr.public.system import NotificationHigh
 from biz.dfch.scnfmixr.public.system import NotificationMedium
 from biz.dfch.scnfmixr.public.system import NotificationLow
 from biz.dfch.scnfmixr.public.system import MessagePriority
+from biz.dfch.scnfmixr.public.system import OverflowPolicy
+from biz.dfch.scnfmixr.public.messages import Topology
+from biz.dfch.scnfmixr.public.mixer import ConnectionInfo, TopologyDelta
 
-from biz.dfch.scnfmixr.system.message_queue import MessageQueue
+from biz.dfch.scnfmixr.system.message_queue import (
+    MessageQueue,
+    SubscriberLane,
+)
+
+from tests.benchmark import benchmark
 
 
 class TestMessageQueueT(unittest.TestCase):
@@ -49,6 +63,16 @@ class TestMessageQueueT(unittest.TestCase):
     class ArbitraryMessageLow(NotificationLow):
         """Priority Low."""
 
+    class Valued(NotificationMedium):
+        """Priority Medium with a value."""
+
+        value: int
+
+        def __init__(self, value: int):
+            super().__init__()
+
+            self.value = value
+
     def _on_event(self, message: MessageBase):
         """Event handler."""
 
@@ -207,6 +231,1106 @@ class TestMessageQueueT(unittest.TestCase):
         self.assertEqual(message2, handler.messages[0])
         self.assertEqual(message1, handler.messages[1])
 
+    def test_register_with_message_types_dispatches_matching_types(self):
+        """Typed callbacks only receive matching messages and subclasses."""
+
+        class Derived(TestMessageQueueT.ArbitraryMessage1):
+            """Derived"""
+
+        received: list[MessageBase] = []
+        predicate_calls: list[MessageBase] = []
+        signal = Event()
+
+        def on_typed(message: MessageBase) -> None:
+            received.append(message)
+            if 2 == len(received):
+                signal.set()
+
+        def predicate(message: MessageBase) -> bool:
+            predicate_calls.append(message)
+            return True
+
+        sut = MessageQueue.Factory.get()
+
+        result = sut.register(
+            on_typed, predicate, TestMessageQueueT.ArbitraryMessage1)
+        self.assertTrue(result)
+
+        try:
+            sut.publish(TestMessageQueueT.ArbitraryMessage2(),
+                        TestMessageQueueT.ArbitraryMessage1(),
+                        TestMessageQueueT.ArbitraryMessageLow(),
+                        Derived())
+
+            signal.wait(5)
+
+        finally:
+            sut.unregister(on_typed)
+
+        self.assertEqual(2, len(received))
+        self.assertIsInstance(
+            received[0], TestMessageQueueT.ArbitraryMessage1)
+        self.assertIsInstance(received[1], Derived)
+        self.assertEqual(received, predicate_calls)
+
+    def test_dispatch_order_follows_registration_order(self):
+        """Typed and untyped callbacks are invoked in registration order."""
+
+        calls: list[str] = []
+        signal = Event()
+
+        def on_first(_: MessageBase) -> None:
+            calls.append("first")
+
+        def on_second(_: MessageBase) -> None:
+            calls.append("second")
+
+        def on_third(_: MessageBase) -> None:
+            calls.append("third")
+            signal.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_first, message_types=MessageBase)
+        sut.register(on_second)
+        sut.register(
+            on_third, message_types=(TestMessageQueueT.ArbitraryMessage1,
+                                     Message))
+
+        try:
+            sut.publish(TestMessageQueueT.ArbitraryMessage1())
+            signal.wait(5)
+
+        finally:
+            sut.unregister(on_first)
+            sut.unregister(on_second)
+            sut.unregister(on_third)
+
+        self.assertEqual(["first", "second", "third"], calls)
+
+
+class KeyedMessage(NotificationMedium):
+    """A state message coalesced per key."""
+
+    key: int
+    value: int
+
+    def __init__(self, key: int, value: int):
+        super().__init__()
+
+        self.key = key
+        self.value = value
+
+    @property
+    def coalescing_key(self):
+        return (KeyedMessage, self.key)
+
+
+class GateMessage(NotificationMedium):
+    """Blocks the worker until released."""
+
+
+class _Gate:
+    """Holds the message queue worker in a handler, so that messages
+    published meanwhile stay queued."""
+
+    def __init__(self, sut: MessageQueue):
+        self._sut = sut
+        self.entered = Event()
+        self.release = Event()
+
+    def _on_gate(self, _: MessageBase) -> None:
+        self.entered.set()
+        self.release.wait(5)
+
+    def __enter__(self):
+        self._sut.register(self._on_gate, message_types=GateMessage)
+        self._sut.publish(GateMessage())
+        assert self.entered.wait(5)
+        return self
+
+    def __exit__(self, *_):
+        self.release.set()
+        self._sut.unregister(self._on_gate)
+
+
+class TestMessageQueueCoalescing(unittest.TestCase):
+    """Testing coalescing of superseded messages."""
+
+    def test_newer_message_replaces_queued_message(self):
+        """Only the latest message per key is dispatched, at the position of
+        the first one."""
+
+        received: list[MessageBase] = []
+        done = Event()
+
+        def on_message(message: MessageBase) -> None:
+            received.append(message)
+            if isinstance(message, TestMessageQueueT.ArbitraryMessage2):
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        before = sut.metrics.coalesced.get(KeyedMessage(0, 0).name, 0)
+        sut.register(on_message, message_types=(
+            KeyedMessage, TestMessageQueueT.ArbitraryMessage1,
+            TestMessageQueueT.ArbitraryMessage2))
+
+        try:
+            with _Gate(sut):
+                sut.publish(KeyedMessage(1, 1))
+                sut.publish(TestMessageQueueT.ArbitraryMessage1())
+                sut.publish(KeyedMessage(2, 1))
+                for value in range(2, 10):
+                    sut.publish(KeyedMessage(1, value))
+                sut.publish(KeyedMessage(2, 2))
+                sut.publish(TestMessageQueueT.ArbitraryMessage2())
+
+            self.assertTrue(done.wait(5))
+
+        finally:
+            sut.unregister(on_message)
+
+        self.assertEqual(4, len(received))
+        self.assertEqual((1, 9), (received[0].key, received[0].value))
+        self.assertIsInstance(
+            received[1], TestMessageQueueT.ArbitraryMessage1)
+        self.assertEqual((2, 2), (received[2].key, received[2].value))
+
+        after = sut.metrics.coalesced[received[0].name]
+        self.assertEqual(9, after - before)
+
+    def test_message_after_dispatch_is_not_coalesced(self):
+        """A message published after dispatch is dispatched again."""
+
+        received: list[MessageBase] = []
+        signal = Event()
+
+        def on_message(message: MessageBase) -> None:
+            received.append(message)
+            signal.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=KeyedMessage)
+
+        try:
+            for value in range(2):
+                signal.clear()
+                sut.publish(KeyedMessage(3, value))
+                self.assertTrue(signal.wait(5))
+
+        finally:
+            sut.unregister(on_message)
+
+        self.assertEqual([0, 1], [e.value for e in received])
+
+    def test_preempted_message_is_not_resolved_twice(self):
+        """A keyed message put back after preemption by a HIGH message is
+        dispatched once, before a newer message enqueued meanwhile."""
+
+        received: list[int] = []
+        done = Event()
+
+        def on_first(_: MessageBase) -> None:
+            sut.publish(TestMessageQueueT.ArbitraryMessageHigh())
+            sut.publish(KeyedMessage(4, 2))
+            sut.publish(KeyedMessage(4, 3))
+
+        def on_keyed(message: MessageBase) -> None:
+            received.append(message.value)
+            if 3 == message.value:
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(
+            on_first, message_types=TestMessageQueueT.ArbitraryMessage1)
+        sut.register(on_keyed, message_types=KeyedMessage)
+
+        try:
+            sut.publish(
+                TestMessageQueueT.ArbitraryMessage1(), KeyedMessage(4, 1))
+
+            self.assertTrue(done.wait(5))
+            _drain(sut)
+
+        finally:
+            sut.unregister(on_first)
+            sut.unregister(on_keyed)
+
+        self.assertEqual([1, 3], received)
+
+    def test_topology_changed_notifications_merge_deltas(self):
+        """The merged topology notification carries the combined delta."""
+
+        first = Topology.ChangedNotification(
+            ConnectionInfo({("a:1", False): []}),
+            TopologyDelta(ports_added=frozenset({"a:1"})))
+        second = Topology.ChangedNotification(
+            ConnectionInfo({("b:1", False): []}),
+            TopologyDelta(ports_added=frozenset({"b:1"}),
+                          ports_removed=frozenset({"a:1"})))
+
+        result = second.coalesce(first)
+
+        self.assertEqual(first.coalescing_key, second.coalescing_key)
+        self.assertEqual(second.value, result.value)
+        self.assertEqual(frozenset({"b:1"}), result.delta.ports_added)
+        self.assertEqual(frozenset(), result.delta.ports_removed)
+
+        third = Topology.ChangedNotification(
+            ConnectionInfo({("c:1", False): []}))
+
+        self.assertIsNone(third.coalesce(second).delta)
+
+    def test_point_lost_and_found_share_key_per_point(self):
+        """Lost and found notifications of a point supersede each other."""
+
+        self.assertEqual(
+            Topology.PointLostNotification("p1").coalescing_key,
+            Topology.PointFoundNotification("p1").coalescing_key)
+        self.assertNotEqual(
+            Topology.PointLostNotification("p1").coalescing_key,
+            Topology.PointLostNotification("p2").coalescing_key)
+        self.assertIsNone(
+            Topology.PointAddedNotification("p1").coalescing_key)
+
+
+class TestMessageQueueLanes(unittest.TestCase):
+    """Testing per-subscriber lanes."""
+
+    def test_slow_subscriber_on_lane_does_not_block_others(self):
+        """A blocking callback on a dedicated lane does not delay inline
+        callbacks."""
+
+        release = Event()
+        fast_received = Event()
+
+        def on_slow(_: MessageBase) -> None:
+            release.wait(5)
+
+        def on_fast(_: MessageBase) -> None:
+            fast_received.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_slow, message_types=KeyedMessage,
+                     lane=MessageQueue.Lane.DEDICATED)
+        sut.register(on_fast, message_types=KeyedMessage)
+
+        try:
+            sut.publish(KeyedMessage(10, 0))
+
+            self.assertTrue(fast_received.wait(1))
+            self.assertFalse(release.is_set())
+
+        finally:
+            release.set()
+            sut.unregister(on_slow)
+            sut.unregister(on_fast)
+
+    def test_shared_lane_keeps_order(self):
+        """Messages are delivered in order per subscriber."""
+
+        count = 200
+        received: list[int] = []
+        done = Event()
+
+        def on_message(message: MessageBase) -> None:
+            received.append(message.value)
+            if count == len(received):
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=TestMessageQueueT.Valued,
+                     lane=MessageQueue.Lane.SHARED)
+
+        try:
+            for value in range(count):
+                sut.publish(TestMessageQueueT.Valued(value))
+
+            self.assertTrue(done.wait(5))
+
+        finally:
+            sut.unregister(on_message)
+
+        self.assertEqual(list(range(count)), received)
+
+    def test_saturated_shared_lanes_do_not_run_on_worker(self):
+        """Shared lanes wait for the pool instead of running on the worker
+        of the message queue."""
+
+        release = Event()
+        threads: list[Thread] = []
+        fast_received = Event()
+
+        def on_fast(_: MessageBase) -> None:
+            fast_received.set()
+
+        actions = []
+        for i in range(ThreadPool.MAX_WORKERS + 2):
+            def on_slow(_: MessageBase) -> None:
+                threads.append(current_thread())
+                release.wait(5)
+            on_slow.__qualname__ = f"on_slow_{i}"
+            actions.append(on_slow)
+
+        sut = MessageQueue.Factory.get()
+        for action in actions:
+            sut.register(action, message_types=KeyedMessage,
+                         lane=MessageQueue.Lane.SHARED)
+        sut.register(
+            on_fast, message_types=TestMessageQueueT.ArbitraryMessage1)
+
+        try:
+            sut.publish(KeyedMessage(11, 0))
+            sut.publish(TestMessageQueueT.ArbitraryMessage1())
+
+            self.assertTrue(fast_received.wait(1))
+
+            release.set()
+            deadline = time.monotonic() + 5
+            while len(threads) < len(actions) and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+        finally:
+            release.set()
+            sut.unregister(on_fast)
+            for action in actions:
+                sut.unregister(action)
+
+        self.assertEqual(len(actions), len(threads))
+        self.assertNotIn(
+            sut._worker_thread, threads)  # pylint: disable=W0212
+
+    def test_high_priority_preempts_queued_messages_on_lane(self):
+        """HIGH priority messages overtake queued default messages."""
+
+        entered = Event()
+        release = Event()
+        done = Event()
+        received: list[MessageBase] = []
+
+        def on_message(message: MessageBase) -> None:
+            if isinstance(message, GateMessage):
+                entered.set()
+                release.wait(5)
+                return
+            received.append(message)
+            if 3 == len(received):
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(
+            on_message,
+            message_types=(GateMessage, TestMessageQueueT.ArbitraryMessage1,
+                           TestMessageQueueT.ArbitraryMessageHigh),
+            lane=MessageQueue.Lane.DEDICATED)
+
+        try:
+            sut.publish(GateMessage())
+            self.assertTrue(entered.wait(5))
+
+            sut.publish(TestMessageQueueT.ArbitraryMessage1())
+            sut.publish(TestMessageQueueT.ArbitraryMessage1())
+            sut.publish(TestMessageQueueT.ArbitraryMessageHigh())
+            time.sleep(0.05)
+            release.set()
+
+            self.assertTrue(done.wait(5))
+
+        finally:
+            release.set()
+            sut.unregister(on_message)
+
+        self.assertIsInstance(
+            received[0], TestMessageQueueT.ArbitraryMessageHigh)
+
+    def test_metrics_contain_handler_durations(self):
+        """Handler durations are recorded per subscriber."""
+
+        done = Event()
+
+        def on_message(_: MessageBase) -> None:
+            time.sleep(0.01)
+            done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=GateMessage,
+                     lane=MessageQueue.Lane.SHARED)
+
+        try:
+            sut.publish(GateMessage())
+            self.assertTrue(done.wait(5))
+            time.sleep(0.01)
+
+            name = MessageQueue.get_fqcn(on_message)
+            durations = sut.metrics.handler_durations[name]
+
+        finally:
+            sut.unregister(on_message)
+
+        self.assertEqual(1, durations.count)
+        self.assertGreaterEqual(durations.max_s, 0.01)
+
+
+class StampedMessage(NotificationMedium):
+    """Carries the time it was created at."""
+
+    created: float
+
+    def __init__(self):
+        super().__init__()
+
+        self.created = time.perf_counter()
+
+
+class TestMessageQueueLatency(unittest.TestCase):
+    """Testing wake-up and enqueue to dispatch latency."""
+
+    def test_message_published_while_processing_is_dispatched(self):
+        """A message published while the worker processes a batch is not
+        left in the queue until the next publish or wait timeout."""
+
+        done = Event()
+
+        def on_message(message: MessageBase) -> None:
+            if isinstance(message, GateMessage):
+                sut.publish(StampedMessage())
+            else:
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=(GateMessage, StampedMessage))
+
+        try:
+            for _ in range(100):
+                done.clear()
+                sut.publish(GateMessage())
+                self.assertTrue(done.wait(0.5))
+
+        finally:
+            sut.unregister(on_message)
+
+    def test_high_message_preempts_remaining_default_messages(self):
+        """A HIGH message published during a batch is dispatched before the
+        rest of that batch."""
+
+        received = []
+        done = Event()
+
+        def on_message(message: MessageBase) -> None:
+            received.append(message)
+            if isinstance(message, TestMessageQueueT.Valued) \
+                    and 0 == message.value:
+                sut.publish(TestMessageQueueT.ArbitraryMessageHigh())
+            if isinstance(message, TestMessageQueueT.Valued) \
+                    and 2 == message.value:
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=(
+            TestMessageQueueT.Valued, TestMessageQueueT.ArbitraryMessageHigh))
+
+        try:
+            with _Gate(sut):
+                for value in range(3):
+                    sut.publish(TestMessageQueueT.Valued(value))
+
+            self.assertTrue(done.wait(5))
+
+        finally:
+            sut.unregister(on_message)
+
+        self.assertEqual(4, len(received))
+        self.assertEqual(0, received[0].value)
+        self.assertIsInstance(
+            received[1], TestMessageQueueT.ArbitraryMessageHigh)
+        self.assertEqual([1, 2], [e.value for e in received[2:]])
+
+    def test_metrics_contain_dispatch_latencies(self):
+        """Dispatch latencies are recorded per message name."""
+
+        done = Event()
+
+        def on_message(_: MessageBase) -> None:
+            done.set()
+
+        message = StampedMessage()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=StampedMessage)
+
+        try:
+            before = sut.metrics.dispatch_latencies.get(message.name)
+            sut.publish(message)
+            self.assertTrue(done.wait(5))
+
+            result = sut.metrics.dispatch_latencies[message.name]
+
+        finally:
+            sut.unregister(on_message)
+
+        self.assertEqual((before.count if before else 0) + 1, result.count)
+        self.assertLess(result.percentile(50), 1)
+
+
+@benchmark
+class TestMessageQueueLatencyBenchmark(unittest.TestCase):
+    """Enqueue to dispatch latency under load."""
+
+    _RATE_PER_MS = 10
+    _DURATION_MS = 1000
+    _P99_MAX_S = 0.005
+
+    def test_stress_p99_below_5ms(self):
+        """Publishes 10k messages per second and measures the enqueue to
+        dispatch latency."""
+
+        latencies: list[float] = []
+        count = self._RATE_PER_MS * self._DURATION_MS
+        done = Event()
+
+        def on_message(message: StampedMessage) -> None:
+            latencies.append(time.perf_counter() - message.created)
+            if count == len(latencies):
+                done.set()
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=StampedMessage)
+
+        logging.disable(logging.CRITICAL)
+
+        try:
+            start = time.perf_counter()
+            for tick in range(1, self._DURATION_MS + 1):
+                for _ in range(self._RATE_PER_MS):
+                    sut.publish(StampedMessage())
+
+                delay = start + tick / 1000 - time.perf_counter()
+                if 0 < delay:
+                    time.sleep(delay)
+
+            self.assertTrue(done.wait(5))
+
+        finally:
+            logging.disable(logging.NOTSET)
+            sut.unregister(on_message)
+
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[len(latencies) * 99 // 100]
+
+        self.assertLess(
+            p99, self._P99_MAX_S,
+            f"p50 {p50 * 1000:.3f}ms, p99 {p99 * 1000:.3f}ms, "
+            f"max {latencies[-1] * 1000:.3f}ms")
+
+
+class PolicyMessage(NotificationMedium):
+    """A message with a configurable overflow policy."""
+
+    POLICY: OverflowPolicy = OverflowPolicy.BLOCK
+
+    value: int
+
+    def __init__(self, value: int = 0):
+        super().__init__()
+
+        self.value = value
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        return self.POLICY
+
+
+class DropOldestMessage(PolicyMessage):
+    """Drops the oldest queued message of its type."""
+
+    POLICY = OverflowPolicy.DROP_OLDEST
+
+
+class DropNewestMessage(PolicyMessage):
+    """Drops itself."""
+
+    POLICY = OverflowPolicy.DROP_NEWEST
+
+
+class RejectMessage(PolicyMessage):
+    """Raises `queue.Full`."""
+
+    POLICY = OverflowPolicy.REJECT
+
+
+class DrainMessage(NotificationMedium):
+    """Dispatched after all messages queued before it."""
+
+
+def _drain(sut: MessageQueue) -> None:
+    """Waits until all queued messages are dispatched."""
+
+    done = Event()
+
+    def on_drain(_: MessageBase) -> None:
+        done.set()
+
+    sut.register(on_drain, message_types=DrainMessage)
+
+    try:
+        sut.publish(DrainMessage())
+        assert done.wait(5)
+    finally:
+        sut.unregister(on_drain)
+
+
+class TestMessageQueueBackpressure(unittest.TestCase):
+    """Testing bounded queues and overflow policies."""
+
+    def setUp(self):
+        self.sut = MessageQueue.Factory.get()
+        self.received: list[MessageBase] = []
+        self.sut.register(self._on_message, message_types=PolicyMessage)
+
+    def tearDown(self):
+        self.sut.unregister(self._on_message)
+        self.sut.set_capacity(
+            MessageQueue.MAX_SIZE_HIGH,
+            MessageQueue.MAX_SIZE_DEFAULT,
+            MessageQueue.BLOCK_TIMEOUT_S)
+        _drain(self.sut)
+
+    def _on_message(self, message: MessageBase) -> None:
+        self.received.append(message)
+
+    def _wait_for(self, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while len(self.received) < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        time.sleep(0.02)
+
+    def test_block_waits_then_drops(self):
+        """A blocked publisher drops its message after the timeout."""
+
+        self.sut.set_capacity(max_size_default=2, block_timeout_s=0.05)
+
+        with _Gate(self.sut):
+            self.sut.publish(PolicyMessage(0), PolicyMessage(1))
+
+            name = PolicyMessage().name
+            before = self.sut.metrics.dropped.get(name, 0)
+
+            start = time.monotonic()
+            self.sut.publish(PolicyMessage(2))
+            elapsed = time.monotonic() - start
+
+            metrics = self.sut.metrics
+
+        self._wait_for(2)
+
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertEqual(1, metrics.dropped[name] - before)
+        self.assertEqual(0, metrics.rejected.get(name, 0))
+        self.assertEqual([0, 1], [e.value for e in self.received])
+
+    def test_block_admits_once_worker_makes_space(self):
+        """A blocked publisher continues when the worker drains the queue."""
+
+        self.sut.set_capacity(max_size_default=2, block_timeout_s=5)
+
+        with _Gate(self.sut) as gate:
+            self.sut.publish(PolicyMessage(0), PolicyMessage(1))
+
+            Thread(target=lambda: (time.sleep(0.05), gate.release.set()),
+                   daemon=True).start()
+
+            start = time.monotonic()
+            self.sut.publish(PolicyMessage(2))
+            elapsed = time.monotonic() - start
+
+        self._wait_for(3)
+
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertEqual([0, 1, 2], [e.value for e in self.received])
+
+    def test_drop_oldest_keeps_latest_messages(self):
+        """The oldest queued message of the same type is dropped."""
+
+        self.sut.set_capacity(max_size_default=3)
+
+        with _Gate(self.sut):
+            self.sut.publish(PolicyMessage(-1))
+            for value in range(5):
+                self.sut.publish(DropOldestMessage(value))
+
+            metrics = self.sut.metrics
+
+        self._wait_for(3)
+
+        self.assertEqual([-1, 3, 4], [e.value for e in self.received])
+        self.assertGreaterEqual(
+            metrics.dropped[DropOldestMessage().name], 3)
+
+    def test_drop_oldest_without_queued_message_of_type_drops_newest(self):
+        """Messages of other types are never dropped for a message."""
+
+        self.sut.set_capacity(max_size_default=2)
+
+        with _Gate(self.sut):
+            self.sut.publish(PolicyMessage(0), PolicyMessage(1))
+            self.sut.publish(DropOldestMessage(2))
+
+        self._wait_for(2)
+
+        self.assertEqual([0, 1], [e.value for e in self.received])
+
+    def test_drop_newest_keeps_queued_messages(self):
+        """The published message is dropped."""
+
+        self.sut.set_capacity(max_size_default=2)
+
+        with _Gate(self.sut):
+            for value in range(5):
+                self.sut.publish(DropNewestMessage(value))
+
+            metrics = self.sut.metrics
+
+        self._wait_for(2)
+
+        self.assertEqual([0, 1], [e.value for e in self.received])
+        self.assertGreaterEqual(
+            metrics.dropped[DropNewestMessage().name], 3)
+
+    def test_reject_raises_immediately(self):
+        """The publisher of a rejected message gets `queue.Full`."""
+
+        self.sut.set_capacity(max_size_default=1, block_timeout_s=5)
+
+        with _Gate(self.sut):
+            self.sut.publish(RejectMessage(0))
+
+            start = time.monotonic()
+            with self.assertRaises(queue.Full):
+                self.sut.publish(RejectMessage(1))
+
+            self.assertLess(time.monotonic() - start, 1)
+
+        self._wait_for(1)
+
+        self.assertEqual([0], [e.value for e in self.received])
+
+    def test_high_queue_has_own_capacity(self):
+        """A full default queue does not affect HIGH messages."""
+
+        self.sut.set_capacity(max_size_default=1, block_timeout_s=0)
+
+        with _Gate(self.sut):
+            self.sut.publish(PolicyMessage(0))
+            self.sut.publish(TestMessageQueueT.ArbitraryMessageHigh())
+
+            with self.assertRaises(queue.Full):
+                self.sut.publish(RejectMessage(1))
+
+    def test_worker_publishing_to_full_queue_is_admitted(self):
+        """The worker does not wait for itself."""
+
+        self.sut.set_capacity(max_size_default=1, block_timeout_s=5)
+
+        def on_gate(_: MessageBase) -> None:
+            self.sut.publish(PolicyMessage(0), PolicyMessage(1))
+
+        self.sut.register(on_gate, message_types=GateMessage)
+
+        try:
+            start = time.monotonic()
+            self.sut.publish(GateMessage())
+            self._wait_for(2)
+
+        finally:
+            self.sut.unregister(on_gate)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual([0, 1], [e.value for e in self.received])
+
+    def test_metrics_report_depth_and_high_water_mark(self):
+        """Depth and high-water mark are reported per queue."""
+
+        self.sut.set_capacity(max_size_default=3)
+
+        with _Gate(self.sut):
+            for value in range(10):
+                self.sut.publish(DropNewestMessage(value))
+
+            metrics = self.sut.metrics
+
+        self._wait_for(3)
+
+        self.assertEqual(3, metrics.queue_depth[MessagePriority.DEFAULT])
+        self.assertGreaterEqual(
+            metrics.high_water_mark[MessagePriority.DEFAULT], 3)
+        self.assertEqual(
+            0, self.sut.metrics.queue_depth[MessagePriority.DEFAULT])
+
+    def test_full_lane_drops_messages(self):
+        """A stalled subscriber on a lane does not grow without limit."""
+
+        release = Event()
+        received = []
+
+        def on_message(message: MessageBase) -> None:
+            release.wait(5)
+            received.append(message)
+
+        max_size = SubscriberLane.MAX_SIZE
+        SubscriberLane.MAX_SIZE = 2
+
+        self.sut.register(on_message, message_types=DropOldestMessage,
+                          lane=MessageQueue.Lane.DEDICATED)
+
+        try:
+            for value in range(10):
+                self.sut.publish(DropOldestMessage(value))
+            self._wait_for(10)
+
+            release.set()
+            deadline = time.monotonic() + 5
+            while len(received) < 3 and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+            metrics = self.sut.metrics
+
+        finally:
+            SubscriberLane.MAX_SIZE = max_size
+            self.sut.unregister(on_message)
+
+        self.assertEqual([0, 8, 9], [e.value for e in received])
+        self.assertEqual(
+            7, metrics.lane_dropped[MessageQueue.get_fqcn(on_message)])
+
+    def test_overload_keeps_queue_bounded(self):
+        """Publishing at 5x the consumer rate keeps the depth bounded."""
+
+        def on_message(_: MessageBase) -> None:
+            time.sleep(0.001)
+
+        self.sut.set_capacity(max_size_default=100)
+        self.sut.register(on_message, message_types=DropOldestMessage)
+
+        try:
+            depth = 0
+            start = time.monotonic()
+            while time.monotonic() - start < 0.5:
+                for _ in range(5):
+                    self.sut.publish(DropOldestMessage())
+                time.sleep(0.001)
+                depth = max(
+                    depth, self.sut.metrics.queue_depth[
+                        MessagePriority.DEFAULT])
+
+        finally:
+            self.sut.unregister(on_message)
+            self.sut.clear()
+            _drain(self.sut)
+
+        self.assertLessEqual(depth, 100)
+        self.assertGreater(
+            self.sut.metrics.dropped[DropOldestMessage().name], 0)
+
+
+@benchmark
+class TestMessageQueueBenchmark(unittest.TestCase):
+    """Dispatch benchmarks. Set `SCNFMIXR_BENCHMARK=1` to run."""
+
+    _MESSAGE_COUNT = 100_000
+    _SUBSCRIBER_COUNT = 200
+    _TYPE_COUNT = 20
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def _dispatch(
+            self,
+            sut: MessageQueue,
+            messages: list[MessageBase]
+    ) -> float:
+        """Dispatches all messages and returns messages per second."""
+
+        start = time.perf_counter()
+        for message in messages:
+            # pylint: disable=W0212
+            sut._process_message(message, sut._get_callbacks(type(message)))
+        return len(messages) / (time.perf_counter() - start)
+
+    def test_dispatch_predicate_vs_typed(self):
+        """Publishes 100k messages to 200 subscribers."""
+
+        types = [type(f"BenchmarkMessage{i}", (NotificationMedium,), {})
+                 for i in range(self._TYPE_COUNT)]
+        messages = [types[i % self._TYPE_COUNT]()
+                    for i in range(self._MESSAGE_COUNT)]
+
+        sut = MessageQueue.Factory.get()
+        results: dict[str, float] = {}
+
+        for mode in ("predicate", "typed"):
+            actions = []
+            for i in range(self._SUBSCRIBER_COUNT):
+                message_type = types[i % self._TYPE_COUNT]
+
+                def action(_: MessageBase) -> None:
+                    pass
+                action.__qualname__ = f"benchmark_{mode}_{i}"
+                actions.append(action)
+
+                if "predicate" == mode:
+                    sut.register(action, lambda e, t=message_type:
+                                 isinstance(e, t))
+                else:
+                    sut.register(action, message_types=message_type)
+
+            try:
+                results[mode] = self._dispatch(sut, messages)
+            finally:
+                for action in actions:
+                    sut.unregister(action)
+
+        print(f"\nMessageQueue dispatch [{self._MESSAGE_COUNT} messages, "
+              f"{self._SUBSCRIBER_COUNT} subscribers]: "
+              f"predicate {results['predicate']:.0f} msg/s, "
+              f"typed {results['typed']:.0f} msg/s, "
+              f"speed-up {results['typed'] / results['predicate']:.1f}x")
+
+        self.assertGreater(results["typed"], results["predicate"])
+
+    def test_burst_with_and_without_coalescing(self):
+        """Publishes a burst of 10k state messages for 10 keys."""
+
+        class UnkeyedMessage(KeyedMessage):
+            """Same payload, never coalesced."""
+
+            @property
+            def coalescing_key(self):
+                return None
+
+        count = 10_000
+        sut = MessageQueue.Factory.get()
+        sut.set_capacity(max_size_default=0)
+
+        for message_type in (UnkeyedMessage, KeyedMessage):
+            received = []
+            done = Event()
+
+            def on_message(message: MessageBase, received=received,
+                           done=done) -> None:
+                received.append(message)
+                time.sleep(0.0001)
+                if count - 1 == message.value:
+                    done.set()
+
+            on_message.__qualname__ = f"burst_{message_type.__name__}"
+            sut.register(on_message, message_types=KeyedMessage)
+
+            try:
+                with _Gate(sut):
+                    start = time.perf_counter()
+                    for value in range(count):
+                        sut.publish(message_type(value % 10, value))
+
+                done.wait(60)
+                elapsed = time.perf_counter() - start
+
+            finally:
+                sut.unregister(on_message)
+
+            print(f"\n{message_type.__name__}: {count} published, "
+                  f"{len(received)} dispatched in {elapsed * 1000:.0f}ms")
+
+        sut.set_capacity(max_size_default=MessageQueue.MAX_SIZE_DEFAULT)
+
+        print(f"coalesced: {sut.metrics.coalesced_total}")
+
+    def test_publish(self):
+        """Publishes 100k messages while the worker is held."""
+
+        count = self._MESSAGE_COUNT
+        sut = MessageQueue.Factory.get()
+        sut.set_capacity(max_size_default=0)
+
+        messages = [TestMessageQueueT.ArbitraryMessageMedium()
+                    for _ in range(count)]
+
+        try:
+            with _Gate(sut):
+                start = time.perf_counter()
+                for message in messages:
+                    sut.publish(message)
+                elapsed = time.perf_counter() - start
+
+            _drain(sut)
+
+        finally:
+            sut.set_capacity(max_size_default=MessageQueue.MAX_SIZE_DEFAULT)
+
+        print(f"\nMessageQueue publish [{count} messages]: "
+              f"{elapsed / count * 1e6:.2f}us per message, "
+              f"{count / elapsed:.0f} msg/s")
+
+    @staticmethod
+    def _get_rss() -> int:
+        """Returns the resident set size in bytes."""
+
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * resource.getpagesize()
+
+    def test_soak_overload_rss_stays_flat(self):
+        """Publishes at 5x the consumer rate for `SCNFMIXR_SOAK_S` seconds
+        (default: 600) and checks that the RSS stays flat."""
+
+        if not os.path.exists("/proc/self/statm"):
+            self.skipTest("Requires /proc/self/statm.")
+
+        duration_s = float(os.environ.get("SCNFMIXR_SOAK_S", "600"))
+        consumer_rate = 1000
+        max_growth = 4 * 1024 * 1024
+
+        def on_message(_: MessageBase) -> None:
+            time.sleep(1 / consumer_rate)
+
+        sut = MessageQueue.Factory.get()
+        sut.register(on_message, message_types=DropOldestMessage)
+
+        samples: list[int] = []
+
+        try:
+            start = time.monotonic()
+            tick = 0
+            while time.monotonic() - start < duration_s:
+                tick += 1
+                for _ in range(5):
+                    sut.publish(DropOldestMessage(tick))
+
+                delay = start + tick / consumer_rate - time.monotonic()
+                if 0 < delay:
+                    time.sleep(delay)
+
+                if 0 == tick % consumer_rate:
+                    samples.append(self._get_rss())
+
+            metrics = sut.metrics
+
+        finally:
+            sut.unregister(on_message)
+            sut.clear()
+
+        warm = samples[len(samples) // 10]
+        print(f"\nSoak [{duration_s:.0f}s, {5 * consumer_rate} msg/s "
+              f"published, {consumer_rate} msg/s consumed]: "
+              f"RSS {warm / 2**20:.1f}MiB -> {samples[-1] / 2**20:.1f}MiB "
+              f"(max {max(samples) / 2**20:.1f}MiB), "
+              f"high-water mark "
+              f"{metrics.high_water_mark[MessagePriority.DEFAULT]}, "
+              f"dropped {sum(metrics.dropped.values())}")
+
+        self.assertLess(max(samples[len(samples) // 10:]) - warm, max_growth)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,136 @@
+# Copyright (c) 2025 d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Module test_reply_router."""
+
+from concurrent.futures import CancelledError
+import time
+import unittest
+
+from biz.dfch.scnfmixr.public.system import (
+    MessageBase,
+    NotificationMedium,
+    CommandMedium,
+)
+from biz.dfch.scnfmixr.system import MessageQueue, ReplyRouter
+
+
+class AskCommand(CommandMedium):
+    """A request."""
+
+
+class AnswerNotification(NotificationMedium):
+    """A reply."""
+
+    value: int
+
+    def __init__(self, value: int):
+        super().__init__()
+
+        self.value = value
+
+
+class TestReplyRouter(unittest.TestCase):
+    """Testing `ReplyRouter`."""
+
+    def setUp(self):
+        self._mq = MessageQueue.Factory.get()
+        self._mq.register(self._on_ask, message_types=AskCommand)
+
+    def tearDown(self):
+        self._mq.unregister(self._on_ask)
+
+    def _on_ask(self, message: MessageBase) -> None:
+        self._mq.publish(AnswerNotification(42).correlate(message))
+
+    def test_calling_ctor_throws(self):
+
+        with self.assertRaises(AssertionError):
+            _ = ReplyRouter()
+
+    def test_factory_returns_singleton(self):
+
+        self.assertIs(ReplyRouter.Factory.get(), ReplyRouter.Factory.get())
+
+    def test_request_returns_reply(self):
+
+        sut = ReplyRouter.Factory.get()
+
+        message = AskCommand()
+        result = sut.request(message).result(5)
+
+        self.assertIsInstance(result, AnswerNotification)
+        self.assertEqual(42, result.value)
+        self.assertEqual(message.correlation_id, result.correlation_id)
+        self.assertEqual(0, len(sut))
+
+    def test_requests_get_their_own_replies(self):
+
+        sut = ReplyRouter.Factory.get()
+
+        messages = [AskCommand() for _ in range(10)]
+        futures = [sut.request(e) for e in messages]
+
+        for message, future in zip(messages, futures):
+            self.assertEqual(
+                message.correlation_id, future.result(5).correlation_id)
+
+    def test_uncorrelated_reply_does_not_resolve_request(self):
+
+        self._mq.unregister(self._on_ask)
+
+        sut = ReplyRouter.Factory.get()
+
+        future = sut.request(AskCommand(), 0.1)
+        self._mq.publish(AnswerNotification(42))
+
+        with self.assertRaises(TimeoutError):
+            future.result(5)
+
+        self.assertEqual(0, len(sut))
+
+    def test_request_without_reply_times_out(self):
+
+        self._mq.unregister(self._on_ask)
+
+        sut = ReplyRouter.Factory.get()
+
+        start = time.monotonic()
+        future = sut.request(AskCommand(), 0.05)
+
+        with self.assertRaises(TimeoutError):
+            future.result(5)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(0, len(sut))
+
+    def test_cancelled_request_is_discarded(self):
+
+        self._mq.unregister(self._on_ask)
+
+        sut = ReplyRouter.Factory.get()
+
+        future = sut.request(AskCommand(), 5)
+
+        self.assertTrue(future.cancel())
+        self.assertEqual(0, len(sut))
+
+        with self.assertRaises(CancelledError):
+            future.result(1)
+
+
+if __name__ == "__main__":
+    unittest.main()